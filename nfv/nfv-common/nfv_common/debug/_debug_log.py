@@ -5,7 +5,6 @@
 #
 import datetime
 import functools
-import inspect
 import logging
 import os
 from pathlib import Path
@@ -17,6 +16,18 @@ from nfv_common.debug._debug_thread import DebugLoggingThread
 
 _debug_loggers = {}
 
+# Debug levels looked up once for the checks done on every log call.
+_VERBOSE = DEBUG_LEVEL.VERBOSE
+_DEBUG = DEBUG_LEVEL.DEBUG
+_INFO = DEBUG_LEVEL.INFO
+_NOTICE = DEBUG_LEVEL.NOTICE
+_WARN = DEBUG_LEVEL.WARN
+_ERROR = DEBUG_LEVEL.ERROR
+_CRITICAL = DEBUG_LEVEL.CRITICAL
+
+# Base names of the source files of callers, keyed by the full path.
+_caller_filenames = {}
+
 
 class DebugLogFormatter(logging.Formatter):
     """Debug Log Formatter."""
@@ -133,10 +144,11 @@ class DebugLogger:
         self.process_name = process_name
         self.thread_name = thread_name
         self.debug_level = debug_level
+        self._enabled_level = max(debug_level, Debug().debug_level)
         self.logger = logging.getLogger(name)
         self.logger.propagate = False
         self.logger.setLevel(logging.NOTSET)
-        for handler in self.logger.handlers:
+        for handler in list(self.logger.handlers):
             self.logger.removeHandler(handler)
         self.logger.addHandler(DebugLogHandler())
 
@@ -145,6 +157,9 @@ class DebugLogger:
 
         log_level = self.log_level_mapping.get(debug_level, logging.NOTSET)
         self.debug_level = debug_level
+        # Logs below the overall debug level are dropped as well, the overall
+        # level is set before the loggers levels are set.
+        self._enabled_level = max(debug_level, Debug().debug_level)
         self.logger.setLevel(log_level)
 
     def set_process_name(self, process_name):
@@ -159,69 +174,81 @@ class DebugLogger:
         for handler in self.logger.handlers:
             handler.set_thread_name(thread_name)
 
+    def is_enabled_for(self, debug_level):
+        """Returns true if logs of the given debug level are enabled, allows
+
+        callers to skip building expensive log messages.
+        """
+        return debug_level >= self._enabled_level
+
     @staticmethod
-    def get_caller():
+    def get_caller(depth=2):
         """Get the calling function and line number."""
 
-        caller = inspect.currentframe().f_back.f_back
-        _, filename = os.path.split(caller.f_code.co_filename)
+        caller = sys._getframe(depth)
+        filename = _caller_filenames.get(caller.f_code.co_filename, None)
+        if filename is None:
+            _, filename = os.path.split(caller.f_code.co_filename)
+            _caller_filenames[caller.f_code.co_filename] = filename
         return "%42s.%-4s  " % (filename, caller.f_lineno)
 
+    def _log(self, log_level, msg, args, kwargs):
+        """Log a message, the message is only formatted with its arguments
+
+        when the record is emitted.
+        """
+        caller = self.get_caller(3)
+        if kwargs:
+            self.logger.log(log_level, caller + msg, *args, **kwargs)
+        else:
+            # Skips the search for the caller done by logging.Logger.log.
+            self.logger.handle(
+                self.logger.makeRecord(
+                    self.name, log_level, "(unknown file)", 0, caller + msg, args, None
+                )
+            )
+
     def verbose(self, msg, *args, **kwargs):
         """Debug log with severity of VERBOSE."""
 
-        if DEBUG_LEVEL.VERBOSE >= Debug().debug_level:
-            if DEBUG_LEVEL.VERBOSE >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.debug(caller + msg, *args, **kwargs)
+        if _VERBOSE >= self._enabled_level:
+            self._log(logging.DEBUG, msg, args, kwargs)
 
     def debug(self, msg, *args, **kwargs):
         """Debug log with severity of DEBUG."""
 
-        if DEBUG_LEVEL.DEBUG >= Debug().debug_level:
-            if DEBUG_LEVEL.DEBUG >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.debug(caller + msg, *args, **kwargs)
+        if _DEBUG >= self._enabled_level:
+            self._log(logging.DEBUG, msg, args, kwargs)
 
     def info(self, msg, *args, **kwargs):
         """Debug log with severity of INFO."""
 
-        if DEBUG_LEVEL.INFO >= Debug().debug_level:
-            if DEBUG_LEVEL.INFO >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.info(caller + msg, *args, **kwargs)
+        if _INFO >= self._enabled_level:
+            self._log(logging.INFO, msg, args, kwargs)
 
     def notice(self, msg, *args, **kwargs):
         """Debug log with severity of NOTICE."""
 
-        if DEBUG_LEVEL.NOTICE >= Debug().debug_level:
-            if DEBUG_LEVEL.NOTICE >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.info(caller + msg, *args, **kwargs)
+        if _NOTICE >= self._enabled_level:
+            self._log(logging.INFO, msg, args, kwargs)
 
     def warn(self, msg, *args, **kwargs):
         """Debug log with severity of WARNING."""
 
-        if DEBUG_LEVEL.WARN >= Debug().debug_level:
-            if DEBUG_LEVEL.WARN >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.warning(caller + msg, *args, **kwargs)
+        if _WARN >= self._enabled_level:
+            self._log(logging.WARNING, msg, args, kwargs)
 
     def error(self, msg, *args, **kwargs):
         """Debug log with severity of ERROR."""
 
-        if DEBUG_LEVEL.ERROR >= Debug().debug_level:
-            if DEBUG_LEVEL.ERROR >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.error(caller + msg, *args, **kwargs)
+        if _ERROR >= self._enabled_level:
+            self._log(logging.ERROR, msg, args, kwargs)
 
     def critical(self, msg, *args, **kwargs):
         """Debug log with severity of CRITICAL."""
 
-        if DEBUG_LEVEL.CRITICAL >= Debug().debug_level:
-            if DEBUG_LEVEL.CRITICAL >= self.debug_level:
-                caller = self.get_caller()
-                self.logger.critical(caller + msg, *args, **kwargs)
+        if _CRITICAL >= self._enabled_level:
+            self._log(logging.CRITICAL, msg, args, kwargs)
 
     def exception(self, msg, *args):
         """Debug exception log."""
@@ -297,7 +324,7 @@ def debug_get_logger(name, debug_level=None, process_name=None, thread_name=None
 
     logger = _debug_loggers.get(name, None)
     if logger is None:
-        logger = DebugLogger(name, process_name, thread_name)
+        logger = DebugLogger(name, process_name=process_name, thread_name=thread_name)
         _debug_loggers[name] = logger
         if debug_level is None:
             logger.set_level(DEBUG_LEVEL.NONE)
@@ -152,4 +152,4 @@ def debug_initialize(config, process_name=None, thread_name=None):
 def debug_finalize():
     """Finalizes the debug subsystem."""
 
-    return
+    DebugLoggingThread().flush(DebugLoggingThread.EXIT_FLUSH_TIMEOUT_IN_SECS)
@@ -3,9 +3,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import atexit
+import collections
+import itertools
 import logging
 from logging.handlers import SysLogHandler
 import multiprocessing
+import os
 import sys
 import threading
 
@@ -23,26 +27,167 @@ class DebugLoggingThreadFormatter(logging.Formatter):
         super().format(record)
 
 
+class DebugLogBuffer:
+    """Debug Log Buffer.
+
+    Bounded buffer of log records waiting to be sent to the debug logging
+    thread, records added while the buffer is full are dropped and counted.
+    """
+
+    def __init__(self, max_records=10000, batch_size=256):
+        self._max_records = max_records
+        self._batch_size = batch_size
+        self._records = collections.deque()
+        self._dropped = 0
+        # Re-entrant, as a signal handler may flush while the buffer is in use.
+        self._lock = threading.RLock()
+
+    @property
+    def dropped(self):
+        """Returns the number of records dropped since the last take."""
+
+        return self._dropped
+
+    def add(self, log_record):
+        """Add a record, returns true if a batch is ready to be flushed."""
+
+        with self._lock:
+            if self._max_records <= len(self._records):
+                self._dropped += 1
+                return True
+
+            self._records.append(log_record)
+            return self._batch_size <= len(self._records)
+
+    def take(self):
+        """Returns the records and the number of records dropped, emptying
+
+        the buffer.
+        """
+        with self._lock:
+            records = list(self._records)
+            self._records.clear()
+            dropped, self._dropped = self._dropped, 0
+        return records, dropped
+
+
 class DebugLoggingThread(metaclass=Singleton):
-    """Debug Logging Thread."""
+    """Debug Logging Thread.
+
+    Records are buffered in the process logging them and flushed in batches
+    to the debug logging thread, which may be in a parent process.  Error
+    records are flushed straight away, and the records left are logged
+    before the process exits.
+    """
+
+    FLUSH_INTERVAL_IN_SECS = 0.1
+    EXIT_FLUSH_TIMEOUT_IN_SECS = 2
 
     def __init__(self):
         self._handlers = []
         self._log_queue = multiprocessing.Queue()
+        self._pid = os.getpid()
+        self._sync_ids = itertools.count()
+        self._sync_events = {}
         self._thread = threading.Thread(target=self._receive_logs)
         self._thread.daemon = True
         self._thread.start()
+        self._dropped = 0
+        self._reset_buffer()
+        os.register_at_fork(after_in_child=self._reset_buffer)
+        atexit.register(self.flush, self.EXIT_FLUSH_TIMEOUT_IN_SECS)
+
+    def _reset_buffer(self):
+        """Start with an empty buffer, the flusher is started on first use
+
+        as it does not survive a fork.
+        """
+        self._buffer = DebugLogBuffer()
+        self._flush_event = threading.Event()
+        self._flusher = None
+
+    @property
+    def dropped(self):
+        """Returns the number of log records dropped."""
+
+        return self._dropped + self._buffer.dropped
 
     def send_log_record(self, log_record):
         """Send a log record to debug logging thread."""
 
-        self._log_queue.put_nowait(["log-record", log_record])
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_logs)
+            self._flusher.daemon = True
+            self._flusher.start()
+
+        if self._buffer.add(log_record):
+            self._flush_event.set()
+
+        if logging.ERROR <= log_record.levelno:
+            self.flush()
+
+    def flush(self, timeout_in_secs=None):
+        """Send the buffered log records to the debug logging thread, if a
+
+        timeout is given wait up to that long for the debug logging thread
+        of this process to log them.
+        """
+        records, dropped = self._buffer.take()
+        if records or dropped:
+            self._dropped += dropped
+            self._log_queue.put_nowait(["log-records", (records, dropped)])
+
+        if timeout_in_secs is not None and os.getpid() == self._pid:
+            sync_id = next(self._sync_ids)
+            logged = threading.Event()
+            self._sync_events[sync_id] = logged
+            self._log_queue.put_nowait(["log-sync", sync_id])
+            logged.wait(timeout_in_secs)
+            self._sync_events.pop(sync_id, None)
+
+    def _flush_logs(self):
+        """Flush the buffered log records periodically or when a batch is
+
+        ready.
+        """
+        flush_event = self._flush_event
+        while True:
+            flush_event.wait(self.FLUSH_INTERVAL_IN_SECS)
+            flush_event.clear()
+            self.flush()
 
     def send_log_config(self, config):
         """Send log configuration to debug logging thread."""
 
         self._log_queue.put_nowait(["log-config", config])
 
+    def _emit_log_record(self, log_record):
+        """Emit a log record to the handlers."""
+
+        for handler in self._handlers:
+            if hasattr(handler, "is_stdout"):
+                try:
+                    date_time = log_record.asctime
+                    text = str(log_record.formatted_log)
+                    text = text.split("[", 1)[-1]
+                    text = text.split(":", 1)[-1]
+                    log_record.formatted_log = date_time + " " + text
+                except Exception:
+                    pass
+
+            handler.emit(log_record)
+
+    def _emit_dropped(self, dropped):
+        """Emit a log of the number of records dropped."""
+
+        log_record = logging.makeLogRecord(
+            {"levelno": logging.WARNING, "levelname": "WARNING"}
+        )
+        log_record.formatted_log = "Debug logging overloaded, %d logs dropped." % (
+            dropped
+        )
+        self._emit_log_record(log_record)
+
     def _receive_logs(self):
         """Receive log records sent to the debug logging thread."""
 
@@ -56,19 +201,19 @@ class DebugLoggingThread(metaclass=Singleton):
                     action, work = log_work
 
                     if "log-record" == action:
-                        if self._handlers:
-                            for handler in self._handlers:
-                                if hasattr(handler, "is_stdout"):
-                                    try:
-                                        date_time = work.asctime
-                                        text = str(work.formatted_log)
-                                        text = text.split("[", 1)[-1]
-                                        text = text.split(":", 1)[-1]
-                                        work.formatted_log = date_time + " " + text
-                                    except Exception:
-                                        pass
-
-                                handler.emit(work)
+                        self._emit_log_record(work)
+
+                    elif "log-records" == action:
+                        records, dropped = work
+                        for log_record in records:
+                            self._emit_log_record(log_record)
+                        if dropped:
+                            self._emit_dropped(dropped)
+
+                    elif "log-sync" == action:
+                        logged = self._sync_events.get(work, None)
+                        if logged is not None:
+                            logged.set()
 
                     elif "log-config" == action:
                         if self._handlers:
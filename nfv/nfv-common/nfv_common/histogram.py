@@ -4,18 +4,54 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import array
+import collections
 import datetime
+import json
 import math
+import os
+import time
 
 from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import coroutine
+from nfv_common.helpers import Singleton
 
 DLOG = debug.debug_get_logger("nfv_common.histogram")
 
 
+class HistogramExportFormat(Constants, metaclass=Singleton):
+    """Histogram Export Format Constants."""
+
+    JSON = Constant("json")
+    OPENMETRICS = Constant("openmetrics")
+
+
+# Constant Instantiation
+HISTOGRAM_EXPORT_FORMAT = HistogramExportFormat()
+
+HISTOGRAM_NUM_BUCKETS = 16
+HISTOGRAM_QUANTILES = (50, 90, 99)
+HISTOGRAM_WINDOW_SLICES = 10
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class HistogramSlice:
+    """Samples added to a histogram during one slice of its time window."""
+
+    def __init__(self, start, num_counts):
+        self.start = start
+        self.counts = array.array("L", [0] * num_counts)
+        self.num_samples = 0
+        self.sample_total = 0
+        self.max_sample = -1
+
+
 class Histogram:
     """Histogram Object."""
 
-    def __init__(self, name, num_buckets, units):
+    def __init__(self, name, num_buckets, units, sub_buckets=1, window_secs=0):
         self._name = name
         self._units = units
         self._num_buckets = num_buckets
@@ -27,6 +63,16 @@ class Histogram:
         self._max_sample = -1
         self._max_sample_date = None
         self._buckets = array.array("L", [0] * num_buckets)
+        # Power of two buckets are split into linear sub-buckets to give
+        # finer quantile estimates.
+        self._sub_buckets = max(1, int(sub_buckets))
+        self._sub_bucket_counts = None
+        if 1 < self._sub_buckets:
+            self._sub_bucket_counts = array.array(
+                "L", [0] * num_buckets * self._sub_buckets
+            )
+        self._window_secs = window_secs
+        self._window = collections.deque()
 
     @property
     def name(self):
@@ -34,6 +80,68 @@ class Histogram:
 
         return self._name
 
+    def _count_index(self, bucket_idx, sample_as_int):
+        """Returns the index of the sub-bucket the sample falls in."""
+
+        if 1 == self._sub_buckets:
+            return bucket_idx
+
+        if 0 == bucket_idx:
+            sub_bucket_idx = min(max(sample_as_int, 0), 1) * (self._sub_buckets - 1)
+        else:
+            # The bucket holds the samples above 2^(idx-1) up to 2^idx.
+            width = 1 << (bucket_idx - 1)
+            offset = max(sample_as_int - width - 1, 0)
+            sub_bucket_idx = min(
+                (offset * self._sub_buckets) // width, self._sub_buckets - 1
+            )
+        return bucket_idx * self._sub_buckets + sub_bucket_idx
+
+    def _count_bounds(self, count_idx, max_sample):
+        """Returns the range of samples counted by a (sub-)bucket."""
+
+        bucket_idx, sub_bucket_idx = divmod(count_idx, self._sub_buckets)
+        if 0 == bucket_idx:
+            lower, upper = 0, 1
+        else:
+            lower, upper = 1 << (bucket_idx - 1), 1 << bucket_idx
+
+        width = (upper - lower) / self._sub_buckets
+        sub_lower = lower + width * sub_bucket_idx
+        sub_upper = sub_lower + width
+        if (
+            self._num_buckets - 1 == bucket_idx
+            and self._sub_buckets - 1 == sub_bucket_idx
+        ):
+            # The last bucket also counts the samples that are too big.
+            sub_upper = max(sub_upper, max_sample)
+        return sub_lower, sub_upper
+
+    def _expire_window(self, now):
+        """Drop the slices that have moved out of the time window."""
+
+        while self._window and self._window_secs <= now - self._window[0].start:
+            self._window.popleft()
+
+    def _add_window_data(self, count_idx, sample_as_int):
+        """Add a sample to the current slice of the time window."""
+
+        now = time.monotonic()
+        self._expire_window(now)
+
+        slice_secs = self._window_secs / HISTOGRAM_WINDOW_SLICES
+        if not self._window or slice_secs <= now - self._window[-1].start:
+            self._window.append(
+                HistogramSlice(now, self._num_buckets * self._sub_buckets)
+            )
+
+        window_slice = self._window[-1]
+        window_slice.counts[count_idx] += 1
+        window_slice.num_samples += 1
+        window_slice.sample_total += sample_as_int
+        if sample_as_int > window_slice.max_sample:
+            window_slice.max_sample = sample_as_int
+
     def add_data(self, sample):
         """Convert data given to the nearest power of two."""
 
@@ -43,7 +151,7 @@ class Histogram:
         else:
             bucket_idx = (sample_as_int - 1).bit_length()
 
-        if bucket_idx > self._num_buckets:
+        if bucket_idx >= self._num_buckets:
             bucket_idx = self._num_buckets - 1
 
         if sample_as_int > self._max_sample:
@@ -56,6 +164,13 @@ class Histogram:
 
         self._buckets[bucket_idx] += 1
 
+        count_idx = self._count_index(bucket_idx, sample_as_int)
+        if self._sub_bucket_counts is not None:
+            self._sub_bucket_counts[count_idx] += 1
+
+        if self._window_secs:
+            self._add_window_data(count_idx, sample_as_int)
+
     def reset_data(self):
         """Clear out the collected samples."""
 
@@ -67,6 +182,110 @@ class Histogram:
         self._max_sample_date = None
         for idx, _ in enumerate(self._buckets):
             self._buckets[idx] = 0
+        if self._sub_bucket_counts is not None:
+            for idx, _ in enumerate(self._sub_bucket_counts):
+                self._sub_bucket_counts[idx] = 0
+        self._window.clear()
+
+    def _quantile(self, counts, num_samples, max_sample, quantile):
+        """Estimate a quantile by interpolating within the (sub-)bucket it
+
+        falls in, returns None if there are no samples.
+        """
+        if 0 == num_samples:
+            return None
+
+        rank = num_samples * quantile / 100.0
+        samples_below = 0
+        for count_idx, count in enumerate(counts):
+            if count and samples_below + count >= rank:
+                lower, upper = self._count_bounds(count_idx, max_sample)
+                # No sample is above the biggest one seen.
+                upper = max(min(upper, max_sample), lower)
+                sample = lower + (upper - lower) * (rank - samples_below) / count
+                return round(sample, 2)
+            samples_below += count
+        return max_sample
+
+    def quantile(self, quantile):
+        """Returns an estimate of a quantile (0-100) of the samples."""
+
+        if self._sub_bucket_counts is not None:
+            counts = self._sub_bucket_counts
+        else:
+            counts = self._buckets
+        return self._quantile(counts, self._num_samples, self._max_sample, quantile)
+
+    def _window_data(self, quantiles):
+        """Returns the samples added over the time window."""
+
+        self._expire_window(time.monotonic())
+
+        counts = array.array("L", [0] * self._num_buckets * self._sub_buckets)
+        num_samples = 0
+        sample_total = 0
+        max_sample = -1
+        for window_slice in self._window:
+            for count_idx, count in enumerate(window_slice.counts):
+                counts[count_idx] += count
+            num_samples += window_slice.num_samples
+            sample_total += window_slice.sample_total
+            max_sample = max(max_sample, window_slice.max_sample)
+
+        average_sample = None
+        if num_samples:
+            average_sample = sample_total // num_samples
+
+        return {
+            "secs": self._window_secs,
+            "total": num_samples,
+            "sum": sample_total,
+            "avg": average_sample,
+            "max": max_sample if num_samples else None,
+            "quantiles": dict(
+                (
+                    "p%s" % quantile,
+                    self._quantile(counts, num_samples, max_sample, quantile),
+                )
+                for quantile in quantiles
+            ),
+        }
+
+    def get_data(self, quantiles=HISTOGRAM_QUANTILES):
+        """Returns the histogram data in a form that can be serialized."""
+
+        buckets = []
+        for idx, bucket_value in enumerate(self._buckets):
+            if self._num_buckets - 1 == idx:
+                upper = "+Inf"
+            else:
+                upper = 1 << idx
+            buckets.append([upper, bucket_value])
+
+        data = {
+            "name": self._name,
+            "units": self._units,
+            "created_date": str(self._created_date),
+            "reset_date": str(self._reset_date),
+            "total": self._num_samples,
+            "sum": self._sample_total,
+            "avg": self._average_sample,
+            "max": self._max_sample if self._num_samples else None,
+            "max_date": None,
+            "buckets": buckets,
+            "quantiles": dict(
+                ("p%s" % quantile, self.quantile(quantile)) for quantile in quantiles
+            ),
+            "window": None,
+        }
+
+        if self._max_sample_date is not None:
+            data["max_date"] = str(self._max_sample_date)
+
+        if self._window_secs:
+            data["window"] = self._window_data(quantiles)
+
+        return data
 
     @staticmethod
     def _scale_sample(scale_min, scale_max, sample_min, sample_max, sample):
@@ -105,6 +324,10 @@ class Histogram:
                     self._max_sample_date,
                 )
 
+            if 0 < self._num_samples:
+                for quantile in HISTOGRAM_QUANTILES:
+                    values_str += "  p%s: %s" % (quantile, self.quantile(quantile))
+
             DLOG.info("%s" % "-" * 120)
 
         DLOG.info("Histogram: %s" % self._name)
@@ -143,6 +366,12 @@ class Histogram:
 
 
 _histograms = {}
+_sub_buckets = 1
+_window_secs = 0
+_process_name = None
+_export_dir = None
+_export_format = HISTOGRAM_EXPORT_FORMAT.JSON
+_export_timer_id = None
 
 
 def _find_histogram(name):
@@ -160,7 +389,9 @@ def add_histogram_data(name, sample, units):
 
     histogram = _find_histogram(name)
     if histogram is None:
-        histogram = Histogram(name, 16, units)
+        histogram = Histogram(
+            name, HISTOGRAM_NUM_BUCKETS, units, _sub_buckets, _window_secs
+        )
         _histograms[name] = histogram
 
     histogram.add_data(sample)
@@ -188,3 +419,171 @@ def display_histogram_data(name=None, pretty_format=True):
         histogram = _find_histogram(name)
         if histogram is not None:
             histogram.display_data(pretty_format)
+
+
+def get_histogram_data(name=None):
+    """Returns the data of the histograms in a form that can be serialized."""
+
+    if name is None:
+        histograms = list(_histograms.values())
+    else:
+        histograms = [x for x in [_find_histogram(name)] if x is not None]
+
+    histogram_data = []
+    for histogram in histograms:
+        data = histogram.get_data()
+        data["process"] = _process_name
+        histogram_data.append(data)
+    return histogram_data
+
+
+def histogram_data_to_json(histogram_data):
+    """Returns histogram data as a JSON document."""
+
+    return json.dumps({"histograms": histogram_data}, indent=2, sort_keys=True)
+
+
+def _openmetrics_labels(data, **labels):
+    """Returns the OpenMetrics labels of a histogram."""
+
+    label_values = [("name", data["name"]), ("units", data["units"])]
+    if data.get("process", None) is not None:
+        label_values.append(("process", data["process"]))
+    label_values.extend(sorted(labels.items()))
+
+    label_strs = []
+    for label, value in label_values:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        label_strs.append('%s="%s"' % (label, value.replace("\n", "\\n")))
+    return "{%s}" % ",".join(label_strs)
+
+
+def histogram_data_to_openmetrics(histogram_data):
+    """Returns histogram data in the OpenMetrics text format, the histograms
+
+    are a single metric family labelled with the histogram name so that
+    names do not need to be mangled into metric names.
+    """
+    lines = ["# TYPE nfv_histogram histogram"]
+    for data in histogram_data:
+        cumulative = 0
+        for upper, bucket_value in data["buckets"]:
+            cumulative += bucket_value
+            lines.append(
+                "nfv_histogram_bucket%s %d"
+                % (_openmetrics_labels(data, le=upper), cumulative)
+            )
+        labels = _openmetrics_labels(data)
+        lines.append("nfv_histogram_count%s %d" % (labels, data["total"]))
+        lines.append("nfv_histogram_sum%s %d" % (labels, data["sum"]))
+
+    lines.append("# TYPE nfv_histogram_quantile gauge")
+    for data in histogram_data:
+        series = [("lifetime", data["quantiles"])]
+        if data["window"] is not None:
+            series.append(("%ss" % data["window"]["secs"], data["window"]["quantiles"]))
+
+        for window, quantiles in series:
+            for quantile, value in sorted(quantiles.items()):
+                if value is not None:
+                    labels = _openmetrics_labels(
+                        data, quantile=int(quantile[1:]) / 100.0, window=window
+                    )
+                    lines.append("nfv_histogram_quantile%s %s" % (labels, value))
+
+    lines.append("# TYPE nfv_histogram_max gauge")
+    for data in histogram_data:
+        if data["max"] is not None:
+            labels = _openmetrics_labels(data)
+            lines.append("nfv_histogram_max%s %d" % (labels, data["max"]))
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def export_histogram_data(export_dir=None, export_format=None):
+    """Write the histogram data to a file in the export directory, the file
+
+    is replaced atomically so that it can be read at any time.  Returns the
+    name of the file written or None.
+    """
+    export_dir = export_dir or _export_dir
+    export_format = export_format or _export_format
+    if not export_dir:
+        return None
+
+    histogram_data = get_histogram_data()
+    if HISTOGRAM_EXPORT_FORMAT.OPENMETRICS == export_format:
+        text = histogram_data_to_openmetrics(histogram_data)
+        extension = "prom"
+    else:
+        text = histogram_data_to_json(histogram_data)
+        extension = "json"
+
+    process_name = (_process_name or "process").lower()
+    filename = os.path.join(
+        export_dir, "nfv-%s-histograms.%s" % (process_name, extension)
+    )
+    try:
+        with open(filename + ".tmp", "w") as f:
+            f.write(text)
+        os.replace(filename + ".tmp", filename)
+
+    except OSError as e:
+        DLOG.error("Failed to export histograms to %s, error=%s." % (filename, e))
+        return None
+
+    return filename
+
+
+@coroutine
+def _export_histogram_data_timeout():
+    """Export the histogram data periodically."""
+
+    while True:
+        (yield)
+        export_histogram_data()
+
+
+def histogram_initialize(config=None, process_name=None):
+    """Initialize the histogram module, the timers must be initialized
+
+    for periodic exports.
+    """
+    from nfv_common import timers
+
+    global _sub_buckets, _window_secs, _process_name
+    global _export_dir, _export_format, _export_timer_id
+
+    _process_name = process_name
+    if config is None:
+        return
+
+    _sub_buckets = int(config.get("sub_buckets", 1))
+    _window_secs = int(config.get("window_secs", 0))
+    _export_dir = config.get("export_dir", None)
+    _export_format = config.get("export_format", HISTOGRAM_EXPORT_FORMAT.JSON)
+    if _export_format not in HISTOGRAM_EXPORT_FORMAT:
+        DLOG.error("Unknown histogram export format %s." % _export_format)
+        _export_format = HISTOGRAM_EXPORT_FORMAT.JSON
+
+    export_interval_secs = int(config.get("export_interval_secs", 0))
+    if _export_dir and 0 < export_interval_secs:
+        _export_timer_id = timers.timers_create_timer(
+            "histogram-export",
+            export_interval_secs,
+            export_interval_secs,
+            _export_histogram_data_timeout,
+        )
+
+
+def histogram_finalize():
+    """Finalize the histogram module."""
+
+    from nfv_common import timers
+
+    global _export_timer_id
+
+    if _export_timer_id is not None:
+        timers.timers_delete_timer(_export_timer_id)
+        _export_timer_id = None
@@ -3,6 +3,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
+import os
+import sys
+import threading
+import time
+
 from nfv_common import debug
 
 DLOG = debug.debug_get_logger("nfv_common.profiler")
@@ -47,9 +53,318 @@ def profile_memory_dump():
         DLOG.info("%s" % "-" * 120)
 
 
-def profiler_initialize():
+class DispatchStats:
+    """CPU and wall time spent dispatching a callback or coroutine."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cpu_secs = 0.0
+        self.self_cpu_secs = 0.0
+        self.wall_secs = 0.0
+        self.max_wall_secs = 0.0
+
+
+class SamplingProfiler:
+    """Sampling Profiler.
+
+    Samples the stack of a thread at a fixed rate from a background thread,
+    each sample is prefixed with the dispatches (timer, selection object
+    callback or task) in progress so that samples can be attributed to what
+    the main loop was running.
+    """
+
+    MAX_STACK_DEPTH = 64
+
+    def __init__(self, sampling_rate_hz, thread_id=None):
+        self._interval_secs = 1.0 / sampling_rate_hz
+        self._sampling_rate_hz = sampling_rate_hz
+        if thread_id is None:
+            thread_id = threading.main_thread().ident
+        self._thread_id = thread_id
+        self._frame_names = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.reset()
+
+    @property
+    def running(self):
+        """Returns true if samples are being taken."""
+
+        return self._thread is not None
+
+    def reset(self):
+        """Clear out the samples and dispatch statistics."""
+
+        with self._lock:
+            self._start_time = time.monotonic()
+            self._num_samples = 0
+            self._stacks = collections.Counter()
+            self._dispatch_stats = collections.defaultdict(DispatchStats)
+
+    def _samples(self):
+        """Returns a copy of the samples taken, the start time and the
+
+        number of samples, safe to use while samples are being taken.
+        """
+        with self._lock:
+            return self._stacks.copy(), self._start_time, self._num_samples
+
+    def start(self):
+        """Start sampling."""
+
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sampling-profiler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Take samples until stopped."""
+
+        while not self._stop_event.wait(self._interval_secs):
+            self.sample()
+
+    def _frame_name(self, code):
+        """Returns the name of a frame in the collapsed stacks."""
+
+        name = self._frame_names.get(code, None)
+        if name is None:
+            name = "%s:%s" % (os.path.basename(code.co_filename), code.co_name)
+            self._frame_names[code] = name
+        return name
+
+    def sample(self):
+        """Take a sample of the stack of the thread being profiled."""
+
+        frame = sys._current_frames().get(self._thread_id, None)
+        if frame is None:
+            return
+
+        frames = []
+        while frame is not None and len(frames) < self.MAX_STACK_DEPTH:
+            frames.append(self._frame_name(frame.f_code))
+            frame = frame.f_back
+        frames.reverse()
+
+        labels = [_dispatch_label(x) for x in list(_dispatches)] or ["main-loop"]
+        stack = ";".join(labels + frames)
+        with self._lock:
+            self._stacks[stack] += 1
+            self._num_samples += 1
+
+    def record_dispatch(self, label, wall_secs, cpu_secs, self_cpu_secs):
+        """Record the time spent dispatching a callback or coroutine."""
+
+        stats = self._dispatch_stats[label]
+        stats.calls += 1
+        stats.cpu_secs += cpu_secs
+        stats.self_cpu_secs += self_cpu_secs
+        stats.wall_secs += wall_secs
+        if wall_secs > stats.max_wall_secs:
+            stats.max_wall_secs = wall_secs
+
+    def collapsed_stacks(self):
+        """Returns the samples as collapsed stacks, one stack per line with
+
+        its frames separated by semicolons followed by the number of samples,
+        as taken by flamegraph tools.
+        """
+        stacks, _, _ = self._samples()
+        lines = ["%s %d" % (stack, count) for stack, count in stacks.items()]
+        lines.sort()
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def report(self, top_n=20):
+        """Returns the top dispatches by CPU time and the top functions and
+
+        stacks by samples.
+        """
+        stacks, start_time, total_samples = self._samples()
+        duration_secs = time.monotonic() - start_time
+        num_samples = max(total_samples, 1)
+        lines = [
+            "Profile: %.1f secs, %d samples at %d Hz."
+            % (duration_secs, total_samples, self._sampling_rate_hz),
+            "",
+            "%-60s %8s %10s %10s %10s %12s"
+            % ("dispatch", "calls", "cpu-secs", "self-cpu", "wall-secs", "max-wall-ms"),
+        ]
+        dispatch_stats = sorted(
+            self._dispatch_stats.items(), key=lambda x: x[1].self_cpu_secs, reverse=True
+        )
+        for label, stats in dispatch_stats[:top_n]:
+            lines.append(
+                "%-60s %8d %10.3f %10.3f %10.3f %12.1f"
+                % (
+                    label[:60],
+                    stats.calls,
+                    stats.cpu_secs,
+                    stats.self_cpu_secs,
+                    stats.wall_secs,
+                    stats.max_wall_secs * 1000,
+                )
+            )
+
+        # A function is on cpu (or blocked) in the samples where it is the
+        # innermost frame.
+        functions = collections.Counter()
+        for stack, count in stacks.items():
+            functions[stack.rsplit(";", 1)[-1]] += count
+
+        lines.extend(["", "%8s %6s  %s" % ("samples", "pct", "function")])
+        for function, count in functions.most_common(top_n):
+            lines.append(
+                "%8d %5.1f%%  %s" % (count, count * 100.0 / num_samples, function)
+            )
+
+        lines.extend(["", "%8s %6s  %s" % ("samples", "pct", "stack")])
+        for stack, count in stacks.most_common(top_n):
+            lines.append(
+                "%8d %5.1f%%  %s" % (count, count * 100.0 / num_samples, stack)
+            )
+        return "\n".join(lines) + "\n"
+
+
+# Dispatches in progress on the main loop, outermost first, each entry is
+# [kind, name, wall start, cpu start, cpu of nested dispatches].
+_dispatches = []
+_profiler = None
+_config = {}
+_process_name = None
+
+
+def _dispatch_label(dispatch):
+    """Returns the label of a dispatch."""
+
+    return "%s: %s" % (dispatch[0], dispatch[1])
+
+
+def profile_dispatch_begin(kind, name):
+    """Mark the start of the dispatch of a callback or coroutine by the
+
+    main loop, must be paired with profile_dispatch_end.
+    """
+    if _profiler is None:
+        _dispatches.append([kind, name, None, None, 0.0])
+    else:
+        _dispatches.append([kind, name, time.monotonic(), time.thread_time(), 0.0])
+
+
+def profile_dispatch_end():
+    """Mark the end of the dispatch of a callback or coroutine."""
+
+    dispatch = _dispatches.pop()
+    if dispatch[2] is None or _profiler is None:
+        return
+
+    wall_secs = time.monotonic() - dispatch[2]
+    cpu_secs = time.thread_time() - dispatch[3]
+    if _dispatches:
+        _dispatches[-1][4] += cpu_secs
+    else:
+        slow_dispatch_ms = int(_config.get("slow_dispatch_ms", 0))
+        if 0 < slow_dispatch_ms <= wall_secs * 1000:
+            DLOG.info(
+                "Slow dispatch of %s, wall=%d ms, cpu=%d ms.",
+                _dispatch_label(dispatch),
+                wall_secs * 1000,
+                cpu_secs * 1000,
+            )
+    _profiler.record_dispatch(
+        _dispatch_label(dispatch), wall_secs, cpu_secs, cpu_secs - dispatch[4]
+    )
+
+
+def profile_sampling_start():
+    """Start the sampling profiler."""
+
+    global _profiler
+
+    if _profiler is None:
+        _profiler = SamplingProfiler(int(_config.get("sampling_rate_hz", 100)))
+        _profiler.start()
+        DLOG.info("Sampling profiler started.")
+
+
+def profile_sampling_dump():
+    """Write the collapsed stacks and report of the sampling profiler,
+
+    returns the names of the files written.
+    """
+    if _profiler is None:
+        return []
+
+    output_dir = _config.get("output_dir", "/tmp")
+    prefix = os.path.join(
+        output_dir, "nfv-%s-profile" % (_process_name or "process").lower()
+    )
+    outputs = [
+        (prefix + ".collapsed", _profiler.collapsed_stacks()),
+        (prefix + ".txt", _profiler.report(int(_config.get("top_n", 20)))),
+    ]
+
+    filenames = []
+    for filename, text in outputs:
+        try:
+            with open(filename, "w") as f:
+                f.write(text)
+            filenames.append(filename)
+
+        except OSError as e:
+            DLOG.error("Failed to write profile %s, error=%s." % (filename, e))
+
+    DLOG.info("Sampling profile written to %s." % ", ".join(filenames))
+    return filenames
+
+
+def profile_sampling_stop():
+    """Stop the sampling profiler, writing out what was sampled."""
+
+    global _profiler
+
+    if _profiler is not None:
+        _profiler.stop()
+        profile_sampling_dump()
+        _profiler = None
+        DLOG.info("Sampling profiler stopped.")
+
+
+def profile_sampling_toggle():
+    """Start the sampling profiler if stopped, stop it otherwise."""
+
+    if _profiler is None:
+        profile_sampling_start()
+    else:
+        profile_sampling_stop()
+
+
+def profile_sampling_reset():
+    """Clear out the samples taken by the sampling profiler."""
+
+    if _profiler is not None:
+        _profiler.reset()
+
+
+def profiler_initialize(config=None, process_name=None):
     """Profiler - Initialize."""
 
+    global _config, _process_name
+
+    _config = config or {}
+    _process_name = process_name
+    if _config.get("sampling", "false").lower() in ["true", "1"]:
+        profile_sampling_start()
+
     if memory_profiling is not None:
         DLOG.info("Memory Profiling Enabled")
         memory_profiling.setref()
@@ -57,3 +372,5 @@ def profiler_initialize():
 
 def profiler_finalize():
     """Profiler - Finalize."""
+
+    profile_sampling_stop()
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import multiprocessing
+import os
 import socket
 
 import queue as threading_queue
@@ -34,6 +35,48 @@ class ThreadQueue:
         except threading_queue.Empty:
             return None
 
+    def close(self):
+        self._send_socket.close()
+        self._receive_socket.close()
+
+
+class SelfPipeSignal:
+    """Selection object that becomes readable once signalled and stays
+
+    readable until cleared; repeated signals before a clear are coalesced.
+    """
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._signalled = False
+
+    @property
+    def selobj(self):
+        return self._read_fd
+
+    @property
+    def signalled(self):
+        return self._signalled
+
+    def signal(self):
+        if not self._signalled:
+            os.write(self._write_fd, b"\x00")
+            self._signalled = True
+
+    def clear(self):
+        if self._signalled:
+            try:
+                os.read(self._read_fd, 64)
+            except BlockingIOError:
+                pass
+            self._signalled = False
+
+    def close(self):
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
 
 class MultiprocessQueue:
     def __init__(self):
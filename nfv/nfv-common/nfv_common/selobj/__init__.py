@@ -1,14 +1,16 @@
 #
-# Copyright (c) 2015-2016 Wind River Systems, Inc.
+# Copyright (c) 2015-2016, 2026 Wind River Systems, Inc.
 #
 # SPDX-License-Identifier: Apache-2.0
 #
 from nfv_common.selobj._selobj_module import selobj_add_error_callback  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_add_read_obj  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_add_write_obj  # noqa: F401
+from nfv_common.selobj._selobj_module import SELOBJ_BACKEND  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_del_error_callback  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_del_read_obj  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_del_write_obj  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_dispatch  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_finalize  # noqa: F401
+from nfv_common.selobj._selobj_module import selobj_get_config  # noqa: F401
 from nfv_common.selobj._selobj_module import selobj_initialize  # noqa: F401
@@ -5,35 +5,104 @@
 #
 import errno
 import select
+import selectors
 import socket
 
 from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+from nfv_common import profiler
 
 DLOG = debug.debug_get_logger("nfv_common.selobj")
 
+
+class SelobjBackend(Constants, metaclass=Singleton):
+    """Selection Object Backend Constants."""
+
+    SELECT = Constant("select")
+    EPOLL = Constant("epoll")
+
+
+# Constant Instantiation
+SELOBJ_BACKEND = SelobjBackend()
+
+_config = None
+_selector = None
 _read_callbacks = {}
 _write_callbacks = {}
 _error_callbacks = {}
 
 
+def _selobj_fd(selobj):
+    """Returns the file descriptor number of a selection object."""
+
+    if isinstance(selobj, int):
+        return selobj
+    return int(selobj.fileno())
+
+
+def _selector_update(selobj):
+    """Update the events registered with the selector for a selection object
+
+    so that they match the read and write callbacks installed.
+    """
+    if _selector is None:
+        return
+
+    events = 0
+    if selobj in _read_callbacks:
+        events |= selectors.EVENT_READ
+    if selobj in _write_callbacks:
+        events |= selectors.EVENT_WRITE
+
+    try:
+        key = _selector.get_key(selobj)
+    except (KeyError, ValueError):
+        key = None
+
+    if key is None:
+        if not events:
+            return
+        try:
+            _selector.register(selobj, events)
+        except KeyError:
+            # The file descriptor was closed and reused without the previous
+            # selection object being removed, drop the stale registration.
+            stale_key = _selector.get_map()[_selobj_fd(selobj)]
+            DLOG.error(
+                "Selection object %s replaces stale selection object %s, fd=%s."
+                % (selobj, stale_key.fileobj, stale_key.fd)
+            )
+            _selector.unregister(stale_key.fileobj)
+            _read_callbacks.pop(stale_key.fileobj, None)
+            _write_callbacks.pop(stale_key.fileobj, None)
+            _error_callbacks.pop(stale_key.fileobj, None)
+            _selector.register(selobj, events)
+
+    elif not events:
+        _selector.unregister(selobj)
+
+    elif events != key.events:
+        _selector.modify(selobj, events)
+
+
 def selobj_add_read_obj(selobj, callback, *callback_args, **callback_kwargs):
     """Add read selection object, callback is a co-routine that is
 
     sent the selection object that has become readable.
     """
-    global _read_callbacks
-
     coroutine = callback(*callback_args, **callback_kwargs)
     _read_callbacks[selobj] = coroutine
+    _selector_update(selobj)
 
 
 def selobj_del_read_obj(selobj):
     """Delete read selection object."""
 
-    global _read_callbacks
-
-    if selobj in list(_read_callbacks):
+    if selobj in _read_callbacks:
         _read_callbacks.pop(selobj)
+        _selector_update(selobj)
 
 
 def selobj_add_write_obj(selobj, callback, *callback_args, **callback_kwargs):
@@ -41,19 +110,17 @@ def selobj_add_write_obj(selobj, callback, *callback_args, **callback_kwargs):
 
     sent the selection object that has become writeable.
     """
-    global _write_callbacks
-
     coroutine = callback(*callback_args, **callback_kwargs)
     _write_callbacks[selobj] = coroutine
+    _selector_update(selobj)
 
 
 def selobj_del_write_obj(selobj):
     """Delete write selection object."""
 
-    global _write_callbacks
-
-    if selobj in list(_write_callbacks):
+    if selobj in _write_callbacks:
         _write_callbacks.pop(selobj)
+        _selector_update(selobj)
 
 
 def selobj_add_error_callback(selobj, callback, *callback_args, **callback_kwargs):
@@ -61,8 +128,6 @@ def selobj_add_error_callback(selobj, callback, *callback_args, **callback_kwarg
 
     called when the selection object is in error.
     """
-    global _error_callbacks
-
     coroutine = callback(*callback_args, **callback_kwargs)
     _error_callbacks[selobj] = coroutine
 
@@ -70,72 +135,88 @@ def selobj_add_error_callback(selobj, callback, *callback_args, **callback_kwarg
 def selobj_del_error_callback(selobj):
     """Delete selection object error callback."""
 
-    global _error_callbacks
-
     if selobj in list(_error_callbacks):
         _error_callbacks.pop(selobj)
 
 
-def selobj_dispatch(timeout_in_ms):
-    """Dispatch selection objects that have become readable or writeable
+def _selobj_dispatch_callback(callbacks, selobj, callback_type):
+    """Send a selection object to its callback, removing the callback
 
-    within the given time period.
+    if the co-routine has finished.  Returns True if the callback was
+    removed.
     """
     from nfv_common import histogram
     from nfv_common import timers
 
-    global _read_callbacks, _write_callbacks, _error_callbacks
+    callback = callbacks.get(selobj, None)
+    if callback is None:
+        return False
+
+    removed = False
+    start_ms = timers.get_monotonic_timestamp_in_ms()
+    profiler.profile_dispatch_begin("selobj " + callback_type, callback.__name__)
+    try:
+        callback.send(selobj)
+    except (StopIteration, RuntimeError):
+        if callbacks.get(selobj, None) is callback:
+            callbacks.pop(selobj)
+            removed = True
+    finally:
+        profiler.profile_dispatch_end()
+    elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+    histogram.add_histogram_data(
+        "selobj %s: %s" % (callback_type, callback.__name__),
+        elapsed_ms // 100,
+        "decisecond",
+    )
+    return removed
+
+
+def _selobj_select(timeout_in_ms):
+    """Wait on the selection objects using select."""
 
     read_objs = list(_read_callbacks)
     write_objs = list(_write_callbacks)
 
+    return select.select(read_objs, write_objs, [], timeout_in_ms / 1000.0)
+
+
+def _selobj_epoll(timeout_in_ms):
+    """Wait on the selection objects registered with the selector."""
+
+    readable = []
+    writeable = []
+
+    for key, events in _selector.select(timeout_in_ms / 1000.0):
+        if events & selectors.EVENT_READ:
+            readable.append(key.fileobj)
+        if events & selectors.EVENT_WRITE:
+            writeable.append(key.fileobj)
+
+    return readable, writeable, []
+
+
+def selobj_dispatch(timeout_in_ms):
+    """Dispatch selection objects that have become readable or writeable
+
+    within the given time period.
+    """
     try:
-        readable, writeable, in_error = select.select(
-            read_objs, write_objs, [], timeout_in_ms / 1000.0
-        )
+        if _selector is None:
+            readable, writeable, in_error = _selobj_select(timeout_in_ms)
+        else:
+            readable, writeable, in_error = _selobj_epoll(timeout_in_ms)
 
         for selobj in readable:
-            callback = _read_callbacks.get(selobj, None)
-            if callback is not None:
-                start_ms = timers.get_monotonic_timestamp_in_ms()
-                try:
-                    callback.send(selobj)
-                except (StopIteration, RuntimeError):
-                    _read_callbacks.pop(selobj)
-                elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
-                histogram.add_histogram_data(
-                    "selobj read: " + callback.__name__, elapsed_ms // 100, "decisecond"
-                )
+            if _selobj_dispatch_callback(_read_callbacks, selobj, "read"):
+                _selector_update(selobj)
 
         for selobj in writeable:
-            callback = _write_callbacks.get(selobj, None)
-            if callback is not None:
-                start_ms = timers.get_monotonic_timestamp_in_ms()
-                try:
-                    callback.send(selobj)
-                except (StopIteration, RuntimeError):
-                    _write_callbacks.pop(selobj)
-                elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
-                histogram.add_histogram_data(
-                    "selobj write: " + callback.__name__,
-                    elapsed_ms // 100,
-                    "decisecond",
-                )
+            if _selobj_dispatch_callback(_write_callbacks, selobj, "write"):
+                _selector_update(selobj)
 
         for selobj in in_error:
-            callback = _error_callbacks.get(selobj, None)
-            if callback is not None:
-                start_ms = timers.get_monotonic_timestamp_in_ms()
-                try:
-                    callback.send(selobj)
-                except (StopIteration, RuntimeError):
-                    _error_callbacks.pop(selobj)
-                elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
-                histogram.add_histogram_data(
-                    "selobj error: " + callback.__name__,
-                    elapsed_ms // 100,
-                    "decisecond",
-                )
+            _selobj_dispatch_callback(_error_callbacks, selobj, "error")
 
             if selobj in list(_read_callbacks):
                 _read_callbacks.pop(selobj)
@@ -143,15 +224,46 @@ def selobj_dispatch(timeout_in_ms):
             if selobj in list(_write_callbacks):
                 _write_callbacks.pop(selobj)
 
+            _selector_update(selobj)
+
     except (OSError, socket.error, select.error) as e:
         if errno.EINTR == e.args[0]:
             pass
 
 
-def selobj_initialize():
+def selobj_get_config():
+    """Returns the configuration the selection object module was
+
+    initialized with.
+    """
+    return _config
+
+
+def selobj_initialize(config=None):
     """Initialize the selection object module."""
 
-    global _read_callbacks, _write_callbacks
+    global _config, _selector, _read_callbacks, _write_callbacks
+
+    _config = config
+
+    if _selector is not None:
+        # Only close the selector, an inherited epoll instance is shared
+        # with the parent process so registrations must not be touched.
+        _selector.close()
+        _selector = None
+
+    backend = SELOBJ_BACKEND.SELECT
+    if config is not None:
+        backend = config.get("backend", backend)
+
+    if SELOBJ_BACKEND.EPOLL == backend:
+        if hasattr(selectors, "EpollSelector"):
+            _selector = selectors.EpollSelector()
+        else:
+            DLOG.error("Selection object backend epoll is not supported.")
+
+    elif SELOBJ_BACKEND.SELECT != backend:
+        DLOG.error("Unknown selection object backend %s." % backend)
 
     del _read_callbacks
     _read_callbacks = {}  # noqa: F841
@@ -163,7 +275,11 @@ def selobj_initialize():
 def selobj_finalize():
     """Finalize the selection object module."""
 
-    global _read_callbacks, _write_callbacks
+    global _selector, _read_callbacks, _write_callbacks
+
+    if _selector is not None:
+        _selector.close()
+        _selector = None
 
     del _read_callbacks
     _read_callbacks = {}  # noqa: F841
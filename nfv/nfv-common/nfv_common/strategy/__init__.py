@@ -9,6 +9,7 @@ from nfv_common.strategy._strategy_defs import STRATEGY_ALARM_RESTRICTION_TYPES
 from nfv_common.strategy._strategy_defs import STRATEGY_APPLY_TYPE
 from nfv_common.strategy._strategy_defs import STRATEGY_PHASE
 from nfv_common.strategy._strategy_defs import STRATEGY_STATE
+from nfv_common.strategy._strategy_journal import StrategyJournal
 from nfv_common.strategy._strategy_phase import StrategyPhase
 from nfv_common.strategy._strategy_result import STRATEGY_PHASE_RESULT
 from nfv_common.strategy._strategy_result import STRATEGY_RESULT
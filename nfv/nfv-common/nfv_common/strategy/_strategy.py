@@ -54,6 +54,7 @@ class Strategy:
         apply_phase.strategy = self
         abort_phase.strategy = self
 
+        self._phases_as_dict = True
         self._phase = {}
         self._phase[STRATEGY_PHASE.BUILD] = build_phase
         self._phase[STRATEGY_PHASE.APPLY] = apply_phase
@@ -352,10 +353,10 @@ class Strategy:
 
         return handled
 
-    def phase_save(self):
+    def phase_save(self, phase, stage=None):
         """Strategy Phase Save."""
 
-        self.save()
+        self.save_progress(phase, stage)
 
     def phase_extend_timeout(self, phase):
         """Strategy Phase Extend Timeout."""
@@ -447,6 +448,13 @@ class Strategy:
     def save(self):
         """Strategy Save (can be overridden by child class)."""
 
+    def save_progress(self, phase, stage=None):
+        """Strategy Save Progress of a phase or of one of its stages (can be
+
+        overridden by child class).
+        """
+        self.save()
+
     def build(self):
         """Strategy Build (can be overridden by child class)."""
 
@@ -527,11 +535,23 @@ class Strategy:
             )
         else:
             data["current_phase_completion_percentage"] = 0
-        data["build_phase"] = self.build_phase.as_dict()
-        data["apply_phase"] = self.apply_phase.as_dict()
-        data["abort_phase"] = self.abort_phase.as_dict()
+        if self._phases_as_dict:
+            data["build_phase"] = self.build_phase.as_dict()
+            data["apply_phase"] = self.apply_phase.as_dict()
+            data["abort_phase"] = self.abort_phase.as_dict()
         return data
 
+    def as_state_dict(self):
+        """Represent the state of the strategy, without its phases, as a
+
+        dictionary.
+        """
+        self._phases_as_dict = False
+        try:
+            return self.as_dict()
+        finally:
+            self._phases_as_dict = True
+
     def as_json(self):
         """Represent the strategy as json."""
 
@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+
+
+class StrategyJournal:
+    """Strategy Journal.
+
+    Records the progress of a strategy as deltas against its last snapshot.
+    A delta holds the state of the strategy, of the phase saved and of the
+    stages and steps of that phase which changed since they were last
+    recorded, so its size follows the size of the change and not the size
+    of the strategy.
+    """
+
+    def __init__(self):
+        self._shapes = None
+        self._recorded = {}
+        self._num_records = 0
+        self._record_bytes = 0
+        self._snapshot_bytes = 0
+
+    @property
+    def num_records(self):
+        """Returns the number of records since the last snapshot."""
+
+        return self._num_records
+
+    @property
+    def record_bytes(self):
+        """Returns the size of the records since the last snapshot."""
+
+        return self._record_bytes
+
+    @property
+    def snapshot_bytes(self):
+        """Returns the size of the last snapshot."""
+
+        return self._snapshot_bytes
+
+    @staticmethod
+    def _phase_shape(phase):
+        """Returns the shape of a phase, a phase whose shape changed had
+
+        stages or steps added or was replaced and can't be recorded as a
+        delta against the last snapshot.
+        """
+        return (id(phase), tuple(len(stage.steps) for stage in phase.stages))
+
+    def _strategy_shape(self, strategy):
+        """Returns the shape of a strategy."""
+
+        return (
+            id(strategy),
+            self._phase_shape(strategy.build_phase),
+            self._phase_shape(strategy.apply_phase),
+            self._phase_shape(strategy.abort_phase),
+        )
+
+    def _changed(self, key, data):
+        """Returns true if the data changed since it was last recorded."""
+
+        data_json = json.dumps(data, sort_keys=True)
+        if self._recorded.get(key, None) == data_json:
+            return False
+        self._recorded[key] = data_json
+        return True
+
+    def snapshot(self, strategy):
+        """Returns a snapshot of the strategy as json and restarts the
+
+        journal from it.
+        """
+        data = strategy.as_dict()
+        snapshot = json.dumps(data)
+
+        self._shapes = self._strategy_shape(strategy)
+        self._recorded.clear()
+        for key, value in data.items():
+            if key not in ["build_phase", "apply_phase", "abort_phase"]:
+                self._changed(("strategy", key), value)
+
+        for phase_key in ["build_phase", "apply_phase", "abort_phase"]:
+            phase_data = dict(data[phase_key])
+            phase_name = phase_data["name"]
+            for stage_data in phase_data.pop("stages"):
+                stage_data = dict(stage_data)
+                stage_id = stage_data["id"]
+                for step_data in stage_data.pop("steps"):
+                    self._changed((phase_name, stage_id, step_data["id"]), step_data)
+                self._changed((phase_name, stage_id), stage_data)
+            self._changed((phase_name,), phase_data)
+        self._num_records = 0
+        self._record_bytes = 0
+        self._snapshot_bytes = len(snapshot)
+        return snapshot
+
+    def record(self, strategy, phase, stage=None):
+        """Returns the changes made by the phase, or by the given stage of
+
+        the phase, as a json record. Returns an empty string if nothing
+        changed and None if a snapshot must be taken instead.
+        """
+        if self._shapes != self._strategy_shape(strategy):
+            return None
+
+        record = {}
+
+        strategy_data = {}
+        for key, value in strategy.as_state_dict().items():
+            if self._changed(("strategy", key), value):
+                strategy_data[key] = value
+        if strategy_data:
+            record["strategy"] = strategy_data
+
+        phase_data = {}
+        phase_state = phase.as_state_dict()
+        if self._changed((phase.name,), phase_state):
+            phase_data["phase"] = phase_state
+
+        if stage is None:
+            # The phase moved between stages, the stages it moved from and to
+            # saved their steps, only the current stage can have changed steps.
+            stages = phase.stages
+            current_stage = phase.current_stage
+        else:
+            stages = [stage]
+            current_stage = stage.id
+
+        stages_data = {}
+        for each_stage in stages:
+            stage_data = {}
+            stage_state = each_stage.as_state_dict()
+            if self._changed((phase.name, each_stage.id), stage_state):
+                stage_data["stage"] = stage_state
+
+            if each_stage.id == current_stage:
+                steps_data = {}
+                for step in each_stage.steps:
+                    step_state = step.as_dict()
+                    if self._changed((phase.name, each_stage.id, step.id), step_state):
+                        steps_data[str(step.id)] = step_state
+                if steps_data:
+                    stage_data["steps"] = steps_data
+
+            if stage_data:
+                stages_data[str(each_stage.id)] = stage_data
+
+        if stages_data:
+            phase_data["stages"] = stages_data
+        if phase_data:
+            record["phases"] = {phase.name: phase_data}
+
+        if not record:
+            return ""
+
+        record_json = json.dumps(record)
+        self._num_records += 1
+        self._record_bytes += len(record_json)
+        return record_json
+
+    def needs_compaction(self, max_records):
+        """Returns true if the records should be compacted into a snapshot,
+
+        either there are too many of them to replay or together they are
+        larger than the snapshot.
+        """
+        return (
+            max_records <= self._num_records
+            or self._snapshot_bytes < self._record_bytes
+        )
+
+    @staticmethod
+    def apply(data, record):
+        """Applies a record to the dictionary of a strategy snapshot."""
+
+        data.update(record.get("strategy", {}))
+        for phase_name, phase_data in record.get("phases", {}).items():
+            phase_dict = data[phase_name + "_phase"]
+            phase_dict.update(phase_data.get("phase", {}))
+            for stage_id, stage_data in phase_data.get("stages", {}).items():
+                stage_dict = phase_dict["stages"][int(stage_id)]
+                stage_dict.update(stage_data.get("stage", {}))
+                for step_id, step_data in stage_data.get("steps", {}).items():
+                    stage_dict["steps"][int(step_id)] = step_data
+        return data
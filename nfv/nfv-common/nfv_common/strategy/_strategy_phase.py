@@ -217,11 +217,11 @@ class StrategyPhase:
         stage.phase = self
         self._stages.append(stage)
 
-    def _save(self):
+    def _save(self, stage=None):
         """Phase Save."""
 
         if self.strategy is not None:
-            self.strategy.phase_save()  # pylint: disable=no-member
+            self.strategy.phase_save(self, stage)  # pylint: disable=no-member
         else:
             DLOG.info("Strategy reference is invalid for phase (%s)." % self._name)
 
@@ -481,10 +481,10 @@ class StrategyPhase:
         else:
             self.refresh_timeouts()
 
-    def stage_save(self):
+    def stage_save(self, stage=None):
         """Strategy Stage Save."""
 
-        self._save()
+        self._save(stage)
 
     def refresh_timeouts(self):
         """Phase Refresh Timeouts."""
@@ -620,9 +620,11 @@ class StrategyPhase:
 
         return self
 
-    def as_dict(self):
-        """Represent the strategy phase as a dictionary."""
+    def as_state_dict(self):
+        """Represent the state of the strategy phase, without its stages, as a
 
+        dictionary.
+        """
         data = {}
         data["name"] = self.name
         data["timeout"] = self._timeout_in_secs
@@ -631,12 +633,18 @@ class StrategyPhase:
         data["current_stage"] = self._current_stage
         data["stop_at_stage"] = self._stop_at_stage
         data["total_stages"] = len(self._stages)
-        data["stages"] = []
-        for stage in self._stages:
-            data["stages"].append(stage.as_dict())
         data["result"] = self._result
         data["result_reason"] = self._result_reason
         data["result_response"] = self._result_response
         data["start_date_time"] = self._start_date_time
         data["end_date_time"] = self._end_date_time
         return data
+
+    def as_dict(self):
+        """Represent the strategy phase as a dictionary."""
+
+        data = self.as_state_dict()
+        data["stages"] = []
+        for stage in self._stages:
+            data["stages"].append(stage.as_dict())
+        return data
@@ -196,7 +196,7 @@ class StrategyStage:
         import os
 
         if self.phase is not None:
-            self.phase.stage_save()
+            self.phase.stage_save(self)
         else:
             caller = inspect.currentframe().f_back
             _, filename = os.path.split(caller.f_code.co_filename)
@@ -588,9 +588,11 @@ class StrategyStage:
 
         return self
 
-    def as_dict(self):
-        """Represent the strategy stage as a dictionary."""
+    def as_state_dict(self):
+        """Represent the state of the strategy stage, without its steps, as a
 
+        dictionary.
+        """
         data = {}
         data["id"] = self._id
         data["name"] = self._name
@@ -599,11 +601,17 @@ class StrategyStage:
         data["inprogress"] = self._inprogress
         data["current_step"] = self._current_step
         data["total_steps"] = len(self._steps)
-        data["steps"] = []
-        for step in self._steps:
-            data["steps"].append(step.as_dict())
         data["result"] = self._result
         data["result_reason"] = self._result_reason
         data["start_date_time"] = self._start_date_time
         data["end_date_time"] = self._end_date_time
         return data
+
+    def as_dict(self):
+        """Represent the strategy stage as a dictionary."""
+
+        data = self.as_state_dict()
+        data["steps"] = []
+        for step in self._steps:
+            data["steps"].append(step.as_dict())
+        return data
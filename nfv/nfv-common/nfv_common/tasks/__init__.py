@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2015-2016 Wind River Systems, Inc.
+# Copyright (c) 2015-2016, 2026 Wind River Systems, Inc.
 #
 # SPDX-License-Identifier: Apache-2.0
 #
@@ -7,4 +7,5 @@ from nfv_common.tasks._task import Task  # noqa: F401
 from nfv_common.tasks._task import TASK_PRIORITY  # noqa: F401
 from nfv_common.tasks._task_future import TaskFuture  # noqa: F401
 from nfv_common.tasks._task_scheduler import TaskScheduler  # noqa: F401
+from nfv_common.tasks._task_worker_pool import TASK_WORKER_MODE  # noqa: F401
 from nfv_common.tasks._task_worker_pool import TaskWorkerPool  # noqa: F401
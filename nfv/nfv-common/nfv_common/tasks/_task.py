@@ -50,7 +50,8 @@ class Task:
         self._started = False
         self._target = target
         self._work_list = collections.OrderedDict()
-        DLOG.debug("Task created, id=%s, name=%s." % (self._id, self._name))
+        self._gathers = dict()
+        DLOG.debug("Task created, id=%s, name=%s.", self._id, self._name)
         Task._id += 1
 
     @property
@@ -138,22 +139,41 @@ class Task:
         self._work_list[task_work.id] = [Task._READY, task_work]
         return task_work
 
+    def add_task_work_gather(self, task_work_gather, task_works):
+        """Add a batch of work to be done by the task, the results of which
+
+        are sent to the task target together.
+        """
+        for task_work in task_works:
+            self.add_task_work(task_work)
+            self._gathers[task_work.id] = task_work_gather
+        return task_work_gather
+
     def task_work_complete(self, task_work):
         """Task work has been completed, send result to the task target
 
         (results are sent in order the task work was scheduled).
         """
-        DLOG.verbose("TaskWork complete, name=%s." % task_work.name)
+        DLOG.verbose("TaskWork complete, name=%s.", task_work.name)
 
         state, _ = self._work_list[task_work.id]
         if Task._TIMEOUT == state:
             DLOG.verbose(
                 "TaskWork already marked as timed out, ignoring "
-                "completed result, name=%s." % task_work.name
+                "completed result, name=%s.",
+                task_work.name,
             )
             self._scheduler.schedule_task(self)
             return
 
+        task_work_gather = self._gathers.pop(task_work.id, None)
+        if task_work_gather is not None:
+            self._work_list[task_work.id] = [Task._COMPLETED, task_work]
+            self._scheduler.schedule_task(self)
+            if task_work_gather.task_work_complete(task_work):
+                self._target.send(task_work_gather.result)
+            return
+
         self._work_list[task_work.id] = [Task._COMPLETE, task_work]
 
         # Following is used to order how the results are sent to the task
@@ -195,6 +215,14 @@ class Task:
             "Task(%s) work (%s) timed out, id=%s."
             % (self._name, task_work.name, self._id)
         )
+        task_work_gather = self._gathers.pop(task_work.id, None)
+        if task_work_gather is not None:
+            self._work_list[task_work.id] = [Task._TIMEOUT, task_work]
+            self._scheduler.schedule_task(self)
+            if task_work_gather.task_work_timeout(task_work):
+                self._target.send(task_work_gather.result)
+            return
+
         task_result = TaskResult(
             complete=False, result_data=None, ancillary_result_data=None
         )
@@ -205,15 +233,16 @@ class Task:
     def run(self):
         """Run the task."""
 
-        DLOG.debug("Task(%s) run, id=%s." % (self._name, self._id))
+        DLOG.debug("Task(%s) run, id=%s.", self._name, self._id)
         if not self._started:
             self._target.send(None)
             self._scheduler.reschedule_task(self)
             self._started = True
         else:
-            # Schedule work that is ready
+            # Schedule work that is ready, work that does not get a worker
+            # right away stays queued in the scheduler until one is available,
+            # so it must not be queued again the next time the task runs.
             for key, (state, task_work) in list(self._work_list.items()):
                 if Task._READY == state:
-                    scheduled = self._scheduler.schedule_task_work(task_work)
-                    if scheduled:
-                        self._work_list[task_work.id] = [Task._RUNNING, task_work]
+                    self._scheduler.schedule_task_work(task_work)
+                    self._work_list[task_work.id] = [Task._RUNNING, task_work]
@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import threading
+
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import selectable
+from nfv_common import timers
+
+DLOG = debug.debug_get_logger("nfv_common.tasks.task_executor_worker")
+
+
+class TaskExecutorWorker:
+    """Task Executor Worker.
+
+    A worker slot whose task work runs on a thread of an executor shared by
+    the pool, instead of in a dedicated worker process.  Task work is handed
+    over by reference, so nothing is pickled, and the completed task work is
+    signalled back to the scheduler through a selectable thread queue.
+    """
+
+    _id = 1
+
+    def __init__(self, name, pool_name, executor):
+        """Create a task executor worker."""
+
+        self._id = TaskExecutorWorker._id
+        self._name = name
+        self._pool_name = pool_name
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._busy = False
+        self._abandoned = False
+        self._result_queue = selectable.ThreadQueue("w")
+        TaskExecutorWorker._id += 1
+
+    @property
+    def id(self):
+        """Returns a unique identifier for this task worker."""
+
+        return self._id
+
+    @property
+    def name(self):
+        """Returns the name for this task worker."""
+
+        return self._name
+
+    @property
+    def selobj(self):
+        """Returns the selection object that signals when task work
+
+        is complete.
+        """
+        return self._result_queue.selobj
+
+    def _run_task_work(self, task_work, submit_timestamp_ms):
+        """Run task work on an executor thread."""
+
+        start_timestamp_ms = timers.get_monotonic_timestamp_in_ms()
+        task_work.run()
+        with self._lock:
+            self._busy = False
+            if self._abandoned:
+                self._result_queue.close()
+            else:
+                self._result_queue.put(
+                    (task_work, start_timestamp_ms - submit_timestamp_ms)
+                )
+
+    def start(self):
+        """Start the task worker, executor threads are started on demand."""
+
+        return
+
+    def stop(self, max_wait_in_seconds):
+        """Stop the task worker, running task work cannot be interrupted
+
+        so its result is discarded.
+        """
+        self.abandon()
+
+    def abandon(self):
+        """Abandon any task work in progress, its result is discarded."""
+
+        with self._lock:
+            if not self._abandoned:
+                self._abandoned = True
+                if not self._busy:
+                    self._result_queue.close()
+
+    def submit_task_work(self, task_work):
+        """Submit task work for this task worker to execute."""
+
+        with self._lock:
+            self._busy = True
+        self._executor.submit(
+            self._run_task_work, task_work, timers.get_monotonic_timestamp_in_ms()
+        )
+
+    def get_task_work_result(self):
+        """Returns the result of task work completed."""
+
+        entry = self._result_queue.get_nowait()
+        if entry is None:
+            return None
+
+        result, queue_wait_ms = entry
+
+        histogram.add_histogram_data(
+            self._pool_name + " [executor-wait]", queue_wait_ms // 100, "decisecond"
+        )
+
+        if hasattr(result.ancillary_result_data, "execution_time"):
+            histogram.add_histogram_data(
+                result.name + " [worker-execution-time]",
+                result.ancillary_result_data.execution_time,
+                "secs",
+            )
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        elapsed_secs = (now_ms - result.create_timestamp_ms) // 1000
+        histogram.add_histogram_data(
+            result.name + " [execution-time]", elapsed_secs, "secs"
+        )
+
+        return result
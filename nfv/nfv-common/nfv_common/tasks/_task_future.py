@@ -5,6 +5,7 @@
 #
 from nfv_common import debug
 from nfv_common.tasks._task_work import TaskWork
+from nfv_common.tasks._task_work import TaskWorkGather
 
 DLOG = debug.debug_get_logger("nfv_common.tasks.task_future")
 
@@ -28,8 +29,8 @@ class TaskFuture:
         """
         self._timeouts = timeouts
 
-    def work(self, target, *args, **kwargs):
-        """Schedule work in the future."""
+    def _timeout_in_secs(self, target, kwargs):
+        """Returns the timeout in seconds for work to be done."""
 
         timeout_in_secs = None
         if self._timeouts is not None:
@@ -73,6 +74,13 @@ class TaskFuture:
         if timeout_in_secs is not None:
             timeout_in_secs += 5
 
+        return timeout_in_secs
+
+    def work(self, target, *args, **kwargs):
+        """Schedule work in the future."""
+
+        timeout_in_secs = self._timeout_in_secs(target, kwargs)
+
         if self._scheduler.running_task is not None:
             task_work = TaskWork(timeout_in_secs, target, *args, **kwargs)
             self._scheduler.running_task.add_task_work(task_work)
@@ -80,6 +88,35 @@ class TaskFuture:
             return task_work.id
         raise LookupError("Running task no longer running")
 
+    def work_item(self, target, *args, **kwargs):
+        """Create work to be scheduled as part of a gather, the timeout of
+
+        the work item is found the same way as for work.
+        """
+        timeout_in_secs = self._timeout_in_secs(target, kwargs)
+        return TaskWork(timeout_in_secs, target, *args, **kwargs)
+
+    def gather(self, work_items):
+        """Schedule a batch of work items in the future, the work items run
+
+        in parallel on the available task workers and the task is sent a
+        single result once every work item has completed or timed out.  The
+        result data is the list of the work item results, in the order the
+        work items were given, a work item that raised an exception has its
+        exception as the error of its result.
+        """
+        if not work_items:
+            raise ValueError("No work items to gather")
+
+        if self._scheduler.running_task is not None:
+            task_work_gather = TaskWorkGather(work_items)
+            self._scheduler.running_task.add_task_work_gather(
+                task_work_gather, work_items
+            )
+            self._result = None
+            return task_work_gather.task_work_ids
+        raise LookupError("Running task no longer running")
+
     def timer(self, name, interval_secs):
         """Schedule a timer to be fired after so many milliseconds,
 
@@ -19,6 +19,7 @@ class TaskResult:
         selobj_result=False,
         result_data=None,
         ancillary_result_data=None,
+        error=None,
     ):
         """Create a task result."""
 
@@ -28,6 +29,7 @@ class TaskResult:
         self._selobj_result = selobj_result
         self._result_data = result_data
         self._ancillary_result_data = ancillary_result_data
+        self._error = error
 
     @property
     def ancillary_data(self):
@@ -41,6 +43,12 @@ class TaskResult:
 
         return self._result_data
 
+    @property
+    def error(self):
+        """Returns the exception raised by the task work, if any."""
+
+        return self._error
+
     def is_complete(self):
         """Indicates if the task result has been completed."""
 
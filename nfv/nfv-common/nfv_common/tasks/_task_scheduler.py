@@ -9,6 +9,7 @@ import inspect
 from nfv_common import debug
 from nfv_common.helpers import coroutine
 from nfv_common import histogram
+from nfv_common import profiler
 from nfv_common import selectable
 from nfv_common import selobj
 from nfv_common.tasks._task import Task
@@ -22,8 +23,11 @@ DLOG = debug.debug_get_logger("nfv_common.tasks.task_scheduler")
 class TaskScheduler:
     """Task Scheduler."""
 
-    def __init__(self, name, task_worker_pool):
-        """Create a task scheduler."""
+    def __init__(self, name, task_worker_pool, max_tasks_per_dispatch=32):
+        """Create a task scheduler, at most max_tasks_per_dispatch ready
+
+        tasks are run each time the scheduler is dispatched.
+        """
 
         self._name = name
         self._task_worker_pool = task_worker_pool
@@ -34,16 +38,39 @@ class TaskScheduler:
         self._task_work_timers = {}
         self._task_read_selobjs = {}
         self._task_write_selobjs = {}
+        # Reverse indexes of the resources owned by each task, and of the
+        # timer guarding each task work, so that teardown does not need to
+        # scan the resources of every task.
+        self._task_timer_ids = {}
+        self._task_work_timer_ids = {}
+        self._task_read_selobj_index = {}
+        self._task_write_selobj_index = {}
+        self._task_work_timer_id = {}
         self._running_task = None
-        self._tasks_scheduled = False
+        self._max_tasks_per_dispatch = max_tasks_per_dispatch
         self._wait_queue = collections.deque()
         self._ready_queue = []
         self._ready_dequeues = []
+        self._ready_task_ids = set()
         for _ in TASK_PRIORITY:
             self._ready_queue.append(collections.deque())
             self._ready_dequeues.append(0)
-        self._run_queue = selectable.MultiprocessQueue()
-        selobj.selobj_add_read_obj(self._run_queue.selobj, self.run_tasks)
+        self._run_signal = selectable.SelfPipeSignal()
+        selobj.selobj_add_read_obj(self._run_signal.selobj, self.run_tasks)
+        self._autoscale_timer_id = None
+        if task_worker_pool.max_workers > task_worker_pool.min_workers:
+            self._autoscale_timer_id = timers.timers_create_timer(
+                self._name + " autoscale", 1, 1, self.autoscale_task_worker_pool
+            )
+
+    def shutdown(self):
+        """Shutdown the scheduler, the task worker pool is no longer grown
+
+        or shrunk.
+        """
+        if self._autoscale_timer_id is not None:
+            timers.timers_delete_timer(self._autoscale_timer_id)
+            self._autoscale_timer_id = None
 
     @property
     def name(self):
@@ -57,6 +84,64 @@ class TaskScheduler:
 
         return self._running_task
 
+    @property
+    def stats(self):
+        """Returns a snapshot of the scheduler statistics."""
+
+        stats = {
+            "live-tasks": len(self._tasks),
+            "pending-task-work": len(self._wait_queue),
+            "running-task-work": len(self._workers_selobj),
+            "task-timers": len(self._task_timers),
+            "task-work-timers": len(self._task_work_timers),
+            "task-selobjs": len(self._task_read_selobjs)
+            + len(self._task_write_selobjs),
+        }
+        for pri in TASK_PRIORITY:
+            stats["ready-tasks-p%i" % pri] = len(self._ready_queue[pri])
+        return stats
+
+    def _record_stats(self):
+        """Record the scheduler statistics so that they are included in
+
+        the histogram dump.
+        """
+        stats = self.stats
+        for stat_name in ("live-tasks", "pending-task-work", "running-task-work"):
+            histogram.add_histogram_data(
+                self._name + " [%s]" % stat_name, stats[stat_name], "entries"
+            )
+
+    @staticmethod
+    def _index_add(index, task_id, key):
+        """Record that a task owns the given key."""
+
+        keys = index.get(task_id, None)
+        if keys is None:
+            keys = set()
+            index[task_id] = keys
+        keys.add(key)
+
+    @staticmethod
+    def _index_discard(index, task_id, key):
+        """Forget that a task owns the given key."""
+
+        keys = index.get(task_id, None)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[task_id]
+
+    def _delete_task_work_timer(self, timer_id):
+        """Delete the timer guarding task work."""
+
+        timers.timers_delete_timer(timer_id)
+        task_work = self._task_work_timers.pop(timer_id, None)
+        if task_work is not None:
+            self._task_work_timer_id.pop(task_work.id, None)
+            self._index_discard(self._task_work_timer_ids, task_work.task_id, timer_id)
+        self._workers_timer.pop(timer_id, None)
+
     def add_task(self, priority, target, *args, **kwargs):
         """Add a task to the task scheduler."""
 
@@ -64,7 +149,7 @@ class TaskScheduler:
             future = TaskFuture(self)
             task = Task(self, priority, target(future, *args, **kwargs))
             DLOG.debug(
-                "Pool %s: Add Task, name=%s." % (self._task_worker_pool.name, task.name)
+                "Pool %s: Add Task, name=%s.", self._task_worker_pool.name, task.name
             )
             self.schedule_task(task)
             result = task.id
@@ -76,27 +161,22 @@ class TaskScheduler:
         """Delete a task from the task scheduler."""
 
         DLOG.debug(
-            "Pool %s: Delete Task, name=%s." % (self._task_worker_pool.name, task.name)
+            "Pool %s: Delete Task, name=%s.", self._task_worker_pool.name, task.name
         )
-        for timer_id, timer_owner in list(self._task_timers.items()):
-            if timer_owner.id == task.id:
-                timers.timers_delete_timer(timer_id)
-                del self._task_timers[timer_id]
+        for timer_id in self._task_timer_ids.pop(task.id, set()):
+            timers.timers_delete_timer(timer_id)
+            del self._task_timers[timer_id]
 
-        for timer_id, timer_owner in list(self._task_work_timers.items()):
-            if timer_owner.task_id == task.id:
-                timers.timers_delete_timer(timer_id)
-                del self._task_work_timers[timer_id]
+        for timer_id in list(self._task_work_timer_ids.get(task.id, set())):
+            self._delete_task_work_timer(timer_id)
 
-        for select_obj, select_obj_owner in list(self._task_read_selobjs.items()):
-            if select_obj_owner.id == task.id:
-                selobj.selobj_del_read_obj(select_obj)
-                del self._task_read_selobjs[select_obj]
+        for select_obj in self._task_read_selobj_index.pop(task.id, set()):
+            selobj.selobj_del_read_obj(select_obj)
+            del self._task_read_selobjs[select_obj]
 
-        for select_obj, select_obj_owner in list(self._task_write_selobjs.items()):
-            if select_obj_owner.id == task.id:
-                selobj.selobj_del_write_obj(select_obj)
-                del self._task_write_selobjs[select_obj]
+        for select_obj in self._task_write_selobj_index.pop(task.id, set()):
+            selobj.selobj_del_write_obj(select_obj)
+            del self._task_write_selobjs[select_obj]
 
         del self._tasks[task.id]
 
@@ -107,6 +187,7 @@ class TaskScheduler:
             name, interval_secs, interval_secs, self.task_timer_timeout
         )
         self._task_timers[timer_id] = task
+        self._index_add(self._task_timer_ids, task.id, timer_id)
         return timer_id
 
     def cancel_task_timer(self, timer_id, task):
@@ -115,6 +196,7 @@ class TaskScheduler:
             if timer_owner.id == task.id:
                 timers.timers_delete_timer(timer_id)
                 del self._task_timers[timer_id]
+                self._index_discard(self._task_timer_ids, task.id, timer_id)
 
     @coroutine
     def task_timer_timeout(self):
@@ -135,7 +217,13 @@ class TaskScheduler:
         """Add a task read selection object to wait on."""
 
         selobj.selobj_add_read_obj(select_obj, self.task_io_wait_complete)
+        select_obj_owner = self._task_read_selobjs.get(select_obj, None)
+        if select_obj_owner is not None:
+            self._index_discard(
+                self._task_read_selobj_index, select_obj_owner.id, select_obj
+            )
         self._task_read_selobjs[select_obj] = task
+        self._index_add(self._task_read_selobj_index, task.id, select_obj)
 
     def cancel_task_io_read_wait(self, select_obj, task):
         """Cancel a task read selection object being waited on."""
@@ -145,12 +233,19 @@ class TaskScheduler:
             if select_obj_owner.id == task.id:
                 selobj.selobj_del_read_obj(select_obj)
                 del self._task_read_selobjs[select_obj]
+                self._index_discard(self._task_read_selobj_index, task.id, select_obj)
 
     def add_io_write_wait(self, select_obj, task):
         """Add a task write selection object to wait on."""
 
         selobj.selobj_add_write_obj(select_obj, self.task_io_wait_complete)
+        select_obj_owner = self._task_write_selobjs.get(select_obj, None)
+        if select_obj_owner is not None:
+            self._index_discard(
+                self._task_write_selobj_index, select_obj_owner.id, select_obj
+            )
         self._task_write_selobjs[select_obj] = task
+        self._index_add(self._task_write_selobj_index, task.id, select_obj)
 
     def cancel_io_write_wait(self, select_obj, task):
         """Cancel a task write selection object being waited on."""
@@ -160,6 +255,7 @@ class TaskScheduler:
             if select_obj_owner.id == task.id:
                 selobj.selobj_del_write_obj(select_obj)
                 del self._task_write_selobjs[select_obj]
+                self._index_discard(self._task_write_selobj_index, task.id, select_obj)
 
     @coroutine
     def task_io_wait_complete(self):
@@ -180,8 +276,12 @@ class TaskScheduler:
                 self.delete_task(task)
                 break
 
-    def _schedule_next_task(self):
-        """Schedule next task."""
+    def _next_task_id(self):
+        """Dequeue the next ready task, high priority tasks are favoured but
+
+        a medium priority task is run after every 60 high priority tasks
+        and a low priority task after every 60 medium priority tasks.
+        """
 
         task_id = None
 
@@ -217,22 +317,19 @@ class TaskScheduler:
                 self._ready_dequeues[TASK_PRIORITY.LOW] += 1
 
         if task_id is not None:
-            self._run_queue.put(task_id)
-            self._tasks_scheduled = True
+            self._ready_task_ids.discard(task_id)
+        return task_id
 
     def _schedule_task(self, task, reschedule=False):
         """Schedule or Reschedule a task."""
 
         DLOG.verbose(
-            "Pool %s: Scheduling Task, name=%s."
-            % (self._task_worker_pool.name, task.name)
+            "Pool %s: Scheduling Task, name=%s.", self._task_worker_pool.name, task.name
         )
         self._tasks[task.id] = task
 
-        for pri in TASK_PRIORITY:
-            if task.id in self._ready_queue[pri]:
-                break
-        else:
+        if task.id not in self._ready_task_ids:
+            self._ready_task_ids.add(task.id)
             if reschedule:
                 self._ready_queue[task.priority].append(task.id)
             else:
@@ -244,8 +341,7 @@ class TaskScheduler:
                 "ready-tasks",
             )
 
-        if not self._tasks_scheduled:
-            self._schedule_next_task()
+        self._run_signal.signal()
 
     def reschedule_task(self, task):
         """Reschedule a task."""
@@ -267,12 +363,25 @@ class TaskScheduler:
             return False
 
         worker = self._task_worker_pool.claim_worker()
+        if worker is None and self._autoscale_task_worker_pool():
+            worker = self._task_worker_pool.claim_worker()
+
         if worker is not None:
             task_work = self._wait_queue.pop()
 
+            queue_wait_ms = (
+                timers.get_monotonic_timestamp_in_ms() - task_work.create_timestamp_ms
+            )
+            histogram.add_histogram_data(
+                self._task_worker_pool.name + " [queue-wait]",
+                queue_wait_ms // 100,
+                "decisecond",
+            )
+
             DLOG.verbose(
-                "Pool %s: Task worker available to run TaskWork, "
-                "name=%s." % (self._task_worker_pool.name, task_work.name)
+                "Pool %s: Task worker available to run TaskWork, name=%s.",
+                self._task_worker_pool.name,
+                task_work.name,
             )
 
             selobj.selobj_add_read_obj(worker.selobj, self.task_work_complete)
@@ -287,14 +396,43 @@ class TaskScheduler:
                     self.task_work_timeout,
                 )
                 self._task_work_timers[timer_id] = task_work
+                self._task_work_timer_id[task_work.id] = timer_id
+                self._index_add(self._task_work_timer_ids, task_work.task_id, timer_id)
                 self._workers_timer[timer_id] = worker
             return True
         DLOG.verbose(
-            "Pool %s: No task worker available to run TaskWork."
-            % self._task_worker_pool.name
+            "Pool %s: No task worker available to run TaskWork.",
+            self._task_worker_pool.name,
         )
         return False
 
+    def _autoscale_task_worker_pool(self):
+        """Give the task worker pool the chance to grow based on the task
+
+        work waiting for a worker, returns true if the pool grew.
+        """
+        if not self._wait_queue:
+            return False
+
+        # The oldest task work is at the end of the wait queue.
+        queue_wait_ms = (
+            timers.get_monotonic_timestamp_in_ms()
+            - self._wait_queue[-1].create_timestamp_ms
+        )
+        return self._task_worker_pool.autoscale(len(self._wait_queue), queue_wait_ms)
+
+    @coroutine
+    def autoscale_task_worker_pool(self):
+        """Called periodically to grow the task worker pool when task work
+
+        has been waiting too long and to shrink it when workers are idle.
+        """
+        while True:
+            (yield)
+            self._task_worker_pool.shrink_idle_workers()
+            if self._autoscale_task_worker_pool():
+                self.schedule_task_work()
+
     @coroutine
     def task_work_complete(self):
         """A task worker has completed it's assigned work."""
@@ -304,16 +442,14 @@ class TaskScheduler:
             worker = self._workers_selobj.get(select_obj, None)
             if worker is not None:
                 self._task_worker_pool.release_worker(worker)
-                selobj.selobj_del_read_obj(worker.selobj)
-                del self._workers_selobj[worker.selobj]
+                selobj.selobj_del_read_obj(select_obj)
+                del self._workers_selobj[select_obj]
 
                 task_work = worker.get_task_work_result()
                 if task_work is not None:
-                    for timer_id, timer_owner in list(self._task_work_timers.items()):
-                        if timer_owner.id == task_work.id:
-                            timers.timers_delete_timer(timer_id)
-                            del self._task_work_timers[timer_id]
-                            del self._workers_timer[timer_id]
+                    timer_id = self._task_work_timer_id.get(task_work.id, None)
+                    if timer_id is not None:
+                        self._delete_task_work_timer(timer_id)
 
                     task = self._tasks.get(task_work.task_id, None)
                     if task is not None:
@@ -333,10 +469,13 @@ class TaskScheduler:
         timer_id = yield
         worker = self._workers_timer.get(timer_id, None)
         if worker is not None:
-            self._task_worker_pool.timeout_worker(worker)
-            selobj.selobj_del_read_obj(worker.selobj)
-            del self._workers_selobj[worker.selobj]
+            # Deregister the worker before timing it out, a timed out worker
+            # may close its selection object.
+            select_obj = worker.selobj
+            selobj.selobj_del_read_obj(select_obj)
+            del self._workers_selobj[select_obj]
             del self._workers_timer[timer_id]
+            self._task_worker_pool.timeout_worker(worker)
 
             task_work = self._task_work_timers.get(timer_id, None)
             if task_work is not None:
@@ -344,7 +483,7 @@ class TaskScheduler:
                 if task is not None:
                     try:
                         task.task_work_timeout(task_work)
-                        del self._task_work_timers[timer_id]
+                        self._delete_task_work_timer(timer_id)
                     except (StopIteration, RuntimeError):
                         self.delete_task(task)
 
@@ -353,24 +492,29 @@ class TaskScheduler:
 
     @coroutine
     def run_tasks(self):
-        """Run tasks that are ready to run."""
+        """Run a batch of tasks that are ready to run."""
 
         while True:
             select_obj = yield
-            if select_obj == self._run_queue.selobj:
-                self._tasks_scheduled = False
-                task_id = self._run_queue.get()
-                if self._tasks:
-                    DLOG.verbose(
-                        "Pool %s: Total tasks=%s."
-                        % (self._task_worker_pool.name, len(self._tasks))
-                    )
+            if select_obj == self._run_signal.selobj:
+                self._run_signal.clear()
+                tasks_run = 0
+                while tasks_run < self._max_tasks_per_dispatch:
+                    task_id = self._next_task_id()
+                    if task_id is None:
+                        break
+
                     self._running_task = self._tasks.get(task_id, None)
                     if self._running_task is not None:
+                        tasks_run += 1
                         try:
                             DLOG.verbose(
-                                "Pool %s: Running task, name=%s."
-                                % (self._task_worker_pool.name, self._running_task.name)
+                                "Pool %s: Running task, name=%s.",
+                                self._task_worker_pool.name,
+                                self._running_task.name,
+                            )
+                            profiler.profile_dispatch_begin(
+                                "task", self._running_task.name
                             )
                             self._running_task.run()
 
@@ -378,11 +522,22 @@ class TaskScheduler:
                             self.delete_task(self._running_task)
 
                         finally:
+                            profiler.profile_dispatch_end()
                             self._running_task = None
 
-                    self._schedule_next_task()
-
-                else:
+                if tasks_run:
+                    self._record_stats()
                     DLOG.verbose(
-                        "Pool %s: No tasks to schedule." % self._task_worker_pool.name
+                        "Pool %s: Ran %s tasks, total tasks=%s.",
+                        self._task_worker_pool.name,
+                        tasks_run,
+                        len(self._tasks),
                     )
+                    histogram.add_histogram_data(
+                        self._name + " [tasks-per-dispatch]", tasks_run, "tasks"
+                    )
+
+                # Leave the remaining ready tasks for the next dispatch so that
+                # other selection objects and timers are not starved.
+                if self._ready_task_ids:
+                    self._run_signal.signal()
@@ -6,6 +6,7 @@
 from nfv_common import debug
 from nfv_common import exceptions
 from nfv_common.helpers import Result
+from nfv_common.tasks._task_result import TaskResult
 from nfv_common import timers
 
 DLOG = debug.debug_get_logger("nfv_common.tasks.task_work")
@@ -31,8 +32,10 @@ class TaskWork:
         self._create_timestamp_ms = timers.get_monotonic_timestamp_in_ms()
 
         DLOG.debug(
-            "TaskWork created, id=%s, name=%s, timeout_in_secs=%i."
-            % (self._id, self._name, self._timeout_in_secs)
+            "TaskWork created, id=%s, name=%s, timeout_in_secs=%i.",
+            self._id,
+            self._name,
+            self._timeout_in_secs,
         )
         TaskWork._id += 1
 
@@ -89,7 +92,7 @@ class TaskWork:
     def run(self):
         """Runs the task work."""
 
-        DLOG.debug("TaskWork run, id=%s, name=%s." % (self._id, self._name))
+        DLOG.debug("TaskWork run, id=%s, name=%s.", self._id, self._name)
         try:
             result = self._target(*self._args, **self._kwargs)
             if isinstance(result, Result):
@@ -103,3 +106,62 @@ class TaskWork:
                 self._result = e
             else:
                 self._result = Exception(e.__class__.__name__ + ": " + str(e))
+
+
+class TaskWorkGather:
+    """Task Work Gather, a batch of task work whose results are sent to the
+
+    task together once all of the task work has completed or timed out.
+    """
+
+    def __init__(self, task_works):
+        """Create a task work gather."""
+
+        self._index = {task_work.id: i for i, task_work in enumerate(task_works)}
+        self._results = [None] * len(task_works)
+        self._outstanding = len(task_works)
+
+    @property
+    def task_work_ids(self):
+        """Returns the identifiers of the task work being gathered."""
+
+        return list(self._index)
+
+    def task_work_complete(self, task_work):
+        """Record the result of completed task work, returns true once all
+
+        of the task work has been gathered.
+        """
+        if isinstance(task_work.result, Exception):
+            task_result = TaskResult(complete=False, error=task_work.result)
+        else:
+            task_result = TaskResult(
+                complete=True,
+                result_data=task_work.result,
+                ancillary_result_data=task_work.ancillary_result_data,
+            )
+        return self._add_result(task_work, task_result)
+
+    def task_work_timeout(self, task_work):
+        """Record that task work has timed out, returns true once all of
+
+        the task work has been gathered.
+        """
+        return self._add_result(task_work, TaskResult(complete=False))
+
+    def _add_result(self, task_work, task_result):
+        """Record the result of task work."""
+
+        self._results[self._index[task_work.id]] = task_result
+        self._outstanding -= 1
+        return 0 == self._outstanding
+
+    @property
+    def result(self):
+        """Returns the gathered result, the result data is the list of task
+
+        results in the order the task work was given, the gathered result
+        is only complete if all of the task work completed.
+        """
+        complete = all(x.is_complete() for x in self._results)
+        return TaskResult(complete=complete, result_data=list(self._results))
@@ -4,30 +4,98 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import collections
+from concurrent import futures
 
 from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+from nfv_common import histogram
+from nfv_common.tasks._task_executor_worker import TaskExecutorWorker
 from nfv_common.tasks._task_worker import TaskWorkerThread
+from nfv_common import timers
 
 DLOG = debug.debug_get_logger("nfv_common.tasks.task_worker_pool")
 
 
+class TaskWorkerMode(Constants, metaclass=Singleton):
+    """Task Worker Mode Constants."""
+
+    PROCESS = Constant("process")
+    THREAD = Constant("thread")
+
+
+# Constant Instantiation
+TASK_WORKER_MODE = TaskWorkerMode()
+
+
 class TaskWorkerPool:
     """Task Worker Pool."""
 
-    def __init__(self, pool_name, num_workers=1):
-        """Create Task Worker Pool."""
+    def __init__(
+        self,
+        pool_name,
+        num_workers=1,
+        worker_mode=TASK_WORKER_MODE.PROCESS,
+        max_workers=None,
+        grow_queue_depth=2,
+        grow_queue_wait_ms=1000,
+        idle_secs=60,
+    ):
+        """Create Task Worker Pool.
+
+        In process mode each worker is a forked process that task work is
+        pickled to.  In thread mode each worker is a slot on a thread pool
+        executor; the executor has room for as many threads again so that
+        workers replacing timed out workers, whose threads cannot be
+        interrupted, are not starved.
+
+        The pool starts with num_workers workers and can grow up to
+        max_workers while task work is waiting for a worker, see autoscale.
+        Workers above num_workers that have been idle for idle_secs are
+        stopped again, see shrink_idle_workers.
+        """
 
         self._pool_name = pool_name
+        self._worker_mode = worker_mode
         self._workers_avail = collections.OrderedDict()
         self._workers = []
-
-        for worker_x in range(num_workers):
-            worker = TaskWorkerThread("%s-Worker-%s" % (pool_name, worker_x))
-            self._workers.append(worker)
-
-        for worker in self._workers:
-            worker.start()
-            self._workers_avail[worker.id] = worker
+        self._executor = None
+        self._min_workers = num_workers
+        self._max_workers = max(num_workers, max_workers or num_workers)
+        self._grow_queue_depth = grow_queue_depth
+        self._grow_queue_wait_ms = grow_queue_wait_ms
+        self._idle_ms = idle_secs * 1000
+        self._idle_since_ms = {}
+        self._next_worker_x = 0
+
+        if TASK_WORKER_MODE.THREAD == worker_mode:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_workers * 2, thread_name_prefix=pool_name
+            )
+
+        for _ in range(num_workers):
+            self._add_worker()
+
+    def _create_worker(self, worker_name):
+        """Create a worker for the pool's worker mode."""
+
+        if self._executor is not None:
+            return TaskExecutorWorker(worker_name, self._pool_name, self._executor)
+        return TaskWorkerThread(worker_name)
+
+    def _add_worker(self):
+        """Create, start and add a worker to the pool."""
+
+        worker = self._create_worker(
+            "%s-Worker-%s" % (self._pool_name, self._next_worker_x)
+        )
+        self._next_worker_x += 1
+        worker.start()
+        self._workers.append(worker)
+        self._workers_avail[worker.id] = worker
+        self._idle_since_ms[worker.id] = timers.get_monotonic_timestamp_in_ms()
+        return worker
 
     @property
     def name(self):
@@ -35,6 +103,103 @@ class TaskWorkerPool:
 
         return self._pool_name
 
+    @property
+    def worker_mode(self):
+        """Returns the mode of the workers in the pool."""
+
+        return self._worker_mode
+
+    @property
+    def num_workers(self):
+        """Returns the number of workers in the pool."""
+
+        return len(self._workers)
+
+    @property
+    def min_workers(self):
+        """Returns the number of workers the pool does not shrink below."""
+
+        return self._min_workers
+
+    @property
+    def max_workers(self):
+        """Returns the number of workers the pool does not grow above."""
+
+        return self._max_workers
+
+    def _record_utilisation(self):
+        """Record how many of the pool's workers are busy."""
+
+        busy_workers = len(self._workers) - len(self._workers_avail)
+        histogram.add_histogram_data(
+            self._pool_name + " [busy-workers]", busy_workers, "workers"
+        )
+        histogram.add_histogram_data(
+            self._pool_name + " [busy-ratio]",
+            busy_workers * 100 // len(self._workers),
+            "percent",
+        )
+
+    def autoscale(self, queue_depth, queue_wait_ms):
+        """Grow the pool by a worker if all workers are busy and the task
+
+        work waiting for a worker has crossed the queue depth or queue wait
+        thresholds, returns true if a worker was added.
+        """
+        if self._workers_avail or len(self._workers) >= self._max_workers:
+            return False
+
+        if (
+            queue_depth < self._grow_queue_depth
+            and queue_wait_ms < self._grow_queue_wait_ms
+        ):
+            return False
+
+        worker = self._add_worker()
+        DLOG.info(
+            "Pool %s: grew to %s workers, added worker %s, queue_depth=%s, "
+            "queue_wait_ms=%s."
+            % (
+                self._pool_name,
+                len(self._workers),
+                worker.name,
+                queue_depth,
+                queue_wait_ms,
+            )
+        )
+        histogram.add_histogram_data(
+            self._pool_name + " [workers]", len(self._workers), "workers"
+        )
+        return True
+
+    def shrink_idle_workers(self):
+        """Stop workers that have been idle for too long, the pool does not
+
+        shrink below its minimum number of workers.
+        """
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+
+        # Available workers are claimed from the end, so the workers idle
+        # the longest are at the front.
+        for worker_id, worker in list(self._workers_avail.items()):
+            if len(self._workers) <= self._min_workers:
+                break
+
+            if now_ms - self._idle_since_ms.get(worker_id, now_ms) < self._idle_ms:
+                break
+
+            del self._workers_avail[worker_id]
+            self._idle_since_ms.pop(worker_id, None)
+            self._workers = [x for x in self._workers if x.id != worker_id]
+            worker.stop(max_wait_in_seconds=1)
+            DLOG.info(
+                "Pool %s: shrunk to %s workers, stopped idle worker %s."
+                % (self._pool_name, len(self._workers), worker.name)
+            )
+            histogram.add_histogram_data(
+                self._pool_name + " [workers]", len(self._workers), "workers"
+            )
+
     def available_workers(self):
         """Returns true if there are workers available to do work."""
 
@@ -47,7 +212,9 @@ class TaskWorkerPool:
 
         if self._workers_avail:
             _, worker = self._workers_avail.popitem()
-            DLOG.verbose("Claim worker %s" % worker.name)
+            self._idle_since_ms.pop(worker.id, None)
+            DLOG.verbose("Claim worker %s", worker.name)
+            self._record_utilisation()
             return worker
         return None
 
@@ -55,8 +222,9 @@ class TaskWorkerPool:
         """Release a worker back into the pool."""
 
         if worker is not None:
-            DLOG.verbose("Release worker %s" % worker.name)
+            DLOG.verbose("Release worker %s", worker.name)
             self._workers_avail[worker.id] = worker
+            self._idle_since_ms[worker.id] = timers.get_monotonic_timestamp_in_ms()
 
     def timeout_worker(self, worker):
         """Timeout a worker."""
@@ -64,11 +232,12 @@ class TaskWorkerPool:
         if worker is not None:
             DLOG.info("Timeout worker %s" % worker.name)
             worker.stop(max_wait_in_seconds=1)
-            new_worker = TaskWorkerThread(worker.name)
+            new_worker = self._create_worker(worker.name)
             new_worker.start()
-            self._workers = [x for x in self._workers if x.id == worker.id]
+            self._workers = [x for x in self._workers if x.id != worker.id]
             self._workers.append(new_worker)
             self._workers_avail[new_worker.id] = new_worker
+            self._idle_since_ms[new_worker.id] = timers.get_monotonic_timestamp_in_ms()
             del worker
 
     def shutdown(self):
@@ -76,3 +245,6 @@ class TaskWorkerPool:
 
         for worker in self._workers:
             worker.stop(max_wait_in_seconds=1)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
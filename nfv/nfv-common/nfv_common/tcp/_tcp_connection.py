@@ -4,14 +4,18 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import base64
+import collections
 import errno
 import hashlib
 import hmac
+import itertools
 import select
 import socket
 import struct
 
 from nfv_common import debug
+from nfv_common.helpers import coroutine
+from nfv_common import selobj
 from nfv_common import timers
 
 DLOG = debug.debug_get_logger("nfv_common.tcp")
@@ -21,10 +25,16 @@ class TCPConnection:
     """TCP Connection."""
 
     AUTH_VECTOR_MAX_SIZE = 64
+    HEADER_SIZE = struct.calcsize("!L")
+    RECEIVE_BUFFER_SIZE = 64 * 1024
+    SEND_BUFFERS_MAX = 64
 
     def __init__(self, ip, port, sock=None, blocking=True, owner=None, auth_key=None):
         """Create a TCP connection."""
 
+        if isinstance(auth_key, str):
+            auth_key = auth_key.encode("utf-8")
+
         self._owner = owner
         self._auth_key = auth_key
         self._ip = ip
@@ -52,9 +62,12 @@ class TCPConnection:
         self._blocking = blocking
         self._socket.setblocking(blocking)
         self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        self._msg_parts = []
-        self._msg_len = 0
-        self._msg_len_remaining = -1
+        self._recv_buffer = bytearray(self.RECEIVE_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._recv_start = 0
+        self._recv_end = 0
+        self._send_queue = collections.deque()
+        self._closing = False
 
     @property
     def ip(self):
@@ -83,7 +96,7 @@ class TCPConnection:
     def is_shutdown(self):
         """Returns true if the connection has shutdown."""
 
-        return self._socket is None
+        return self._socket is None or self._closing
 
     def connect(self, ip, port, timeout_in_secs=None):
         """Connect to an end-point."""
@@ -110,90 +123,193 @@ class TCPConnection:
         """Send a message into the TCP connection, assumes the following
 
         messaging format:  | length (4-bytes) | string of bytes |
-        struct.pack returns string in python2 and bytes in python3.
+        the header, authorization vector and payload are sent from their own
+        buffers and the whole message is sent, not just what fits in the
+        socket buffer.
         """
         bytes_sent = 0
 
-        if self._socket is not None:
+        if not self.is_shutdown():
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+
             if self._auth_key is None:
-                msg = struct.pack("!L", socket.htonl(len(payload)))
-                msg += bytes(payload, "utf-8")
+                buffers = [self._header(len(payload)), payload]
             else:
                 auth_vector = hmac.new(
                     self._auth_key, msg=payload, digestmod=hashlib.sha512
-                ).digest()
+                ).digest()[: self.AUTH_VECTOR_MAX_SIZE]
                 msg_len = len(auth_vector) + len(payload)
-                msg = struct.pack("!L", socket.htonl(msg_len))
-                msg += auth_vector[: self.AUTH_VECTOR_MAX_SIZE]
-                msg += bytes(payload, "utf-8")
+                buffers = [self._header(msg_len), auth_vector, payload]
 
-            bytes_sent = self._socket.send(bytes(msg))
+            bytes_sent = self._send_all(buffers)
         return bytes_sent
 
-    def _receive_non_blocking(self):
-        """Receive a message from the TCP connection (non-blocking), assumes the
+    @staticmethod
+    def _header(msg_len):
+        """Returns the length header of a message."""
 
-        following messaging format:  | length (4-bytes) | string of bytes |.
+        return struct.pack("!L", socket.htonl(msg_len))
+
+    def _send_all(self, buffers):
+        """Send the buffers, what does not fit in the socket buffer of a
+
+        non-blocking socket is queued and sent from the main loop once the
+        socket is writeable, rather than waiting for a slow peer to read.
         """
-        if self._socket is None:
-            return None
+        queued = bool(self._send_queue)
+        bytes_sent = 0
+        for buffer in buffers:
+            if len(buffer):
+                self._send_queue.append(memoryview(buffer))
+                bytes_sent += len(buffer)
 
-        message = None
-        self._socket.setblocking(False)
-        try:
-            if -1 == self._msg_len_remaining:
-                if 0 == self._msg_len:
-                    read_len = struct.calcsize("!L")
-                else:
-                    read_len = struct.calcsize("!L") - self._msg_len
-
-                msg_block = self._socket.recv(read_len)
-                if 0 == len(msg_block):
-                    DLOG.verbose("Connection closed.")
+        if not queued:
+            try:
+                self._send_queued()
+            except socket.error:
+                self._send_queue.clear()
+                raise
+
+            if self._send_queue:
+                selobj.selobj_add_write_obj(self.selobj, self._send_ready_callback)
+        return bytes_sent
+
+    def _send_queued(self):
+        """Send as much of the queued message data as the socket takes."""
+
+        while self._send_queue:
+            try:
+                sent = self._socket.sendmsg(
+                    itertools.islice(self._send_queue, self.SEND_BUFFERS_MAX)
+                )
+
+            except BlockingIOError:
+                return
+
+            while self._send_queue and len(self._send_queue[0]) <= sent:
+                sent -= len(self._send_queue.popleft())
+            if sent:
+                self._send_queue[0] = self._send_queue[0][sent:]
+
+    @coroutine
+    def _send_ready_callback(self):
+        """Send the queued message data when the socket is writeable."""
+
+        while True:
+            select_obj = yield
+            try:
+                self._send_queued()
+
+            except socket.error as e:
+                DLOG.error(
+                    "TCP socket error, ip=%s, port=%s, error=%s."
+                    % (self._ip, self._port, e)
+                )
+                self._send_queue.clear()
+                self.close()
+
+            if not self._send_queue:
+                selobj.selobj_del_write_obj(select_obj)
+                if self._closing:
                     self.close()
-                else:
-                    self._msg_parts.append(msg_block)
-                    msg = b"".join(self._msg_parts)
-                    self._msg_len = len(msg_block)
 
-                    if struct.calcsize("!L") == len(msg):
-                        self._msg_parts[:] = []
-                        self._msg_len = socket.ntohl(struct.unpack("!L", msg)[0])
-                        self._msg_len_remaining = self._msg_len
+    def _next_message(self):
+        """Returns the next complete message in the receive buffer, None if
 
+        a complete message has not been received yet.
+        """
+        while True:
+            available = self._recv_end - self._recv_start
+            if available < self.HEADER_SIZE:
+                return None
+
+            msg_start = self._recv_start + self.HEADER_SIZE
+            header = self._recv_view[self._recv_start : msg_start]
+            msg_len = socket.ntohl(struct.unpack("!L", header)[0])
+            if available < self.HEADER_SIZE + msg_len:
+                self._reserve(self.HEADER_SIZE + msg_len)
+                return None
+
+            self._recv_start = msg_start + msg_len
+            if self._auth_key is None:
+                message = bytes(self._recv_view[msg_start : self._recv_start])
             else:
-                msg_block = self._socket.recv(self._msg_len_remaining)
-                if 0 == len(msg_block):
-                    DLOG.verbose("Connection closed.")
-                    self.close()
-                else:
-                    self._msg_parts.append(msg_block)
-                    self._msg_len_remaining -= len(msg_block)
-                    if 0 == self._msg_len_remaining:
-                        msg = b"".join(self._msg_parts)
-                        self._msg_parts[:] = []
-                        self._msg_len = 0
-                        self._msg_len_remaining = -1
-
-                        if self._auth_key is None:
-                            message = msg
-                        else:
-                            auth_vector = msg[: self.AUTH_VECTOR_MAX_SIZE]
-                            message = msg[self.AUTH_VECTOR_MAX_SIZE :]
-                            expected = hmac.new(
-                                self._auth_key, msg=message, digestmod=hashlib.sha512
-                            ).digest()
-
-                            if auth_vector != expected:
-                                auth_vector_str = base64.b64encode(auth_vector)
-                                expected_str = base64.b64encode(expected)
-
-                                DLOG.info(
-                                    "Authorization vector mismatch, msg=%s, "
-                                    "auth_vector=%s, expected=%s."
-                                    % (message, auth_vector_str, expected_str)
-                                )
-                                message = None
+                auth_end = msg_start + self.AUTH_VECTOR_MAX_SIZE
+                auth_vector = bytes(self._recv_view[msg_start:auth_end])
+                message = bytes(self._recv_view[auth_end : self._recv_start])
+                expected = hmac.new(
+                    self._auth_key, msg=message, digestmod=hashlib.sha512
+                ).digest()[: self.AUTH_VECTOR_MAX_SIZE]
+
+                if not hmac.compare_digest(auth_vector, expected):
+                    auth_vector_str = base64.b64encode(auth_vector)
+                    expected_str = base64.b64encode(expected)
+
+                    DLOG.info(
+                        "Authorization vector mismatch, msg=%s, "
+                        "auth_vector=%s, expected=%s."
+                        % (message, auth_vector_str, expected_str)
+                    )
+                    message = None
+
+            if self._recv_start == self._recv_end:
+                self._recv_start = self._recv_end = 0
+                if self.RECEIVE_BUFFER_SIZE < len(self._recv_buffer):
+                    # Release the space taken by a large message.
+                    self._set_receive_buffer(bytearray(self.RECEIVE_BUFFER_SIZE))
+
+            if message is not None:
+                return message
+
+    def _set_receive_buffer(self, buffer):
+        """Replace the receive buffer."""
+
+        self._recv_view.release()
+        self._recv_buffer = buffer
+        self._recv_view = memoryview(buffer)
+
+    def _reserve(self, msg_len):
+        """Make room in the receive buffer for a message of msg_len bytes,
+
+        moving a partial message to the front of the buffer.
+        """
+        if len(self._recv_buffer) - self._recv_start >= msg_len:
+            return
+
+        available = self._recv_end - self._recv_start
+        if len(self._recv_buffer) < msg_len:
+            buffer = bytearray(msg_len)
+            buffer[:available] = self._recv_view[self._recv_start : self._recv_end]
+            self._set_receive_buffer(buffer)
+        else:
+            self._recv_view[:available] = self._recv_view[
+                self._recv_start : self._recv_end
+            ]
+        self._recv_start = 0
+        self._recv_end = available
+
+    def _receive_into_buffer(self):
+        """Read what has been queued on the socket into the receive buffer."""
+
+        if self._recv_end == len(self._recv_buffer):
+            self._reserve(self._recv_end - self._recv_start + self.HEADER_SIZE)
+
+        try:
+            # Use MSG_DONTWAIT rather than switching the socket to
+            # non-blocking, so that a message can be sent on the socket by
+            # another thread while receiving.
+            bytes_read = self._socket.recv_into(
+                self._recv_view[self._recv_end :], 0, socket.MSG_DONTWAIT
+            )
+            if 0 == bytes_read:
+                DLOG.verbose("Connection closed.")
+                self.close()
+            else:
+                self._recv_end += bytes_read
+
+        except BlockingIOError:
+            pass
 
         except socket.timeout as e:
             DLOG.info(
@@ -208,15 +324,32 @@ class TCPConnection:
             )
             self.close()
 
-        finally:
-            if self._socket is not None:
-                self._socket.setblocking(self._blocking)
+    def receive_buffered(self):
+        """Returns the next message that has already been received, a single
+
+        read can receive several messages so callers woken up by the socket
+        should call this until it returns None.
+        """
+        return self._next_message()
+
+    def _receive_non_blocking(self):
+        """Receive a message from the TCP connection (non-blocking), assumes the
 
+        following messaging format:  | length (4-bytes) | string of bytes |.
+        """
+        message = self._next_message()
+        if message is None and self._socket is not None:
+            self._receive_into_buffer()
+            message = self._next_message()
         return message
 
     def _receive_blocking(self, timeout_in_secs=5):
         """Receive a message from the TCP connection (blocking)."""
 
+        message = self._next_message()
+        if message is not None:
+            return message
+
         start_ms = timers.get_monotonic_timestamp_in_ms()
 
         while self._socket is not None:
@@ -254,10 +387,17 @@ class TCPConnection:
         return self._receive_non_blocking()
 
     def close(self):
-        """Close the TCP connection."""
+        """Close the TCP connection, once the message data queued is sent."""
 
-        if self._socket is not None:
+        if self._socket is None:
+            return
+
+        if not self._closing:
+            self._closing = True
             if self._owner is not None:
                 self._owner.closing_connection(self.selobj)
+
+        if not self._send_queue:
+            selobj.selobj_del_write_obj(self._socket.fileno())
             self._socket.close()
             self._socket = None
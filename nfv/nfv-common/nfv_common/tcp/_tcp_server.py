@@ -65,14 +65,18 @@ class TCPServer:
                 # Client Data
                 client_connection = self._client_connections.get(select_obj, None)
                 if client_connection is not None:
+                    # Handle all of the messages received in one read.
                     msg = client_connection.receive(blocking=False)
-                    if msg is not None:
+                    while msg is not None:
                         DLOG.verbose(
                             "Message received from %s, port=%s, "
                             "select_obj=%s."
                             % (client_connection.ip, client_connection.port, select_obj)
                         )
                         self._message_handler(client_connection, msg)
+                        if client_connection.is_shutdown():
+                            break
+                        msg = client_connection.receive_buffered()
 
                 client_connection = self._client_connections.get(select_obj, None)
                 if client_connection is not None:
@@ -45,6 +45,7 @@ class Thread:
                 self._name,
                 self._progress_marker,
                 debug.debug_get_config(),
+                selobj.selobj_get_config(),
                 thread_worker,
                 self._work_queue,
             ),
@@ -167,7 +168,9 @@ def _thread_dispatch_work(thread_state, thread_worker, work_queue):
                     thread_worker.do_work(action, work)
 
 
-def _thread_main(thread_name, progress_marker, debug_config, thread_worker, work_queue):
+def _thread_main(
+    thread_name, progress_marker, debug_config, selobj_config, thread_worker, work_queue
+):
     """Main loop for the thread."""
 
     from ctypes import util
@@ -197,7 +200,7 @@ def _thread_main(thread_name, progress_marker, debug_config, thread_worker, work
         thread_state = ThreadState()
 
         debug.debug_initialize(debug_config, thread_name=thread_name)
-        selobj.selobj_initialize()
+        selobj.selobj_initialize(selobj_config)
         timers.timers_initialize(
             thread_worker.tick_interval_in_ms,
             thread_worker.tick_max_delay_in_ms,
@@ -218,7 +221,9 @@ def _thread_main(thread_name, progress_marker, debug_config, thread_worker, work
         DLOG.debug("Thread %s: started." % thread_name)
         while thread_state.stay_on:
             progress_marker.increment()
-            selobj.selobj_dispatch(thread_worker.tick_interval_in_ms)
+            selobj.selobj_dispatch(
+                timers.timers_next_schedule_in_ms(thread_worker.tick_interval_in_ms)
+            )
             timers.timers_schedule()
 
             if not timers.timers_scheduling_on_time():
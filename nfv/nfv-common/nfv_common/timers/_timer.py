@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import math
+
 from nfv_common import debug
 from nfv_common.timers._timestamp import get_monotonic_timestamp_in_ms
 
@@ -49,6 +51,14 @@ class Timer:
 
         return self._timer_name
 
+    @property
+    def expiry_ms(self):
+        """Returns the monotonic timestamp, in milliseconds, at which the
+
+        timer is next due to fire.
+        """
+        return self._arm_timestamp + (math.floor(self._next_expiry_in_secs) + 1) * 1000
+
     def reschedule(self, interval_secs):
         """Reschedule a timer."""
 
@@ -64,7 +74,7 @@ class Timer:
         secs_expired = (now_ms - self._arm_timestamp) // 1000
         if secs_expired > self._next_expiry_in_secs:
             DLOG.verbose(
-                "Timer %s with timer id %s fired." % (self._timer_name, self._timer_id)
+                "Timer %s with timer id %s fired.", self._timer_name, self._timer_id
             )
             try:
                 self._callback.send(self._timer_id)
@@ -45,8 +45,6 @@ def timers_create_timer(
 ):
     """Create a timer."""
 
-    global _scheduler
-
     timer = Timer(
         name,
         initial_delay_secs,
@@ -56,41 +54,42 @@ def timers_create_timer(
         **callback_kwargs,
     )
     _scheduler.add_timer(timer)
-    DLOG.debug("Timer %s created, name=%s." % (timer.timer_id, name))
+    DLOG.debug("Timer %s created, name=%s.", timer.timer_id, name)
     return timer.timer_id
 
 
 def timers_delete_timer(timer_id):
     """Delete a timer."""
 
-    global _scheduler
-
     _scheduler.delete_timer(timer_id)
-    DLOG.debug("Timer %s deleted." % timer_id)
+    DLOG.debug("Timer %s deleted.", timer_id)
 
 
 def timers_reschedule_timer(timer_id, interval_secs):
     """Reschedule a timer at a different interval."""
 
-    global _scheduler
-
     _scheduler.reschedule_timer(timer_id, interval_secs)
-    DLOG.debug("Timer %s rescheduled every %s seconds." % (timer_id, interval_secs))
+    DLOG.debug("Timer %s rescheduled every %s seconds.", timer_id, interval_secs)
 
 
 def timers_scheduling_on_time():
     """Determine if we are scheduling timers on time."""
 
-    global _scheduler
-
     return _scheduler.scheduling_on_time
 
 
+def timers_next_schedule_in_ms(max_delay_ms):
+    """Returns how long, in milliseconds, the caller can wait for selection
+
+    objects before timers need to be scheduled, bounded by max_delay_ms.
+    """
+
+    return _scheduler.next_schedule_in_ms(max_delay_ms)
+
+
 def timers_schedule():
     """Schedule timers."""
 
-    global _scheduler
-
     _scheduler.schedule()
 
 
@@ -123,5 +122,4 @@ def timers_finalize():
 
     global _scheduler
 
-    if _scheduler is not None:
-        del _scheduler
+    _scheduler = None
@@ -3,15 +3,24 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import heapq
+
 from nfv_common import debug
 from nfv_common import histogram
+from nfv_common import profiler
 from nfv_common.timers._timestamp import get_monotonic_timestamp_in_ms
 
 DLOG = debug.debug_get_logger("nfv_common.timers.timer_scheduler")
 
 
 class TimerScheduler:
-    """Timer Scheduler."""
+    """Timer Scheduler.
+
+    Timers are kept in a min-heap ordered by expiry so that scheduling only
+    touches the timers that have expired.  Deleted and rescheduled timers
+    leave stale entries in the heap which are discarded when they reach the
+    top or when the heap is compacted.
+    """
 
     def __init__(
         self, scheduler_interval_ms, scheduler_max_delay_ms, scheduler_delay_debounce_ms
@@ -23,10 +32,9 @@ class TimerScheduler:
         self._scheduler_delay_debounce_ms = scheduler_delay_debounce_ms
         self._scheduler_timestamp_ms = 0
         self._scheduler_delay_timestamp_ms = 0
-        self._timers = []
+        self._timers = {}
+        self._timer_heap = []
         self._scheduling_on_time = True
-        self._timers_to_delete = []
-        self._scheduling_timers = False
 
     @property
     def scheduling_on_time(self):
@@ -34,6 +42,49 @@ class TimerScheduler:
 
         return self._scheduling_on_time
 
+    def _push_timer(self, timer):
+        """Add a heap entry for the next expiry of a timer."""
+
+        heapq.heappush(self._timer_heap, (timer.expiry_ms, timer.timer_id))
+
+        # Compact the heap when stale entries dominate it.
+        if len(self._timer_heap) > 2 * len(self._timers) + 64:
+            self._timer_heap[:] = [
+                (timer.expiry_ms, timer.timer_id) for timer in self._timers.values()
+            ]
+            heapq.heapify(self._timer_heap)
+
+    def _pop_expired_timers(self, now_ms):
+        """Remove and return the timers that have expired."""
+
+        expired_timers = []
+        while self._timer_heap and self._timer_heap[0][0] <= now_ms:
+            expiry_ms, timer_id = heapq.heappop(self._timer_heap)
+            timer = self._timers.get(timer_id, None)
+            if timer is not None and expiry_ms == timer.expiry_ms:
+                expired_timers.append(timer)
+        return expired_timers
+
+    def next_schedule_in_ms(self, max_delay_ms):
+        """Returns the number of milliseconds the caller can wait before
+
+        timers need to be scheduled, bounded by max_delay_ms.
+        """
+        now_ms = get_monotonic_timestamp_in_ms()
+        next_ms = self._scheduler_timestamp_ms + self._scheduler_interval_ms
+
+        while self._timer_heap:
+            expiry_ms, timer_id = self._timer_heap[0]
+            timer = self._timers.get(timer_id, None)
+            if timer is not None and expiry_ms == timer.expiry_ms:
+                next_ms = max(next_ms, expiry_ms)
+                break
+            heapq.heappop(self._timer_heap)
+        else:
+            next_ms = now_ms + max_delay_ms
+
+        return int(min(max(next_ms - now_ms, 0), max_delay_ms))
+
     def schedule(self):
         """Schedule timers."""
 
@@ -42,8 +93,8 @@ class TimerScheduler:
 
         if ms_expired < self._scheduler_interval_ms:
             DLOG.verbose(
-                "Not enough time has elapsed to schedule timers, "
-                "ms_expired=%d ms." % ms_expired
+                "Not enough time has elapsed to schedule timers, ms_expired=%d ms.",
+                ms_expired,
             )
             return
 
@@ -62,33 +113,31 @@ class TimerScheduler:
                         DLOG.info("Now scheduling on time.")
 
         self._scheduler_timestamp_ms = now_ms
-        self._scheduling_timers = True
         overall_start_ms = get_monotonic_timestamp_in_ms()
         try:
             DLOG.verbose("Scheduling timers.")
-            for timer in self._timers:
+            for timer in self._pop_expired_timers(now_ms):
+                # An earlier callback may have deleted or rescheduled this timer.
+                if self._timers.get(timer.timer_id, None) is not timer:
+                    continue
+
                 start_ms = get_monotonic_timestamp_in_ms()
-                rearm = timer.callback(now_ms)
+                profiler.profile_dispatch_begin("timer", timer.timer_name)
+                try:
+                    rearm = timer.callback(now_ms)
+                finally:
+                    profiler.profile_dispatch_end()
                 elapsed_ms = get_monotonic_timestamp_in_ms() - start_ms
                 histogram.add_histogram_data(
                     "timer callback: " + timer.timer_name,
                     elapsed_ms // 100,
                     "decisecond",
                 )
-                if not rearm and timer.timer_id not in self._timers_to_delete:
-                    self._timers_to_delete.append(timer.timer_id)
+                if not rearm:
+                    self._timers.pop(timer.timer_id, None)
+                elif self._timers.get(timer.timer_id, None) is timer:
+                    self._push_timer(timer)
         finally:
-            self._scheduling_timers = False
-
-            # Cleanup pending timers to be deleted.
-            self._timers[:] = [
-                timer
-                for timer in self._timers
-                if timer.timer_id not in self._timers_to_delete
-            ]
-            # Cleanup list of timers to delete
-            del self._timers_to_delete[:]
-
             elapsed_ms = get_monotonic_timestamp_in_ms() - overall_start_ms
             histogram.add_histogram_data(
                 "timer overall time per dispatch: ", elapsed_ms // 100, "decisecond"
@@ -97,23 +146,21 @@ class TimerScheduler:
     def add_timer(self, timer):
         """Add a timer."""
 
-        self._timers.append(timer)
+        self._timers[timer.timer_id] = timer
+        self._push_timer(timer)
 
     def delete_timer(self, timer_id):
         """Delete a timer."""
 
-        if self._scheduling_timers:
-            self._timers_to_delete.append(timer_id)
-        else:
-            self._timers[:] = [
-                timer for timer in self._timers if timer_id != timer.timer_id
-            ]
+        self._timers.pop(timer_id, None)
 
     def reschedule_timer(self, timer_id, interval_secs):
         """Reschedule a timer."""
 
-        existing_timer = next(
-            (timer for timer in self._timers if timer_id == timer.timer_id), None
-        )
+        existing_timer = self._timers.get(timer_id, None)
         if existing_timer is not None:
+            expiry_ms = existing_timer.expiry_ms
             existing_timer.reschedule(interval_secs)
+            # The heap already holds an entry for an unchanged expiry.
+            if existing_timer.expiry_ms != expiry_ms:
+                self._push_timer(existing_timer)
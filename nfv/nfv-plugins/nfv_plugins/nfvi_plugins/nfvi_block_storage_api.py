@@ -74,9 +74,10 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
     _provider = "Wind River"
     _signature = "22b3dbf6-e4ba-441b-8797-fb8a51210a43"
 
+    _token = openstack.CachedToken("_directory")
+
     def __init__(self):
         super().__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -160,8 +161,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -266,8 +266,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -313,8 +312,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -410,8 +408,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -499,8 +496,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -578,8 +574,7 @@ class NFVIBlockStorageAPI(nfvi.api.v1.NFVIBlockStorageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -372,9 +372,10 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
     def signature(self):
         return self._signature
 
+    _token = openstack.CachedToken("_directory")
+
     def __init__(self):
         super().__init__()
-        self._token = None
         self._directory = None
         self._rpc_listener = None
         self._rest_api_server = None
@@ -441,8 +442,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -508,8 +508,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -574,8 +573,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -653,8 +651,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -739,8 +736,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -807,8 +803,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -949,8 +944,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1016,8 +1010,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1104,8 +1097,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             elif httplib.NOT_FOUND == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.NOT_FOUND
@@ -1183,8 +1175,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1323,8 +1314,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1373,8 +1363,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1484,8 +1473,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             elif httplib.NOT_FOUND == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.NOT_FOUND
@@ -1577,8 +1565,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1625,6 +1612,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
                 paging.page_limit,
                 paging.next_page,
                 context=context,
+                changes_since=paging.changes_since,
             )
             future.result = yield
 
@@ -1634,9 +1622,16 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             instance_data_list = future.result.data
 
             instances = []
+            deleted_instances = []
 
             for instance_data in instance_data_list["servers"]:
-                instances.append((instance_data["id"], instance_data["name"]))
+                # Deleted servers are only listed when listing the servers
+                # changed since a given time.
+                vm_state = instance_data.get("OS-EXT-STS:vm_state", None)
+                if nova.VM_STATE.DELETED == vm_state:
+                    deleted_instances.append(instance_data["id"])
+                else:
+                    instances.append((instance_data["id"], instance_data["name"]))
 
             paging.next_page = None
 
@@ -1650,13 +1645,13 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
             DLOG.verbose("Instance paging (after): %s" % paging)
 
             response["result-data"] = instances
+            response["deleted-instances"] = deleted_instances
             response["completed"] = True
 
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1721,25 +1716,35 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             instance_data = future.result.data["server"]
 
-            future.work(
-                nova.get_server, self._token, instance_data["id"], context=context
+            # Get the server and its ports in parallel.
+            future.gather(
+                [
+                    future.work_item(
+                        nova.get_server,
+                        self._token,
+                        instance_data["id"],
+                        context=context,
+                    ),
+                    future.work_item(
+                        neutron.get_ports_for_instance, self._token, instance_data["id"]
+                    ),
+                ]
             )
             future.result = yield
 
-            if not future.result.is_complete():
-                return
+            server_result, ports_result = future.result.data
+            for work_result in future.result.data:
+                if work_result.error is not None:
+                    raise work_result.error
 
-            instance_data = future.result.data["server"]
-
-            future.work(
-                neutron.get_ports_for_instance, self._token, instance_data["id"]
-            )
-            future.result = yield
+            if not server_result.is_complete():
+                return
 
-            if not future.result.is_complete() or future.result.data is None:
+            if not ports_result.is_complete() or ports_result.data is None:
                 return
 
-            ports_data = future.result.data.get("ports", [])
+            instance_data = server_result.data["server"]
+            ports_data = ports_result.data.get("ports", [])
 
             nfvi_data = {}
             nfvi_data["vm_state"] = instance_data["OS-EXT-STS:vm_state"]
@@ -1799,8 +1804,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1878,8 +1882,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1967,8 +1970,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2053,8 +2055,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2139,8 +2140,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2228,8 +2228,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2309,8 +2308,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2392,8 +2390,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2482,8 +2479,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2575,8 +2571,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2671,8 +2666,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2741,8 +2735,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2805,8 +2798,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2886,8 +2878,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2968,8 +2959,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3048,8 +3038,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3127,8 +3116,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3201,8 +3189,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3270,8 +3257,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3307,21 +3293,32 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
 
                 self._token = future.result.data
 
-            future.work(nova.get_server, self._token, instance_uuid, context=context)
+            # Get the server and its ports in parallel.
+            future.gather(
+                [
+                    future.work_item(
+                        nova.get_server, self._token, instance_uuid, context=context
+                    ),
+                    future.work_item(
+                        neutron.get_ports_for_instance, self._token, instance_uuid
+                    ),
+                ]
+            )
             future.result = yield
 
-            if not future.result.is_complete():
-                return
+            server_result, ports_result = future.result.data
+            for work_result in future.result.data:
+                if work_result.error is not None:
+                    raise work_result.error
 
-            instance_data = future.result.data["server"]
-
-            future.work(neutron.get_ports_for_instance, self._token, instance_uuid)
-            future.result = yield
+            if not server_result.is_complete():
+                return
 
-            if not future.result.is_complete() or future.result.data is None:
+            if not ports_result.is_complete() or ports_result.data is None:
                 return
 
-            ports_data = future.result.data.get("ports", [])
+            instance_data = server_result.data["server"]
+            ports_data = ports_result.data.get("ports", [])
 
             power_state_str = nova.vm_power_state_str(
                 instance_data["OS-EXT-STS:power_state"]
@@ -3405,8 +3402,7 @@ class NFVIComputeAPI(nfvi.api.v1.NFVIComputeAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             elif httplib.NOT_FOUND == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.NOT_FOUND
@@ -41,9 +41,10 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
     def signature(self):
         return self._signature
 
+    _openstack_token = openstack.CachedToken("_openstack_directory")
+
     def __init__(self):
         super().__init__()
-        self._openstack_token = None
         self._openstack_directory = None
 
     def get_openstack_alarms(self, future, callback):
@@ -92,8 +93,7 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._openstack_token is not None:
-                    self._openstack_token.set_expired()
+                openstack.expire_cached_token(self._openstack_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -138,8 +138,7 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._openstack_token is not None:
-                    self._openstack_token.set_expired()
+                openstack.expire_cached_token(self._openstack_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -186,8 +185,7 @@ class NFVIFaultMgmtAPI(nfvi.api.v1.NFVIFaultMgmtAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._openstack_token is not None:
-                    self._openstack_token.set_expired()
+                openstack.expire_cached_token(self._openstack_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -190,9 +190,10 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
     def signature(self):
         return self._signature
 
+    _token = openstack.CachedToken("_directory")
+
     def __init__(self):
         super().__init__()
-        self._token = None
         self._directory = None
         self._openstack_directory = None
         self._rest_api_server = None
@@ -250,8 +251,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -334,8 +334,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -391,8 +390,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -472,8 +470,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -542,8 +539,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -613,8 +609,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -706,8 +701,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -777,8 +771,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -845,8 +838,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -923,8 +915,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -991,8 +982,7 @@ class NFVIGuestAPI(nfvi.api.v1.NFVIGuestAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -24,9 +24,10 @@ class NFVIIdentityAPI(nfvi.api.v1.NFVIIdentityAPI):
     _provider = "Wind River"
     _signature = "22b3dbf6-e4ba-441b-8797-fb8a51210a43"
 
+    _token = openstack.CachedToken("_directory")
+
     def __init__(self):
         super().__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -91,8 +92,7 @@ class NFVIIdentityAPI(nfvi.api.v1.NFVIIdentityAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -51,9 +51,10 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
     _provider = "Wind River"
     _signature = "22b3dbf6-e4ba-441b-8797-fb8a51210a43"
 
+    _token = openstack.CachedToken("_directory")
+
     def __init__(self):
         super().__init__()
-        self._token = None
         self._directory = None
 
     @property
@@ -185,8 +186,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -344,8 +344,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -391,8 +390,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             elif httplib.NOT_FOUND == e.http_status_code:
                 response["completed"] = True
@@ -522,8 +520,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -627,8 +624,7 @@ class NFVIImageAPI(nfvi.api.v1.NFVIImageAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._token is not None:
-                    self._token.set_expired()
+                openstack.expire_cached_token(self._directory, e.token_id)
 
             elif httplib.NOT_FOUND == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.NOT_FOUND
@@ -172,10 +172,11 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
 
         return (openstack_compute, openstack_control, remote_storage)
 
+    _platform_token = openstack.CachedToken("_platform_directory")
+    _openstack_token = openstack.CachedToken("_openstack_directory")
+
     def __init__(self):
         super().__init__()
-        self._platform_token = None
-        self._openstack_token = None
         self._platform_directory = None
         self._openstack_directory = None
         self._rest_api_server = None
@@ -242,8 +243,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -311,8 +311,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -366,8 +365,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -413,26 +411,48 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
                 DLOG.error("Get-Hosts did not complete.")
                 return
 
-            host_data_list = future.result.data
-
-            host_objs = []
+            host_data_list = [
+                host_data
+                for host_data in future.result.data["ihosts"]
+                if host_data["hostname"] is not None
+                and host_data["subfunctions"] is not None
+            ]
+
+            # Query the state and labels of all hosts in parallel.
+            host_results = []
+            if host_data_list:
+                work_items = []
+                for host_data in host_data_list:
+                    work_items.append(
+                        future.work_item(
+                            mtc.host_query,
+                            self._platform_token,
+                            host_data["uuid"],
+                            host_data["hostname"],
+                        )
+                    )
+                    work_items.append(
+                        future.work_item(
+                            sysinv.get_host_labels,
+                            self._platform_token,
+                            host_data["uuid"],
+                        )
+                    )
+                future.gather(work_items)
+                future.result = yield
 
-            for host_data in host_data_list["ihosts"]:
-                if host_data["hostname"] is None:
-                    continue
+                host_results = future.result.data
+                for host_result in host_results:
+                    if host_result.error is not None:
+                        raise host_result.error
 
-                if host_data["subfunctions"] is None:
-                    continue
+            host_objs = []
 
-                future.work(
-                    mtc.host_query,
-                    self._platform_token,
-                    host_data["uuid"],
-                    host_data["hostname"],
-                )
-                future.result = yield
+            for index, host_data in enumerate(host_data_list):
+                state_result = host_results[2 * index]
+                labels_result = host_results[2 * index + 1]
 
-                if not future.result.is_complete():
+                if not state_result.is_complete():
                     DLOG.error(
                         "Query-Host-State did not complete, "
                         "host=%s." % host_data["hostname"]
@@ -440,7 +460,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
                     response["incomplete-hosts"].append(host_data["hostname"])
                     continue
 
-                state = future.result.data["state"]
+                state = state_result.data["state"]
 
                 host_uuid = host_data["uuid"]
                 host_name = host_data["hostname"]
@@ -458,15 +478,12 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
                 sw_version = host_data.get("sw_version")
                 device_image_update = host_data["device_image_update"]
 
-                future.work(sysinv.get_host_labels, self._platform_token, host_uuid)
-                future.result = yield
-
-                if not future.result.is_complete():
+                if not labels_result.is_complete():
                     DLOG.error("Get-Host-Labels did not complete.")
                     response["incomplete-hosts"].append(host_data["hostname"])
                     continue
 
-                host_label_list = future.result.data["labels"]
+                host_label_list = labels_result.data["labels"]
 
                 openstack_compute, openstack_control, remote_storage = (
                     self._get_host_labels(host_label_list)
@@ -537,8 +554,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -668,8 +684,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -724,8 +739,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -782,8 +796,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -841,8 +854,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -899,8 +911,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -947,8 +958,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -991,8 +1001,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1044,8 +1053,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1158,8 +1166,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1202,8 +1209,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1251,8 +1257,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1324,8 +1329,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
                 response["reason"] = "token expired"
             else:
                 DLOG.exception("Caught exception %s err=%s" % (activity, e))
@@ -1408,8 +1412,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception("Caught exception kube host upgrade list err=%s" % e)
@@ -1510,8 +1513,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             # todo(abailey): refactor the code for uniform error handling
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
                 response["reason"] = "token expired"
 
             else:
@@ -1566,8 +1568,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1625,21 +1626,37 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
                 DLOG.error("%s did not complete." % action_type)
                 return
 
-            # walk the list of versions and get the patch info
+            # get the patch info of all the versions in parallel
             kube_versions_list = []
             limited_kube_version_list = future.result.data["kube_versions"]
-            for kube_list_entry in limited_kube_version_list:
-                kube_ver = kube_list_entry["version"]
-                future.work(sysinv.get_kube_version, self._platform_token, kube_ver)
+            if limited_kube_version_list:
+                future.gather(
+                    [
+                        future.work_item(
+                            sysinv.get_kube_version,
+                            self._platform_token,
+                            kube_list_entry["version"],
+                        )
+                        for kube_list_entry in limited_kube_version_list
+                    ]
+                )
                 future.result = yield
-                if not future.result.is_complete():
-                    DLOG.error(
-                        "%s for version:%s did not complete." % (action_type, kube_ver)
-                    )
-                    return
-                # returns a single object
-                kube_ver_data = future.result.data
-                kube_versions_list.append(self._extract_kube_version(kube_ver_data))
+
+                for kube_list_entry, kube_ver_result in zip(
+                    limited_kube_version_list, future.result.data
+                ):
+                    if kube_ver_result.error is not None:
+                        raise kube_ver_result.error
+
+                    if not kube_ver_result.is_complete():
+                        DLOG.error(
+                            "%s for version:%s did not complete."
+                            % (action_type, kube_list_entry["version"])
+                        )
+                        return
+                    # returns a single object
+                    kube_ver_data = kube_ver_result.data
+                    kube_versions_list.append(self._extract_kube_version(kube_ver_data))
 
             response["result-data"] = kube_versions_list
             response["completed"] = True
@@ -1647,8 +1664,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1710,8 +1726,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1775,8 +1790,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1824,8 +1838,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
             else:
                 DLOG.exception(
                     "Caught API exception while trying %s. error=%s" % (action_type, e)
@@ -1873,8 +1886,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1932,8 +1944,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -1991,8 +2002,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2049,8 +2059,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2107,8 +2116,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2165,8 +2173,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2223,8 +2230,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2293,8 +2299,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -2355,8 +2360,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif not error_msg:
                 error_msg = (
@@ -2467,8 +2471,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -2570,8 +2573,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -2659,8 +2661,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -2747,8 +2748,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -2839,8 +2839,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -2928,8 +2927,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -3017,8 +3015,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -3090,8 +3087,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = body.get("error", body.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -3167,8 +3163,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = body.get("error", body.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif httplib.NOT_ACCEPTABLE == e.http_status_code:
                 if not error_msg:
@@ -3569,8 +3564,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3704,8 +3698,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3842,8 +3835,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -3981,8 +3973,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4036,8 +4027,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4175,8 +4165,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4246,8 +4235,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4304,8 +4292,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4363,8 +4350,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4419,8 +4405,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4475,8 +4460,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4531,8 +4515,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4593,8 +4576,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
             error_msg = x.get("error", x.get("info"))
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             elif not error_msg:
                 error_msg = (
@@ -4654,8 +4636,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4721,8 +4702,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4767,8 +4747,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
@@ -4815,8 +4794,7 @@ class NFVIInfrastructureAPI(nfvi.api.v1.NFVIInfrastructureAPI):
         except exceptions.OpenStackRestAPIException as e:
             if httplib.UNAUTHORIZED == e.http_status_code:
                 response["error-code"] = nfvi.NFVI_ERROR_CODE.TOKEN_EXPIRED
-                if self._platform_token is not None:
-                    self._platform_token.set_expired()
+                openstack.expire_cached_token(self._platform_directory, e.token_id)
 
             else:
                 DLOG.exception(
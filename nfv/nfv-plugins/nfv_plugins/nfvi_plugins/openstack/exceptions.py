@@ -77,6 +77,7 @@ class OpenStackRestAPIException(exceptions.PickleableException):
         response_headers,
         response_body,
         response_reason,
+        token_id=None,
     ):
         """Create an OpenStack Rest-API exception."""
 
@@ -91,6 +92,7 @@ class OpenStackRestAPIException(exceptions.PickleableException):
         self._response_headers = response_headers
         self._response_body = response_body
         self._response_reason = response_reason
+        self._token_id = token_id  # token the request was sent with
 
     def __str__(self):
         """Return a string representing the exception."""
@@ -132,6 +134,7 @@ class OpenStackRestAPIException(exceptions.PickleableException):
                 self._response_headers,
                 self._response_body,
                 self._response_reason,
+                self._token_id,
             ),
         )
 
@@ -159,6 +162,12 @@ class OpenStackRestAPIException(exceptions.PickleableException):
 
         return self._response_reason
 
+    @property
+    def token_id(self):
+        """Returns the identifier of the token the request was sent with."""
+
+        return self._token_id
+
     @property
     def message(self):
         """Returns the message for the exception."""
@@ -388,8 +388,19 @@ def get_server_groups(token, all_projects=True):
     return response
 
 
-def get_servers(token, page_limit=None, next_page=None, all_tenants=True, context=None):
-    """Asks OpenStack Nova for a list of servers."""
+def get_servers(
+    token,
+    page_limit=None,
+    next_page=None,
+    all_tenants=True,
+    context=None,
+    changes_since=None,
+):
+    """Asks OpenStack Nova for a list of servers, when changes_since is
+
+    given only the servers changed since then are listed, with their
+    details so that deleted servers can be told apart.
+    """
 
     if context is None:
         tenant_id = token.get_tenant_id()
@@ -402,13 +413,18 @@ def get_servers(token, page_limit=None, next_page=None, all_tenants=True, contex
             raise ValueError("OpenStack Nova URL is invalid")
 
         api_cmd = url + "/v2.1/%s/servers" % tenant_id
+        if changes_since is not None:
+            api_cmd += "/detail"
 
+        api_cmd_args = []
         if page_limit is not None:
-            api_cmd += "?limit=%s" % page_limit
-            if all_tenants:
-                api_cmd += "&all_tenants=1"
-        elif all_tenants:
-            api_cmd += "?all_tenants=1"
+            api_cmd_args.append("limit=%s" % page_limit)
+        if all_tenants:
+            api_cmd_args.append("all_tenants=1")
+        if changes_since is not None:
+            api_cmd_args.append("changes-since=%s" % changes_since)
+        if api_cmd_args:
+            api_cmd += "?" + "&".join(api_cmd_args)
     else:
         api_cmd = next_page
 
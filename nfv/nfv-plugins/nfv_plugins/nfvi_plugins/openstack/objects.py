@@ -12,9 +12,20 @@ from nfv_common import debug
 from nfv_common.helpers import Constant
 from nfv_common.helpers import Constants
 from nfv_common.helpers import Singleton
+from nfv_common import timers
 
 DLOG = debug.debug_get_logger("nfv_plugins.nfvi_plugins.openstack.objects")
 
+# A token is treated as expired within TOKEN_EXPIRY_SECS of its expiry. Once
+# it expires within TOKEN_REFRESH_SECS it is treated as expired by one caller,
+# which gets a new token through its usual get-token task work while the
+# other callers keep using this token. The refresh is handed to another
+# caller if a new token has not replaced this one within
+# TOKEN_REFRESH_RETRY_SECS.
+TOKEN_EXPIRY_SECS = 60
+TOKEN_REFRESH_SECS = 300
+TOKEN_REFRESH_RETRY_SECS = 30
+
 
 class ServiceCategory(Constants, metaclass=Singleton):
     """Service Category Constants."""
@@ -131,6 +142,7 @@ class Directory:
         self._auth_user_domain_name = auth_user_domain_name
         self._auth_project_domain_name = auth_project_domain_name
         self._entries = {}
+        self._cache_key = None
 
     @property
     def service_category(self):
@@ -216,34 +228,101 @@ class Directory:
             region_name, service_name, service_type, endpoint_type, endpoint_override
         )
         self._entries[service] = entry
+        self._cache_key = None
 
     def get_service_info(self, service):
         """Get information for a particular service."""
 
         return self._entries.get(service, None)
 
+    @property
+    def cache_key(self):
+        """Returns a key identifying the credentials and services of the
+
+        directory, directories with the same key can share tokens.
+        """
+        if self._cache_key is not None:
+            return self._cache_key
+
+        self._cache_key = (
+            self._service_category,
+            self._auth_uri,
+            self._auth_protocol,
+            self._auth_host,
+            self._auth_port,
+            self._auth_project,
+            self._auth_username,
+            self._auth_user_domain_name,
+            self._auth_project_domain_name,
+            tuple(
+                (
+                    service,
+                    entry.region_name,
+                    entry.service_name,
+                    entry.service_type,
+                    entry.endpoint_type,
+                    entry.endpoint_override,
+                )
+                for service, entry in sorted(self._entries.items())
+            ),
+        )
+        return self._cache_key
+
 
 class Token:
-    """Token."""
+    """Token.
+
+    The expiry of the token is parsed once, and the endpoints of its
+    catalog are indexed by region, service name, service type and interface
+    the first time a service url is looked up, so checking the token and
+    looking up service urls does not parse timestamps or scan the catalog.
+    """
 
     def __init__(self, token_data, directory, token_id):
         self._expired = False
         self._data = token_data
         self._directory = directory
         self._token_id = token_id
+        self._expires_at = iso8601.parse_date(token_data["token"]["expires_at"])
+        self._endpoints = None
+        self._service_urls = {}
+        self._refresh_timestamp_ms = None
 
     def set_expired(self):
         self._expired = True
 
-    def is_expired(self, within_seconds=300):
-        if not self._expired:
-            end = iso8601.parse_date(self._data["token"]["expires_at"])
-            now = iso8601.parse_date(datetime.datetime.utcnow().isoformat())
-            if end <= now:
+    def expires_in_secs(self):
+        """Returns the seconds until the token expires."""
+
+        if self._expired:
+            return 0
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (self._expires_at - now).total_seconds()
+
+    def is_expired(self, within_seconds=None):
+        """Returns true if the token expires within the given seconds, or
+
+        if the caller should get a new token when no seconds are given.
+        """
+        expires_in_secs = self.expires_in_secs()
+        if within_seconds is not None:
+            return expires_in_secs <= within_seconds
+
+        if expires_in_secs <= TOKEN_EXPIRY_SECS:
+            return True
+
+        if expires_in_secs <= TOKEN_REFRESH_SECS:
+            now_ms = timers.get_monotonic_timestamp_in_ms()
+            if (
+                self._refresh_timestamp_ms is None
+                or now_ms - self._refresh_timestamp_ms
+                >= TOKEN_REFRESH_RETRY_SECS * 1000
+            ):
+                self._refresh_timestamp_ms = now_ms
+                DLOG.verbose("Refreshing token, expires in %i secs." % expires_in_secs)
                 return True
-            delta = abs(end - now).seconds
-            return delta <= within_seconds
-        return True
+
+        return False
 
     def get_id(self):
         """Get the identifier of the token."""
@@ -271,24 +350,44 @@ class Token:
 
         return url
 
+    def _index_endpoints(self):
+        """Index the endpoints of the catalog, the first endpoint listed
+
+        wins if the catalog has duplicates.
+        """
+        endpoints = {}
+        for catalog in self._data["token"]["catalog"]:
+            for endpoint in catalog["endpoints"]:
+                key = (
+                    endpoint["region"],
+                    catalog["name"],
+                    catalog["type"],
+                    endpoint["interface"],
+                )
+                endpoints.setdefault(key, endpoint["url"])
+        return endpoints
+
     def _get_service_url(self, region_name, service_name, service_type, endpoint_type):
         """Search the catalog of a service in a region for the url."""
 
-        for catalog in self._data["token"]["catalog"]:
-            if catalog["type"] == service_type:
-                if catalog["name"] == service_name:
-                    if 0 != len(catalog["endpoints"]):
-                        for endpoint in catalog["endpoints"]:
-                            if (
-                                endpoint["region"] == region_name
-                                and endpoint["interface"] == endpoint_type
-                            ):
-                                return endpoint["url"]
-        return None
+        if self._endpoints is None:
+            self._endpoints = self._index_endpoints()
+
+        return self._endpoints.get(
+            (region_name, service_name, service_type, endpoint_type), None
+        )
 
     def get_service_url(self, service, strip_version=False):
         """Get the service url for a service."""
 
+        key = (service, strip_version)
+        if key not in self._service_urls:
+            self._service_urls[key] = self._lookup_service_url(service, strip_version)
+        return self._service_urls[key]
+
+    def _lookup_service_url(self, service, strip_version):
+        """Look up the service url for a service."""
+
         service_info = self._directory.get_service_info(service)
         if service_info is not None:
             region_name = service_info.region_name
@@ -16,6 +16,8 @@ from nfv_plugins.nfvi_plugins.openstack.objects import Token
 
 DLOG = debug.debug_get_logger("nfv_plugins.nfvi_plugins.openstack")
 
+_token_cache = {}
+
 
 def get_token(directory):
     """Ask OpenStack for a token."""
@@ -87,6 +89,66 @@ def get_token(directory):
         return None
 
 
+def get_cached_token(directory):
+    """Get the token shared by the directories with the same credentials,
+
+    returns None if there is no token.  The token is returned even once it
+    has expired, callers check Token.is_expired to know when to get a new
+    token.
+    """
+    if directory is None:
+        return None
+
+    return _token_cache.get(directory.cache_key, None)
+
+
+def set_cached_token(directory, token):
+    """Share a token with the directories with the same credentials."""
+
+    if directory is None:
+        return
+
+    if token is None:
+        _token_cache.pop(directory.cache_key, None)
+    else:
+        _token_cache[directory.cache_key] = token
+
+
+def expire_cached_token(directory, token_id):
+    """Expire the shared token if it is the token with the given identifier,
+
+    a token rejected by a request may already have been replaced.
+    """
+    token = get_cached_token(directory)
+    if token is not None and token_id is not None and token.get_id() == token_id:
+        token.set_expired()
+
+
+class CachedToken:
+    """Cached Token.
+
+    Plugin attribute for the token shared through the token cache, given
+    the name of the plugin attribute holding the directory of the token.
+    """
+
+    def __init__(self, directory_attr):
+        """Create a cached token attribute."""
+
+        self._directory_attr = directory_attr
+
+    def __get__(self, obj, objtype=None):
+        """Returns the token shared by the plugins, see get_cached_token."""
+
+        if obj is None:
+            return self
+        return get_cached_token(getattr(obj, self._directory_attr))
+
+    def __set__(self, obj, token):
+        """Share a token with the other plugins."""
+
+        set_cached_token(getattr(obj, self._directory_attr), token)
+
+
 def get_directory(config, service_category):
     """Get directory information from the given configuration for the given
 
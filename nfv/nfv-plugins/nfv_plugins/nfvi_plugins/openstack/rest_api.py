@@ -5,14 +5,20 @@
 #
 import http.client as httplib
 import http.server as BaseHTTPServer
+import io
 import json
+import os
 import re
+import select
 import socket
 import socketserver as SocketServer
 import ssl
 import struct
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+import urllib.response
 
 import requests
 
@@ -21,6 +27,7 @@ from nfv_common.helpers import coroutine
 from nfv_common.helpers import get_system_ca_file
 from nfv_common.helpers import Object
 from nfv_common.helpers import Result
+from nfv_common import histogram
 from nfv_common import selobj
 from nfv_common import timers
 from nfv_plugins.nfvi_plugins.openstack.exceptions import OpenStackException
@@ -31,22 +38,63 @@ from nfv_plugins.nfvi_plugins.openstack.openstack_log import log_info
 DLOG = debug.debug_get_logger("nfv_plugins.nfvi_plugins.openstack.rest_api")
 
 _ssl_context = None
+_connection_pool = None
+_requests_session = None
+
+# Requests that can be resent without side effects if a pooled connection
+# turns out to have been closed by the server.
+_idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
 
 
 class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
-    """Reset-API Request Handler."""
+    """Reset-API Request Handler.
+
+    Handles one request on a connection of the Rest-API Server.  The
+    response is buffered until the request is done, so that it can be sent
+    with a content length and the connection kept open for the next
+    request if the client asked for a persistent connection.
+    """
+
+    protocol_version = "HTTP/1.1"
 
     _handlers = {}
+    _routes = {}
 
     def __init__(self, request, client_address, server):
         self._is_shutdown = False
         self._response_delayed = False
+        self._response_code = None
+        self._response_headers = []
+        self._content_length_sent = False
+        self._connection_sent = False
 
         # Call old-style class __init__
         BaseHTTPServer.BaseHTTPRequestHandler.__init__(
             self, request, client_address, server
         )
 
+    @property
+    def is_delayed(self):
+        """Returns true if the response is still to be done."""
+
+        return self._response_delayed and not self._is_shutdown
+
+    def setup(self):
+        """Override setup so that the requests of a connection share its
+
+        read buffer, and so that the response is buffered.
+        """
+        self.connection = self.request
+        self.rfile = self.server.get_connection(self.request).rfile
+        self.wfile = io.BytesIO()
+
+    def handle(self):
+        """Override handle so that only one request is handled, the server
+
+        waits for the next request of a persistent connection.
+        """
+        self.handle_one_request()
+
     def response_delayed(self):
         """Indicate that the response is not done inline."""
 
@@ -57,12 +105,17 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
 
         if not self._is_shutdown:
             if "server" != keyword.lower():
+                if "content-length" == keyword.lower():
+                    self._content_length_sent = True
+                elif "connection" == keyword.lower():
+                    self._connection_sent = True
                 BaseHTTPServer.BaseHTTPRequestHandler.send_header(self, keyword, value)
 
     def send_response(self, code, message=None):
         """Override send_response."""
 
         if not self._is_shutdown:
+            self._response_code = code
             BaseHTTPServer.BaseHTTPRequestHandler.send_response(self, code, message)
 
     def send_error(self, code, message=None):
@@ -71,6 +124,14 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
         if not self._is_shutdown:
             BaseHTTPServer.BaseHTTPRequestHandler.send_error(self, code, message)
 
+    def flush_headers(self):
+        """Override flush_headers so that the headers are held until the
+
+        request is done.
+        """
+        self._response_headers.extend(getattr(self, "_headers_buffer", []))
+        self._headers_buffer = []
+
     # pylint: disable-next=redefined-builtin
     def log_error(self, format, *args):
         """Override log_error so that it goes to syslog on error."""
@@ -78,33 +139,56 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
         DLOG.error(format, *args)
 
     def done(self):
-        # todo:abailey  Remove the calls to 'done' in the plugins
-        DLOG.debug("Deprecated: 'done' method no longer supported")
+        """Finished with processing a delayed response."""
+
+        if self._response_delayed:
+            self._done()
+
+    def _response(self):
+        """Returns the buffered response, None if there is no response."""
+
+        self.flush_headers()
+        headers = self._response_headers
+        if not headers:
+            return None
+
+        if b"\r\n" == headers[-1]:
+            headers = headers[:-1]
+
+        body = self.wfile.getvalue()
+        code = self._response_code
+        if not self._content_length_sent and code not in (
+            httplib.NO_CONTENT,
+            httplib.NOT_MODIFIED,
+        ):
+            headers.append(b"Content-Length: %i\r\n" % len(body))
+
+        if self.close_connection and not self._connection_sent:
+            headers.append(b"Connection: close\r\n")
+
+        headers.append(b"\r\n")
+        return b"".join(headers) + body
 
     def _done(self):
         """Finished with processing the request."""
 
         if not self._is_shutdown:
-            if not self.wfile.closed:
+            self._is_shutdown = True
+
+            response = self._response()
+            if response is None:
+                # Nothing to respond with, the client sees the connection
+                # closed.
+                self.close_connection = True
+            else:
                 try:
-                    self.wfile.flush()
+                    self.request.sendall(response)
                 except socket.error:
                     # Ignore socket errors, the connection could already
                     # be closed.
-                    pass
-
-            self.wfile.close()
-            self.rfile.close()
-
-            try:
-                # Force shutdown of the socket.
-                self.request.shutdown(socket.SHUT_WR)
-            except socket.error:
-                # Ignore any socket errors.
-                pass
+                    self.close_connection = True
 
-            self.request.close()
-            self._is_shutdown = True
+            self.server.request_done(self, self._response_delayed)
 
     def finish(self):
         """Override finish so that the socket is not closed, until we respond."""
@@ -113,44 +197,74 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
             # Clean up the request
             self._done()
 
-    def _dispatch(self, handlers):
+    def _dispatch(self, operation):
         """Dispatch Rest-API command to the appropriate handler."""
 
         DLOG.verbose("Rest-API dispatch, path=%s" % self.path)
 
-        path_list = list(handlers.keys())
-        path_list.sort(key=len, reverse=True)
-        for path in path_list:
-            # Longest match search
-            if re.search(path, self.path) is not None:
-                handler = handlers[path]
+        route = self._get_route(self.server.port, operation)
+        if route is not None:
+            regex, handlers = route
+            match = regex.match(self.path)
+            if match is not None:
+                handler = handlers[match.lastgroup]
                 handler(self)
-                break
 
     def do_GET(self):
         """Handle GET Rest-API command."""
 
-        self._dispatch(self._handlers[self.server.port]["GET"])
+        self._dispatch("GET")
 
     def do_POST(self):
         """Handle POST Rest-API command."""
 
-        self._dispatch(self._handlers[self.server.port]["POST"])
+        self._dispatch("POST")
 
     def do_PATCH(self):
         """Handle PATCH Rest-API command."""
 
-        self._dispatch(self._handlers[self.server.port]["PATCH"])
+        self._dispatch("PATCH")
 
     def do_DELETE(self):
         """Handle DELETE Rest-API command."""
 
-        self._dispatch(self._handlers[self.server.port]["DELETE"])
+        self._dispatch("DELETE")
 
     def do_PUT(self):
         """Handle PUT Rest-API command."""
 
-        self._dispatch(self._handlers[self.server.port]["PUT"])
+        self._dispatch("PUT")
+
+    @classmethod
+    def _get_route(cls, port, operation):
+        """Returns the route of an operation as a compiled regex and the
+
+        handlers indexed by the group names of the regex, or None if there
+        are no handlers for the operation.
+
+        Each path is searched for in the request path, the handler of the
+        longest path found is used.  The paths are combined, longest first,
+        into one regex matched from the start of the request path, as the
+        alternatives of a regex are tried in order the first path found is
+        the longest.
+        """
+        key = (port, operation)
+        if key not in cls._routes:
+            handlers = cls._handlers.get(port, {}).get(operation, {})
+            if not handlers:
+                cls._routes[key] = None
+            else:
+                path_list = list(handlers.keys())
+                path_list.sort(key=len, reverse=True)
+                route_handlers = {}
+                alternatives = []
+                for path_x, path in enumerate(path_list):
+                    group = "route%i" % path_x
+                    route_handlers[group] = handlers[path]
+                    alternatives.append("(?P<%s>[\\s\\S]*?(?:%s))" % (group, path))
+                cls._routes[key] = (re.compile("|".join(alternatives)), route_handlers)
+
+        return cls._routes[key]
 
     @classmethod
     def add_handler(cls, host, port, operation, path, handler):
@@ -163,6 +277,7 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
             cls._handlers[port][operation.upper()] = {}
 
         cls._handlers[port][operation.upper()][path] = handler
+        cls._routes.pop((port, operation.upper()), None)
 
     @classmethod
     def del_handler(cls, host, port, operation, path):
@@ -172,12 +287,69 @@ class RestAPIRequestDispatcher(BaseHTTPServer.BaseHTTPRequestHandler):
             if operation.upper() in cls._handlers[port]:
                 if path in cls._handlers[port][operation.upper()]:
                     del cls._handlers[port][operation.upper()][path]
+                    cls._routes.pop((port, operation.upper()), None)
+
+
+class RestAPIConnection:
+    """Rest-API Server Connection."""
+
+    def __init__(self, request, client_address, timeout_in_secs):
+        """Create a connection for an accepted socket."""
+
+        self.request = request
+        self.client_address = client_address
+        self.fd = request.fileno()
+        self.rfile = request.makefile("rb", -1)
+        self.timeout_in_secs = timeout_in_secs
+        self.last_request_ms = timers.get_monotonic_timestamp_in_ms()
+        self.waiting = False
+
+    def buffered(self):
+        """Returns true if the next request has already been received,
+
+        without waiting for it.
+        """
+        self.request.setblocking(False)
+        try:
+            return 0 < len(self.rfile.peek(1))
+
+        except (OSError, ValueError):
+            return False
+
+        finally:
+            try:
+                self.request.settimeout(self.timeout_in_secs)
+            except socket.error:
+                pass
+
+    def close(self):
+        """Close the connection."""
+
+        try:
+            self.rfile.close()
+        except socket.error:
+            pass
+
+        try:
+            # Force shutdown of the socket.
+            self.request.shutdown(socket.SHUT_WR)
+        except socket.error:
+            # Ignore any socket errors.
+            pass
+
+        self.request.close()
 
 
 class RestAPIServer(SocketServer.TCPServer):
-    """Rest-API Server."""
+    """Rest-API Server.
+
+    Connections on which the client asked for a persistent connection are
+    kept open, up to max_idle_connections of them, and closed once they
+    have been idle for idle_timeout_secs.  Idle connections are looked for
+    when a connection is accepted and every sixth of idle_timeout_secs.
+    """
 
-    def __init__(self, ip, port):
+    def __init__(self, ip, port, max_idle_connections=64, idle_timeout_secs=30):
         """Create the Rest-API Server."""
 
         l_on_off = 1
@@ -186,7 +358,9 @@ class RestAPIServer(SocketServer.TCPServer):
         self._ip = ip
         self._port = port
         self._http_handler = RestAPIRequestDispatcher
-        self._http_handler.protocol = "HTTP/1.1"
+        self._connections = {}
+        self._max_idle_connections = max_idle_connections
+        self._idle_timeout_ms = idle_timeout_secs * 1000
         try:
             socket.inet_pton(socket.AF_INET6, ip)
             self.address_family = socket.AF_INET6
@@ -207,6 +381,13 @@ class RestAPIServer(SocketServer.TCPServer):
         self.server_bind()
         self.server_activate()
         selobj.selobj_add_read_obj(self.fileno(), self.dispatch_rest_api)
+        interval_secs = max(idle_timeout_secs // 6, 1)
+        self._idle_timer_id = timers.timers_create_timer(
+            "rest-api-idle-connections",
+            interval_secs,
+            interval_secs,
+            self.audit_idle_connections,
+        )
 
     @property
     def ip(self):
@@ -230,13 +411,141 @@ class RestAPIServer(SocketServer.TCPServer):
 
         self._http_handler.del_handler(self._ip, self._port, operation, path)
 
+    def get_connection(self, request):
+        """Returns the connection of a request."""
+
+        return self._connections[request.fileno()]
+
+    def _close_connection(self, connection):
+        """Close a connection."""
+
+        if connection.waiting:
+            selobj.selobj_del_read_obj(connection.fd)
+            connection.waiting = False
+
+        self._connections.pop(connection.fd, None)
+        connection.close()
+
+    def _close_idle_connections(self):
+        """Close the connections that have been idle for too long, and the
+
+        longest idle connections if there are too many.
+        """
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        idle = sorted(
+            (x for x in self._connections.values() if x.waiting),
+            key=lambda x: x.last_request_ms,
+        )
+        excess = len(idle) - self._max_idle_connections
+        for connection in idle:
+            if 0 < excess or self._idle_timeout_ms <= (
+                now_ms - connection.last_request_ms
+            ):
+                DLOG.verbose(
+                    "Closing idle Rest-API connection from %s."
+                    % (connection.client_address,)
+                )
+                self._close_connection(connection)
+                excess -= 1
+
+    def _wait_for_request(self, connection):
+        """Wait for the next request of a connection."""
+
+        if not connection.waiting:
+            connection.waiting = True
+            selobj.selobj_add_read_obj(
+                connection.fd, self.dispatch_connection, connection
+            )
+
+    def _handle_requests(self, connection):
+        """Handle the requests received on a connection, until the next
+
+        request needs to be waited for.
+        """
+        while True:
+            connection.last_request_ms = timers.get_monotonic_timestamp_in_ms()
+            dispatcher = self._http_handler(
+                connection.request, connection.client_address, self
+            )
+
+            if connection.fd not in self._connections:
+                return
+
+            if dispatcher.is_delayed:
+                # Responses must be sent in order, stop reading requests
+                # until the response has been sent.
+                if connection.waiting:
+                    selobj.selobj_del_read_obj(connection.fd)
+                    connection.waiting = False
+                return
+
+            if not connection.buffered():
+                self._wait_for_request(connection)
+                return
+
+    def request_done(self, dispatcher, delayed):
+        """Notification that the response to a request has been sent."""
+
+        connection = self._connections.get(dispatcher.request.fileno(), None)
+        if connection is None:
+            return
+
+        if dispatcher.close_connection:
+            self._close_connection(connection)
+
+        elif delayed:
+            if connection.buffered():
+                self._handle_requests(connection)
+            else:
+                self._wait_for_request(connection)
+
     def process_request(self, request, client_address):
         """Process a request by invoking the http_handler."""
 
-        self.finish_request(request, client_address)
-        # Override process_request so that the socket is not closed,
-        # until we respond.
-        # self.shutdown_request(request)
+        connection = RestAPIConnection(request, client_address, request.gettimeout())
+        self._connections[connection.fd] = connection
+        self._handle_requests(connection)
+
+    def server_close(self):
+        """Close the server."""
+
+        if self._idle_timer_id is not None:
+            timers.timers_delete_timer(self._idle_timer_id)
+            self._idle_timer_id = None
+        SocketServer.TCPServer.server_close(self)
+
+    def shutdown_request(self, request):
+        """Close the connection of a request."""
+
+        connection = self._connections.get(request.fileno(), None)
+        if connection is not None:
+            self._close_connection(connection)
+        else:
+            SocketServer.TCPServer.shutdown_request(self, request)
+
+    @coroutine
+    def dispatch_connection(self, connection):
+        """Dispatch the next Rest-API request received on a connection."""
+
+        while True:
+            yield
+            try:
+                self._handle_requests(connection)
+
+            except BaseException as e:
+                DLOG.error("Caught exception while processing request, error=%s." % e)
+                self.handle_error(connection.request, connection.client_address)
+                self._close_connection(connection)
+
+    @coroutine
+    def audit_idle_connections(self):
+        """Called periodically to close the connections that have been idle
+
+        for too long, even if no new connections are accepted.
+        """
+        while True:
+            (yield)
+            self._close_idle_connections()
 
     @coroutine
     def dispatch_rest_api(self):
@@ -245,6 +554,8 @@ class RestAPIServer(SocketServer.TCPServer):
         while True:
             select_obj = yield
             if select_obj == self.fileno():
+                self._close_idle_connections()
+
                 try:
                     request, client_address = self.get_request()
 
@@ -277,6 +588,335 @@ def rest_api_get_server(host, port):
     return RestAPIServer(host, port)
 
 
+class RestAPIHTTPSConnection(httplib.HTTPSConnection):
+    """HTTPS connection that resumes the TLS session of a previous
+
+    connection to the same endpoint when reconnecting.
+    """
+
+    def __init__(self, host, port=None, tls_session=None, **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.tls_session = tls_session
+
+    def connect(self):
+        """Connect, resuming the TLS session if one is available."""
+
+        httplib.HTTPConnection.connect(self)
+
+        server_hostname = self._tunnel_host if self._tunnel_host else self.host
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=self.tls_session
+        )
+        self.tls_session = self.sock.session
+
+
+def _rest_api_connection_dropped(connection):
+    """Returns true if an idle connection can no longer be used.
+
+    Nothing is expected from the server on an idle keep-alive connection, so
+    a readable socket means the server closed it (or sent something that
+    cannot be answered to), sending a request on it would fail.
+    """
+    if connection.sock is None:
+        return False
+
+    poller = select.poll()
+    poller.register(connection.sock, select.POLLIN)
+    return bool(poller.poll(0))
+
+
+class RestAPIConnectionPool:
+    """Rest-API Connection Pool.
+
+    Keeps idle HTTP/1.1 keep-alive connections per (scheme, host, port) so
+    that requests to the same endpoint do not each pay for a new TCP and TLS
+    handshake.  A pool belongs to the process that created it, connections
+    are only handed to one thread at a time.
+    """
+
+    def __init__(self, max_idle_per_endpoint=4, max_idle_secs=30):
+        """Create a connection pool."""
+
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._max_idle_per_endpoint = max_idle_per_endpoint
+        self._max_idle_ms = max_idle_secs * 1000
+        self._idle_connections = {}
+        self._tls_sessions = {}
+        self._stats = {}
+
+    @property
+    def pid(self):
+        """Returns the process identifier of the process owning the pool."""
+
+        return self._pid
+
+    def _endpoint_stats(self, endpoint):
+        """Returns the statistics of an endpoint."""
+
+        stats = self._stats.get(endpoint, None)
+        if stats is None:
+            stats = {
+                "requests": 0,
+                "connections-created": 0,
+                "connections-reused": 0,
+                "connections-retried": 0,
+                "connections-dropped": 0,
+                "total-ms": 0,
+                "max-ms": 0,
+            }
+            self._stats[endpoint] = stats
+        return stats
+
+    def get_connection(self, endpoint, timeout_in_secs):
+        """Returns a connection to the endpoint and whether it was reused."""
+
+        scheme, host, port = endpoint
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+
+        with self._lock:
+            idle_connections = self._idle_connections.get(endpoint, [])
+            while idle_connections:
+                connection, idle_timestamp_ms = idle_connections.pop()
+                if now_ms - idle_timestamp_ms > self._max_idle_ms:
+                    connection.close()
+                    continue
+
+                if _rest_api_connection_dropped(connection):
+                    self._endpoint_stats(endpoint)["connections-dropped"] += 1
+                    connection.close()
+                    continue
+
+                self._endpoint_stats(endpoint)["connections-reused"] += 1
+                connection.timeout = timeout_in_secs
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout_in_secs)
+                return connection, True
+
+            self._endpoint_stats(endpoint)["connections-created"] += 1
+            tls_session = self._tls_sessions.get(endpoint, None)
+
+        if "https" == scheme:
+            connection = RestAPIHTTPSConnection(
+                host,
+                port,
+                tls_session=tls_session,
+                timeout=timeout_in_secs,
+                context=_rest_api_ssl_context(),
+            )
+        else:
+            connection = httplib.HTTPConnection(host, port, timeout=timeout_in_secs)
+        return connection, False
+
+    def put_connection(self, endpoint, connection):
+        """Return a connection to the pool for reuse."""
+
+        with self._lock:
+            tls_session = getattr(connection, "tls_session", None)
+            if tls_session is not None:
+                self._tls_sessions[endpoint] = tls_session
+
+            idle_connections = self._idle_connections.setdefault(endpoint, [])
+            if len(idle_connections) < self._max_idle_per_endpoint:
+                idle_connections.append(
+                    (connection, timers.get_monotonic_timestamp_in_ms())
+                )
+                return
+
+        connection.close()
+
+    def record_request(self, endpoint, elapsed_ms, retried):
+        """Record the latency of a request to an endpoint."""
+
+        with self._lock:
+            stats = self._endpoint_stats(endpoint)
+            stats["requests"] += 1
+            stats["total-ms"] += int(elapsed_ms)
+            stats["max-ms"] = max(stats["max-ms"], int(elapsed_ms))
+            if retried:
+                stats["connections-retried"] += 1
+
+    def get_stats(self):
+        """Returns a copy of the per-endpoint statistics."""
+
+        with self._lock:
+            return {
+                "%s://%s:%s" % endpoint: dict(stats)
+                for endpoint, stats in self._stats.items()
+            }
+
+    def close(self):
+        """Close all idle connections."""
+
+        with self._lock:
+            for idle_connections in self._idle_connections.values():
+                for connection, _ in idle_connections:
+                    connection.close()
+            self._idle_connections.clear()
+
+
+def _rest_api_ssl_context():
+    """Returns the cached ssl context used for https requests."""
+
+    global _ssl_context
+
+    if _ssl_context is None:
+        ca_file = get_system_ca_file()
+        if ca_file:
+            _ssl_context = ssl.create_default_context(
+                ssl.Purpose.SERVER_AUTH, cafile=ca_file
+            )
+    return _ssl_context
+
+
+def rest_api_get_connection_pool():
+    """Returns the connection pool of the calling process."""
+
+    global _connection_pool
+
+    if _connection_pool is None or _connection_pool.pid != os.getpid():
+        # Connections inherited from a parent process cannot be shared.
+        if _connection_pool is not None:
+            _connection_pool.close()
+        _connection_pool = RestAPIConnectionPool()
+    return _connection_pool
+
+
+def rest_api_get_connection_pool_stats():
+    """Returns the per-endpoint statistics of the connection pool."""
+
+    return rest_api_get_connection_pool().get_stats()
+
+
+def _rest_api_get_requests_session():
+    """Returns the requests session used to post files."""
+
+    global _requests_session
+
+    if _requests_session is None or _requests_session.pid != os.getpid():
+        _requests_session = requests.Session()
+        _requests_session.pid = os.getpid()
+    return _requests_session
+
+
+def _rest_api_pooled_urlopen(request_info, timeout_in_secs, redirects=0):
+    """Send a request over a pooled keep-alive connection.
+
+    Returns None if the request has to be sent using urlopen instead.
+    Otherwise returns the status code, response headers and body, raising
+    the same urllib errors that urlopen would for error responses and
+    connection failures.  Redirects of GET and HEAD requests are followed
+    like urlopen would, the request is never sent a second time.
+    """
+    url = urllib.parse.urlsplit(request_info.full_url)
+    if url.scheme not in ("http", "https"):
+        return None
+
+    if url.scheme in urllib.request.getproxies():
+        return None
+
+    port = url.port
+    if port is None:
+        port = httplib.HTTPS_PORT if "https" == url.scheme else httplib.HTTP_PORT
+    endpoint = (url.scheme, url.hostname, port)
+
+    selector = url.path if url.path else "/"
+    if url.query:
+        selector += "?" + url.query
+
+    headers = dict(request_info.header_items())
+    if request_info.data is not None and "Content-type" not in headers:
+        headers["Content-type"] = "application/x-www-form-urlencoded"
+
+    method = request_info.get_method()
+    pool = rest_api_get_connection_pool()
+    start_ms = timers.get_monotonic_timestamp_in_ms()
+    retried = False
+
+    while True:
+        connection, reused = pool.get_connection(endpoint, timeout_in_secs)
+        try:
+            connection.request(method, selector, request_info.data, headers)
+            response = connection.getresponse()
+
+        except (
+            httplib.RemoteDisconnected,
+            BrokenPipeError,
+            ConnectionResetError,
+        ) as e:
+            connection.close()
+            if reused and not retried and method in _idempotent_methods:
+                # The server closed the idle connection, try a new one. Other
+                # requests may have reached the server, so are not resent.
+                retried = True
+                continue
+            raise urllib.error.URLError(e)
+
+        except OSError as e:
+            connection.close()
+            raise urllib.error.URLError(e)
+
+        except BaseException:
+            connection.close()
+            raise
+
+        break
+
+    try:
+        response_raw = response.read()
+    except BaseException:
+        connection.close()
+        raise
+
+    if response.will_close:
+        connection.close()
+    else:
+        pool.put_connection(endpoint, connection)
+
+    elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
+    pool.record_request(endpoint, elapsed_ms, retried)
+    histogram.add_histogram_data(
+        "rest-api %s://%s:%s [latency]" % endpoint, elapsed_ms // 100, "decisecond"
+    )
+
+    if 300 <= response.status:
+        response_fp = urllib.response.addinfourl(
+            io.BytesIO(response_raw),
+            response.msg,
+            request_info.full_url,
+            response.status,
+        )
+
+        location = response.msg.get("location", response.msg.get("uri", None))
+        if response.status < 400 and method in ("GET", "HEAD") and location is not None:
+            redirect_handler = urllib.request.HTTPRedirectHandler()
+            if redirects < redirect_handler.max_redirections:
+                # Raises an HTTPError if the redirect cannot be followed.
+                redirect_request = redirect_handler.redirect_request(
+                    request_info,
+                    response_fp,
+                    response.status,
+                    response.reason,
+                    response.msg,
+                    urllib.parse.urljoin(request_info.full_url, location),
+                )
+                redirect_response = _rest_api_pooled_urlopen(
+                    redirect_request, timeout_in_secs, redirects + 1
+                )
+                if redirect_response is not None:
+                    return redirect_response
+
+        raise urllib.error.HTTPError(
+            request_info.full_url,
+            response.status,
+            response.reason,
+            response.msg,
+            response_fp,
+        )
+
+    return response.status, response.msg, response_raw
+
+
 def _rest_api_request(
     token_id,
     method,
@@ -330,34 +970,38 @@ def _rest_api_request(
         if file_to_post is not None:
             headers = {"X-Auth-Token": token_id}
             files = {"file": ("for_upload", file_to_post)}
-            with requests.post(
+            with _rest_api_get_requests_session().post(
                 api_cmd, headers=headers, files=files, timeout=timeout_in_secs
             ) as request:
                 status_code = request.status_code
                 response_raw = request.text
 
         else:
-            global _ssl_context
-            ssl_context = None
-            if api_cmd.startswith("https://"):
-                if _ssl_context is None:
-                    ca_file = get_system_ca_file()
-                    if ca_file:
-                        _ssl_context = ssl.create_default_context(
-                            ssl.Purpose.SERVER_AUTH, cafile=ca_file
-                        )
-                ssl_context = _ssl_context
-            with urllib.request.urlopen(
-                request_info, timeout=timeout_in_secs, context=ssl_context
-            ) as request:
+            pooled_response = _rest_api_pooled_urlopen(request_info, timeout_in_secs)
+            if pooled_response is not None:
+                status_code, response_info, response_raw = pooled_response
                 headers = []  # list of tuples
-                for key, value in request.info().items():
+                for key, value in response_info.items():
                     if key not in headers_per_hop:
                         cap_key = "-".join((ck.capitalize() for ck in key.split("-")))
                         headers.append((cap_key, value))
-
-                response_raw = request.read()
-                status_code = request.code
+            else:
+                ssl_context = None
+                if api_cmd.startswith("https://"):
+                    ssl_context = _rest_api_ssl_context()
+                with urllib.request.urlopen(
+                    request_info, timeout=timeout_in_secs, context=ssl_context
+                ) as request:
+                    headers = []  # list of tuples
+                    for key, value in request.info().items():
+                        if key not in headers_per_hop:
+                            cap_key = "-".join(
+                                (ck.capitalize() for ck in key.split("-"))
+                            )
+                            headers.append((cap_key, value))
+
+                    response_raw = request.read()
+                    status_code = request.code
 
         if response_raw == "" or response_raw == b"":
             response = {}
@@ -472,6 +1116,7 @@ def _rest_api_request(
             headers,
             response_raw,
             reason,
+            token_id=token_id,
         )
 
     except urllib.error.URLError as e:
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import os
+import time
+
+from nfv_common.debug._debug_log import debug_get_logger
+from nfv_common.debug._debug_module import debug_finalize
+from nfv_common.debug._debug_module import debug_initialize
+from nfv_common.debug._debug_thread import DebugLoggingThread
+
+# Loggers logging on every pass of the main loop of the VIM.
+TICK_LOGGERS = [
+    "nfv_common.timers.timer",
+    "nfv_common.timers.timer_scheduler",
+    "nfv_common.timers.timestamp",
+    "nfv_common.tasks.task_scheduler",
+    "nfv_common.tasks.task_worker_pool",
+]
+
+DEFAULT_CONFIG_FILE = os.path.join(
+    os.path.dirname(__file__), "../../nfv-vim/nfv_vim/debug.ini"
+)
+
+
+class Timer:
+    """Timer standing in for the objects logged by the main loop."""
+
+    def __init__(self, timer_id):
+        self.timer_id = timer_id
+        self.name = "timer-%s" % timer_id
+
+    def __str__(self):
+        return "Timer(id=%s, name=%s)" % (self.timer_id, self.name)
+
+
+def tick_deferred(loggers, timer):
+    """Log the way the main loop does, formatting only enabled logs."""
+
+    for logger in loggers:
+        logger.verbose("Timer %s fired, name=%s.", timer.timer_id, timer.name)
+        logger.debug("Scheduling %s.", timer)
+
+
+def tick_eager(loggers, timer):
+    """Log the way the main loop used to, formatting every log."""
+
+    for logger in loggers:
+        logger.verbose("Timer %s fired, name=%s." % (timer.timer_id, timer.name))
+        logger.debug("Scheduling %s." % timer)
+
+
+def tick_info(loggers, timer):
+    """Log at a level enabled by default, every log is recorded."""
+
+    for logger in loggers:
+        logger.info("Timer %s fired, name=%s.", timer.timer_id, timer.name)
+
+
+def run(tick, loggers, ticks):
+    """Run the given number of main loop ticks, returns the elapsed seconds."""
+
+    timer = Timer(1)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick(loggers, timer)
+    elapsed = time.perf_counter() - start
+    DebugLoggingThread().flush()
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-c", "--config", help="debug configuration", default=DEFAULT_CONFIG_FILE
+    )
+    parser.add_argument("-t", "--ticks", help="main loop ticks", type=int, default=0)
+    args = parser.parse_args()
+
+    # No handlers, only the cost to the process logging is measured.
+    debug_initialize({"config_file": args.config, "handlers": ""}, "BENCHMARK")
+    loggers = [debug_get_logger(x) for x in TICK_LOGGERS]
+    ticks = args.ticks or 100000
+
+    print("%10s %10s %12s %8s" % ("tick", "ticks", "usecs/tick", "loggers"))
+    for tick in [tick_deferred, tick_eager, tick_info]:
+        elapsed = run(tick, loggers, ticks)
+        print(
+            "%10s %10d %12.3f %8d"
+            % (tick.__name__[5:], ticks, elapsed * 1000000 / ticks, len(loggers))
+        )
+    print("dropped=%d" % DebugLoggingThread().dropped)
+    debug_finalize()
@@ -0,0 +1,224 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import random
+import time
+
+from nfv_vim.objects import INSTANCE_GROUP_POLICY
+from nfv_vim.strategy._host_grouping import HostGrouping
+
+CONFLICT_POLICIES = [
+    INSTANCE_GROUP_POLICY.ANTI_AFFINITY,
+    INSTANCE_GROUP_POLICY.ANTI_AFFINITY_BEST_EFFORT,
+]
+
+
+class Host:
+    """Worker host of a benchmark cloud."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Cloud:
+    """Worker hosts, instances, instance groups and aggregates of an edge
+
+    cloud, indexed the way the instance, instance group and host aggregate
+    tables index them.
+    """
+
+    def __init__(
+        self, num_hosts, instances_per_host, group_size, num_aggregates, seed=0
+    ):
+        rand = random.Random(seed)
+        self.hosts = [Host("worker-%d" % x) for x in range(num_hosts)]
+
+        self.host_instances = {}
+        instance_uuids = []
+        for host in self.hosts:
+            self.host_instances[host.name] = []
+            for _ in range(rand.randint(0, instances_per_host)):
+                instance_uuid = "instance-%d" % len(instance_uuids)
+                self.host_instances[host.name].append(instance_uuid)
+                instance_uuids.append(instance_uuid)
+
+        # Instances in groups of up to group_size members, most of them
+        # anti-affinity groups.
+        self.instance_groups = {}
+        self.instance_group_uuids = {}
+        rand.shuffle(instance_uuids)
+        for idx in range(0, len(instance_uuids), group_size):
+            group_uuid = "group-%d" % len(self.instance_groups)
+            policy = rand.choice(CONFLICT_POLICIES + [INSTANCE_GROUP_POLICY.AFFINITY])
+            self.instance_groups[group_uuid] = [policy]
+            for instance_uuid in instance_uuids[idx : idx + group_size]:
+                self.instance_group_uuids[instance_uuid] = {group_uuid}
+
+        # Every host in one aggregate, some in a second one.
+        self.aggregate_host_names = {}
+        self.host_aggregate_names = {}
+        for host in self.hosts:
+            aggregate_names = {"aggregate-%d" % rand.randrange(num_aggregates)}
+            if rand.random() < 0.25:
+                aggregate_names.add("aggregate-%d" % rand.randrange(num_aggregates))
+            self.host_aggregate_names[host.name] = sorted(aggregate_names)
+            for aggregate_name in aggregate_names:
+                self.aggregate_host_names.setdefault(aggregate_name, []).append(
+                    host.name
+                )
+
+    def same_group(self, policy, instance_uuid, peer_instance_uuid):
+        """Returns true if the instances share a group with the policy."""
+
+        group_uuids = self.instance_group_uuids.get(instance_uuid, set())
+        peer_group_uuids = self.instance_group_uuids.get(peer_instance_uuid, set())
+        for group_uuid in group_uuids & peer_group_uuids:
+            if policy in self.instance_groups[group_uuid]:
+                return True
+        return False
+
+    def conflict_keys(self, host_name):
+        """Returns the anti-affinity groups with instances on the host."""
+
+        conflict_keys = set()
+        for instance_uuid in self.host_instances[host_name]:
+            for group_uuid in self.instance_group_uuids.get(instance_uuid, set()):
+                for policy in CONFLICT_POLICIES:
+                    if policy in self.instance_groups[group_uuid]:
+                        conflict_keys.add(group_uuid)
+                        break
+        return conflict_keys
+
+    def aggregate_limits(self, max_parallel_hosts):
+        """Returns the limit of hosts updated at once in each aggregate."""
+
+        aggregate_ratio = min(float(max_parallel_hosts) / len(self.hosts), 0.5)
+        aggregate_limits = {}
+        for aggregate_name, host_names in self.aggregate_host_names.items():
+            if 1 == len(host_names):
+                aggregate_limits[aggregate_name] = 1
+            else:
+                aggregate_limits[aggregate_name] = max(
+                    1, int(len(host_names) * aggregate_ratio)
+                )
+        return aggregate_limits
+
+
+def group_hosts_pairwise(cloud, max_parallel_hosts, aggregate_limits):
+    """Group the hosts comparing the instances of every pair of hosts and
+
+    recounting the aggregates of every list, the way worker host lists were
+    created before the host grouping engine.
+    """
+
+    def has_policy_conflict(host, peer_host):
+        for instance_uuid in cloud.host_instances[host.name]:
+            for peer_instance_uuid in cloud.host_instances[peer_host.name]:
+                for policy in CONFLICT_POLICIES:
+                    if cloud.same_group(policy, instance_uuid, peer_instance_uuid):
+                        return True
+        return False
+
+    def aggregate_limit_reached(host, host_list):
+        host_aggregate_count = {}
+        for existing_host in host_list:
+            for aggregate_name in cloud.host_aggregate_names[existing_host.name]:
+                host_aggregate_count[aggregate_name] = (
+                    host_aggregate_count.get(aggregate_name, 0) + 1
+                )
+        for aggregate_name in cloud.host_aggregate_names[host.name]:
+            if aggregate_name in host_aggregate_count:
+                if (
+                    host_aggregate_count[aggregate_name]
+                    == aggregate_limits[aggregate_name]
+                ):
+                    return True
+        return False
+
+    host_lists = []
+    for host in cloud.hosts:
+        for host_list in host_lists:
+            if len(host_list) >= max_parallel_hosts:
+                continue
+
+            for peer_host in host_list:
+                if has_policy_conflict(host, peer_host):
+                    break
+            else:
+                if aggregate_limit_reached(host, host_list):
+                    continue
+
+                host_list.append(host)
+                break
+        else:
+            host_lists.append([host])
+    return host_lists
+
+
+def group_hosts(cloud, max_parallel_hosts, aggregate_limits):
+    """Group the hosts using the host grouping engine."""
+
+    host_grouping = HostGrouping(max_parallel_hosts, aggregate_limits)
+    for host in cloud.hosts:
+        host_grouping.add_host(
+            host,
+            cloud.conflict_keys(host.name),
+            cloud.host_aggregate_names[host.name],
+        )
+    return host_grouping.host_lists
+
+
+def run(group, cloud, max_parallel_hosts):
+    """Group the hosts of the cloud, returns the host names of each list
+
+    and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    host_lists = group(
+        cloud, max_parallel_hosts, cloud.aggregate_limits(max_parallel_hosts)
+    )
+    elapsed = time.perf_counter() - start
+    return [[host.name for host in host_list] for host_list in host_lists], elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n", "--hosts", help="worker hosts", type=int, nargs="+", default=[]
+    )
+    parser.add_argument(
+        "-p", "--max-parallel", help="max parallel hosts", type=int, default=20
+    )
+    parser.add_argument(
+        "-i", "--instances", help="max instances per host", type=int, default=10
+    )
+    parser.add_argument(
+        "-g", "--group-size", help="instance group size", type=int, default=4
+    )
+    parser.add_argument(
+        "-a", "--aggregates", help="host aggregates", type=int, default=8
+    )
+    args = parser.parse_args()
+
+    print(
+        "%8s %8s %12s %12s %8s %10s"
+        % ("hosts", "lists", "pairwise-ms", "engine-ms", "speedup", "identical")
+    )
+    for num_hosts in args.hosts or [500, 1000, 2000]:
+        cloud = Cloud(num_hosts, args.instances, args.group_size, args.aggregates)
+        expected, pairwise_elapsed = run(group_hosts_pairwise, cloud, args.max_parallel)
+        host_lists, engine_elapsed = run(group_hosts, cloud, args.max_parallel)
+        print(
+            "%8d %8d %12.1f %12.1f %8.1f %10s"
+            % (
+                num_hosts,
+                len(host_lists),
+                pairwise_elapsed * 1000,
+                engine_elapsed * 1000,
+                pairwise_elapsed / engine_elapsed,
+                expected == host_lists,
+            )
+        )
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import argparse
+import socket
+import threading
+import time
+
+from nfv_common import selobj
+from nfv_common.tcp._tcp_connection import TCPConnection
+
+
+def connections(auth_key=None):
+    """Returns a blocking client and non-blocking server connection."""
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    client = TCPConnection("127.0.0.1", 0, auth_key=auth_key)
+    client.connect("127.0.0.1", listener.getsockname()[1])
+    sock, address = listener.accept()
+    listener.close()
+    server = TCPConnection(address[0], address[1], sock, False, auth_key=auth_key)
+    return client, server
+
+
+def run(msg_size, count, auth_key=None):
+    """Send count responses of msg_size bytes from the server to the client,
+
+    the way strategy responses are sent from the VIM main loop to the
+    VIM-API, returns the elapsed seconds.
+    """
+    selobj.selobj_initialize()
+    client, server = connections(auth_key)
+    payload = "x" * msg_size
+    received = []
+
+    def receive():
+        for _ in range(count):
+            msg = client.receive(timeout_in_secs=30)
+            if msg is None or len(msg) != msg_size:
+                break
+            received.append(len(msg))
+
+    start = time.monotonic()
+    thread = threading.Thread(target=receive)
+    thread.start()
+    for _ in range(count):
+        server.send(payload)
+        selobj.selobj_dispatch(0)
+    while thread.is_alive():
+        selobj.selobj_dispatch(10)
+    elapsed = time.monotonic() - start
+
+    client.close()
+    server.close()
+    selobj.selobj_finalize()
+    if count != len(received):
+        raise RuntimeError("message lost")
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-s", "--sizes", help="message sizes in KiB", default="1,64,1024,4096,16384"
+    )
+    parser.add_argument("-c", "--count", help="messages per size", type=int, default=0)
+    parser.add_argument("-a", "--auth", help="authorize messages", action="store_true")
+    args = parser.parse_args()
+
+    auth_key = "benchmark" if args.auth else None
+    print("%10s %8s %10s %12s" % ("size-KiB", "count", "MiB/s", "messages/s"))
+    for size in [int(x) for x in args.sizes.split(",")]:
+        msg_size = size * 1024
+        # Send about 64 MiB of each size unless told otherwise.
+        count = args.count or max(8, (64 * 1024 * 1024) // msg_size)
+        elapsed = run(msg_size, count, auth_key)
+        print(
+            "%10d %8d %10.1f %12.1f"
+            % (
+                size,
+                count,
+                msg_size * count / elapsed / (1024 * 1024),
+                count / elapsed,
+            )
+        )
@@ -259,6 +259,13 @@ class SwUpdateStrategyTestCase(testcase.NFVTestCase):
     def tearDown(self):
         """Cleanup testing setup."""
 
+        for table in (
+            self._instance_table,
+            self._instance_group_table,
+            self._host_table,
+            self._host_aggregate_table,
+        ):
+            self.assertEqual([], table.check_indexes())
         super().tearDown()
         self._tenant_table.clear()
         self._instance_type_table.clear()
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_unit_tests.tests import testcase
+from nfv_vim.audits import _audit_rate_controller
+from nfv_vim.audits._audit_rate_controller import AuditRateController
+
+
+class TestAuditRateController(testcase.NFVTestCase):
+    """Unit tests for the audit rate controller."""
+
+    def setUp(self):
+        super().setUp()
+        self.now_ms = 1000
+        self.patch(
+            _audit_rate_controller.timers,
+            "get_monotonic_timestamp_in_ms",
+            lambda: self.now_ms,
+        )
+        self.key = 0
+
+    def _start(self, controller):
+        started = []
+        while controller.can_start():
+            controller.request_started(self.key)
+            started.append(self.key)
+            self.key += 1
+        return started
+
+    def _complete(self, controller, keys, latency_ms=100, success=True):
+        self.now_ms += latency_ms
+        for key in keys:
+            controller.request_complete(key, success)
+
+    def test_additive_increase(self):
+        controller = AuditRateController(
+            "test", initial_concurrent=4, max_concurrent=8, max_requests_per_sec=1000
+        )
+        keys = self._start(controller)
+        self.assertEqual(4, len(keys))
+        self._complete(controller, keys)
+        self.assertEqual(5, controller.concurrency)
+
+        for _ in range(20):
+            self._complete(controller, self._start(controller))
+        self.assertEqual(8, controller.concurrency)
+        self.assertEqual(8, len(self._start(controller)))
+
+    def test_backoff_on_failure(self):
+        controller = AuditRateController(
+            "test", initial_concurrent=8, max_concurrent=8, max_requests_per_sec=1000
+        )
+        keys = self._start(controller)
+
+        # The failures of requests outstanding together only back off once.
+        self._complete(controller, keys, success=False)
+        self.assertEqual(4, controller.concurrency)
+
+        self._complete(controller, self._start(controller), success=False)
+        self.assertEqual(2, controller.concurrency)
+
+        for _ in range(3):
+            self._complete(controller, self._start(controller), success=False)
+        self.assertEqual(1, controller.concurrency)
+
+    def test_backoff_on_latency(self):
+        controller = AuditRateController(
+            "test",
+            initial_concurrent=4,
+            target_latency_ms=500,
+            max_requests_per_sec=1000,
+        )
+        self._complete(controller, self._start(controller), latency_ms=5000)
+        self.assertEqual(2, controller.concurrency)
+        self.assertEqual(5000, controller.latency_ms)
+
+    def test_token_bucket(self):
+        controller = AuditRateController(
+            "test", initial_concurrent=32, max_concurrent=32, max_requests_per_sec=2
+        )
+        keys = self._start(controller)
+        self.assertEqual(32, len(keys))
+        self._complete(controller, keys, latency_ms=0)
+        self.assertEqual([], self._start(controller))
+
+        self.now_ms += 1000
+        self.assertEqual(2, len(self._start(controller)))
+
+    def test_drain_time(self):
+        controller = AuditRateController(
+            "test", initial_concurrent=4, max_requests_per_sec=1000
+        )
+        self.assertIsNone(controller.drain_time_secs(100))
+        self._complete(controller, self._start(controller), latency_ms=400)
+        self.assertEqual(5, controller.concurrency)
+        self.assertEqual(8, controller.drain_time_secs(100))
+
+    def test_drain_time_rate_limited(self):
+        # Five requests every 400 ms would be 12.5 per second, the token
+        # bucket only starts 10 per second.
+        controller = AuditRateController("test", initial_concurrent=4)
+        self._complete(controller, self._start(controller), latency_ms=400)
+        self.assertEqual(5, controller.concurrency)
+        self.assertEqual(10, controller.drain_time_secs(100))
+
+    def test_backoff_on_overdue(self):
+        controller = AuditRateController(
+            "test", initial_concurrent=8, max_concurrent=8, max_requests_per_sec=1000
+        )
+        keys = self._start(controller)
+        self.now_ms += 10000
+        self.assertEqual(keys, controller.overdue(10000))
+        self.assertEqual(4, controller.concurrency)
+
+        # Requests still outstanding do not back off again.
+        self.now_ms += 10000
+        self.assertEqual(keys, controller.overdue(10000))
+        self.assertEqual(4, controller.concurrency)
+
+        controller.request_started("slow")
+        self.now_ms += 10000
+        self.assertEqual(keys + ["slow"], controller.overdue(10000))
+        self.assertEqual(2, controller.concurrency)
+
+        controller.request_abandoned("slow")
+        self._complete(controller, keys)
+        self.assertEqual([], controller.overdue(0))
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_unit_tests.tests import testcase
+from nfv_vim.audits import _audit_scheduler
+from nfv_vim.audits._audit_scheduler import AuditScheduler
+
+
+class TestAuditScheduler(testcase.NFVTestCase):
+    """Unit tests for the audit scheduler."""
+
+    def setUp(self):
+        super().setUp()
+        self.now_ms = 1000
+        self.patch(
+            _audit_scheduler.timers,
+            "get_monotonic_timestamp_in_ms",
+            lambda: self.now_ms,
+        )
+        self.started = []
+
+    def _create_scheduler(self, max_concurrent, enabled=None):
+        scheduler = AuditScheduler("test-audit", max_concurrent)
+        for name, depends_on in [
+            ("system", None),
+            ("hosts", None),
+            ("hypervisors", ["hosts"]),
+            ("tenants", ["hosts"]),
+            ("instances", ["hypervisors", "tenants"]),
+        ]:
+            scheduler.add_audit(
+                name,
+                lambda name=name: self.started.append(name),
+                depends_on,
+                enabled if "tenants" == name else None,
+            )
+        return scheduler
+
+    def test_sequential(self):
+        scheduler = self._create_scheduler(max_concurrent=1)
+        scheduler.start_cycle()
+        for name in ["system", "hosts", "hypervisors", "tenants", "instances"]:
+            self.assertEqual(name, self.started[-1])
+            scheduler.audit_complete(name)
+        self.assertFalse(scheduler.cycle_inprogress)
+
+    def test_concurrent_with_dependencies(self):
+        scheduler = self._create_scheduler(max_concurrent=4)
+        scheduler.start_cycle()
+        self.assertEqual(["system", "hosts"], self.started)
+
+        scheduler.audit_complete("hosts")
+        self.assertEqual(["system", "hosts", "hypervisors", "tenants"], self.started)
+
+        scheduler.audit_complete("tenants")
+        scheduler.audit_complete("hypervisors")
+        self.assertEqual("instances", self.started[-1])
+
+        scheduler.audit_complete("instances")
+        self.assertTrue(scheduler.cycle_inprogress)
+        scheduler.audit_complete("system")
+        self.assertFalse(scheduler.cycle_inprogress)
+
+    def test_disabled_audit_skipped(self):
+        scheduler = self._create_scheduler(max_concurrent=4, enabled=lambda: False)
+        scheduler.start_cycle()
+        scheduler.audit_complete("hosts")
+        scheduler.audit_complete("hypervisors")
+        self.assertNotIn("tenants", self.started)
+        self.assertEqual("instances", self.started[-1])
+
+    def test_interval(self):
+        scheduler = AuditScheduler("test-audit", 2)
+        scheduler.add_audit("hosts", lambda: self.started.append("hosts"))
+        scheduler.add_audit(
+            "images", lambda: self.started.append("images"), interval_secs=60
+        )
+
+        for _ in range(2):
+            scheduler.start_cycle()
+            scheduler.audit_complete("hosts")
+            if "images" == self.started[-1]:
+                scheduler.audit_complete("images")
+            self.now_ms += 30000
+        self.assertEqual(["hosts", "images", "hosts"], self.started)
+        self.assertEqual(60, scheduler.staleness_secs("images"))
+
+        scheduler.start_cycle()
+        self.assertEqual(["hosts", "images", "hosts", "hosts", "images"], self.started)
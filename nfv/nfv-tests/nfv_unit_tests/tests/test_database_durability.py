@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import signal
+import subprocess
+import sys
+
+import fixtures
+from sqlalchemy import text
+
+from nfv_unit_tests.tests import testcase
+from nfv_vim.database import _database
+from nfv_vim.database import model
+
+# Commits rows to the database one at a time, reporting each row once it
+# has been committed, until it is killed.
+_COMMIT_BURST = """
+import sys
+
+from nfv_vim.database import _database
+from nfv_vim.database import model
+
+_database.database_create(sys.argv[1], {"durability": sys.argv[2]})
+session = _database.database_get().session
+row_id = 0
+while True:
+    row = model.InstanceGroup()
+    row.uuid = str(row_id)
+    row.name = "group-%s" % row_id
+    row.member_uuids = "[]"
+    row.policies = "[]"
+    row.nfvi_instance_group_data = "x" * 1024
+    session.add(row)
+    session.commit()
+    sys.stdout.write("%s\\n" % row_id)
+    sys.stdout.flush()
+    row_id += 1
+"""
+
+
+class TestDatabaseDurability(testcase.NFVTestCase):
+    """Unit tests for the database durability profiles."""
+
+    def setUp(self):
+        super().setUp()
+        self.db_dir = self.useFixture(fixtures.TempDir()).path
+        # database_create sets the pragmas of every later connection.
+        self.patch(_database, "_db_pragmas", list())
+        self.patch(_database, "_db_obj", None)
+
+    def test_sqlite_pragmas(self):
+        self.assertEqual(
+            ["journal_mode=TRUNCATE", "synchronous=EXTRA"],
+            _database.database_get_sqlite_pragmas({}),
+        )
+        self.assertEqual(
+            [
+                "journal_mode=WAL",
+                "synchronous=NORMAL",
+                "wal_autocheckpoint=500",
+                "journal_size_limit=1048576",
+                "mmap_size=268435456",
+            ],
+            _database.database_get_sqlite_pragmas(
+                {
+                    "durability": "wal",
+                    "wal_autocheckpoint": "500",
+                    "journal_size_limit": "1048576",
+                    "mmap_size": "268435456",
+                }
+            ),
+        )
+        self.assertEqual(
+            ["journal_mode=TRUNCATE", "synchronous=FULL"],
+            _database.database_get_sqlite_pragmas(
+                {"durability": "unknown", "synchronous": "full"}
+            ),
+        )
+
+    def _kill_during_commit_burst(self, durability, min_commits=200):
+        """Kill a process committing rows and return the number of rows
+
+        it reported as committed.
+        """
+        process = subprocess.Popen(
+            [sys.executable, "-c", _COMMIT_BURST, self.db_dir, durability],
+            stdout=subprocess.PIPE,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+        self.addCleanup(process.wait)
+        self.addCleanup(process.stdout.close)
+
+        committed = 0
+        for line in process.stdout:
+            committed = int(line) + 1
+            if committed >= min_commits:
+                break
+        os.kill(process.pid, signal.SIGKILL)
+        process.wait()
+        self.assertEqual(-signal.SIGKILL, process.returncode)
+        return committed
+
+    def _check_database(self, durability, committed):
+        _database.database_create(self.db_dir, {"durability": durability})
+        db = _database.database_get()
+        self.addCleanup(db.end_session)
+
+        session = db.session
+        self.assertEqual("ok", session.execute(text("PRAGMA integrity_check")).scalar())
+        row_ids = sorted(
+            int(row.uuid) for row in session.query(model.InstanceGroup).all()
+        )
+        # Every commit reported before the kill survived, and the commits
+        # that survived are all complete.
+        self.assertGreaterEqual(len(row_ids), committed)
+        self.assertEqual(list(range(len(row_ids))), row_ids)
+
+    def test_strict_survives_kill_during_commits(self):
+        committed = self._kill_during_commit_burst(_database.DATABASE_DURABILITY.STRICT)
+        self._check_database(_database.DATABASE_DURABILITY.STRICT, committed)
+
+    def test_wal_survives_kill_during_commits(self):
+        committed = self._kill_during_commit_burst(_database.DATABASE_DURABILITY.WAL)
+        self._check_database(_database.DATABASE_DURABILITY.WAL, committed)
+
+        db = _database.database_get()
+        self.assertEqual(
+            "wal", db.session.execute(text("PRAGMA journal_mode")).scalar()
+        )
+        db.checkpoint()
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+
+from nfv_unit_tests.tests import testcase
+from nfv_vim import database
+from nfv_vim.database._database import database_get
+from nfv_vim.database import model
+from nfv_vim import nfvi
+from nfv_vim import objects
+
+
+class TestDatabaseWriteBehind(testcase.NFVTestCase):
+    """Unit tests for the coalescing write-behind of database rows."""
+
+    def setUp(self):
+        super().setUp()
+        self.useFixture(testcase.MainLoopFixture())
+        self.db_dir = self.useFixture(fixtures.TempDir()).path
+        database.database_initialize({"database_dir": self.db_dir})
+        self.addCleanup(database.database_finalize)
+        self.db = database_get()
+
+    def _instance_group(self, member_uuids):
+        return objects.InstanceGroup(
+            nfvi.objects.v1.InstanceGroup(
+                "group-uuid", "group", member_uuids, ["anti-affinity"]
+            )
+        )
+
+    def _commit(self):
+        self.db.flush_rows()
+        self.db.session.commit()
+
+    def _stored_member_uuids(self):
+        return [row.member_uuids for row in self.db.session.query(model.InstanceGroup)]
+
+    def test_updates_coalesced(self):
+        instance_group = self._instance_group([])
+        for x in range(5):
+            instance_group.nfvi_instance_group.member_uuids = ["uuid-%s" % x]
+            database.database_instance_group_add(instance_group)
+        self._commit()
+
+        self.assertEqual(['["uuid-4"]'], self._stored_member_uuids())
+        stats = self.db.write_stats
+        self.assertEqual(1, stats["rows-written"])
+        self.assertEqual(4, stats["writes-coalesced"])
+
+    def test_unchanged_row_suppressed(self):
+        instance_group = self._instance_group(["uuid-1"])
+        database.database_instance_group_add(instance_group)
+        self._commit()
+        database.database_instance_group_add(instance_group)
+        self._commit()
+
+        stats = self.db.write_stats
+        self.assertEqual(1, stats["rows-written"])
+        self.assertEqual(1, stats["writes-suppressed"])
+
+        instance_group.nfvi_instance_group.member_uuids = ["uuid-2"]
+        database.database_instance_group_add(instance_group)
+        self._commit()
+        self.assertEqual(['["uuid-2"]'], self._stored_member_uuids())
+        self.assertEqual(2, self.db.write_stats["rows-written"])
+
+    def test_rolled_back_row_written_again(self):
+        instance_group = self._instance_group(["uuid-1"])
+        database.database_instance_group_add(instance_group)
+        self.db.flush_rows()
+        self.db.session.rollback()
+        self.assertEqual([], self._stored_member_uuids())
+
+        database.database_instance_group_add(instance_group)
+        self._commit()
+        self.assertEqual(['["uuid-1"]'], self._stored_member_uuids())
+        self.assertEqual(0, self.db.write_stats["writes-suppressed"])
+
+    def test_delete_discards_pending_row(self):
+        instance_group = self._instance_group(["uuid-1"])
+        database.database_instance_group_add(instance_group)
+        self._commit()
+
+        database.database_instance_group_add(instance_group)
+        database.database_instance_group_delete(instance_group.uuid)
+        self._commit()
+        self.assertEqual([], self._stored_member_uuids())
+
+        database.database_instance_group_add(instance_group)
+        self._commit()
+        self.assertEqual(['["uuid-1"]'], self._stored_member_uuids())
@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import logging
+import threading
+
+from nfv_common.debug._debug_defs import DEBUG_LEVEL
+from nfv_common.debug import _debug_log
+from nfv_common.debug._debug_module import Debug
+from nfv_common.debug._debug_thread import DebugLogBuffer
+from nfv_common.debug._debug_thread import DebugLoggingThread
+from nfv_unit_tests.tests import testcase
+
+
+class FormatCounter:
+    """Log argument counting how often it is formatted."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return "formatted"
+
+
+class FakeHandler:
+    """Handler collecting the records emitted."""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, log_record):
+        self.records.append(log_record)
+
+
+class TestDebugLog(testcase.NFVTestCase):
+    """Unit tests for the debug log fast path and buffering."""
+
+    def setUp(self):
+        super().setUp()
+        self.patch(Debug(), "_debug_level", DEBUG_LEVEL.VERBOSE)
+        self.records = []
+        self.patch(DebugLoggingThread(), "send_log_record", self.records.append)
+        self.logger = _debug_log.DebugLogger("nfv_unit_tests.debug_log")
+        self.logger.set_level(DEBUG_LEVEL.INFO)
+
+    def test_disabled_levels_not_formatted(self):
+        def get_caller(depth=2):
+            raise AssertionError("caller looked up for a disabled log")
+
+        self.patch(self.logger, "get_caller", get_caller)
+        arg = FormatCounter()
+        self.logger.verbose("verbose %s", arg)
+        self.logger.debug("debug %s", arg)
+        self.assertEqual(0, arg.count)
+        self.assertEqual([], self.records)
+        self.assertFalse(self.logger.is_enabled_for(DEBUG_LEVEL.DEBUG))
+        self.assertTrue(self.logger.is_enabled_for(DEBUG_LEVEL.INFO))
+
+    def test_overall_level(self):
+        Debug()._debug_level = DEBUG_LEVEL.ERROR
+        self.logger.set_level(DEBUG_LEVEL.VERBOSE)
+        self.logger.info("dropped")
+        self.assertEqual([], self.records)
+        self.logger.error("logged")
+        self.assertEqual(1, len(self.records))
+
+    def test_deferred_args(self):
+        arg = FormatCounter()
+        self.logger.info("info %s, count=%d", arg, 3)
+        self.assertEqual(1, arg.count)
+
+        record = self.records[0]
+        self.assertEqual(logging.INFO, record.levelno)
+        self.assertIsNone(record.args)
+        self.assertTrue(record.msg.endswith("  info formatted, count=3"))
+        self.assertIn("test_debug_log.py", record.msg)
+        self.assertIn(record.msg, record.formatted_log)
+
+    def test_buffer_batches_and_drops(self):
+        log_buffer = DebugLogBuffer(max_records=4, batch_size=2)
+        self.assertFalse(log_buffer.add("r0"))
+        self.assertTrue(log_buffer.add("r1"))
+        log_buffer.add("r2")
+        log_buffer.add("r3")
+        self.assertTrue(log_buffer.add("r4"))
+        self.assertEqual(1, log_buffer.dropped)
+
+        self.assertEqual((["r0", "r1", "r2", "r3"], 1), log_buffer.take())
+        self.assertEqual(([], 0), log_buffer.take())
+
+    def _log_record(self, level, msg):
+        log_record = logging.makeLogRecord(
+            {"levelno": level, "levelname": logging.getLevelName(level)}
+        )
+        log_record.formatted_log = msg
+        return log_record
+
+    def test_error_flushed_immediately(self):
+        log_thread = DebugLoggingThread()
+        self.patch(log_thread, "_buffer", DebugLogBuffer())
+        self.patch(log_thread, "_flush_event", threading.Event())
+        self.patch(log_thread, "_flusher", threading.current_thread())
+        queued = []
+        self.patch(log_thread._log_queue, "put_nowait", queued.append)
+
+        info = self._log_record(logging.INFO, "info")
+        DebugLoggingThread.send_log_record(log_thread, info)
+        self.assertEqual([], queued)
+
+        error = self._log_record(logging.ERROR, "error")
+        DebugLoggingThread.send_log_record(log_thread, error)
+        self.assertEqual([["log-records", ([info, error], 0)]], queued)
+
+    def test_flush_waits_for_records_logged(self):
+        log_thread = DebugLoggingThread()
+        self.patch(log_thread, "_buffer", DebugLogBuffer())
+        handler = FakeHandler()
+        self.patch(log_thread, "_handlers", [handler])
+
+        log_records = [self._log_record(logging.INFO, "info-%d" % x) for x in range(3)]
+        for log_record in log_records:
+            log_thread._buffer.add(log_record)
+        log_thread.flush(DebugLoggingThread.EXIT_FLUSH_TIMEOUT_IN_SECS)
+        self.assertEqual(
+            ["info-%d" % x for x in range(3)],
+            [x.formatted_log for x in handler.records],
+        )
+        self.assertEqual({}, log_thread._sync_events)
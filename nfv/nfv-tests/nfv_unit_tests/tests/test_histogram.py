@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+import os
+
+import fixtures
+
+from nfv_common import histogram
+from nfv_unit_tests.tests import testcase
+from nfv_vim.events import _vim_histogram_api_events
+from nfv_vim import rpc
+
+
+class FakeConnection:
+    """Connection collecting the responses sent."""
+
+    def __init__(self):
+        self.responses = []
+
+    def send(self, msg):
+        self.responses.append(rpc.RPCMessage.deserialize(msg))
+
+    def close(self):
+        pass
+
+
+class TestHistogram(testcase.NFVTestCase):
+    """Unit tests for the histogram quantiles, windows and exports."""
+
+    def setUp(self):
+        super().setUp()
+        self.now = 1000.0
+        self.patch(histogram.time, "monotonic", lambda: self.now)
+        self.patch(histogram, "_histograms", {})
+        self.patch(histogram, "_process_name", "VIM")
+
+    def test_quantiles(self):
+        coarse = histogram.Histogram("coarse", 16, "ms")
+        fine = histogram.Histogram("fine", 16, "ms", sub_buckets=8)
+        self.assertIsNone(coarse.quantile(50))
+
+        for sample in range(1, 1001):
+            coarse.add_data(sample)
+            fine.add_data(sample)
+
+        # The samples from 513 to 1000 share one power of two bucket.
+        self.assertEqual(500, round(coarse.quantile(50)))
+        self.assertTrue(abs(900 - coarse.quantile(90)) < 40)
+        self.assertTrue(abs(900 - fine.quantile(90)) < 5)
+        self.assertTrue(abs(990 - fine.quantile(99)) < 10)
+        self.assertEqual(1000, fine.quantile(100))
+
+    def test_overflow_bucket(self):
+        data = histogram.Histogram("overflow", 4, "ms", sub_buckets=4)
+        for sample in [1, 2, 3, 100, 200]:
+            data.add_data(sample)
+
+        self.assertEqual([1, 1, 1, 2], list(data._buckets))
+        self.assertTrue(100 < data.quantile(90) <= 200)
+        self.assertEqual(200, data.quantile(100))
+
+    def test_window(self):
+        data = histogram.Histogram("window", 16, "ms", window_secs=100)
+        for _ in range(10):
+            data.add_data(1000)
+        self.now += 50
+        for _ in range(10):
+            data.add_data(10)
+
+        window = data.get_data()["window"]
+        self.assertEqual(20, window["total"])
+        self.assertEqual(1000, window["max"])
+
+        # The first samples move out of the window.
+        self.now += 60
+        window = data.get_data()["window"]
+        self.assertEqual(10, window["total"])
+        self.assertEqual(10, window["max"])
+        self.assertTrue(window["quantiles"]["p99"] <= 10)
+        self.assertEqual(20, data.get_data()["total"])
+
+        data.reset_data()
+        self.assertEqual(0, data.get_data()["window"]["total"])
+
+    def test_openmetrics(self):
+        histogram.add_histogram_data('selobj read: "x"', 3, "decisecond")
+        histogram.add_histogram_data('selobj read: "x"', 300000, "decisecond")
+        text = histogram.histogram_data_to_openmetrics(histogram.get_histogram_data())
+        lines = text.splitlines()
+
+        labels = 'name="selobj read: \\"x\\"",units="decisecond",process="VIM"'
+        self.assertEqual("# TYPE nfv_histogram histogram", lines[0])
+        self.assertIn('nfv_histogram_bucket{%s,le="4"} 1' % labels, lines)
+        self.assertIn('nfv_histogram_bucket{%s,le="+Inf"} 2' % labels, lines)
+        self.assertIn("nfv_histogram_count{%s} 2" % labels, lines)
+        self.assertIn("nfv_histogram_sum{%s} 300003" % labels, lines)
+        self.assertIn("nfv_histogram_max{%s} 300000" % labels, lines)
+        self.assertIn(
+            'nfv_histogram_quantile{%s,quantile="0.5",window="lifetime"} 4.0' % labels,
+            lines,
+        )
+        self.assertEqual("# EOF", lines[-1])
+
+    def test_export(self):
+        export_dir = self.useFixture(fixtures.TempDir()).path
+        self.assertIsNone(histogram.export_histogram_data())
+
+        histogram.add_histogram_data("database-commits (inline)", 2, "decisecond")
+        filename = histogram.export_histogram_data(export_dir)
+        self.assertEqual(os.path.join(export_dir, "nfv-vim-histograms.json"), filename)
+        with open(filename) as f:
+            data = json.load(f)["histograms"]
+        self.assertEqual(["database-commits (inline)"], [x["name"] for x in data])
+        self.assertEqual(1, data[0]["total"])
+
+        filename = histogram.export_histogram_data(
+            export_dir, histogram.HISTOGRAM_EXPORT_FORMAT.OPENMETRICS
+        )
+        self.assertTrue(filename.endswith("nfv-vim-histograms.prom"))
+        self.assertEqual(
+            ["nfv-vim-histograms.json", "nfv-vim-histograms.prom"],
+            sorted(os.listdir(export_dir)),
+        )
+
+    def test_get_histograms_request(self):
+        histogram.add_histogram_data("timer-a", 1, "ms")
+        histogram.add_histogram_data("timer-b", 1, "ms")
+
+        request = rpc.APIRequestGetHistograms()
+        request.filter_by_name = "timer-b"
+        request = rpc.RPCMessage.deserialize(request.serialize())
+        connection = FakeConnection()
+        _vim_histogram_api_events.vim_histogram_api_get_histograms(connection, request)
+        response = connection.responses[0]
+        self.assertEqual(rpc.RPC_MSG_RESULT.SUCCESS, response.result)
+        self.assertEqual(["timer-b"], [x["name"] for x in response.histograms])
+
+        request.filter_by_name = "timer-c"
+        _vim_histogram_api_events.vim_histogram_api_get_histograms(connection, request)
+        self.assertEqual(rpc.RPC_MSG_RESULT.NOT_FOUND, connection.responses[1].result)
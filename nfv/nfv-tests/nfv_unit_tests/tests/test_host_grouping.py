@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_benchmarks import host_grouping as benchmark
+from nfv_unit_tests.tests import testcase
+from nfv_vim.strategy._host_grouping import HostGrouping
+
+
+class TestHostGrouping(testcase.NFVTestCase):
+    """Unit tests for the host grouping engine."""
+
+    def _host_names(self, host_grouping):
+        return [[host.name for host in x] for x in host_grouping.host_lists]
+
+    def test_max_hosts(self):
+        host_grouping = HostGrouping(2)
+        for x in range(5):
+            host_grouping.add_host(benchmark.Host("worker-%d" % x))
+        self.assertEqual(
+            [["worker-0", "worker-1"], ["worker-2", "worker-3"], ["worker-4"]],
+            self._host_names(host_grouping),
+        )
+
+    def test_single_host(self):
+        host_grouping = HostGrouping(1)
+        for x in range(3):
+            self.assertEqual(x, host_grouping.add_host(benchmark.Host("worker-%d" % x)))
+
+    def test_conflict_keys(self):
+        host_grouping = HostGrouping(10)
+        host_grouping.add_host(benchmark.Host("worker-0"), {"group-a"})
+        host_grouping.add_host(benchmark.Host("worker-1"), {"group-a", "group-b"})
+        host_grouping.add_host(benchmark.Host("worker-2"), {"group-b"})
+        host_grouping.add_host(benchmark.Host("worker-3"), {"group-c"})
+        self.assertEqual(
+            [["worker-0", "worker-2", "worker-3"], ["worker-1"]],
+            self._host_names(host_grouping),
+        )
+
+    def test_aggregate_limits(self):
+        host_grouping = HostGrouping(10, {"aggregate-a": 2, "aggregate-b": 1})
+        host_grouping.add_host(benchmark.Host("worker-0"), (), ["aggregate-a"])
+        host_grouping.add_host(benchmark.Host("worker-1"), (), ["aggregate-a"])
+        host_grouping.add_host(
+            benchmark.Host("worker-2"), (), ["aggregate-a", "aggregate-b"]
+        )
+        host_grouping.add_host(benchmark.Host("worker-3"), (), ["aggregate-b"])
+        self.assertEqual(
+            [["worker-0", "worker-1", "worker-3"], ["worker-2"]],
+            self._host_names(host_grouping),
+        )
+
+    def test_same_as_pairwise(self):
+        # The engine creates the same host lists as comparing every pair of
+        # hosts and recounting the aggregates of every list.
+        for seed in range(10):
+            for max_parallel_hosts in [2, 5, 20]:
+                cloud = benchmark.Cloud(60, 6, 3, 4, seed)
+                expected, _ = benchmark.run(
+                    benchmark.group_hosts_pairwise, cloud, max_parallel_hosts
+                )
+                host_lists, _ = benchmark.run(
+                    benchmark.group_hosts, cloud, max_parallel_hosts
+                )
+                self.assertEqual(expected, host_lists)
@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+from unittest import mock
 import uuid
 
 import fixtures
@@ -10,7 +11,10 @@ import fixtures
 from nfv_common import config
 from nfv_unit_tests.tests import testcase
 from nfv_unit_tests.tests import utils
+from nfv_vim import database
+from nfv_vim import directors
 from nfv_vim import host_fsm
+from nfv_vim import instance_fsm
 from nfv_vim import nfvi
 from nfv_vim.nfvi.objects import v1 as nfvi_objects
 from nfv_vim import objects
@@ -289,6 +293,33 @@ class TestInstance(testcase.NFVTestCase):
         host_aggregate = objects.HostAggregate(nfvi_host_aggregate)
         self._host_aggregate_table[host_aggregate.name] = host_aggregate
 
+    def test_host_change_indexed_before_handled(self):
+        self.create_instance_type("small")
+        self.create_image("image_0")
+        instance = self.create_instance(
+            "test_instance_0", "small", "image_0", "compute-0"
+        )
+        self.patch(directors, "get_instance_director", mock.Mock)
+        self.patch(database, "database_instance_add", lambda instance: None)
+
+        on_host = []
+
+        def _handle_event(event, event_data=None):
+            if instance_fsm.INSTANCE_EVENT.NFVI_HOST_CHANGED == event:
+                on_host.append(list(self._instance_table.on_host("compute-1")))
+                on_host.append(self._instance_table.exist_on_host("compute-0"))
+
+        self.patch(instance._action_fsm, "handle_event", _handle_event)
+        nfvi_instance = instance.nfvi_instance
+        instance.nfvi_instance_state_change(
+            nfvi_instance.admin_state,
+            nfvi_instance.oper_state,
+            nfvi_instance.avail_status,
+            nfvi_instance.action,
+            "compute-1",
+        )
+        self.assertEqual([[instance], False], on_host)
+
     def test_live_migration_completion_timeout(self):
         self.create_instance_type("small")
         self.create_image("image_0")
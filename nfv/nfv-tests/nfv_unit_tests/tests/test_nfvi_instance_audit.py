@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import fixtures
+from unittest import mock
+
+from nfv_plugins.nfvi_plugins.openstack import nova
+from nfv_unit_tests.tests import testcase
+from nfv_vim.audits import _vim_nfvi_audits
+
+
+class FakeInstance:
+    """Instance that is deleted as soon as the NFVI says so."""
+
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.deleted = False
+
+    def nfvi_instance_deleted(self):
+        self.deleted = True
+
+    def is_deleted(self):
+        return self.deleted
+
+
+class FakeToken:
+    """Token for the nova rest-api requests."""
+
+    def get_tenant_id(self):
+        return "tenant"
+
+    def get_service_url(self, service, strip_version=False):
+        return "http://nova"
+
+
+class TestNFVIInstanceAudit(testcase.NFVTestCase):
+    """Unit tests for the full and changes-since listings of instances."""
+
+    def setUp(self):
+        super().setUp()
+        self.instance_table = {x: FakeInstance(x) for x in ["a", "b", "c"]}
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                "nfv_vim.tables._instance_table._instance_table",
+                self.instance_table,
+            )
+        )
+        for name, value in [
+            ("_audit_scheduler", mock.Mock()),
+            ("_deletable_instances", None),
+            ("_nfvi_instances_paging", _vim_nfvi_audits.nfvi.objects.v1.Paging(2)),
+            ("_nfvi_instances_to_audit", dict()),
+            ("_nfvi_instance_outstanding", dict()),
+            ("_nfvi_instances_full_audit_listings", 3),
+            ("_nfvi_instances_listings", 0),
+            ("_nfvi_instances_changes_since", None),
+        ]:
+            self.patch(_vim_nfvi_audits, name, value)
+        self.patch(_vim_nfvi_audits.directors, "get_instance_director", mock.Mock())
+        self.patch(_vim_nfvi_audits.nfvi, "nfvi_get_instances", self._get_instances)
+        self.pages = []
+        self.requests = []
+
+    def _get_instances(self, paging, callback):
+        self.requests.append(paging.changes_since)
+        result_data, deleted_instances = self.pages.pop(0)
+        paging.next_page = "next" if self.pages else None
+        response = {
+            "completed": True,
+            "page-request-id": paging.page_request_id,
+            "result-data": [(x, x) for x in result_data],
+            "deleted-instances": deleted_instances,
+        }
+        self.assertRaises(StopIteration, callback.send, response)
+
+    def _audit(self, *pages):
+        self.pages = list(pages)
+        while self.pages:
+            _vim_nfvi_audits._audit_nfvi_instances()
+
+    def test_full_then_changes_since(self):
+        # Full listing over two pages, instance b is missing.
+        self._audit((["a"], []), (["c", "d"], []))
+        self.assertEqual([None, None], self.requests)
+        self.assertEqual(["a", "c"], sorted(self.instance_table))
+        self.assertEqual(
+            ["a", "c", "d"], sorted(_vim_nfvi_audits._nfvi_instances_to_audit)
+        )
+
+        # Changes-since listings, instances missing from these are kept.
+        _vim_nfvi_audits._nfvi_instances_to_audit.clear()
+        self._audit(([], ["c"]))
+        self._audit((["e"], []))
+        self.assertEqual(4, len(self.requests))
+        self.assertIsNotNone(self.requests[2])
+        self.assertTrue(self.requests[2].endswith("Z"))
+        self.assertIsNotNone(self.requests[3])
+        self.assertEqual(["a"], sorted(self.instance_table))
+        self.assertEqual(["e"], list(_vim_nfvi_audits._nfvi_instances_to_audit))
+
+        # Every third listing is a full listing again.
+        self._audit(([], []))
+        self.assertIsNone(self.requests[4])
+        self.assertEqual([], sorted(self.instance_table))
+
+    def test_get_servers_changes_since(self):
+        requests = []
+        self.patch(nova, "rest_api_request", lambda token, method, url, headers: url)
+        requests.append(nova.get_servers(FakeToken(), 32))
+        requests.append(
+            nova.get_servers(FakeToken(), 32, changes_since="2026-01-01T00:00:00Z")
+        )
+        self.assertEqual(
+            [
+                "http://nova/v2.1/tenant/servers?limit=32&all_tenants=1",
+                "http://nova/v2.1/tenant/servers/detail?limit=32&all_tenants=1"
+                "&changes-since=2026-01-01T00:00:00Z",
+            ],
+            requests,
+        )
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import datetime
+import pickle
+
+from nfv_plugins.nfvi_plugins.openstack import exceptions
+from nfv_plugins.nfvi_plugins.openstack import objects
+from nfv_plugins.nfvi_plugins.openstack import openstack
+from nfv_unit_tests.tests import testcase
+
+
+def _directory():
+    directory = objects.Directory(
+        objects.SERVICE_CATEGORY.OPENSTACK,
+        "CGCS",
+        "http",
+        "127.0.0.1",
+        "5000",
+        "admin",
+        "admin",
+        None,
+        "Default",
+        "Default",
+    )
+    directory.set_service_info(
+        objects.OPENSTACK_SERVICE.NOVA,
+        "RegionOne",
+        "nova",
+        "compute",
+        "admin",
+        None,
+    )
+    return directory
+
+
+def _token(directory, expires_in_secs, token_id="token"):
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        seconds=expires_in_secs
+    )
+    token_data = {
+        "token": {
+            "expires_at": expires_at.isoformat(),
+            "project": {"id": "project"},
+            "catalog": [
+                {
+                    "type": "compute",
+                    "name": "nova",
+                    "endpoints": [
+                        {
+                            "region": "RegionOne",
+                            "interface": "admin",
+                            "url": "http://nova:8774/v2.1/project",
+                        },
+                        {
+                            "region": "RegionOne",
+                            "interface": "admin",
+                            "url": "http://duplicate:8774/v2.1/project",
+                        },
+                    ],
+                }
+            ],
+        }
+    }
+    return objects.Token(token_data, directory, token_id)
+
+
+class TestOpenStackTokenCache(testcase.NFVTestCase):
+    """Unit tests for the token and service catalog cache."""
+
+    def setUp(self):
+        super().setUp()
+        self.patch(openstack, "_token_cache", {})
+        self.now_ms = 1000000
+        self.patch(objects.timers, "get_monotonic_timestamp_in_ms", self._now_ms)
+
+    def _now_ms(self):
+        return self.now_ms
+
+    def test_token_expiry(self):
+        directory = _directory()
+        token = _token(directory, 3600)
+        self.assertFalse(token.is_expired())
+        self.assertFalse(token.is_expired(objects.TOKEN_REFRESH_SECS))
+        self.assertTrue(_token(directory, 30).is_expired())
+        self.assertTrue(_token(directory, -30).is_expired())
+        token.set_expired()
+        self.assertTrue(token.is_expired())
+
+    def test_service_url(self):
+        directory = _directory()
+        token = _token(directory, 3600)
+        self.assertEqual(
+            "http://nova:8774/v2.1/project",
+            token.get_service_url(objects.OPENSTACK_SERVICE.NOVA),
+        )
+        self.assertEqual(
+            "http://nova:8774",
+            token.get_service_url(objects.OPENSTACK_SERVICE.NOVA, strip_version=True),
+        )
+        self.assertIsNone(token.get_service_url(objects.OPENSTACK_SERVICE.CINDER))
+
+    def test_token_shared(self):
+        token = _token(_directory(), 3600)
+        openstack.set_cached_token(_directory(), token)
+        self.assertIs(token, openstack.get_cached_token(_directory()))
+        self.assertIsNone(openstack.get_cached_token(None))
+
+        other = _directory()
+        other.set_service_info(
+            objects.OPENSTACK_SERVICE.CINDER,
+            "RegionOne",
+            "cinder",
+            "volumev3",
+            "admin",
+            None,
+        )
+        self.assertIsNone(openstack.get_cached_token(other))
+
+    def test_token_refreshed_ahead_of_expiry(self):
+        directory = _directory()
+        token = _token(directory, objects.TOKEN_REFRESH_SECS - 10)
+        openstack.set_cached_token(directory, token)
+
+        # One caller gets a new token, the others keep using the token while
+        # the refresh is in progress.
+        self.assertIs(token, openstack.get_cached_token(directory))
+        self.assertTrue(token.is_expired())
+        self.assertIs(token, openstack.get_cached_token(directory))
+        self.assertFalse(token.is_expired())
+
+        # A refresh that does not complete is handed to another caller.
+        self.now_ms += objects.TOKEN_REFRESH_RETRY_SECS * 1000
+        self.assertTrue(token.is_expired())
+        self.assertFalse(token.is_expired())
+
+        refreshed = _token(directory, 3600, "refreshed")
+        openstack.set_cached_token(directory, refreshed)
+        self.assertIs(refreshed, openstack.get_cached_token(directory))
+        self.assertFalse(refreshed.is_expired())
+
+    def test_expired_token_returned(self):
+        # Callers check the expiry of the token, a token read again part way
+        # through an operation is never None.
+        directory = _directory()
+        token = _token(directory, 30)
+        openstack.set_cached_token(directory, token)
+        self.assertIs(token, openstack.get_cached_token(directory))
+        self.assertTrue(token.is_expired())
+
+    def test_expire_cached_token(self):
+        directory = _directory()
+        token = _token(directory, 3600, "old")
+        openstack.set_cached_token(directory, token)
+
+        # A request rejected with a token that has since been replaced does
+        # not expire the new token.
+        refreshed = _token(directory, 3600, "refreshed")
+        openstack.set_cached_token(directory, refreshed)
+        openstack.expire_cached_token(directory, "old")
+        openstack.expire_cached_token(directory, None)
+        self.assertFalse(refreshed.is_expired())
+
+        openstack.expire_cached_token(directory, "refreshed")
+        self.assertTrue(refreshed.is_expired())
+        openstack.expire_cached_token(None, "refreshed")
+
+    def test_cached_token_attribute(self):
+        class Plugin:
+            _token = openstack.CachedToken("_directory")
+
+            def __init__(self):
+                self._directory = _directory()
+
+        plugin, other_plugin = Plugin(), Plugin()
+        self.assertIsNone(plugin._token)
+        token = _token(plugin._directory, 3600)
+        plugin._token = token
+        self.assertIs(token, other_plugin._token)
+        self.assertIsInstance(Plugin._token, openstack.CachedToken)
+
+    def test_exception_token_id(self):
+        e = exceptions.OpenStackRestAPIException(
+            "GET", "http://nova", {}, None, 401, "", "", {}, "", "", token_id="old"
+        )
+        self.assertEqual("old", pickle.loads(pickle.dumps(e)).token_id)
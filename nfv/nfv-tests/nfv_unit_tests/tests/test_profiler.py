@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import threading
+import time
+
+import fixtures
+
+from nfv_common import profiler
+from nfv_unit_tests.tests import testcase
+
+
+def _burn_cpu(secs):
+    end = time.thread_time() + secs
+    while time.thread_time() < end:
+        pass
+
+
+class TestProfiler(testcase.NFVTestCase):
+    """Unit tests for the sampling profiler and dispatch accounting."""
+
+    def setUp(self):
+        super().setUp()
+        self.output_dir = self.useFixture(fixtures.TempDir()).path
+        self.patch(profiler, "_dispatches", [])
+        self.patch(profiler, "_process_name", "VIM")
+        self.patch(profiler, "_config", {"output_dir": self.output_dir})
+        self.profiler = profiler.SamplingProfiler(100, threading.get_ident())
+        self.patch(profiler, "_profiler", self.profiler)
+
+    def test_dispatch_accounting(self):
+        profiler.profile_dispatch_begin("timer", "audit")
+        _burn_cpu(0.02)
+        profiler.profile_dispatch_begin("task", "host-audit")
+        _burn_cpu(0.02)
+        profiler.profile_dispatch_end()
+        profiler.profile_dispatch_end()
+        self.assertEqual([], profiler._dispatches)
+
+        timer = self.profiler._dispatch_stats["timer: audit"]
+        task = self.profiler._dispatch_stats["task: host-audit"]
+        self.assertEqual(1, timer.calls)
+        self.assertEqual(1, task.calls)
+        self.assertTrue(timer.cpu_secs >= 0.04)
+        self.assertTrue(task.cpu_secs >= 0.02)
+        self.assertAlmostEqual(timer.cpu_secs - task.cpu_secs, timer.self_cpu_secs)
+        self.assertTrue(timer.max_wall_secs >= timer.cpu_secs)
+
+    def test_dispatch_while_stopped(self):
+        self.patch(profiler, "_profiler", None)
+        profiler.profile_dispatch_begin("selobj read", "callback")
+        self.patch(profiler, "_profiler", self.profiler)
+        profiler.profile_dispatch_end()
+        self.assertEqual({}, self.profiler._dispatch_stats)
+
+    def test_sample(self):
+        # Sampling from the profiled thread, the sampler is the leaf frame.
+        self.profiler.sample()
+        profiler.profile_dispatch_begin("timer", "audit")
+        profiler.profile_dispatch_begin("task", "host-audit")
+        self.profiler.sample()
+        self.profiler.sample()
+        profiler.profile_dispatch_end()
+        profiler.profile_dispatch_end()
+
+        stacks = self.profiler.collapsed_stacks().splitlines()
+        self.assertEqual(2, len(stacks))
+        idle, busy = sorted(stacks)
+        self.assertTrue(idle.startswith("main-loop;"))
+        self.assertTrue(
+            idle.endswith("test_profiler.py:test_sample;profiler.py:sample 1")
+        )
+        self.assertTrue(busy.startswith("timer: audit;task: host-audit;"))
+        self.assertTrue(
+            busy.endswith("test_profiler.py:test_sample;profiler.py:sample 2")
+        )
+
+        report = self.profiler.report(top_n=5)
+        self.assertIn("3 samples at 100 Hz", report)
+        self.assertIn("timer: audit", report)
+        self.assertIn("task: host-audit", report)
+
+    def test_dump(self):
+        profiler.profile_dispatch_begin("timer", "audit")
+        self.profiler.sample()
+        profiler.profile_dispatch_end()
+
+        filenames = profiler.profile_sampling_dump()
+        self.assertEqual(
+            [
+                os.path.join(self.output_dir, "nfv-vim-profile.collapsed"),
+                os.path.join(self.output_dir, "nfv-vim-profile.txt"),
+            ],
+            filenames,
+        )
+        with open(filenames[1]) as f:
+            self.assertIn("timer: audit", f.read())
+
+        profiler.profile_sampling_reset()
+        self.assertEqual("", self.profiler.collapsed_stacks())
+
+    def test_report_while_sampling(self):
+        # Each dispatch adds new stacks while the samples are being read.
+        stop = threading.Event()
+        self.addCleanup(stop.set)
+
+        def _sample():
+            while not stop.is_set():
+                self.profiler.sample()
+
+        sampler = threading.Thread(target=_sample, daemon=True)
+        sampler.start()
+        for x in range(1000):
+            profiler.profile_dispatch_begin("timer", "audit-%d" % x)
+            self.profiler.collapsed_stacks()
+            self.profiler.report()
+            profiler.profile_dispatch_end()
+        stop.set()
+        sampler.join()
+
+    def test_toggle(self):
+        self.patch(profiler, "_profiler", None)
+        profiler.profile_sampling_toggle()
+        self.assertTrue(profiler._profiler.running)
+        time.sleep(0.05)
+        profiler.profile_sampling_toggle()
+        self.assertIsNone(profiler._profiler)
+        self.assertEqual(
+            ["nfv-vim-profile.collapsed", "nfv-vim-profile.txt"],
+            sorted(os.listdir(self.output_dir)),
+        )
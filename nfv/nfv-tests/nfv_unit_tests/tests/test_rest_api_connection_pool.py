@@ -0,0 +1,205 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import http.server
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+from nfv_plugins.nfvi_plugins.openstack.exceptions import OpenStackRestAPIException
+from nfv_plugins.nfvi_plugins.openstack import rest_api
+from nfv_unit_tests.tests import testcase
+
+
+class FakeToken:
+    """Token that never expires."""
+
+    def get_id(self):
+        return "token"
+
+    def set_expired(self):
+        return
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler answering with keep-alive HTTP/1.1 responses."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        return
+
+    def _respond(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.paths.append(self.path)
+        if "/missing" == self.path:
+            self._respond(404, {"badRequest": {"message": "Not there."}})
+        elif self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", self.path[len("/redirect") :])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._respond(200, {"path": self.path})
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        length = int(self.headers["Content-Length"])
+        self._respond(200, json.loads(self.rfile.read(length)))
+
+
+class TestRestAPIConnectionPool(testcase.NFVTestCase):
+    """Unit tests for the rest-api keep-alive connection pool."""
+
+    def setUp(self):
+        super().setUp()
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), KeepAliveHandler
+        )
+        self.server.daemon_threads = True
+        self.server.connections = set()
+        self.server.paths = []
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.pool = rest_api.RestAPIConnectionPool()
+        self.addCleanup(self.pool.close)
+        self.patch(rest_api, "_connection_pool", self.pool)
+        self.token = FakeToken()
+        self.url = "http://127.0.0.1:%s" % self.server.server_address[1]
+
+    def test_connection_reused(self):
+        for x in range(5):
+            result = rest_api.rest_api_request(
+                self.token, "GET", self.url + "/v2/%s" % x, timeout_in_secs=5
+            )
+            self.assertEqual({"path": "/v2/%s" % x}, result.result_data)
+            self.assertEqual(200, result.ancillary_data.status_code)
+
+        result = rest_api.rest_api_request(
+            self.token, "POST", self.url + "/v2", None, json.dumps({"a": 1}), 5
+        )
+        self.assertEqual({"a": 1}, result.result_data)
+
+        self.assertEqual(1, len(self.server.connections))
+        stats = rest_api.rest_api_get_connection_pool_stats()[
+            "http://127.0.0.1:%s" % self.server.server_address[1]
+        ]
+        self.assertEqual(6, stats["requests"])
+        self.assertEqual(1, stats["connections-created"])
+        self.assertEqual(5, stats["connections-reused"])
+
+    def test_http_error(self):
+        e = self.assertRaises(
+            OpenStackRestAPIException,
+            rest_api.rest_api_request,
+            self.token,
+            "GET",
+            self.url + "/missing",
+            timeout_in_secs=5,
+        )
+        self.assertEqual(404, e.http_status_code)
+        self.assertEqual("not there", e.http_response_reason)
+
+        result = rest_api.rest_api_request(
+            self.token, "GET", self.url + "/v2", timeout_in_secs=5
+        )
+        self.assertEqual({"path": "/v2"}, result.result_data)
+        self.assertEqual(1, len(self.server.connections))
+
+    def test_stale_connection_retried(self):
+        rest_api.rest_api_request(
+            self.token, "GET", self.url + "/v2", timeout_in_secs=5
+        )
+        # Simulate the server closing the idle connection once it has been
+        # checked.
+        self.patch(rest_api, "_rest_api_connection_dropped", lambda x: False)
+        for idle_connections in self.pool._idle_connections.values():
+            for connection, _ in idle_connections:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+
+        result = rest_api.rest_api_request(
+            self.token, "GET", self.url + "/v3", timeout_in_secs=5
+        )
+        self.assertEqual({"path": "/v3"}, result.result_data)
+        stats = rest_api.rest_api_get_connection_pool_stats()[
+            "http://127.0.0.1:%s" % self.server.server_address[1]
+        ]
+        self.assertEqual(1, stats["connections-retried"])
+
+    def test_closed_connection_not_reused_for_post(self):
+        rest_api.rest_api_request(
+            self.token, "GET", self.url + "/v2", timeout_in_secs=5
+        )
+        for idle_connections in self.pool._idle_connections.values():
+            for connection, _ in idle_connections:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+
+        # The closed connection is seen before the request is sent on it.
+        result = rest_api.rest_api_request(
+            self.token, "POST", self.url + "/v2", None, json.dumps({"a": 1}), 5
+        )
+        self.assertEqual({"a": 1}, result.result_data)
+        stats = rest_api.rest_api_get_connection_pool_stats()[
+            "http://127.0.0.1:%s" % self.server.server_address[1]
+        ]
+        self.assertEqual(1, stats["connections-dropped"])
+        self.assertEqual(0, stats["connections-retried"])
+        self.assertEqual(2, stats["connections-created"])
+
+    def test_stale_connection_not_retried_for_post(self):
+        rest_api.rest_api_request(
+            self.token, "GET", self.url + "/v2", timeout_in_secs=5
+        )
+        # The server closes the idle connection once it has been checked.
+        self.patch(rest_api, "_rest_api_connection_dropped", lambda x: False)
+        for idle_connections in self.pool._idle_connections.values():
+            for connection, _ in idle_connections:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+
+        # A server action may have reached the server, it is not resent.
+        self.assertRaises(
+            urllib.error.URLError,
+            rest_api._rest_api_pooled_urlopen,
+            urllib.request.Request(
+                self.url + "/v2", data=json.dumps({"a": 1}).encode(), method="POST"
+            ),
+            5,
+        )
+        self.assertEqual(1, len(self.server.connections))
+
+    def test_redirect_followed(self):
+        result = rest_api.rest_api_request(
+            self.token, "GET", self.url + "/redirect/v3", timeout_in_secs=5
+        )
+        self.assertEqual({"path": "/v3"}, result.result_data)
+        self.assertEqual(["/redirect/v3", "/v3"], self.server.paths)
+        self.assertEqual(1, len(self.server.connections))
+
+    def test_redirect_loop(self):
+        self.assertRaises(
+            urllib.error.HTTPError,
+            rest_api._rest_api_pooled_urlopen,
+            urllib.request.Request(self.url + "/redirect/redirect/redirect/v3"),
+            5,
+            urllib.request.HTTPRedirectHandler.max_redirections - 1,
+        )
+        self.assertEqual(
+            ["/redirect/redirect/redirect/v3", "/redirect/redirect/v3"],
+            self.server.paths,
+        )
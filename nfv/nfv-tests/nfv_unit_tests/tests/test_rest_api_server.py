@@ -0,0 +1,174 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import http.client
+import json
+
+from nfv_common import timers
+from nfv_common.timers import _timer_module
+from nfv_plugins.nfvi_plugins.openstack import rest_api
+from nfv_unit_tests.tests import testcase
+
+
+class TestRestAPIServer(testcase.NFVTestCase):
+    """Unit tests for the plugin Rest-API server."""
+
+    def setUp(self):
+        super().setUp()
+        self.main_loop = self.useFixture(testcase.MainLoopFixture())
+        self.patch(rest_api.RestAPIRequestDispatcher, "_handlers", {})
+        self.patch(rest_api.RestAPIRequestDispatcher, "_routes", {})
+
+        self.server = rest_api.RestAPIServer("127.0.0.1", 0)
+        self.addCleanup(self.server.server_close)
+        self.port = self.server.server_address[1]
+        self.clients = set()
+        self.delayed = []
+
+    def _get_handler(self, request_dispatch):
+        self.clients.add(request_dispatch.client_address)
+        request_dispatch.send_response(http.client.OK)
+        request_dispatch.send_header("Content-Type", "application/json")
+        request_dispatch.end_headers()
+        request_dispatch.wfile.write(
+            json.dumps({"path": request_dispatch.path}).encode()
+        )
+        request_dispatch.done()
+
+    def _post_handler(self, request_dispatch):
+        self.clients.add(request_dispatch.client_address)
+        content_len = int(request_dispatch.headers.get("content-length", 0))
+        request_dispatch.rfile.read(content_len)
+        request_dispatch.response_delayed()
+        self.delayed.append(request_dispatch)
+
+    def _respond_delayed(self):
+        while self.delayed:
+            request_dispatch = self.delayed.pop(0)
+            request_dispatch.send_response(http.client.ACCEPTED)
+            request_dispatch.done()
+
+    def _run_client(self, client):
+        """Run a client in a thread while dispatching the server."""
+
+        return self.main_loop.run_in_thread(client, self._respond_delayed)
+
+    def test_route_longest_path(self):
+        handlers = rest_api.RestAPIRequestDispatcher
+        handlers.add_handler("127.0.0.1", 1, "POST", "/v2/*", "v2")
+        handlers.add_handler("127.0.0.1", 1, "post", "/v2.1/*", "v2.1")
+        handlers.add_handler("127.0.0.1", 1, "POST", "/hosts*", "hosts")
+
+        regex, route_handlers = handlers._get_route(1, "POST")
+        for path, expected in [
+            ("/v2.1/servers/action", "v2.1"),
+            ("/v2/servers/action", "v2"),
+            ("/v1/hosts/uuid", "hosts"),
+        ]:
+            match = regex.match(path)
+            self.assertEqual(expected, route_handlers[match.lastgroup])
+        self.assertIsNone(regex.match("/v1/instances"))
+        self.assertIsNone(handlers._get_route(1, "GET"))
+
+        handlers.del_handler("127.0.0.1", 1, "POST", "/v2.1/*")
+        regex, route_handlers = handlers._get_route(1, "POST")
+        match = regex.match("/v2.1/servers/action")
+        self.assertEqual("v2", route_handlers[match.lastgroup])
+
+    def test_persistent_connection(self):
+        self.server.add_handler("GET", "/nfvi-plugins/v1/hosts*", self._get_handler)
+        self.server.add_handler("POST", "/nfvi-plugins/v1/hosts*", self._post_handler)
+
+        def client():
+            connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+            responses = []
+            for x in range(3):
+                connection.request("GET", "/nfvi-plugins/v1/hosts/%s" % x)
+                response = connection.getresponse()
+                responses.append((response.status, json.loads(response.read())))
+            connection.request("POST", "/nfvi-plugins/v1/hosts", body=b"{}")
+            response = connection.getresponse()
+            responses.append((response.status, response.read()))
+            connection.request("GET", "/nfvi-plugins/v1/hosts/3")
+            response = connection.getresponse()
+            responses.append((response.status, json.loads(response.read())))
+            connection.close()
+            return responses
+
+        responses = self._run_client(client)
+        self.assertEqual(
+            [
+                (http.client.OK, {"path": "/nfvi-plugins/v1/hosts/%s" % x})
+                for x in range(3)
+            ],
+            responses[:3],
+        )
+        self.assertEqual((http.client.ACCEPTED, b""), responses[3])
+        self.assertEqual(
+            (http.client.OK, {"path": "/nfvi-plugins/v1/hosts/3"}), responses[4]
+        )
+        self.assertEqual(1, len(self.clients))
+
+    def test_connection_close(self):
+        self.server.add_handler("GET", "/nfvi-plugins/v1/hosts*", self._get_handler)
+
+        def client():
+            responses = []
+            for x in range(2):
+                connection = http.client.HTTPConnection(
+                    "127.0.0.1", self.port, timeout=5
+                )
+                connection.request(
+                    "GET",
+                    "/nfvi-plugins/v1/hosts/%s" % x,
+                    headers={"Connection": "close"},
+                )
+                response = connection.getresponse()
+                responses.append((response.getheader("Connection"), response.read()))
+                connection.close()
+            # An unknown path gets no response.
+            connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+            connection.request("GET", "/unknown")
+            try:
+                connection.getresponse()
+                responses.append("response")
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                responses.append("disconnected")
+            connection.close()
+            return responses
+
+        responses = self._run_client(client)
+        self.assertEqual(
+            [
+                ("close", b'{"path": "/nfvi-plugins/v1/hosts/0"}'),
+                ("close", b'{"path": "/nfvi-plugins/v1/hosts/1"}'),
+                "disconnected",
+            ],
+            responses,
+        )
+        self.assertEqual(2, len(self.clients))
+        self.assertEqual({}, self.server._connections)
+
+    def test_idle_connection_closed_without_new_connections(self):
+        self.server.add_handler("GET", "/nfvi-plugins/v1/hosts*", self._get_handler)
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.addCleanup(connection.close)
+
+        def client():
+            connection.request("GET", "/nfvi-plugins/v1/hosts/0")
+            return connection.getresponse().read()
+
+        self._run_client(client)
+        self.assertEqual(1, len(self.server._connections))
+        self.assertIn(self.server._idle_timer_id, _timer_module._scheduler._timers)
+
+        now_ms = timers.get_monotonic_timestamp_in_ms() + 31000
+        self.patch(rest_api.timers, "get_monotonic_timestamp_in_ms", lambda: now_ms)
+        self.server.audit_idle_connections().send(None)
+        self.assertEqual({}, self.server._connections)
+
+        timer_id = self.server._idle_timer_id
+        self.server.server_close()
+        self.assertNotIn(timer_id, _timer_module._scheduler._timers)
@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import socket
+
+from nfv_common import tcp
+from nfv_unit_tests.tests import testcase
+from nfv_vim import rpc
+
+
+class TestRPCChannel(testcase.NFVTestCase):
+    """Unit tests for the VIM-API to VIM RPC channels."""
+
+    def setUp(self):
+        super().setUp()
+        self.main_loop = self.useFixture(testcase.MainLoopFixture())
+        self.requests = []
+        self.received = []
+        self.server = tcp.TCPServer("127.0.0.1", 0, self._message_handler)
+        self.addCleanup(self.server.shutdown)
+        self.port = self.server._socket.getsockname()[1]
+
+    def _message_handler(self, connection, msg):
+        connection, msg = rpc.rpc_channel_demultiplex(connection, msg)
+        if msg is None:
+            return
+
+        msg = msg.decode()
+        self.received.append(msg)
+        if msg.startswith("stream"):
+            for x in range(3):
+                connection.send("%s-%s" % (msg, x))
+            connection.close()
+        else:
+            # Respond once two requests are outstanding, last first.
+            self.requests.append((connection, msg))
+            if 2 == len(self.requests):
+                for connection, msg in reversed(self.requests):
+                    connection.send("reply-" + msg)
+                    connection.close()
+                self.requests[:] = []
+
+    def _channel(self, port=None, **kwargs):
+        channel = rpc.RPCChannel(
+            "127.0.0.1", 0, "127.0.0.1", port or self.port, **kwargs
+        )
+        self.addCleanup(channel.close)
+        return channel
+
+    def _receive_all(self, connection):
+        responses = []
+        while True:
+            self.main_loop.run_until(lambda: not connection._responses.empty())
+            response = connection.receive(timeout_in_secs=1)
+            if response is None:
+                return responses
+            responses.append(response)
+
+    def test_responses_out_of_order(self):
+        channel = self._channel()
+        first = channel.open_connection()
+        second = channel.open_connection()
+        first.send("first")
+        second.send("second")
+
+        self.assertEqual([b"reply-second"], self._receive_all(second))
+        self.assertEqual([b"reply-first"], self._receive_all(first))
+        self.assertTrue(channel.is_alive)
+        first.close()
+        second.close()
+        self.assertEqual(0, channel.outstanding)
+
+    def test_responses_delivered_while_sending(self):
+        channel = self._channel()
+        first = channel.open_connection()
+        second = channel.open_connection()
+        first.send("first")
+        second.send("second")
+
+        # A send blocked waiting for the VIM does not hold up responses.
+        with channel._send_lock:
+            self.assertEqual([b"reply-second"], self._receive_all(second))
+            self.assertEqual([b"reply-first"], self._receive_all(first))
+
+    def test_streamed_responses(self):
+        channel = self._channel()
+        connections = [channel.open_connection() for x in range(2)]
+        for index, connection in enumerate(connections):
+            connection.send("stream%s" % index)
+
+        for index, connection in enumerate(connections):
+            self.assertEqual(
+                [("stream%s-%s" % (index, x)).encode() for x in range(3)],
+                self._receive_all(connection),
+            )
+            self.assertIsNone(connection.receive(timeout_in_secs=0))
+
+    def test_legacy_connection(self):
+        connection = tcp.TCPConnection("127.0.0.1", 0)
+        connection.connect("127.0.0.1", self.port)
+        self.addCleanup(connection.close)
+        connection.send("stream")
+
+        # The VIM closes the connection once it has sent the responses.
+        self.assertTrue(self.main_loop.run_until(lambda: self.received))
+        self.assertEqual({}, self.server._client_connections)
+        self.assertEqual(
+            [("stream-%s" % x).encode() for x in range(3)],
+            [connection.receive(timeout_in_secs=1) for x in range(3)],
+        )
+        self.assertIsNone(connection.receive(timeout_in_secs=1))
+        self.assertTrue(connection.is_shutdown())
+
+    def test_heartbeat(self):
+        channel = self._channel(heartbeat_interval_secs=0.1, heartbeat_timeout_secs=1)
+        self.main_loop.run_until(lambda: False, 2)
+        self.assertTrue(channel.is_alive)
+
+    def test_vim_failure_detected(self):
+        # A VIM that accepts the channel but never responds.
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        channel = self._channel(
+            listener.getsockname()[1],
+            heartbeat_interval_secs=0.1,
+            heartbeat_timeout_secs=0.3,
+        )
+        connection = channel.open_connection()
+        connection.send("request")
+        self.assertIsNone(connection.receive(timeout_in_secs=5))
+        self.assertTrue(connection.is_shutdown())
+        self.assertTrue(self.main_loop.run_until(lambda: not channel.is_alive))
+        self.assertIsNone(channel.open_connection().receive(timeout_in_secs=0))
@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+
+from nfv_common.helpers import coroutine
+from nfv_common import selobj
+from nfv_common.selobj import _selobj_module
+from nfv_unit_tests.tests import testcase
+
+
+class SelobjTestMixin:
+    """Selection object tests run against each backend."""
+
+    BACKEND = None
+
+    def setUp(self):
+        super().setUp()
+        self.useFixture(testcase.MainLoopFixture({"backend": self.BACKEND}))
+        self.received = []
+
+    def _pipe(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        return read_fd, write_fd
+
+    @coroutine
+    def _reader(self):
+        while True:
+            fd = yield
+            self.received.append(os.read(fd, 64))
+
+    @coroutine
+    def _one_shot_writer(self):
+        fd = yield
+        os.write(fd, b"x")
+
+    def test_read_dispatch(self):
+        read_fd, write_fd = self._pipe()
+        selobj.selobj_add_read_obj(read_fd, self._reader)
+
+        selobj.selobj_dispatch(0)
+        self.assertEqual([], self.received)
+
+        os.write(write_fd, b"hello")
+        selobj.selobj_dispatch(100)
+        self.assertEqual([b"hello"], self.received)
+
+    def test_delete_read_obj(self):
+        read_fd, write_fd = self._pipe()
+        selobj.selobj_add_read_obj(read_fd, self._reader)
+        selobj.selobj_del_read_obj(read_fd)
+
+        os.write(write_fd, b"hello")
+        selobj.selobj_dispatch(0)
+        self.assertEqual([], self.received)
+
+    def test_finished_callback_removed(self):
+        read_fd, write_fd = self._pipe()
+        selobj.selobj_add_read_obj(read_fd, self._reader)
+        selobj.selobj_add_write_obj(write_fd, self._one_shot_writer)
+
+        selobj.selobj_dispatch(100)
+        self.assertNotIn(write_fd, _selobj_module._write_callbacks)
+
+        selobj.selobj_dispatch(100)
+        self.assertEqual([b"x"], self.received)
+
+    def test_read_and_write_same_object(self):
+        read_fd, write_fd = self._pipe()
+        selobj.selobj_add_read_obj(write_fd, self._reader)
+        selobj.selobj_add_write_obj(write_fd, self._one_shot_writer)
+        selobj.selobj_del_read_obj(write_fd)
+
+        selobj.selobj_dispatch(100)
+        self.assertEqual(b"x", os.read(read_fd, 64))
+
+
+class TestSelobjSelect(SelobjTestMixin, testcase.NFVTestCase):
+    BACKEND = selobj.SELOBJ_BACKEND.SELECT
+
+    def test_no_selector(self):
+        self.assertIsNone(_selobj_module._selector)
+
+
+class TestSelobjEpoll(SelobjTestMixin, testcase.NFVTestCase):
+    BACKEND = selobj.SELOBJ_BACKEND.EPOLL
+
+    def test_incremental_registration(self):
+        read_fd, write_fd = self._pipe()
+        selobj.selobj_add_read_obj(read_fd, self._reader)
+        self.assertIn(read_fd, _selobj_module._selector.get_map())
+
+        selobj.selobj_del_read_obj(read_fd)
+        self.assertNotIn(read_fd, _selobj_module._selector.get_map())
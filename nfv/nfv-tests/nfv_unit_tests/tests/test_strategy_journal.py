@@ -0,0 +1,207 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+
+import fixtures
+
+from nfv_common import strategy
+from nfv_unit_tests.tests import testcase
+from nfv_vim import database
+from nfv_vim.database._database import database_get
+from nfv_vim.database import _database_sw_update
+from nfv_vim.database import model
+from nfv_vim import objects
+
+
+class WaitStep(strategy.StrategyStep):
+    """Step waiting to be completed, with a list of hosts standing in for
+
+    the entities of the steps of the software update strategies.
+    """
+
+    def __init__(self, name, host_names):
+        super(WaitStep, self).__init__(name)
+        self.host_names = host_names
+
+    def apply(self):
+        return strategy.STRATEGY_STEP_RESULT.WAIT, ""
+
+    def as_dict(self):
+        data = super(WaitStep, self).as_dict()
+        data["entity_names"] = self.host_names
+        return data
+
+
+class JournaledStrategy(strategy.Strategy):
+    """Strategy saving a snapshot and journal records."""
+
+    def __init__(self, num_stages, num_steps):
+        super(JournaledStrategy, self).__init__("strategy-uuid", "journaled")
+        host_names = ["worker-%d" % x for x in range(200)]
+        for stage_id in range(num_stages):
+            stage = strategy.StrategyStage("stage-%d" % stage_id)
+            for step_id in range(num_steps):
+                stage.add_step(WaitStep("step-%d" % step_id, host_names))
+            self.apply_phase.add_stage(stage)
+        self._state = strategy.STRATEGY_STATE.READY_TO_APPLY
+        self._current_phase = strategy.STRATEGY_PHASE.BUILD
+        self.journal = strategy.StrategyJournal()
+        self.num_snapshots = 0
+        self.save()
+
+    def save(self):
+        self.snapshot = self.journal.snapshot(self)
+        self.num_snapshots += 1
+        self.records = []
+
+    def save_progress(self, phase, stage=None):
+        record = self.journal.record(self, phase, stage)
+        if record is None:
+            self.save()
+        elif record:
+            self.records.append(record)
+
+    def rebuild(self):
+        data = json.loads(self.snapshot)
+        for record in self.records:
+            strategy.StrategyJournal.apply(data, json.loads(record))
+        return data
+
+
+class FakeSwUpdate:
+    """Software update object to be saved in the database."""
+
+    def __init__(self, sw_update_strategy):
+        self.uuid = "sw-update-uuid"
+        self.sw_update_type = objects.SW_UPDATE_TYPE.SW_UPGRADE
+        self.strategy = sw_update_strategy
+
+
+class TestStrategyJournal(testcase.NFVTestCase):
+    """Unit tests for the strategy state journal."""
+
+    def _complete_step(self, journaled):
+        phase = journaled.apply_phase
+        phase.stages[phase.current_stage].step_complete(
+            strategy.STRATEGY_STEP_RESULT.SUCCESS, ""
+        )
+
+    def test_replay(self):
+        journaled = JournaledStrategy(4, 3)
+        journaled.apply(None)
+        self.assertEqual(2, journaled.num_snapshots)
+        self.assertEqual(journaled.as_dict(), journaled.rebuild())
+
+        for _ in range(11):
+            self._complete_step(journaled)
+            self.assertEqual(journaled.as_dict(), journaled.rebuild())
+            self.assertEqual(2, journaled.num_snapshots)
+
+        # Each record only holds the steps of the stage saved, not the hosts of
+        # every step of the strategy.
+        self.assertTrue(
+            max(len(x) for x in journaled.records) * 4 < len(journaled.snapshot)
+        )
+
+        # The strategy is saved whole once applied.
+        self._complete_step(journaled)
+        self.assertTrue(journaled.is_applied())
+        self.assertEqual([], journaled.records)
+        self.assertEqual(0, journaled.journal.num_records)
+
+    def test_unchanged(self):
+        journaled = JournaledStrategy(1, 2)
+        journaled.apply(None)
+        phase = journaled.apply_phase
+        self.assertEqual(
+            "", journaled.journal.record(journaled, phase, phase.stages[0])
+        )
+
+    def test_shape_changed(self):
+        journaled = JournaledStrategy(2, 2)
+        phase = journaled.apply_phase
+        phase.stages[1].add_step(WaitStep("step-2", []))
+        self.assertIsNone(journaled.journal.record(journaled, phase, phase.stages[1]))
+
+    def test_needs_compaction(self):
+        journaled = JournaledStrategy(2, 50)
+        journaled.apply(None)
+        for _ in range(5):
+            self._complete_step(journaled)
+        journal = journaled.journal
+        self.assertEqual(len(journaled.records), journal.num_records)
+        self.assertFalse(journal.needs_compaction(100))
+        self.assertTrue(journal.needs_compaction(journal.num_records))
+
+        self.patch(journal, "_snapshot_bytes", journal.record_bytes - 1)
+        self.assertTrue(journal.needs_compaction(100))
+
+
+class TestDatabaseStrategyJournal(testcase.NFVTestCase):
+    """Unit tests for the strategy state journal of the database."""
+
+    def setUp(self):
+        super().setUp()
+        self.useFixture(testcase.MainLoopFixture())
+        self.db_dir = self.useFixture(fixtures.TempDir()).path
+        self.patch(_database_sw_update, "_journal_enabled", False)
+        self.patch(_database_sw_update, "_journal_compact_records", 100)
+        database.database_initialize(
+            {
+                "database_dir": self.db_dir,
+                "strategy_journal": "true",
+                "strategy_journal_compact_records": "3",
+            }
+        )
+        self.addCleanup(database.database_finalize)
+        self.db = database_get()
+        self.patch(objects, "SwUpgrade", lambda uuid, data: (uuid, data))
+
+    def _commit(self):
+        self.db.flush_rows()
+        self.db.session.commit()
+
+    def _journal_sequences(self):
+        query = self.db.session.query(model.SoftwareUpdateJournal)
+        return [row.sequence for row in query.all()]
+
+    def test_journal(self):
+        self.assertTrue(database.database_sw_update_journal_enabled())
+        journaled = JournaledStrategy(2, 3)
+        journaled.apply(None)
+        sw_update = FakeSwUpdate(journaled)
+        database.database_sw_update_add(sw_update)
+        self._commit()
+
+        phase = journaled.apply_phase
+        for _ in range(2):
+            stage = phase.stages[phase.current_stage]
+            stage.step_complete(strategy.STRATEGY_STEP_RESULT.SUCCESS, "")
+            database.database_sw_update_journal_add(sw_update, phase, stage)
+        self._commit()
+        self.assertEqual([1, 2], self._journal_sequences())
+
+        self.assertEqual(
+            [("sw-update-uuid", journaled.as_dict())],
+            database.database_sw_update_get_list(),
+        )
+
+        # The third record compacts the journal into the strategy data.
+        stage = phase.stages[phase.current_stage]
+        stage.step_complete(strategy.STRATEGY_STEP_RESULT.SUCCESS, "")
+        database.database_sw_update_journal_add(sw_update, phase, stage)
+        self._commit()
+        self.assertEqual([], self._journal_sequences())
+        self.assertEqual(
+            [("sw-update-uuid", journaled.as_dict())],
+            database.database_sw_update_get_list(),
+        )
+
+        database.database_sw_update_journal_add(sw_update, phase, stage)
+        database.database_sw_update_delete(sw_update.uuid)
+        self._commit()
+        self.assertEqual([], self._journal_sequences())
+        self.assertEqual([], database.database_sw_update_get_list())
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_unit_tests.tests import testcase
+from nfv_vim.tables._table import Table
+
+
+class Item:
+    """Table value with indexed attributes."""
+
+    def __init__(self, owner, tags):
+        self.owner = owner
+        self.tags = tags
+
+
+class ItemTable(Table):
+    """Table indexed by item owner and tags."""
+
+    _indexes = {
+        "owner": lambda item: (item.owner,),
+        "tag": lambda item: item.tags,
+    }
+
+
+class TestTableIndexes(testcase.NFVTestCase):
+    """Unit tests for table secondary indexes."""
+
+    def setUp(self):
+        super().setUp()
+        self.table = ItemTable()
+        self.table.persist = False
+        self.addCleanup(lambda: self.assertEqual([], self.table.check_indexes()))
+
+    def test_lookup(self):
+        self.table["a"] = Item("alice", ["x", "y"])
+        self.table["b"] = Item("bob", ["y"])
+        self.table["c"] = Item("alice", [])
+
+        self.assertEqual(["a", "c"], self._keys("owner", "alice"))
+        self.assertEqual(["a", "b"], self._keys("tag", "y"))
+        self.assertEqual([], self._keys("tag", "z"))
+
+    def test_lookup_keys(self):
+        self.table["a"] = Item("alice", ["x", "y"])
+        self.table["b"] = Item("bob", ["y"])
+
+        self.assertEqual({"a", "b"}, self.table.lookup_keys("tag", "y"))
+        self.assertEqual(frozenset(), self.table.lookup_keys("tag", "z"))
+        del self.table["b"]
+        self.assertEqual({"a"}, self.table.lookup_keys("tag", "y"))
+
+    def _keys(self, index_name, index_key):
+        values = self.table.lookup(index_name, index_key)
+        return [k for k, v in self.table.items() if any(v is x for x in values)]
+
+    def test_lookup_follows_table_order(self):
+        for key in ["c", "a", "b"]:
+            self.table[key] = Item("alice", [])
+        self.table["a"] = Item("alice", ["x"])
+        del self.table["c"]
+        self.table["c"] = Item("alice", [])
+
+        self.assertEqual(
+            [self.table[key] for key in ["a", "b", "c"]],
+            self.table.lookup("owner", "alice"),
+        )
+
+    def test_delete(self):
+        self.table["a"] = Item("alice", ["x"])
+        del self.table["a"]
+        self.assertEqual([], self.table.lookup("owner", "alice"))
+        self.assertEqual({}, self.table._index_entries["tag"])
+
+    def test_update_indexes(self):
+        item = Item("alice", ["x"])
+        self.table["a"] = item
+        item.owner = "bob"
+        item.tags = ["y"]
+        self.assertNotEqual([], self.table.check_indexes())
+
+        self.table.update_indexes("a")
+        self.assertEqual([item], self.table.lookup("owner", "bob"))
+        self.assertEqual([], self.table.lookup("owner", "alice"))
+        self.assertEqual([item], self.table.lookup("tag", "y"))
+
+        self.table.update_indexes("unknown")
@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+
+from nfv_common import selobj
+from nfv_common import tasks
+from nfv_unit_tests.tests import testcase
+
+
+class FakeTaskWorkerPool:
+    """Task worker pool that never has a worker available."""
+
+    name = "fake-pool"
+    min_workers = 1
+    max_workers = 1
+
+    def claim_worker(self):
+        return None
+
+    def autoscale(self, queue_depth, queue_wait_ms):
+        return False
+
+    def available_workers(self):
+        return False
+
+
+def _task(future, log, value):
+    log.append(value)
+    yield
+
+
+class TestTaskScheduler(testcase.NFVTestCase):
+    """Unit tests for the task scheduler run queue."""
+
+    def setUp(self):
+        super().setUp()
+        self.useFixture(testcase.MainLoopFixture())
+        self.log = []
+
+    def _create_scheduler(self, max_tasks_per_dispatch=32):
+        return tasks.TaskScheduler(
+            "test-scheduler",
+            FakeTaskWorkerPool(),
+            max_tasks_per_dispatch=max_tasks_per_dispatch,
+        )
+
+    def test_ready_tasks_run_in_one_dispatch(self):
+        scheduler = self._create_scheduler()
+        for value in range(10):
+            scheduler.add_task(tasks.TASK_PRIORITY.MED, _task, self.log, value)
+
+        selobj.selobj_dispatch(0)
+        self.assertEqual(list(range(10)), self.log)
+
+        selobj.selobj_dispatch(0)
+        self.assertEqual(list(range(10)), self.log)
+
+    def test_dispatch_is_bounded(self):
+        scheduler = self._create_scheduler(max_tasks_per_dispatch=4)
+        for value in range(10):
+            scheduler.add_task(tasks.TASK_PRIORITY.MED, _task, self.log, value)
+
+        # Each task is run twice to start it, once to send it None and once
+        # more to schedule its work.
+        selobj.selobj_dispatch(0)
+        self.assertEqual([0, 1], self.log)
+
+        for _ in range(4):
+            selobj.selobj_dispatch(0)
+        self.assertEqual(list(range(10)), self.log)
+
+    def test_task_scheduled_once(self):
+        scheduler = self._create_scheduler()
+        task_id = scheduler.add_task(tasks.TASK_PRIORITY.LOW, _task, self.log, 0)
+        task = scheduler._tasks[task_id]
+        scheduler.schedule_task(task)
+        scheduler.reschedule_task(task)
+
+        self.assertEqual(task_id, scheduler._next_task_id())
+        self.assertIsNone(scheduler._next_task_id())
+
+    def test_priority_fairness(self):
+        scheduler = self._create_scheduler()
+        high_ids = [
+            scheduler.add_task(tasks.TASK_PRIORITY.HIGH, _task, self.log, value)
+            for value in range(200)
+        ]
+        med_ids = [
+            scheduler.add_task(tasks.TASK_PRIORITY.MED, _task, self.log, value)
+            for value in range(200)
+        ]
+        low_ids = [
+            scheduler.add_task(tasks.TASK_PRIORITY.LOW, _task, self.log, value)
+            for value in range(10)
+        ]
+
+        order = [scheduler._next_task_id() for _ in range(410)]
+        self.assertEqual(high_ids[:60], order[:60])
+        self.assertEqual(med_ids[0], order[60])
+        self.assertIn(low_ids[0], order)
+        self.assertEqual(sorted(high_ids + med_ids + low_ids), sorted(order))
+
+    def test_delete_task_releases_owned_resources(self):
+        scheduler = self._create_scheduler()
+        task_a = scheduler._tasks[
+            scheduler.add_task(tasks.TASK_PRIORITY.MED, _task, self.log, "a")
+        ]
+        task_b = scheduler._tasks[
+            scheduler.add_task(tasks.TASK_PRIORITY.MED, _task, self.log, "b")
+        ]
+
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+
+        timer_a = scheduler.add_task_timer("timer-a", 10, task_a)
+        timer_b = scheduler.add_task_timer("timer-b", 10, task_b)
+        scheduler.add_task_io_read_wait(read_fd, task_a)
+        # Ownership of the selection object moves to task b.
+        scheduler.add_task_io_read_wait(read_fd, task_b)
+        scheduler.add_io_write_wait(write_fd, task_a)
+
+        stats = scheduler.stats
+        self.assertEqual(2, stats["live-tasks"])
+        self.assertEqual(2, stats["task-timers"])
+        self.assertEqual(2, stats["task-selobjs"])
+
+        scheduler.delete_task(task_a)
+        self.assertNotIn(timer_a, scheduler._task_timers)
+        self.assertIn(timer_b, scheduler._task_timers)
+        self.assertIs(task_b, scheduler._task_read_selobjs[read_fd])
+        self.assertNotIn(write_fd, scheduler._task_write_selobjs)
+        self.assertNotIn(task_a.id, scheduler._task_timer_ids)
+
+        scheduler.delete_task(task_b)
+        stats = scheduler.stats
+        self.assertEqual(0, stats["live-tasks"])
+        self.assertEqual(0, stats["task-timers"])
+        self.assertEqual(0, stats["task-selobjs"])
+        self.assertEqual({}, scheduler._task_read_selobj_index)
@@ -0,0 +1,216 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import threading
+
+from nfv_common.selobj import _selobj_module
+from nfv_common import tasks
+from nfv_common.tasks._task_work import TaskWork
+from nfv_common import timers
+from nfv_common.timers import _timer_module
+from nfv_unit_tests.tests import testcase
+
+
+def _add(x, y):
+    return x + y
+
+
+def _fail():
+    raise ValueError("bad value")
+
+
+def _task(future, results, x, y):
+    future.work(_add, x, y)
+    future.result = yield
+    if future.result.is_complete():
+        results.append(future.result.data)
+
+
+def _gather_task(future, results, work_items):
+    future.gather([future.work_item(*work_item) for work_item in work_items])
+    future.result = yield
+    results.append(future.result)
+
+
+def _blocking_task(future, results, blocker):
+    future.work(blocker.wait)
+    future.result = yield
+    results.append(future.result.data)
+
+
+def _failing_task(future, results):
+    future.work(_fail)
+    try:
+        future.result = yield
+    except Exception as e:
+        results.append(str(e))
+
+
+class TestTaskWorkerPoolThreadMode(testcase.NFVTestCase):
+    """Unit tests for task worker pools running task work on threads."""
+
+    def setUp(self):
+        super().setUp()
+        self.main_loop = self.useFixture(testcase.MainLoopFixture())
+        self.pool = tasks.TaskWorkerPool(
+            "test-pool", num_workers=4, worker_mode=tasks.TASK_WORKER_MODE.THREAD
+        )
+        self.addCleanup(self.pool.shutdown)
+        self.scheduler = tasks.TaskScheduler("test-scheduler", self.pool)
+        self.results = []
+
+    def test_task_work_runs_on_threads(self):
+        for x in range(20):
+            self.scheduler.add_task(
+                tasks.TASK_PRIORITY.MED, _task, self.results, x, 100
+            )
+        self.assertTrue(self.main_loop.run_until(lambda: 20 == len(self.results)))
+        self.assertEqual([x + 100 for x in range(20)], sorted(self.results))
+        self.assertTrue(self.pool.available_workers())
+        self.assertEqual(0, self.scheduler.stats["live-tasks"])
+
+    def test_task_work_exception(self):
+        self.scheduler.add_task(tasks.TASK_PRIORITY.MED, _failing_task, self.results)
+        self.assertTrue(self.main_loop.run_until(lambda: self.results))
+        self.assertEqual(["ValueError: bad value"], self.results)
+
+    def test_timeout_worker_discards_result(self):
+        blocker = threading.Event()
+        self.addCleanup(blocker.set)
+
+        worker = self.pool.claim_worker()
+        worker.submit_task_work(TaskWork(1, blocker.wait))
+        self.pool.timeout_worker(worker)
+
+        self.assertNotIn(worker.id, [x.id for x in self.pool._workers])
+        self.assertEqual(4, len(self.pool._workers))
+
+        blocker.set()
+        self.pool._executor.submit(lambda: None).result()
+        self.assertTrue(
+            self.main_loop.run_until(
+                lambda: worker._result_queue._receive_socket.fileno() == -1
+            )
+        )
+
+    def test_task_work_timeout_after_work_done(self):
+        # The task work completes but times out before its result is
+        # dispatched, timing out the worker closes its thread queue.
+        def _timeout_task(future, results):
+            future.gather([TaskWork(1, _add, 1, 2)])
+            future.result = yield
+            results.append(future.result)
+
+        self.scheduler.add_task(tasks.TASK_PRIORITY.MED, _timeout_task, self.results)
+        self.assertTrue(self.main_loop.run_until(lambda: self.scheduler._workers_timer))
+        ((timer_id, worker),) = self.scheduler._workers_timer.items()
+        select_obj = worker.selobj
+        while worker._busy:
+            self.pool._executor.submit(lambda: None).result()
+
+        timer = _timer_module._scheduler._timers[timer_id]
+        timer.callback(timers.get_monotonic_timestamp_in_ms() + 3000)
+
+        self.assertEqual({}, self.scheduler._workers_selobj)
+        self.assertNotIn(select_obj, _selobj_module._read_callbacks)
+        self.assertEqual(-1, worker.selobj)
+        self.assertTrue(self.main_loop.run_until(lambda: self.results))
+        self.assertFalse(self.results[0].data[0].is_complete())
+        self.assertEqual(0, self.scheduler.stats["live-tasks"])
+
+    def test_gather(self):
+        work_items = [(_add, x, 100) for x in range(6)]
+        work_items.append((_fail,))
+        self.scheduler.add_task(
+            tasks.TASK_PRIORITY.MED, _gather_task, self.results, work_items
+        )
+        self.assertTrue(self.main_loop.run_until(lambda: self.results))
+
+        result = self.results[0]
+        self.assertFalse(result.is_complete())
+        self.assertEqual([x + 100 for x in range(6)], [x.data for x in result.data[:6]])
+        self.assertTrue(all(x.is_complete() for x in result.data[:6]))
+        self.assertFalse(result.data[6].is_complete())
+        self.assertEqual("ValueError: bad value", str(result.data[6].error))
+        self.assertEqual(0, self.scheduler.stats["live-tasks"])
+
+    def test_gather_timeout(self):
+        blocker = threading.Event()
+        self.addCleanup(blocker.set)
+
+        def _gather_timeout_task(future, results):
+            future.gather([TaskWork(1, blocker.wait), TaskWork(10, _add, 1, 2)])
+            future.result = yield
+            results.append(future.result)
+
+        self.scheduler.add_task(
+            tasks.TASK_PRIORITY.MED, _gather_timeout_task, self.results
+        )
+        self.assertTrue(self.main_loop.run_until(lambda: self.results))
+
+        result = self.results[0]
+        self.assertFalse(result.is_complete())
+        self.assertFalse(result.data[0].is_complete())
+        self.assertIsNone(result.data[0].error)
+        self.assertEqual(3, result.data[1].data)
+
+
+class TestTaskWorkerPoolAutoscale(testcase.NFVTestCase):
+    """Unit tests for growing and shrinking task worker pools."""
+
+    def setUp(self):
+        super().setUp()
+        self.main_loop = self.useFixture(testcase.MainLoopFixture())
+        self.pool = tasks.TaskWorkerPool(
+            "test-pool",
+            num_workers=1,
+            worker_mode=tasks.TASK_WORKER_MODE.THREAD,
+            max_workers=3,
+            grow_queue_depth=2,
+            idle_secs=0,
+        )
+        self.addCleanup(self.pool.shutdown)
+        self.scheduler = tasks.TaskScheduler("test-scheduler", self.pool)
+        self.blocker = threading.Event()
+        self.addCleanup(self.blocker.set)
+        self.results = []
+
+    def test_grow_and_shrink(self):
+        self.assertEqual(1, self.pool.num_workers)
+        for _ in range(6):
+            self.scheduler.add_task(
+                tasks.TASK_PRIORITY.MED, _blocking_task, self.results, self.blocker
+            )
+        self.assertTrue(self.main_loop.run_until(lambda: 3 == self.pool.num_workers))
+        self.assertFalse(self.pool.available_workers())
+        self.assertEqual(3, self.scheduler.stats["pending-task-work"])
+
+        self.blocker.set()
+        self.assertTrue(self.main_loop.run_until(lambda: 6 == len(self.results)))
+
+        self.pool.shrink_idle_workers()
+        self.assertEqual(1, self.pool.num_workers)
+        self.assertTrue(self.pool.available_workers())
+
+    def test_no_growth_below_threshold(self):
+        self.scheduler.add_task(
+            tasks.TASK_PRIORITY.MED, _blocking_task, self.results, self.blocker
+        )
+        self.scheduler.add_task(
+            tasks.TASK_PRIORITY.MED, _blocking_task, self.results, self.blocker
+        )
+        self.assertTrue(
+            self.main_loop.run_until(
+                lambda: 1 == self.scheduler.stats["pending-task-work"]
+            )
+        )
+        self.assertEqual(1, self.pool.num_workers)
+
+    def test_shutdown_deletes_autoscale_timer(self):
+        timer_id = self.scheduler._autoscale_timer_id
+        self.assertIn(timer_id, _timer_module._scheduler._timers)
+        self.scheduler.shutdown()
+        self.assertNotIn(timer_id, _timer_module._scheduler._timers)
+        self.scheduler.shutdown()
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import socket
+
+from nfv_common import tcp
+from nfv_unit_tests.tests import testcase
+
+
+class TestTCPConnection(testcase.NFVTestCase):
+    """Unit tests for the TCP connection message framing."""
+
+    def setUp(self):
+        super().setUp()
+        self.main_loop = self.useFixture(testcase.MainLoopFixture())
+
+    def _connections(self, auth_key=None, peer_auth_key=None):
+        """Returns a blocking client and a non-blocking server connection."""
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        client = tcp.TCPConnection("127.0.0.1", 0, auth_key=auth_key)
+        client.connect("127.0.0.1", listener.getsockname()[1])
+        self.addCleanup(client.close)
+
+        sock, address = listener.accept()
+        server = tcp.TCPConnection(
+            address[0], address[1], sock, False, auth_key=peer_auth_key or auth_key
+        )
+        self.addCleanup(server.close)
+        return client, server
+
+    def test_several_messages_in_one_read(self):
+        client, server = self._connections()
+        for x in range(5):
+            client.send("message-%s" % x)
+
+        # Wait for all of the messages to be queued on the socket.
+        frames_len = 5 * (server.HEADER_SIZE + len("message-0"))
+        server.sock.setblocking(True)
+        server.sock.settimeout(1)
+        while frames_len > len(server.sock.recv(frames_len, socket.MSG_PEEK)):
+            pass
+
+        messages = [server.receive(timeout_in_secs=1)]
+        msg = server.receive_buffered()
+        while msg is not None:
+            messages.append(msg)
+            msg = server.receive_buffered()
+        self.assertEqual([("message-%s" % x).encode() for x in range(5)], messages)
+
+    def test_partial_messages(self):
+        client, server = self._connections()
+        frame = server._header(5) + b"hello" + server._header(5) + b"world"
+        for x in range(len(frame)):
+            client.sock.sendall(frame[x : x + 1])
+            if 2 == x:
+                self.assertIsNone(server.receive(timeout_in_secs=0))
+
+        self.assertEqual(b"hello", server.receive(timeout_in_secs=1))
+        self.assertEqual(b"world", server.receive(timeout_in_secs=1))
+
+    def test_large_message(self):
+        client, server = self._connections()
+        payload = "".join(chr(ord("a") + x % 26) for x in range(4 * 1024 * 1024))
+
+        # The server is non-blocking, what the client has not read yet is
+        # sent from the main loop.
+        self.assertEqual(len(payload) + server.HEADER_SIZE, server.send(payload))
+        self.assertTrue(server._send_queue)
+        self.assertEqual(payload.encode(), self.main_loop.run_in_thread(client.receive))
+        self.assertFalse(server._send_queue)
+
+        client.send("small")
+        self.assertEqual(b"small", server.receive(timeout_in_secs=1))
+        self.assertEqual(
+            tcp.TCPConnection.RECEIVE_BUFFER_SIZE, len(client._recv_buffer)
+        )
+
+    def test_close_with_queued_messages(self):
+        client, server = self._connections()
+        payload = "x" * (4 * 1024 * 1024)
+
+        # The client is not reading, queued messages are sent in order and
+        # the connection is closed once they have been sent.
+        for x in range(3):
+            server.send("%s-%s" % (x, payload))
+        server.close()
+        self.assertTrue(server.is_shutdown())
+        self.assertIsNotNone(server.sock)
+        for x in range(3):
+            self.assertEqual(
+                ("%s-%s" % (x, payload)).encode(),
+                self.main_loop.run_in_thread(client.receive),
+            )
+        self.assertIsNone(server.sock)
+        self.assertIsNone(client.receive(timeout_in_secs=1))
+        self.assertTrue(client.is_shutdown())
+
+    def test_unicode_message(self):
+        client, server = self._connections()
+        client.send("hôte")
+        self.assertEqual("hôte", server.receive(timeout_in_secs=1).decode())
+
+    def test_authorization(self):
+        client, server = self._connections("NFV Infrastructure Notification")
+        client.send('{"version": 1}')
+        self.assertEqual(b'{"version": 1}', server.receive(timeout_in_secs=1))
+
+        client, server = self._connections("key", "other key")
+        client.send("rejected")
+        client.send("rejected")
+        self.assertIsNone(server.receive(timeout_in_secs=1))
+        self.assertEqual(0, server._recv_end)
+
+    def test_connection_closed(self):
+        client, server = self._connections()
+        client.send("last")
+        client.close()
+        self.assertEqual(b"last", server.receive(timeout_in_secs=1))
+        self.assertIsNone(server.receive(timeout_in_secs=1))
+        self.assertTrue(server.is_shutdown())
@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from unittest import mock
+
+from nfv_common.helpers import coroutine
+from nfv_common.timers._timer import Timer
+from nfv_common.timers._timer_scheduler import TimerScheduler
+from nfv_unit_tests.tests import testcase
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now_ms = 1000000.0
+
+    def __call__(self):
+        return self.now_ms
+
+
+class TestTimerScheduler(testcase.NFVTestCase):
+    """Unit tests for the expiry ordered timer scheduler."""
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        for target in (
+            "nfv_common.timers._timer.get_monotonic_timestamp_in_ms",
+            "nfv_common.timers._timer_scheduler.get_monotonic_timestamp_in_ms",
+        ):
+            patcher = mock.patch(target, self.clock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.scheduler = TimerScheduler(500, 3000, 2000)
+        self.fired = []
+
+    @coroutine
+    def _callback(self, name):
+        while True:
+            timer_id = yield
+            self.fired.append((name, timer_id))
+
+    def _create_timer(self, name, initial_delay_secs, interval_secs):
+        timer = Timer(name, initial_delay_secs, interval_secs, self._callback, name)
+        self.scheduler.add_timer(timer)
+        return timer.timer_id
+
+    def _advance(self, secs):
+        self.clock.now_ms += secs * 1000
+        self.scheduler.schedule()
+
+    def test_timers_fire_in_expiry_order(self):
+        slow_id = self._create_timer("slow", 5, 5)
+        fast_id = self._create_timer("fast", 1, 1)
+
+        self._advance(1)
+        self.assertEqual([], self.fired)
+
+        self._advance(1)
+        self.assertEqual([("fast", fast_id)], self.fired)
+
+        self._advance(4)
+        self.assertEqual(
+            [("fast", fast_id), ("fast", fast_id), ("slow", slow_id)], self.fired
+        )
+
+    def test_delete_timer(self):
+        timer_id = self._create_timer("deleted", 1, 1)
+        self.scheduler.delete_timer(timer_id)
+        self._advance(10)
+        self.assertEqual([], self.fired)
+
+    def test_reschedule_timer(self):
+        timer_id = self._create_timer("rescheduled", 1, 1)
+        self.scheduler.reschedule_timer(timer_id, 10)
+        self._advance(2)
+        self.assertEqual([], self.fired)
+        self._advance(9)
+        self.assertEqual([("rescheduled", timer_id)], self.fired)
+
+    def test_reschedule_timer_unchanged(self):
+        timer_id = self._create_timer("rescheduled", 1, 1)
+        self.scheduler.reschedule_timer(timer_id, 1)
+        self.assertEqual(1, len(self.scheduler._timer_heap))
+        self._advance(2)
+        self.assertEqual([("rescheduled", timer_id)], self.fired)
+
+    def test_timer_deleted_by_earlier_callback(self):
+        victim = []
+
+        @coroutine
+        def _killer():
+            while True:
+                (yield)
+                self.scheduler.delete_timer(victim[0])
+
+        killer = Timer("killer", 1, 1, _killer)
+        self.scheduler.add_timer(killer)
+        victim.append(self._create_timer("victim", 1, 1))
+        self._advance(2)
+        self.assertEqual([], self.fired)
+
+    def test_finished_coroutine_is_removed(self):
+        def _one_shot():
+            (yield)
+
+        timer = Timer("one-shot", 1, 1, _one_shot)
+        timer._callback.send(None)
+        self.scheduler.add_timer(timer)
+        self._advance(2)
+        self.assertNotIn(timer.timer_id, self.scheduler._timers)
+
+    def test_next_schedule_in_ms(self):
+        self.assertEqual(500, self.scheduler.next_schedule_in_ms(500))
+
+        self._create_timer("timer", 1, 1)
+        self.scheduler.schedule()
+        self.assertEqual(2000, self.scheduler.next_schedule_in_ms(5000))
+
+        self.clock.now_ms += 1500
+        self.assertEqual(500, self.scheduler.next_schedule_in_ms(5000))
+        self.clock.now_ms += 500
+        self.assertEqual(0, self.scheduler.next_schedule_in_ms(5000))
+
+    def test_heap_is_compacted(self):
+        timer_id = self._create_timer("timer", 1, 1)
+        for interval_secs in range(1000):
+            self.scheduler.reschedule_timer(timer_id, interval_secs + 2)
+        self.assertLess(len(self.scheduler._timer_heap), 100)
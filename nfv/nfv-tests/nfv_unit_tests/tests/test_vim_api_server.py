@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import http.client
+import threading
+from wsgiref import simple_server
+
+from nfv_common import histogram
+from nfv_unit_tests.tests import testcase
+from nfv_vim import api
+from nfv_vim.api import _server
+
+
+class QuietHandler(simple_server.WSGIRequestHandler):
+    """Request handler that does not log requests."""
+
+    def log_message(self, format, *args):
+        return
+
+
+class TestVimAPIServer(testcase.NFVTestCase):
+    """Unit tests for the VIM-API servers."""
+
+    def setUp(self):
+        super().setUp()
+        self.patch(histogram, "_histograms", {})
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.blocked = threading.Semaphore(0)
+
+    def _application(self, environ, start_response):
+        if environ["PATH_INFO"].startswith("/slow"):
+            self.blocked.release()
+            self.release.wait(5)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [environ["PATH_INFO"].encode()]
+
+    def _server(self, max_workers, max_pending):
+        server = api.ThreadPoolWSGIServer(
+            ("127.0.0.1", 0), QuietHandler, max_workers, max_pending
+        )
+        server.set_app(api.LatencyMiddleware(self._application))
+        self.addCleanup(server.server_close)
+        return server
+
+    def _request(self, server, path, results):
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", server.server_address[1], timeout=5
+        )
+        connection.request("GET", path)
+        response = connection.getresponse()
+        results.append((path, response.status, response.read()))
+        connection.close()
+
+    def _start_request(self, server, path, results):
+        thread = threading.Thread(target=self._request, args=(server, path, results))
+        thread.daemon = True
+        thread.start()
+        server.handle_request()
+        return thread
+
+    def test_slow_request_does_not_block(self):
+        server = self._server(2, 0)
+        slow_results = []
+        slow = self._start_request(server, "/slow", slow_results)
+        self.assertTrue(self.blocked.acquire(timeout=5))
+
+        results = []
+        self._start_request(server, "/fast", results).join(5)
+        self.assertEqual([("/fast", 200, b"/fast")], results)
+        self.assertEqual([], slow_results)
+
+        self.release.set()
+        slow.join(5)
+        self.assertEqual([("/slow", 200, b"/slow")], slow_results)
+
+    def test_busy_server_rejects(self):
+        server = self._server(1, 0)
+        slow = self._start_request(server, "/slow", [])
+        self.assertTrue(self.blocked.acquire(timeout=5))
+
+        results = []
+        self._start_request(server, "/fast", results).join(5)
+        self.assertEqual([("/fast", 503, b"")], results)
+        self.assertEqual(1, server.outstanding)
+
+        self.release.set()
+        slow.join(5)
+
+    def test_latency_histograms(self):
+        server = self._server(2, 0)
+        uuid = "8d8e6f6b-4a5e-4b1e-9f0c-7a3b1f0e2d11"
+        for path in ["/api/hosts/%s" % uuid, "/api/hosts/0", "/api/hosts"]:
+            self._start_request(server, path, []).join(5)
+
+        _server.server_record_samples()
+        names = [x.name for x in histogram._histograms.values()]
+        self.assertIn("vim-api GET /api/hosts/* [latency]", names)
+        self.assertIn("vim-api GET /api/hosts [latency]", names)
+        self.assertIn("vim-api [queue-wait]", names)
+        self.assertIn("vim-api [outstanding]", names)
+
+    def test_endpoints_bounded(self):
+        middleware = api.LatencyMiddleware(self._application, max_endpoints=2)
+        self.assertEqual("GET /a", middleware.endpoint("GET", "/a"))
+        self.assertEqual("GET /b", middleware.endpoint("GET", "/b"))
+        self.assertEqual("GET other", middleware.endpoint("GET", "/c"))
+        self.assertEqual("GET /a", middleware.endpoint("GET", "/a"))
@@ -0,0 +1,254 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import types
+
+import pecan
+from pecan import hooks
+import webob
+
+from nfv_unit_tests.tests import testcase
+from nfv_vim.api.controllers.v1.virtualised_resources import _computes_api
+from nfv_vim.events import _vim_instance_api_events
+from nfv_vim import rpc
+from nfv_vim.tables._instance_table import InstanceTable
+
+
+class FakeConnection:
+    """Connection collecting the responses sent."""
+
+    def __init__(self):
+        self.responses = []
+        self.closed = False
+
+    def send(self, msg):
+        self.responses.append(rpc.RPCMessage.deserialize(msg))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeVimConnection:
+    """Connection to the VIM handing requests to the Get-Instances API."""
+
+    def __init__(self):
+        self.msgs = []
+
+    def send(self, msg):
+        connection = FakeConnection()
+        _vim_instance_api_events.vim_instance_api_get_instances(
+            connection, rpc.RPCMessage.deserialize(msg)
+        )
+        self.msgs = [x.serialize() for x in connection.responses]
+
+    def receive(self):
+        if self.msgs:
+            return self.msgs.pop(0)
+        return None
+
+
+class FakeVimHook(hooks.PecanHook):
+    """Hook connecting requests to a fake VIM."""
+
+    def on_route(self, state):
+        state.request.vim = types.SimpleNamespace(open_connection=FakeVimConnection)
+
+
+class FakeRootController:
+    """Root controller serving the computes API."""
+
+    computes = _computes_api.ComputesAPI()
+
+
+def _instance(index, host_name, oper_state="enabled", tenant_uuid="tenant-a"):
+    return types.SimpleNamespace(
+        uuid="00000000-0000-0000-0000-%012d" % index,
+        name="instance-%s" % index,
+        admin_state="unlocked",
+        oper_state=oper_state,
+        avail_status=[],
+        action="",
+        host_name=host_name,
+        tenant_uuid=tenant_uuid,
+        instance_type_original_name="small",
+        image_uuid="image",
+        vcpus=1,
+        memory_mb=512,
+        disk_gb=1,
+        ephemeral_gb=0,
+        swap_gb=0,
+        auto_recovery=True,
+        max_live_migrate_wait_in_secs=800,
+        max_live_migration_downtime_in_ms=500,
+    )
+
+
+class TestVimInstanceAPIGetInstances(testcase.NFVTestCase):
+    """Unit tests for the Get-Instances API request."""
+
+    def setUp(self):
+        super().setUp()
+        instances = [
+            _instance(3, "compute-1"),
+            _instance(0, "compute-0"),
+            _instance(4, None, "disabled"),
+            _instance(1, "compute-1", tenant_uuid="tenant-b"),
+            _instance(2, "compute-0"),
+        ]
+        self.instance_table = InstanceTable()
+        self.instance_table.persist = False
+        for instance in instances:
+            self.instance_table[instance.uuid] = instance
+        self.host_table = {
+            "compute-0": types.SimpleNamespace(uuid="host-0"),
+            "compute-1": types.SimpleNamespace(uuid="host-1"),
+        }
+        self.patch(
+            _vim_instance_api_events.tables,
+            "tables_get_instance_table",
+            lambda: self.instance_table,
+        )
+        self.patch(
+            _vim_instance_api_events.tables,
+            "tables_get_host_table",
+            lambda: self.host_table,
+        )
+
+    def _get_instances(self, **kwargs):
+        request = rpc.APIRequestGetInstance()
+        request.get_all = True
+        for name, value in kwargs.items():
+            setattr(request, name, value)
+        request = rpc.RPCMessage.deserialize(request.serialize())
+
+        connection = FakeConnection()
+        _vim_instance_api_events.vim_instance_api_get_instances(connection, request)
+        self.assertTrue(connection.closed)
+        return connection.responses
+
+    @staticmethod
+    def _instances(responses):
+        instances = []
+        for response in responses:
+            instances.extend(response.get_instances())
+        return instances
+
+    def test_response_per_instance(self):
+        responses = self._get_instances()
+        self.assertEqual(
+            [rpc.RPC_MSG_TYPE.GET_INSTANCE_RESPONSE] * 5, [x.type for x in responses]
+        )
+        self.assertEqual(
+            ["instance-%s" % x for x in range(5)], [x.name for x in responses]
+        )
+        self.assertEqual(
+            ["host-0", "host-1", "host-0", "host-1", None],
+            [x.host_uuid for x in responses],
+        )
+
+    def test_batches(self):
+        responses = self._get_instances(batch_size=2)
+        self.assertEqual(
+            [rpc.RPC_MSG_TYPE.GET_INSTANCES_RESPONSE] * 3, [x.type for x in responses]
+        )
+        self.assertEqual([2, 2, 1], [len(x.instances) for x in responses])
+        instances = self._instances(responses)
+        self.assertEqual(
+            ["instance-%s" % x for x in range(5)], [x.name for x in instances]
+        )
+        self.assertEqual(800, instances[0].live_migration_timeout)
+        self.assertIsNone(responses[-1].next_marker)
+
+        # A batch is always sent, even when nothing matches.
+        responses = self._get_instances(batch_size=2, filter_by_host="compute-9")
+        self.assertEqual([[]], [x.instances for x in responses])
+
+    def test_filters(self):
+        def names(**kwargs):
+            responses = self._get_instances(batch_size=10, **kwargs)
+            return [x.name for x in self._instances(responses)]
+
+        self.assertEqual(
+            ["instance-0", "instance-2"], names(filter_by_host="compute-0")
+        )
+        self.assertEqual(["instance-4"], names(filter_by_state="disabled"))
+        self.assertEqual(["instance-1"], names(filter_by_tenant="tenant-b"))
+        self.assertEqual(
+            ["instance-3"],
+            names(filter_by_host="compute-1", filter_by_tenant="tenant-a"),
+        )
+
+        # Instances are found through the host index, which only follows the
+        # host of an instance once its indexes are updated.
+        instance_uuid = "00000000-0000-0000-0000-000000000003"
+        self.instance_table[instance_uuid].host_name = "compute-0"
+        self.assertEqual(
+            ["instance-0", "instance-2"], names(filter_by_host="compute-0")
+        )
+        self.instance_table.update_indexes(instance_uuid)
+        self.assertEqual(
+            ["instance-0", "instance-2", "instance-3"],
+            names(filter_by_host="compute-0"),
+        )
+
+    def test_pagination(self):
+        pages = []
+        marker = None
+        while True:
+            responses = self._get_instances(batch_size=10, limit=2, marker=marker)
+            pages.append([x.name for x in self._instances(responses)])
+            marker = responses[-1].next_marker
+            if marker is None:
+                break
+
+        self.assertEqual(
+            [
+                ["instance-0", "instance-1"],
+                ["instance-2", "instance-3"],
+                ["instance-4"],
+            ],
+            pages,
+        )
+
+        # Paging resumes after the marker even if it has been deleted.
+        del self.instance_table["00000000-0000-0000-0000-000000000001"]
+        responses = self._get_instances(
+            batch_size=10, marker="00000000-0000-0000-0000-000000000001"
+        )
+        self.assertEqual(
+            ["instance-2", "instance-3", "instance-4"],
+            [x.name for x in self._instances(responses)],
+        )
+
+    def test_fields(self):
+        responses = self._get_instances(batch_size=10, fields=["name", "vcpus"])
+        self.assertEqual(
+            {"uuid", "name", "vcpus"}, set(responses[0].instances[0].keys())
+        )
+        instance = self._instances(responses)[0]
+        self.assertEqual("instance-0", instance.name)
+        self.assertIsNone(instance.memory_mb)
+
+    def test_computes_api_next_link(self):
+        app = pecan.make_app(FakeRootController(), hooks=[FakeVimHook()])
+        compute_ids = []
+        url = "http://localhost/computes?host=compute-1&limit=1"
+        while url is not None:
+            response = webob.Request.blank(url).get_response(app)
+            self.assertEqual(200, response.status_code)
+            compute_ids.extend(x["query_result"]["compute_id"] for x in response.json)
+            url = None
+            if "Link" in response.headers:
+                link, rel = response.headers["Link"].split("; ")
+                self.assertEqual('rel="next"', rel)
+                url = link.strip("<>")
+
+        self.assertEqual(
+            [
+                "00000000-0000-0000-0000-000000000001",
+                "00000000-0000-0000-0000-000000000003",
+            ],
+            compute_ids,
+        )
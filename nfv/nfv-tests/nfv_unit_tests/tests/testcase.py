@@ -3,8 +3,65 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import threading
+import time
+
+import fixtures
 import testtools
 
+from nfv_common import selobj
+from nfv_common import timers
+
+
+class MainLoopFixture(fixtures.Fixture):
+    """Main loop fixture, initializes the selection objects and timers that
+
+    the code under test registers with and dispatches them on request.
+    """
+
+    def __init__(self, selobj_config=None):
+        super().__init__()
+        self._selobj_config = selobj_config
+
+    def _setUp(self):
+        selobj.selobj_initialize(self._selobj_config)
+        self.addCleanup(selobj.selobj_finalize)
+        timers.timers_initialize(500, 3000, 2000)
+        self.addCleanup(timers.timers_finalize)
+
+    @staticmethod
+    def dispatch(timeout_in_ms=10):
+        """Dispatch one pass of the main loop."""
+
+        selobj.selobj_dispatch(timeout_in_ms)
+        timers.timers_schedule()
+
+    def run_until(self, condition, timeout_in_secs=10):
+        """Dispatch the main loop until the condition is met, returns true
+
+        if it was met before the timeout.
+        """
+        end = time.monotonic() + timeout_in_secs
+        while not condition() and time.monotonic() < end:
+            self.dispatch()
+        return bool(condition())
+
+    def run_in_thread(self, target, on_dispatch=None):
+        """Run target in a thread while dispatching the main loop, returns
+
+        the result of target.
+        """
+        results = []
+        thread = threading.Thread(target=lambda: results.append(target()))
+        thread.daemon = True
+        thread.start()
+        while thread.is_alive():
+            self.dispatch()
+            if on_dispatch is not None:
+                on_dispatch()
+        thread.join()
+        return results[0] if results else None
+
 
 class NFVTestCase(testtools.TestCase):
     pass
@@ -1,6 +1,11 @@
 #
-# Copyright (c) 2015-2016 Wind River Systems, Inc.
+# Copyright (c) 2015-2016, 2026 Wind River Systems, Inc.
 #
 # SPDX-License-Identifier: Apache-2.0
 #
 from nfv_vim.api._application import Application  # noqa: F401
+from nfv_vim.api._hooks import close_rpc_channels  # noqa: F401
+from nfv_vim.api._server import LatencyMiddleware  # noqa: F401
+from nfv_vim.api._server import SERVER_MODE  # noqa: F401
+from nfv_vim.api._server import server_record_samples  # noqa: F401
+from nfv_vim.api._server import ThreadPoolWSGIServer  # noqa: F401
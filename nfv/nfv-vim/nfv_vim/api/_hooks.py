@@ -5,6 +5,7 @@
 #
 import http.client as httplib
 import re
+import threading
 import time
 from urllib.parse import urlparse
 
@@ -17,9 +18,50 @@ from nfv_common.helpers import Object
 from nfv_common import tcp
 from nfv_vim.api.acl.policies import base as base_policy
 from nfv_vim.api.acl import policy
+from nfv_vim import rpc
 
 DLOG = debug.debug_get_logger("nfv_vim.api")
 
+_rpc_channel_pool = None
+_rpc_channel_pool_lock = threading.Lock()
+
+
+def _get_rpc_channel_pool():
+    """Returns the pool of channels to the VIM, None if requests are sent
+
+    on a connection of their own.
+    """
+    global _rpc_channel_pool
+
+    api_config = config.CONF["vim-api"]
+    num_channels = int(api_config.get("rpc_channels", 0))
+    if 0 >= num_channels:
+        return None
+
+    with _rpc_channel_pool_lock:
+        if _rpc_channel_pool is None:
+            _rpc_channel_pool = rpc.RPCChannelPool(
+                api_config["rpc_host"],
+                api_config["rpc_port"],
+                config.CONF["vim"]["rpc_host"],
+                config.CONF["vim"]["rpc_port"],
+                num_channels,
+                int(api_config.get("rpc_heartbeat_interval_secs", 5)),
+                int(api_config.get("rpc_heartbeat_timeout_secs", 30)),
+            )
+        return _rpc_channel_pool
+
+
+def close_rpc_channels():
+    """Close the channels to the VIM."""
+
+    global _rpc_channel_pool
+
+    with _rpc_channel_pool_lock:
+        if _rpc_channel_pool is not None:
+            _rpc_channel_pool.close()
+            _rpc_channel_pool = None
+
 
 class VimConnectionMgmt:
     """VIM Connection Management."""
@@ -32,12 +74,16 @@ class VimConnectionMgmt:
     def open_connection(self):
         """Open a connection to the VIM."""
 
-        connection = tcp.TCPConnection(
-            config.CONF["vim-api"]["rpc_host"], config.CONF["vim-api"]["rpc_port"]
-        )
-        connection.connect(
-            config.CONF["vim"]["rpc_host"], config.CONF["vim"]["rpc_port"]
-        )
+        rpc_channel_pool = _get_rpc_channel_pool()
+        if rpc_channel_pool is not None:
+            connection = rpc_channel_pool.open_connection()
+        else:
+            connection = tcp.TCPConnection(
+                config.CONF["vim-api"]["rpc_host"], config.CONF["vim-api"]["rpc_port"]
+            )
+            connection.connect(
+                config.CONF["vim"]["rpc_host"], config.CONF["vim"]["rpc_port"]
+            )
         self._connections.append(connection)
         return connection
 
@@ -0,0 +1,192 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import collections
+from concurrent import futures
+import re
+import threading
+from wsgiref import simple_server
+
+from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+from nfv_common import histogram
+from nfv_common import timers
+
+DLOG = debug.debug_get_logger("nfv_vim.api.server")
+
+
+class ServerMode(Constants, metaclass=Singleton):
+    """Server Mode Constants."""
+
+    INLINE = Constant("inline")
+    THREAD = Constant("thread")
+
+
+# Constant Instantiation
+SERVER_MODE = ServerMode()
+
+# Path segments that identify an object, such as a uuid or an index.
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-?([0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12})$"
+)
+
+# Histogram samples waiting to be recorded, see server_record_samples.
+_samples = collections.deque()
+
+
+def _add_sample(name, sample, units):
+    """Queue a histogram sample, histograms are only updated from the main
+
+    thread as they are not thread safe.
+    """
+    _samples.append((name, sample, units))
+
+
+def server_record_samples():
+    """Add the queued samples to their histograms."""
+
+    while _samples:
+        name, sample, units = _samples.popleft()
+        histogram.add_histogram_data(name, sample, units)
+
+
+class LatencyMiddleware:
+    """WSGI middleware recording the latency of the requests of each
+
+    endpoint.  An endpoint is a method and path, with the path segments
+    that identify an object replaced by '*'.  Requests beyond the first
+    max_endpoints endpoints are recorded against an 'other' endpoint.
+    """
+
+    def __init__(self, application, name="vim-api", max_endpoints=64):
+        self._application = application
+        self._name = name
+        self._max_endpoints = max_endpoints
+        self._endpoints = set()
+
+    def endpoint(self, method, path):
+        """Returns the endpoint of a request."""
+
+        segments = ["*" if _ID_SEGMENT.match(x) else x for x in path.split("/")]
+        endpoint = "%s %s" % (method, "/".join(segments))
+        if endpoint not in self._endpoints:
+            if self._max_endpoints <= len(self._endpoints):
+                return "%s other" % method
+            self._endpoints.add(endpoint)
+        return endpoint
+
+    def __call__(self, environ, start_response):
+        start_ms = timers.get_monotonic_timestamp_in_ms()
+        try:
+            return self._application(environ, start_response)
+
+        finally:
+            endpoint = self.endpoint(
+                environ.get("REQUEST_METHOD", ""), environ.get("PATH_INFO", "")
+            )
+            _add_sample(
+                "%s %s [latency]" % (self._name, endpoint),
+                timers.get_monotonic_timestamp_in_ms() - start_ms,
+                "ms",
+            )
+
+
+class ThreadPoolWSGIServer(simple_server.WSGIServer):
+    """WSGI server handling requests on a pool of threads.
+
+    At most max_workers requests are handled at a time and up to
+    max_pending more wait for a worker, further requests are rejected
+    with 503 Service Unavailable until the backlog has drained.
+    """
+
+    _REJECT_RESPONSE = (
+        b"HTTP/1.0 503 Service Unavailable\r\n"
+        b"Content-Length: 0\r\n"
+        b"Retry-After: 1\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+
+    def __init__(
+        self,
+        server_address,
+        request_handler_cls,
+        max_workers=8,
+        max_pending=32,
+        name="vim-api",
+    ):
+        simple_server.WSGIServer.__init__(self, server_address, request_handler_cls)
+        self._name = name
+        self._max_workers = max(1, max_workers)
+        self._max_pending = max(0, max_pending)
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix=name
+        )
+
+    @property
+    def outstanding(self):
+        """Returns the number of requests being handled or waiting."""
+
+        return self._outstanding
+
+    def process_request(self, request, client_address):
+        """Queue a request to be handled by a worker thread."""
+
+        with self._lock:
+            if self._max_workers + self._max_pending <= self._outstanding:
+                outstanding = None
+            else:
+                self._outstanding += 1
+                outstanding = self._outstanding
+
+        if outstanding is None:
+            DLOG.info(
+                "%s busy, rejecting request from %s, outstanding=%s."
+                % (self._name, client_address[0], self._outstanding)
+            )
+            try:
+                request.sendall(self._REJECT_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+
+        histogram.add_histogram_data(
+            self._name + " [outstanding]", outstanding, "requests"
+        )
+        self._executor.submit(
+            self._process_request_thread,
+            request,
+            client_address,
+            timers.get_monotonic_timestamp_in_ms(),
+        )
+
+    def _process_request_thread(self, request, client_address, queued_ms):
+        """Handle a request in a worker thread."""
+
+        _add_sample(
+            self._name + " [queue-wait]",
+            timers.get_monotonic_timestamp_in_ms() - queued_ms,
+            "ms",
+        )
+        try:
+            self.finish_request(request, client_address)
+
+        except Exception:
+            self.handle_error(request, client_address)
+
+        finally:
+            self.shutdown_request(request)
+            with self._lock:
+                self._outstanding -= 1
+
+    def server_close(self):
+        """Close the server, requests in progress are not waited for."""
+
+        simple_server.WSGIServer.server_close(self)
+        self._executor.shutdown(wait=False)
@@ -10,6 +10,7 @@ from wsme import types as wsme_types
 import wsmeext.pecan as wsme_pecan
 
 from nfv_vim.api._link import Link
+from nfv_vim.api.controllers.v1._histogram_api import HistogramAPI
 from nfv_vim.api.controllers.v1 import openstack
 from nfv_vim.api.controllers.v1 import orchestration
 from nfv_vim.api.controllers.v1 import virtualised_resources
@@ -31,6 +32,7 @@ class APIVersion(wsme_types.Base):
         v1.status = "stable"
         v1.links = [
             Link.make_link("self", url, "api"),
+            Link.make_link("histograms", url, "api/histograms"),
             Link.make_link("openstack", url, "api/openstack"),
             Link.make_link("orchestration", url, "api/orchestration"),
             Link.make_link("virtualised_resources", url, "api/virtualised-resources"),
@@ -55,7 +57,10 @@ class APIController(rest.RestController):
 
     @pecan.expose()
     def _lookup(self, key, *remainder):
-        if "openstack" == key:
+        if "histograms" == key:
+            return HistogramAPI(), remainder
+
+        elif "openstack" == key:
             return openstack.OpenStackAPI(), remainder
 
         elif "orchestration" == key:
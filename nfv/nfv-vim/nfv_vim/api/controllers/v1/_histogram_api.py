@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import http.client as httplib
+import pecan
+from pecan import rest
+
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_vim import rpc
+
+DLOG = debug.debug_get_logger("nfv_vim.api.histogram")
+
+
+class HistogramAPI(rest.RestController):
+    """Histogram API.
+
+    Returns the histograms of the VIM and of the VIM-API as JSON or in the
+    OpenMetrics text format, so that they can be scraped.
+    """
+
+    # Query parameters are passed as keyword arguments, pecan takes named
+    # arguments of a rest controller to be part of the path.
+    @pecan.expose()
+    @pecan.expose(content_type="application/json")
+    @pecan.expose(content_type="application/openmetrics-text")
+    @pecan.expose(content_type="text/plain")
+    def get_all(self, **kwargs):
+        """Get the histograms, optionally only the one with the given name."""
+
+        export_format = kwargs.get("format", histogram.HISTOGRAM_EXPORT_FORMAT.JSON)
+        name = kwargs.get("name", None)
+        DLOG.verbose(
+            "Histogram-API get called, format=%s, name=%s." % (export_format, name)
+        )
+
+        if export_format not in histogram.HISTOGRAM_EXPORT_FORMAT:
+            DLOG.error("Invalid format received, format=%s." % export_format)
+            return pecan.abort(httplib.BAD_REQUEST)
+
+        rpc_request = rpc.APIRequestGetHistograms()
+        rpc_request.filter_by_name = name
+        vim_connection = pecan.request.vim.open_connection()
+        vim_connection.send(rpc_request.serialize())
+        msg = vim_connection.receive()
+        if msg is None:
+            DLOG.error("No response received for %s." % rpc_request)
+            return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
+
+        response = rpc.RPCMessage.deserialize(msg)
+        if rpc.RPC_MSG_TYPE.GET_HISTOGRAMS_RESPONSE != response.type:
+            DLOG.error("Unexpected message type received, msg_type=%s." % response.type)
+            return pecan.abort(httplib.INTERNAL_SERVER_ERROR)
+
+        histogram_data = response.histograms
+        histogram_data.extend(histogram.get_histogram_data(name))
+        if name is not None and not histogram_data:
+            DLOG.debug("Histogram %s was not found." % name)
+            return pecan.abort(httplib.NOT_FOUND)
+
+        if histogram.HISTOGRAM_EXPORT_FORMAT.OPENMETRICS == export_format:
+            pecan.override_template(None, histogram.OPENMETRICS_CONTENT_TYPE)
+            return histogram.histogram_data_to_openmetrics(histogram_data)
+
+        pecan.override_template(None, "application/json")
+        return histogram.histogram_data_to_json(histogram_data)
@@ -4,12 +4,15 @@
 #
 import http.client as httplib
 import json
+import urllib.parse
+
 import pecan
 from wsme import types as wsme_types
 import wsmeext.pecan as wsme_pecan
 
 from nfv_common import debug
 from nfv_common import validate
+from nfv_vim.api._link import Link
 from nfv_vim import rpc
 
 DLOG = debug.debug_get_logger("nfv_vim.api.virtualised_compute")
@@ -321,6 +324,57 @@ class ComputeQueryData(wsme_types.Base):
     query_result = ComputeQueryResourceType
 
 
+# Fields of a compute that can be selected on a get-all.
+COMPUTE_QUERY_FIELDS = [
+    "name",
+    "host_uuid",
+    "host_name",
+    "admin_state",
+    "oper_state",
+    "avail_status",
+    "instance_type_original_name",
+    "image_uuid",
+    "vcpus",
+    "memory_mb",
+    "sw:wrs:auto_recovery",
+    "hw:wrs:live_migration_timeout",
+    "hw:wrs:live_migration_max_downtime",
+]
+
+# Number of computes the VIM sends in each response of a get-all.
+GET_ALL_BATCH_SIZE = 100
+
+
+def _compute_query_result(response):
+    """Returns the query result for a Get-Instance response."""
+
+    virtual_memory = ComputeQueryVirtualMemoryType()
+    virtual_memory.virtual_mem_size = response.memory_mb
+
+    virtual_cpu = ComputeQueryVirtualCpuType()
+    virtual_cpu.num_virtual_cpu = response.vcpus
+
+    compute_attributes = ComputeQueryAttributesResourceType()
+    compute_attributes.flavour_id = ""
+    compute_attributes.virtual_memory = virtual_memory
+    compute_attributes.virtual_cpu = virtual_cpu
+    compute_attributes.flavour_original_name = response.instance_type_original_name
+
+    query_result = ComputeQueryResourceType()
+    query_result.compute_id = response.uuid
+    query_result.compute_attributes = compute_attributes
+    query_result.host_id = response.host_uuid
+    query_result.vc_image_id = response.image_uuid
+    meta_data = {}
+    meta_data["sw:wrs:auto_recovery"] = response.auto_recovery
+    meta_data["hw:wrs:live_migration_timeout"] = response.live_migration_timeout
+    meta_data["hw:wrs:live_migration_max_downtime"] = (
+        response.live_migration_max_downtime
+    )
+    query_result.meta_data = json.dumps(meta_data)
+    return query_result
+
+
 class ComputesAPI(pecan.rest.RestController):
     """Virtualised Resources - Computes API."""
 
@@ -350,33 +404,7 @@ class ComputesAPI(pecan.rest.RestController):
             return httplib.NOT_FOUND
 
         elif rpc.RPC_MSG_RESULT.SUCCESS == response.result:
-            virtual_memory = ComputeQueryVirtualMemoryType()
-            virtual_memory.virtual_mem_size = response.memory_mb
-
-            virtual_cpu = ComputeQueryVirtualCpuType()
-            virtual_cpu.num_virtual_cpu = response.vcpus
-
-            compute_attributes = ComputeQueryAttributesResourceType()
-            compute_attributes.flavour_id = ""
-            compute_attributes.virtual_memory = virtual_memory
-            compute_attributes.virtual_cpu = virtual_cpu
-            compute_attributes.flavour_original_name = (
-                response.instance_type_original_name
-            )
-
-            query_result = ComputeQueryResourceType()
-            query_result.compute_id = response.uuid
-            query_result.compute_attributes = compute_attributes
-            query_result.host_id = response.host_uuid
-            query_result.vc_image_id = response.image_uuid
-            meta_data = {}
-            meta_data["sw:wrs:auto_recovery"] = response.auto_recovery
-            meta_data["hw:wrs:live_migration_timeout"] = response.live_migration_timeout
-            meta_data["hw:wrs:live_migration_max_downtime"] = (
-                response.live_migration_max_downtime
-            )
-            query_result.meta_data = json.dumps(meta_data)
-            compute.query_result = query_result
+            compute.query_result = _compute_query_result(response)
             return httplib.OK
 
         DLOG.error(
@@ -397,16 +425,47 @@ class ComputesAPI(pecan.rest.RestController):
             return compute
         return pecan.abort(http_response)
 
-    @wsme_pecan.wsexpose([ComputeQueryData], status_code=httplib.OK)
-    def get_all(self):
-        DLOG.verbose("Compute-API get-all called.")
+    @wsme_pecan.wsexpose(
+        [ComputeQueryData], str, str, str, int, str, str, status_code=httplib.OK
+    )
+    def get_all(
+        self, host=None, state=None, tenant=None, limit=None, marker=None, fields=None
+    ):
+        DLOG.verbose(
+            "Compute-API get-all called, host=%s, state=%s, tenant=%s, "
+            "limit=%s, marker=%s, fields=%s."
+            % (host, state, tenant, limit, marker, fields)
+        )
+
+        if limit is not None and 0 >= limit:
+            DLOG.error("Invalid limit received, limit=%s." % limit)
+            return pecan.abort(httplib.BAD_REQUEST)
+
+        if marker is not None and not validate.valid_uuid_str(marker):
+            DLOG.error("Invalid marker received, marker=%s." % marker)
+            return pecan.abort(httplib.BAD_REQUEST)
+
+        if fields is not None:
+            fields = [x.strip() for x in fields.split(",") if x.strip()]
+            unknown_fields = set(fields) - set(COMPUTE_QUERY_FIELDS)
+            if unknown_fields:
+                DLOG.error("Invalid fields received, fields=%s." % unknown_fields)
+                return pecan.abort(httplib.BAD_REQUEST)
 
         vim_connection = pecan.request.vim.open_connection()
         rpc_request = rpc.APIRequestGetInstance()
         rpc_request.get_all = True
+        rpc_request.filter_by_host = host
+        rpc_request.filter_by_state = state
+        rpc_request.filter_by_tenant = tenant
+        rpc_request.limit = limit
+        rpc_request.marker = marker
+        rpc_request.fields = fields
+        rpc_request.batch_size = GET_ALL_BATCH_SIZE
         vim_connection.send(rpc_request.serialize())
 
         computes = []
+        next_marker = None
         while True:
             msg = vim_connection.receive()
             if msg is None:
@@ -414,7 +473,15 @@ class ComputesAPI(pecan.rest.RestController):
                 break
 
             response = rpc.RPCMessage.deserialize(msg)
-            if rpc.RPC_MSG_TYPE.GET_INSTANCE_RESPONSE != response.type:
+            if rpc.RPC_MSG_TYPE.GET_INSTANCES_RESPONSE == response.type:
+                responses = response.get_instances()
+                if response.next_marker is not None:
+                    next_marker = response.next_marker
+
+            elif rpc.RPC_MSG_TYPE.GET_INSTANCE_RESPONSE == response.type:
+                responses = [response]
+
+            else:
                 DLOG.error(
                     "Unexpected message type received, msg_type=%s." % response.type
                 )
@@ -426,38 +493,22 @@ class ComputesAPI(pecan.rest.RestController):
 
             DLOG.verbose("Received response=%s." % response)
 
-            virtual_memory = ComputeQueryVirtualMemoryType()
-            virtual_memory.virtual_mem_size = response.memory_mb
-
-            virtual_cpu = ComputeQueryVirtualCpuType()
-            virtual_cpu.num_virtual_cpu = response.vcpus
-
-            compute_attributes = ComputeQueryAttributesResourceType()
-            compute_attributes.flavour_id = ""
-            compute_attributes.virtual_memory = virtual_memory
-            compute_attributes.virtual_cpu = virtual_cpu
-            compute_attributes.flavour_original_name = (
-                response.instance_type_original_name
-            )
-
-            query_result = ComputeQueryResourceType()
-            query_result.compute_id = response.uuid
-            query_result.compute_attributes = compute_attributes
-            query_result.host_id = response.host_uuid
-            query_result.vc_image_id = response.image_uuid
-            meta_data = {}
-            meta_data["sw:wrs:auto_recovery"] = response.auto_recovery
-            meta_data["hw:wrs:live_migration_timeout"] = response.live_migration_timeout
-            meta_data["hw:wrs:live_migration_max_downtime"] = (
-                response.live_migration_max_downtime
+            for instance_response in responses:
+                compute = ComputeQueryData()
+                compute.query_result = _compute_query_result(instance_response)
+                computes.append(compute)
+
+        if next_marker is not None:
+            # More computes than the limit, link to the next page.
+            query = [(k, v) for k, v in pecan.request.GET.items() if "marker" != k]
+            query.append(("marker", next_marker))
+            link = Link.make_link(
+                "next",
+                pecan.request.host_url,
+                pecan.request.path.lstrip("/"),
+                "?" + urllib.parse.urlencode(query),
             )
-            query_result.meta_data = json.dumps(meta_data)
-
-            compute = ComputeQueryData()
-            compute.query_result = query_result
-
-            computes.append(compute)
-
+            pecan.response.headers["Link"] = '<%s>; rel="%s"' % (link.href, link.rel)
         return computes
 
     @wsme_pecan.wsexpose(
@@ -0,0 +1,214 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import timers
+
+DLOG = debug.debug_get_logger("nfv_vim.audit_rate_controller")
+
+
+class AuditRateController:
+    """Audit Rate Controller.
+
+    Controls how many audit requests may be outstanding at a time using
+    additive increase, multiplicative decrease: the concurrency grows by
+    one for every concurrency's worth of requests that complete within the
+    target latency, and is halved when a request fails, is found overdue or
+    the smoothed latency goes above the target.  A token bucket additionally
+    limits how many requests are started per second.
+    """
+
+    # Weight given to a new latency sample in the smoothed latency.
+    _LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        name,
+        initial_concurrent=4,
+        min_concurrent=1,
+        max_concurrent=32,
+        target_latency_ms=2000,
+        max_requests_per_sec=10,
+    ):
+        """Create an audit rate controller."""
+
+        self._name = name
+        self._min_concurrent = max(1, min_concurrent)
+        self._max_concurrent = max(self._min_concurrent, max_concurrent)
+        self._concurrent = min(
+            max(initial_concurrent, self._min_concurrent), self._max_concurrent
+        )
+        self._acks = 0
+        self._target_latency_ms = target_latency_ms
+        self._max_requests_per_sec = max_requests_per_sec
+        self._tokens = float(self._max_concurrent)
+        self._last_refill_ms = timers.get_monotonic_timestamp_in_ms()
+        self._last_backoff_ms = None
+        self._latency_ms = None
+        self._start_ms = dict()
+        self._overdue = set()
+        self._successes = 0
+        self._failures = 0
+
+    @property
+    def concurrency(self):
+        """Returns the number of requests allowed to be outstanding."""
+
+        return self._concurrent
+
+    @property
+    def latency_ms(self):
+        """Returns the smoothed request latency, None if not known yet."""
+
+        return self._latency_ms
+
+    def _refill(self, now_ms):
+        """Refill the token bucket."""
+
+        elapsed_ms = now_ms - self._last_refill_ms
+        self._last_refill_ms = now_ms
+        self._tokens = min(
+            float(self._max_concurrent),
+            self._tokens + elapsed_ms * self._max_requests_per_sec / 1000.0,
+        )
+
+    def can_start(self):
+        """Returns true if another request can be started."""
+
+        if len(self._start_ms) >= self.concurrency:
+            return False
+
+        self._refill(timers.get_monotonic_timestamp_in_ms())
+        return 1.0 <= self._tokens
+
+    def request_started(self, key):
+        """Notification that a request has been started."""
+
+        self._tokens -= 1.0
+        self._start_ms[key] = timers.get_monotonic_timestamp_in_ms()
+
+    def request_abandoned(self, key):
+        """Notification that a request will not complete, for example
+
+        because the resource being audited has been deleted.
+        """
+        self._start_ms.pop(key, None)
+        self._overdue.discard(key)
+
+    def request_complete(self, key, success):
+        """Notification that a request has completed, adjusts the
+
+        concurrency based on the outcome and latency of the request.
+        """
+        start_ms = self._start_ms.pop(key, None)
+        if start_ms is None:
+            return
+
+        self._overdue.discard(key)
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        latency_ms = now_ms - start_ms
+        histogram.add_histogram_data(
+            self._name + " [latency]", latency_ms // 100, "decisecond"
+        )
+
+        if self._latency_ms is None:
+            self._latency_ms = float(latency_ms)
+        else:
+            self._latency_ms += self._LATENCY_SMOOTHING * (
+                latency_ms - self._latency_ms
+            )
+
+        if success and self._latency_ms <= self._target_latency_ms:
+            self._successes += 1
+            self._acks += 1
+            if self._acks >= self._concurrent:
+                self._acks = 0
+                self._concurrent = min(self._max_concurrent, self._concurrent + 1)
+        else:
+            if not success:
+                self._failures += 1
+            self._backoff(now_ms)
+
+        histogram.add_histogram_data(
+            self._name + " [concurrency]", self.concurrency, "requests"
+        )
+
+    def _backoff(self, now_ms):
+        """Halve the concurrency, at most once per smoothed latency so that
+
+        the requests that were outstanding together only count once.
+        """
+        if self._last_backoff_ms is not None:
+            if now_ms - self._last_backoff_ms < (self._latency_ms or 0):
+                return
+
+        self._last_backoff_ms = now_ms
+        self._acks = 0
+        self._concurrent = max(self._min_concurrent, self._concurrent // 2)
+        DLOG.info(
+            "%s backing off, concurrency=%s, latency_ms=%s."
+            % (
+                self._name,
+                self.concurrency,
+                None if self._latency_ms is None else int(self._latency_ms),
+            )
+        )
+
+    def overdue(self, age_ms):
+        """Returns the keys of the requests outstanding for at least the
+
+        given milliseconds, backing off if a request has newly timed out.
+        """
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        overdue = [
+            key
+            for key, start_ms in self._start_ms.items()
+            if now_ms - start_ms >= age_ms
+        ]
+
+        # A request only counts as timed out once however long it stays
+        # outstanding.
+        timed_out = set(overdue) - self._overdue
+        if timed_out:
+            self._overdue.update(timed_out)
+            self._backoff(now_ms)
+        return overdue
+
+    def drain_time_secs(self, backlog):
+        """Returns the estimated seconds to audit the given backlog, None
+
+        if not known yet.
+        """
+        if self._latency_ms is None:
+            return None
+
+        # Requests complete at the concurrency over the latency, unless the
+        # token bucket starts them at a lower rate.
+        requests_per_sec = float(self._max_requests_per_sec)
+        if 0 < self._latency_ms:
+            requests_per_sec = min(
+                self.concurrency * 1000.0 / self._latency_ms, requests_per_sec
+            )
+        return int(backlog / requests_per_sec)
+
+    def dump(self, backlog):
+        """Log the state of the rate controller."""
+
+        DLOG.info(
+            "%s: backlog=%s, outstanding=%s, concurrency=%s, latency_ms=%s, "
+            "drain_time_secs=%s, successes=%s, failures=%s."
+            % (
+                self._name,
+                backlog,
+                len(self._start_ms),
+                self.concurrency,
+                None if self._latency_ms is None else int(self._latency_ms),
+                self.drain_time_secs(backlog),
+                self._successes,
+                self._failures,
+            )
+        )
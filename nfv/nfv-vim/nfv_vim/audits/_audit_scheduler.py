@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import collections
+
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_common import timers
+
+DLOG = debug.debug_get_logger("nfv_vim.audit_scheduler")
+
+
+class Audit:
+    """Audit."""
+
+    def __init__(self, name, audit_start, depends_on, enabled, interval_secs):
+        """Create an audit."""
+
+        self.name = name
+        self.audit_start = audit_start
+        self.depends_on = depends_on
+        self.enabled = enabled
+        self.interval_ms = interval_secs * 1000
+        self.start_ms = None
+        self.last_complete_ms = None
+
+
+class AuditScheduler:
+    """Audit Scheduler.
+
+    Runs cycles of audits, starting each audit of a cycle once the audits it
+    depends on have completed, with at most max_concurrent audits in
+    progress at a time.  An audit whose interval has not expired since it
+    last completed, or that is not enabled when it is ready to start, is
+    skipped for the cycle.
+    """
+
+    def __init__(self, name, max_concurrent=1):
+        """Create an audit scheduler."""
+
+        self._name = name
+        self._max_concurrent = max(1, max_concurrent)
+        self._audits = collections.OrderedDict()
+        self._pending = list()
+        self._inprogress = set()
+        self._done = set()
+        self._cycle_start_ms = None
+        self._scheduling = False
+
+    @property
+    def cycle_inprogress(self):
+        """Returns true if an audit cycle is in progress."""
+
+        return self._cycle_start_ms is not None
+
+    def add_audit(
+        self, name, audit_start, depends_on=None, enabled=None, interval_secs=0
+    ):
+        """Add an audit, audit_start is called to start the audit, which
+
+        must call audit_complete once it has completed.
+        """
+        if depends_on is None:
+            depends_on = list()
+
+        if enabled is None:
+            enabled = lambda: True  # noqa: E731
+
+        self._audits[name] = Audit(
+            name, audit_start, depends_on, enabled, interval_secs
+        )
+
+    def staleness_secs(self, name):
+        """Returns the seconds since an audit last completed, None if the
+
+        audit has not completed yet.
+        """
+        audit = self._audits[name]
+        if audit.last_complete_ms is None:
+            return None
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        return (now_ms - audit.last_complete_ms) // 1000
+
+    def start_cycle(self):
+        """Start a cycle of audits."""
+
+        if self.cycle_inprogress:
+            DLOG.verbose("%s audit cycle already in progress." % self._name)
+            return
+
+        self._cycle_start_ms = timers.get_monotonic_timestamp_in_ms()
+        self._pending = list(self._audits)
+        self._done.clear()
+        self.schedule()
+
+    def audit_complete(self, name):
+        """Notification that an audit has completed."""
+
+        audit = self._audits[name]
+        if name not in self._inprogress:
+            DLOG.info(
+                "%s audit %s completed, but not in progress." % (self._name, name)
+            )
+            return
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+        self._inprogress.discard(name)
+        self._done.add(name)
+        audit.last_complete_ms = now_ms
+
+        histogram.add_histogram_data(
+            "%s %s [duration]" % (self._name, name),
+            (now_ms - audit.start_ms) // 100,
+            "decisecond",
+        )
+        self.schedule()
+
+    def _ready(self, audit):
+        """Returns true if the audits an audit depends on are done."""
+
+        for name in audit.depends_on:
+            if name in self._audits and name not in self._done:
+                return False
+        return True
+
+    def _start_audit(self, audit):
+        """Start an audit, returns false if the audit was skipped."""
+
+        now_ms = timers.get_monotonic_timestamp_in_ms()
+
+        if audit.last_complete_ms is not None:
+            if now_ms - audit.last_complete_ms < audit.interval_ms:
+                return False
+
+        if not audit.enabled():
+            return False
+
+        if audit.last_complete_ms is not None:
+            histogram.add_histogram_data(
+                "%s %s [staleness]" % (self._name, audit.name),
+                (now_ms - audit.last_complete_ms) // 1000,
+                "secs",
+            )
+
+        DLOG.verbose("%s audit %s started." % (self._name, audit.name))
+        audit.start_ms = now_ms
+        self._inprogress.add(audit.name)
+        audit.audit_start()
+        return True
+
+    def schedule(self):
+        """Start the pending audits that are ready to run."""
+
+        if self._scheduling or not self.cycle_inprogress:
+            return
+
+        self._scheduling = True
+        try:
+            progress = True
+            while progress:
+                progress = False
+                for name in list(self._pending):
+                    if self._max_concurrent <= len(self._inprogress):
+                        break
+
+                    audit = self._audits[name]
+                    if not self._ready(audit):
+                        continue
+
+                    self._pending.remove(name)
+                    if not self._start_audit(audit):
+                        self._done.add(name)
+                    progress = True
+        finally:
+            self._scheduling = False
+
+        if not self._pending and not self._inprogress:
+            now_ms = timers.get_monotonic_timestamp_in_ms()
+            histogram.add_histogram_data(
+                "%s [cycle-duration]" % self._name,
+                (now_ms - self._cycle_start_ms) // 1000,
+                "secs",
+            )
+            self._cycle_start_ms = None
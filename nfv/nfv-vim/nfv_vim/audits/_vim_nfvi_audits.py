@@ -4,11 +4,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import collections
+import datetime
 
+from nfv_common import config
 from nfv_common import debug
 from nfv_common.helpers import coroutine
 from nfv_common import histogram
 from nfv_common import timers
+from nfv_vim.audits._audit_rate_controller import AuditRateController
+from nfv_vim.audits._audit_scheduler import AuditScheduler
 from nfv_vim.database._database_sw_update import database_sw_update_exists
 from nfv_vim import directors
 from nfv_vim import nfvi
@@ -17,7 +21,7 @@ from nfv_vim import tables
 
 DLOG = debug.debug_get_logger("nfv_vim.vim_nfvi_audits")
 
-_main_audit_inprogress = False
+_audit_scheduler = None
 
 _nfvi_hypervisors_to_audit = collections.OrderedDict()
 
@@ -31,8 +35,13 @@ _nfvi_instance_types_outstanding = collections.OrderedDict()
 
 _deletable_instances = None
 _nfvi_instances_paging = nfvi.objects.v1.Paging(page_limit=32)
+_nfvi_instances_full_audit_listings = 1
+_nfvi_instances_listings = 0
+_nfvi_instances_listing_start_time = None
+_nfvi_instances_changes_since = None
 _nfvi_instances_to_audit = collections.OrderedDict()
 _nfvi_instance_outstanding = collections.OrderedDict()
+_nfvi_instance_rate_controller = AuditRateController("audit-nfvi-instance")
 
 _deletable_images = None
 _nfvi_images_paging = nfvi.objects.v1.Paging(page_limit=32)
@@ -42,6 +51,7 @@ _deletable_volumes = None
 _nfvi_volumes_paging = nfvi.objects.v1.Paging(page_limit=32)
 _nfvi_volumes_to_audit = collections.OrderedDict()
 _nfvi_volumes_outstanding = collections.OrderedDict()
+_nfvi_volume_rate_controller = AuditRateController("audit-nfvi-volume")
 
 _deletable_subnets = None
 _nfvi_subnets_paging = nfvi.objects.v1.Paging(page_limit=32)
@@ -54,6 +64,9 @@ _last_audit_debug_dump_ms = 0
 _last_audit_time_ms = 0
 AUDIT_DELAY_MS = 60000  # 60000 ms = 60 seconds
 AUDIT_DELAY_SECONDS = 60  # 60 seconds
+# Allowance for clock differences with the NFVI when listing the instances
+# that changed since the last listing.
+INSTANCES_CHANGES_SINCE_MARGIN_SECS = 60
 
 
 def _audit_dump_debug_info(do_dump=True):
@@ -66,6 +79,8 @@ def _audit_dump_debug_info(do_dump=True):
     if do_dump:
         if 30000 + _audit_debug_dump_back_off_ms <= elapsed_ms:
             histogram.display_histogram_data(pretty_format=False)
+            _nfvi_instance_rate_controller.dump(len(_nfvi_instances_to_audit))
+            _nfvi_volume_rate_controller.dump(len(_nfvi_volumes_to_audit))
             _last_audit_debug_dump_ms = timers.get_monotonic_timestamp_in_ms()
             _audit_debug_dump_back_off_ms += 20000
             if 600000 < _audit_debug_dump_back_off_ms:
@@ -77,11 +92,9 @@ def _audit_dump_debug_info(do_dump=True):
 
 
 @coroutine
-def _audit_nfvi_system_info_callback(timer_id):
+def _audit_nfvi_system_info_callback():
     """Audit System Information."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-System callback, responses=%s." % response)
 
@@ -105,16 +118,13 @@ def _audit_nfvi_system_info_callback(timer_id):
     else:
         DLOG.error("Audit-System callback, not completed, responses=%s." % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("system-info")
 
 
 @coroutine
-def _audit_nfvi_hosts_callback(timer_id):
+def _audit_nfvi_hosts_callback():
     """Audit Hosts."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-Hosts callback, responses=%s." % response)
 
@@ -187,16 +197,13 @@ def _audit_nfvi_hosts_callback(timer_id):
     else:
         DLOG.error("Audit-Hosts callback, not completed, responses=%s." % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("hosts")
 
 
 @coroutine
-def _audit_nfvi_host_aggregates_callback(timer_id):
+def _audit_nfvi_host_aggregates_callback():
     """Audit Host Aggregates."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-Host Aggregates callback, responses=%s." % response)
 
@@ -223,15 +230,13 @@ def _audit_nfvi_host_aggregates_callback(timer_id):
             "Audit-Host Aggregates callback, not completed, responses=%s." % response
         )
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("host-aggregates")
 
 
 @coroutine
-def _audit_nfvi_hypervisors_callback(timer_id):
+def _audit_nfvi_hypervisors_callback():
     """Audit Hypervisors."""
 
-    global _main_audit_inprogress
     global _nfvi_hypervisors_to_audit
 
     response = yield
@@ -274,8 +279,7 @@ def _audit_nfvi_hypervisors_callback(timer_id):
             "Audit-Hypervisors callback, not completed, responses=%s." % response
         )
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("hypervisors")
 
     if trigger_recovery:
         # Hypervisor is now available, there is potential to recover instances.
@@ -285,11 +289,9 @@ def _audit_nfvi_hypervisors_callback(timer_id):
 
 
 @coroutine
-def _audit_nfvi_tenants_callback(timer_id):
+def _audit_nfvi_tenants_callback():
     """Audit Tenants."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-Tenants callback, responses=%s." % response)
 
@@ -319,15 +321,13 @@ def _audit_nfvi_tenants_callback(timer_id):
     else:
         DLOG.error("Audit-Tenants callback, not completed, responses=%s." % response)
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("tenants")
 
 
 @coroutine
-def _audit_nfvi_instance_types_callback(timer_id):
+def _audit_nfvi_instance_types_callback():
     """Audit Instance Types."""
 
-    global _main_audit_inprogress
     global _deletable_instance_types, _nfvi_instance_types_paging
     global _nfvi_instance_types_to_audit, _nfvi_instance_types_outstanding
 
@@ -398,17 +398,40 @@ def _audit_nfvi_instance_types_callback(timer_id):
         _nfvi_instance_types_paging.first_page()
 
     _nfvi_instance_types_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("instance-types")
+
+
+def _audit_nfvi_instance_deleted(instance_uuid):
+    """Handle an instance no longer known to the NFVI, returns true if the
+
+    instance has been deleted.
+    """
+    instance_table = tables.tables_get_instance_table()
+    instance = instance_table.get(instance_uuid, None)
+    if instance is None:
+        return False
+
+    DLOG.info("Deleting instance %s, audit mismatch" % instance_uuid)
+
+    instance.nfvi_instance_deleted()
+    if not instance.is_deleted():
+        return False
+
+    del instance_table[instance_uuid]
+    if instance_uuid in _nfvi_instances_to_audit:
+        del _nfvi_instances_to_audit[instance_uuid]
+    if instance_uuid in _nfvi_instance_outstanding:
+        del _nfvi_instance_outstanding[instance_uuid]
+        _nfvi_instance_rate_controller.request_abandoned(instance_uuid)
+    return True
 
 
 @coroutine
-def _audit_nfvi_instances_callback(timer_id):
+def _audit_nfvi_instances_callback():
     """Audit Instances."""
 
-    global _main_audit_inprogress
-    global _deletable_instances, _nfvi_instances_paging
-    global _nfvi_instances_to_audit, _nfvi_instance_outstanding
+    global _nfvi_instances_listings
+    global _nfvi_instances_changes_since
 
     response = yield
     DLOG.verbose("Audit-Instances callback, response=%s." % response)
@@ -416,37 +439,29 @@ def _audit_nfvi_instances_callback(timer_id):
     trigger_recovery = False
     if response["completed"]:
         if response["page-request-id"] == _nfvi_instances_paging.page_request_id:
-            instance_table = tables.tables_get_instance_table()
-
-            if _deletable_instances is None:
-                _deletable_instances = list(instance_table)
-
             for instance_uuid, instance_name in response["result-data"]:
-                instance = instance_table.get(instance_uuid, None)
-                if instance is not None:
-                    if instance.uuid in _deletable_instances:
-                        _deletable_instances.remove(instance.uuid)
+                if _deletable_instances is not None:
+                    _deletable_instances.discard(instance_uuid)
                 if instance_uuid not in _nfvi_instances_to_audit:
                     _nfvi_instances_to_audit[instance_uuid] = instance_name
 
-            if _nfvi_instances_paging.done:
-                for instance_uuid in _deletable_instances:
-                    instance = instance_table.get(instance_uuid, None)
-                    if instance is not None:
-                        DLOG.info(
-                            "Deleting instance %s, audit mismatch" % instance_uuid
-                        )
+            # Instances listed as deleted since the last listing.
+            for instance_uuid in response.get("deleted-instances", list()):
+                if _audit_nfvi_instance_deleted(instance_uuid):
+                    trigger_recovery = True
 
-                        instance.nfvi_instance_deleted()
-                        if instance.is_deleted():
+            if _nfvi_instances_paging.done:
+                # Instances missing from a full listing have been deleted.
+                if _deletable_instances is not None:
+                    for instance_uuid in _deletable_instances:
+                        if _audit_nfvi_instance_deleted(instance_uuid):
                             trigger_recovery = True
-                            del instance_table[instance_uuid]
-                            if instance_uuid in _nfvi_instances_to_audit:
-                                del _nfvi_instances_to_audit[instance_uuid]
-                            if instance_uuid in _nfvi_instance_outstanding:
-                                del _nfvi_instance_outstanding[instance_uuid]
 
-                _deletable_instances = list(instance_table)
+                _nfvi_instances_listings += 1
+                _nfvi_instances_changes_since = (
+                    _nfvi_instances_listing_start_time
+                    - datetime.timedelta(seconds=INSTANCES_CHANGES_SINCE_MARGIN_SECS)
+                )
                 _nfvi_instances_paging.first_page()
             else:
                 DLOG.verbose("Paging is not done for instances.")
@@ -456,18 +471,13 @@ def _audit_nfvi_instances_callback(timer_id):
                 "responses=%s, page-request-id=%s."
                 % (response, _nfvi_instances_paging.page_request_id)
             )
-            instance_table = tables.tables_get_instance_table()
-            _deletable_instances = list(instance_table)
             _nfvi_instances_paging.first_page()
     else:
         DLOG.error("Audit-Instances callback, not completed, responses=%s." % response)
-        instance_table = tables.tables_get_instance_table()
-        _deletable_instances = list(instance_table)
         _nfvi_instances_paging.first_page()
 
     _nfvi_instances_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("instances")
 
     if trigger_recovery:
         # Resources have been freed, there is potential to recover instances.
@@ -477,11 +487,9 @@ def _audit_nfvi_instances_callback(timer_id):
 
 
 @coroutine
-def _audit_nfvi_instance_groups_callback(timer_id):
+def _audit_nfvi_instance_groups_callback():
     """Audit Instance Groups."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-Instance-Groups callback, response=%s." % response)
 
@@ -511,15 +519,13 @@ def _audit_nfvi_instance_groups_callback(timer_id):
             "Audit-Instance-Groups callback, not completed, responses=%s." % response
         )
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("instance-groups")
 
 
 @coroutine
-def _audit_nfvi_images_callback(timer_id):
+def _audit_nfvi_images_callback():
     """Audit Images."""
 
-    global _main_audit_inprogress
     global _deletable_images, _nfvi_images_paging
 
     response = yield
@@ -568,17 +574,14 @@ def _audit_nfvi_images_callback(timer_id):
         _nfvi_images_paging.first_page()
 
     _nfvi_images_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("images")
 
 
 @coroutine
-def _audit_nfvi_volumes_callback(timer_id):
+def _audit_nfvi_volumes_callback():
     """Audit Volumes."""
 
-    global _main_audit_inprogress
     global _added_volumes, _deletable_volumes, _nfvi_volumes_paging
-    global _nfvi_volumes_to_audit, _nfvi_volumes_outstanding
 
     response = yield
     DLOG.verbose("Audit-Volumes callback, response=%s." % response)
@@ -648,16 +651,13 @@ def _audit_nfvi_volumes_callback(timer_id):
         _nfvi_volumes_paging.first_page()
 
     _nfvi_volumes_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("volumes")
 
 
 @coroutine
-def _audit_nfvi_volume_snapshots_callback(timer_id):
+def _audit_nfvi_volume_snapshots_callback():
     """Audit Volume Snapshots."""
 
-    global _main_audit_inprogress
-
     response = yield
     DLOG.verbose("Audit-Volume-Snapshots callback, response=%s." % response)
 
@@ -685,15 +685,13 @@ def _audit_nfvi_volume_snapshots_callback(timer_id):
             "Audit-Volume-Snapshots callback, not completed, responses=%s." % response
         )
 
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("volume-snapshots")
 
 
 @coroutine
-def _audit_nfvi_subnets_callback(timer_id):
+def _audit_nfvi_subnets_callback():
     """Audit Subnets."""
 
-    global _main_audit_inprogress
     global _deletable_subnets, _nfvi_subnets_paging
 
     response = yield
@@ -747,15 +745,13 @@ def _audit_nfvi_subnets_callback(timer_id):
         _nfvi_subnets_paging.first_page()
 
     _nfvi_subnets_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 2)  # 2 seconds later
+    _audit_scheduler.audit_complete("subnets")
 
 
 @coroutine
-def _audit_nfvi_networks_callback(timer_id):
+def _audit_nfvi_networks_callback():
     """Audit Networks."""
 
-    global _main_audit_inprogress
     global _deletable_networks, _nfvi_networks_paging
 
     response = yield
@@ -815,15 +811,158 @@ def _audit_nfvi_networks_callback(timer_id):
         _nfvi_networks_paging.first_page()
 
     _nfvi_networks_paging.set_page_request_id()
-    _main_audit_inprogress = False
-    timers.timers_reschedule_timer(timer_id, 20)  # 20 seconds later
+    _audit_scheduler.audit_complete("networks")
+
+
+def _audit_nfvi_system_info():
+    """Audit system information."""
+
+    DLOG.verbose("Audit system information called.")
+    nfvi.nfvi_get_system_info(_audit_nfvi_system_info_callback())
+
+
+def _audit_nfvi_hosts():
+    """Audit hosts."""
+
+    DLOG.verbose("Audit hosts called.")
+    nfvi.nfvi_get_hosts(_audit_nfvi_hosts_callback())
+
+
+def _audit_nfvi_host_aggregates():
+    """Audit host aggregates."""
+
+    DLOG.verbose("Audit host aggregates called.")
+    nfvi.nfvi_get_host_aggregates(_audit_nfvi_host_aggregates_callback())
+
+
+def _audit_nfvi_hypervisors():
+    """Audit hypervisors."""
+
+    DLOG.verbose("Audit hypervisors called.")
+    nfvi.nfvi_get_hypervisors(_audit_nfvi_hypervisors_callback())
+
+
+def _audit_nfvi_tenants_enabled():
+    """Returns true if tenants are to be audited."""
+
+    # This is to avoid making frequent /project requests against the platform's
+    # keystone. This audit is relevant when stx-openstack is installed because it
+    # uses projects to isolate virtualized resources.
+    # The solution implemented here is a very simple one. It uses information
+    # already stored in tables_get_host_table() to determine if openstack is
+    # installed or not. It does not follow this repository's standard of defining
+    # flags in configuration files via puppet.
+    # A better alternative is to make use of a config file flag, generated with
+    # puppet, as per conventions here. [1] defines a list of flags to indicate
+    # which plugin is disabled
+    # Add a new item like nfvi_identity_plugin_disabled to mark that
+    # the keystone identity
+    # plugin should be disabled and use here in vim like [2].
+    # [1] https://opendev.org/starlingx/config/src/commit/
+    # 7f3ae1c40df99274c61e4691803662ad04198620/sysinv/sysinv/sysinv/sysinv/
+    # puppet/nfv.py#L295
+    # [2] https://opendev.org/starlingx/nfv/src/commit/
+    # d3ed569df7989e405df17ee67f62574575f196ca/nfv/nfv-vim/nfv_vim/
+    # audits/_vim_nfvi_audits.py#L867
+    return any(
+        host.openstack_control for host in tables.tables_get_host_table().values()
+    )
+
+
+def _audit_nfvi_tenants():
+    """Audit tenants."""
+
+    DLOG.verbose("Audit tenants called.")
+    nfvi.nfvi_get_tenants(_audit_nfvi_tenants_callback())
+
+
+def _audit_nfvi_instance_types():
+    """Audit instance types."""
+
+    DLOG.verbose("Audit instance types called.")
+    nfvi.nfvi_get_instance_types(
+        _nfvi_instance_types_paging, _audit_nfvi_instance_types_callback()
+    )
+
+
+def _audit_nfvi_instances():
+    """Audit instances."""
+
+    global _deletable_instances, _nfvi_instances_listing_start_time
+
+    if _nfvi_instances_paging.next_page is None:
+        # Start of a listing, every so many listings all instances are listed
+        # to find the deleted instances, otherwise only the instances that
+        # changed since the last listing are listed.
+        _nfvi_instances_listing_start_time = datetime.datetime.now(
+            datetime.timezone.utc
+        )
+        if (
+            _nfvi_instances_changes_since is None
+            or 0 == _nfvi_instances_listings % _nfvi_instances_full_audit_listings
+        ):
+            _deletable_instances = set(tables.tables_get_instance_table())
+            _nfvi_instances_paging.changes_since = None
+        else:
+            _deletable_instances = None
+            _nfvi_instances_paging.changes_since = (
+                _nfvi_instances_changes_since.strftime("%Y-%m-%dT%H:%M:%SZ")
+            )
+
+    DLOG.info(
+        "Audit instances called, changes_since=%s."
+        % _nfvi_instances_paging.changes_since
+    )
+    nfvi.nfvi_get_instances(_nfvi_instances_paging, _audit_nfvi_instances_callback())
+
+
+def _audit_nfvi_instance_groups():
+    """Audit instance groups."""
+
+    DLOG.verbose("Audit instance groups called.")
+    nfvi.nfvi_get_instance_groups(_audit_nfvi_instance_groups_callback())
+
+
+def _audit_nfvi_images():
+    """Audit images."""
+
+    DLOG.verbose("Audit images called.")
+    nfvi.nfvi_get_images(_nfvi_images_paging, _audit_nfvi_images_callback())
+
+
+def _audit_nfvi_volumes():
+    """Audit volumes."""
+
+    DLOG.verbose("Audit volumes called.")
+    nfvi.nfvi_get_volumes(_nfvi_volumes_paging, _audit_nfvi_volumes_callback())
+
+
+def _audit_nfvi_volume_snapshots():
+    """Audit volume snapshots."""
+
+    DLOG.verbose("Audit volume snapshots called.")
+    nfvi.nfvi_get_volume_snapshots(_audit_nfvi_volume_snapshots_callback())
+
+
+def _audit_nfvi_subnets():
+    """Audit subnets."""
+
+    DLOG.verbose("Audit subnets called.")
+    nfvi.nfvi_get_subnets(_nfvi_subnets_paging, _audit_nfvi_subnets_callback())
+
+
+def _audit_nfvi_networks():
+    """Audit networks."""
+
+    DLOG.verbose("Audit networks called.")
+    nfvi.nfvi_get_networks(_nfvi_networks_paging, _audit_nfvi_networks_callback())
 
 
 @timers.interval_timer("audit_nfvi", initial_delay_secs=1, interval_secs=1)
 def _audit_nfvi():
     """Audit NFVI."""
 
-    global _main_audit_inprogress, _last_audit_time_ms
+    global _last_audit_time_ms
 
     # Initialize the last audit time to the current time
     _last_audit_time_ms = timers.get_monotonic_timestamp_in_ms()
@@ -851,145 +990,15 @@ def _audit_nfvi():
                     f"audit after {AUDIT_DELAY_SECONDS} seconds."
                 )
 
-        DLOG.verbose("Audit system information called, timer_id=%s." % timer_id)
-        nfvi.nfvi_get_system_info(_audit_nfvi_system_info_callback(timer_id))
-
-        _main_audit_inprogress = True
-        while _main_audit_inprogress:
-            timer_id = yield
-
-        DLOG.verbose("Audit hosts called, timer_id=%s." % timer_id)
-        nfvi.nfvi_get_hosts(_audit_nfvi_hosts_callback(timer_id))
+        DLOG.verbose("Audit cycle started, timer_id=%s." % timer_id)
+        _audit_scheduler.start_cycle()
 
-        _main_audit_inprogress = True
-        while _main_audit_inprogress:
+        while _audit_scheduler.cycle_inprogress:
             timer_id = yield
 
-        if not nfvi.nfvi_compute_plugin_disabled():
-            DLOG.verbose("Audit host aggregates called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_host_aggregates(
-                _audit_nfvi_host_aggregates_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-            DLOG.verbose("Audit hypervisors called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_hypervisors(_audit_nfvi_hypervisors_callback(timer_id))
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-        # This is to avoid making frequent /project requests against the platform's
-        # keystone. This audit is relevant when stx-openstack is installed because it
-        # uses projects to isolate virtualized resources.
-        # The solution implemented here is a very simple one. It uses information
-        # already stored in tables_get_host_table() to determine if openstack is
-        # installed or not. It does not follow this repository's standard of defining
-        # flags in configuration files via puppet.
-        # A better alternative is to make use of a config file flag, generated with
-        # puppet, as per conventions here. [1] defines a list of flags to indicate
-        # which plugin is disabled
-        # Add a new item like nfvi_identity_plugin_disabled to mark that
-        # the keystone identity
-        # plugin should be disabled and use here in vim like [2].
-        # [1] https://opendev.org/starlingx/config/src/commit/
-        # 7f3ae1c40df99274c61e4691803662ad04198620/sysinv/sysinv/sysinv/sysinv/
-        # puppet/nfv.py#L295
-        # [2] https://opendev.org/starlingx/nfv/src/commit/
-        # d3ed569df7989e405df17ee67f62574575f196ca/nfv/nfv-vim/nfv_vim/
-        # audits/_vim_nfvi_audits.py#L867
-        if any(
-            host.openstack_control for host in tables.tables_get_host_table().values()
-        ):
-            DLOG.verbose("Audit tenants called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_tenants(_audit_nfvi_tenants_callback(timer_id))
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-        if not nfvi.nfvi_compute_plugin_disabled():
-            DLOG.verbose("Audit instance types called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_instance_types(
-                _nfvi_instance_types_paging,
-                _audit_nfvi_instance_types_callback(timer_id),
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-            DLOG.info("Audit instances called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_instances(
-                _nfvi_instances_paging, _audit_nfvi_instances_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-            DLOG.verbose("Audit instance groups called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_instance_groups(
-                _audit_nfvi_instance_groups_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-        if not nfvi.nfvi_image_plugin_disabled():
-            DLOG.verbose("Audit images called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_images(
-                _nfvi_images_paging, _audit_nfvi_images_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-        if not nfvi.nfvi_block_storage_plugin_disabled():
-            DLOG.verbose("Audit volumes called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_volumes(
-                _nfvi_volumes_paging, _audit_nfvi_volumes_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-            DLOG.verbose("Audit volume snapshots called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_volume_snapshots(
-                _audit_nfvi_volume_snapshots_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-        if not nfvi.nfvi_network_plugin_disabled():
-            DLOG.verbose("Audit subnets called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_subnets(
-                _nfvi_subnets_paging, _audit_nfvi_subnets_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
-            DLOG.verbose("Audit networks called, timer_id=%s." % timer_id)
-            nfvi.nfvi_get_networks(
-                _nfvi_networks_paging, _audit_nfvi_networks_callback(timer_id)
-            )
-
-            _main_audit_inprogress = True
-            while _main_audit_inprogress:
-                timer_id = yield
-
         # Reset the last audit time
         _last_audit_time_ms = timers.get_monotonic_timestamp_in_ms()
+        timers.timers_reschedule_timer(timer_id, 20)  # 20 seconds later
 
 
 @coroutine
@@ -1003,6 +1012,10 @@ def _audit_nfvi_instance_callback(instance_uuid):
     if instance_uuid in _nfvi_instance_outstanding:
         del _nfvi_instance_outstanding[instance_uuid]
 
+    _nfvi_instance_rate_controller.request_complete(
+        instance_uuid, response["completed"]
+    )
+
     if response["completed"]:
         nfvi_instance = response["result-data"]
 
@@ -1028,13 +1041,45 @@ def _audit_nfvi_instance_callback(instance_uuid):
     else:
         DLOG.error("Audit-Instance callback, not completed, response=%s." % response)
 
+    _audit_nfvi_instance_start()
+
+
+def _audit_nfvi_instance_start():
+    """Start auditing the queued instances, as many as the rate controller
+
+    allows.
+    """
+    instance_table = tables.tables_get_instance_table()
+    for instance_uuid in list(_nfvi_instances_to_audit.keys()):
+        if not _nfvi_instance_rate_controller.can_start():
+            break
+
+        do_audit = True
+        instance = instance_table.get(instance_uuid, None)
+        if instance is not None:
+            if instance.nfvi_instance_is_deleted():
+                do_audit = False
+            else:
+                # Indicate that audit is in progress
+                instance.nfvi_instance_audit_in_progress = True
+
+        if do_audit:
+            DLOG.info("Auditing instance %s." % instance_uuid)
+            _nfvi_instance_rate_controller.request_started(instance_uuid)
+            nfvi.nfvi_get_instance(
+                instance_uuid, _audit_nfvi_instance_callback(instance_uuid)
+            )
+            _nfvi_instance_outstanding[instance_uuid] = _nfvi_instances_to_audit[
+                instance_uuid
+            ]
+
+        del _nfvi_instances_to_audit[instance_uuid]
+
 
 @timers.interval_timer("audit_nfvi_instance", initial_delay_secs=10, interval_secs=10)
 def _audit_nfvi_instance():
     """Audit NFVI for Instance Details."""
 
-    global _nfvi_instances_to_audit, _nfvi_instance_outstanding
-
     while True:
         timer_id = yield
         DLOG.verbose("Audit instance called, timer_id=%s." % timer_id)
@@ -1044,39 +1089,21 @@ def _audit_nfvi_instance():
             instance = instance_table.get(instance_uuid, None)
             if instance is None:
                 del _nfvi_instance_outstanding[instance_uuid]
+                _nfvi_instance_rate_controller.request_abandoned(instance_uuid)
 
-        if 0 < len(_nfvi_instance_outstanding):
+        # Queries are started as others complete, only those outstanding
+        # since before the previous audit are of concern.
+        overdue = _nfvi_instance_rate_controller.overdue(10000)
+        if overdue:
             DLOG.info(
                 "Audit instance queries still outstanding, outstanding=%s"
-                % _nfvi_instance_outstanding
+                % {x: _nfvi_instance_outstanding.get(x, None) for x in overdue}
             )
             _audit_dump_debug_info()
         else:
             _audit_dump_debug_info(do_dump=False)
 
-        for instance_uuid in list(_nfvi_instances_to_audit.keys()):
-            if 4 <= len(_nfvi_instance_outstanding):
-                break
-
-            do_audit = True
-            instance = instance_table.get(instance_uuid, None)
-            if instance is not None:
-                if instance.nfvi_instance_is_deleted():
-                    do_audit = False
-                else:
-                    # Indicate that audit is in progress
-                    instance.nfvi_instance_audit_in_progress = True
-
-            if do_audit:
-                DLOG.info("Auditing instance %s." % instance_uuid)
-                nfvi.nfvi_get_instance(
-                    instance_uuid, _audit_nfvi_instance_callback(instance_uuid)
-                )
-                _nfvi_instance_outstanding[instance_uuid] = _nfvi_instances_to_audit[
-                    instance_uuid
-                ]
-
-            del _nfvi_instances_to_audit[instance_uuid]
+        _audit_nfvi_instance_start()
 
 
 @coroutine
@@ -1188,14 +1215,14 @@ def _audit_nfvi_instance_type_details():
 def _audit_nfvi_volume_callback(volume_uuid):
     """Audit Volumes."""
 
-    global _nfvi_volumes_outstanding
-
     response = yield
     DLOG.verbose("Audit-Volume callback, response=%s." % response)
 
     if volume_uuid in _nfvi_volumes_outstanding:
         del _nfvi_volumes_outstanding[volume_uuid]
 
+    _nfvi_volume_rate_controller.request_complete(volume_uuid, response["completed"])
+
     if response["completed"]:
         nfvi_volume = response["result-data"]
         volume_table = tables.tables_get_volume_table()
@@ -1208,13 +1235,31 @@ def _audit_nfvi_volume_callback(volume_uuid):
     else:
         DLOG.error("Audit-Volume callback, not completed, response=%s." % response)
 
+    _audit_nfvi_volume_start()
+
+
+def _audit_nfvi_volume_start():
+    """Start auditing the queued volumes, as many as the rate controller
+
+    allows.
+    """
+    for volume_uuid in list(_nfvi_volumes_to_audit.keys()):
+        if not _nfvi_volume_rate_controller.can_start():
+            break
+
+        DLOG.verbose("Auditing volume %s." % volume_uuid)
+        _nfvi_volume_rate_controller.request_started(volume_uuid)
+        nfvi.nfvi_get_volume(volume_uuid, _audit_nfvi_volume_callback(volume_uuid))
+
+        _nfvi_volumes_outstanding[volume_uuid] = _nfvi_volumes_to_audit[volume_uuid]
+
+        del _nfvi_volumes_to_audit[volume_uuid]
+
 
 @timers.interval_timer("audit_nfvi_volume", initial_delay_secs=10, interval_secs=10)
 def _audit_nfvi_volume():
     """Audit NFVI Volume."""
 
-    global _nfvi_volumes_to_audit, _nfvi_volumes_outstanding
-
     while True:
         timer_id = yield
         DLOG.verbose("Audit volume called, timer_id=%s." % timer_id)
@@ -1224,17 +1269,9 @@ def _audit_nfvi_volume():
             volume = volume_table.get(volume_uuid, None)
             if volume is None:
                 del _nfvi_volumes_outstanding[volume_uuid]
+                _nfvi_volume_rate_controller.request_abandoned(volume_uuid)
 
-        for volume_uuid in list(_nfvi_volumes_to_audit.keys()):
-            if 4 <= len(_nfvi_volumes_outstanding):
-                break
-
-            DLOG.verbose("Auditing volume %s." % volume_uuid)
-            nfvi.nfvi_get_volume(volume_uuid, _audit_nfvi_volume_callback(volume_uuid))
-
-            _nfvi_volumes_outstanding[volume_uuid] = _nfvi_volumes_to_audit[volume_uuid]
-
-            del _nfvi_volumes_to_audit[volume_uuid]
+        _audit_nfvi_volume_start()
 
 
 @coroutine
@@ -1281,9 +1318,96 @@ def _audit_nfvi_guest_services():
                         )
 
 
+def _audit_config():
+    """Returns the nfvi audit configuration."""
+
+    if config.section_exists("nfvi-audit"):
+        return config.CONF["nfvi-audit"]
+    return dict()
+
+
+def _audit_rate_controllers_initialize():
+    """Initialize the rate controllers of the instance and volume audits."""
+
+    global _nfvi_instance_rate_controller, _nfvi_volume_rate_controller
+
+    section = _audit_config()
+
+    def rate_controller(name):
+        return AuditRateController(
+            name,
+            initial_concurrent=int(section.get("detail_audit_initial_concurrent", 4)),
+            max_concurrent=int(section.get("detail_audit_max_concurrent", 4)),
+            target_latency_ms=int(section.get("detail_audit_target_latency_ms", 2000)),
+            max_requests_per_sec=float(
+                section.get("detail_audit_max_requests_per_sec", 10)
+            ),
+        )
+
+    _nfvi_instance_rate_controller = rate_controller("audit-nfvi-instance")
+    _nfvi_volume_rate_controller = rate_controller("audit-nfvi-volume")
+
+
+def _audit_scheduler_initialize():
+    """Initialize the scheduler of the nfvi audit cycle."""
+
+    global _audit_scheduler, _nfvi_instances_full_audit_listings
+
+    section = _audit_config()
+
+    _audit_scheduler = AuditScheduler(
+        "audit-nfvi", int(section.get("max_concurrent_audits", 1))
+    )
+
+    # Every instances_full_audit_listings listings of the instances list all
+    # instances, the listings in between only list the changed instances.
+    _nfvi_instances_full_audit_listings = max(
+        1, int(section.get("instances_full_audit_listings", 1))
+    )
+
+    def add_audit(name, audit_start, depends_on=None, enabled=None):
+        interval_secs = int(section.get(name.replace("-", "_") + "_interval_secs", 0))
+        _audit_scheduler.add_audit(
+            name, audit_start, depends_on, enabled, interval_secs
+        )
+
+    # Resources are audited after the resources they refer to.
+    add_audit("system-info", _audit_nfvi_system_info)
+    add_audit("hosts", _audit_nfvi_hosts)
+
+    if not nfvi.nfvi_compute_plugin_disabled():
+        add_audit("host-aggregates", _audit_nfvi_host_aggregates, ["hosts"])
+        add_audit("hypervisors", _audit_nfvi_hypervisors, ["hosts"])
+
+    add_audit("tenants", _audit_nfvi_tenants, ["hosts"], _audit_nfvi_tenants_enabled)
+
+    if not nfvi.nfvi_compute_plugin_disabled():
+        add_audit("instance-types", _audit_nfvi_instance_types)
+        add_audit(
+            "instances",
+            _audit_nfvi_instances,
+            ["hosts", "hypervisors", "tenants", "instance-types"],
+        )
+        add_audit("instance-groups", _audit_nfvi_instance_groups, ["instances"])
+
+    if not nfvi.nfvi_image_plugin_disabled():
+        add_audit("images", _audit_nfvi_images)
+
+    if not nfvi.nfvi_block_storage_plugin_disabled():
+        add_audit("volumes", _audit_nfvi_volumes, ["images", "tenants"])
+        add_audit("volume-snapshots", _audit_nfvi_volume_snapshots, ["volumes"])
+
+    if not nfvi.nfvi_network_plugin_disabled():
+        add_audit("subnets", _audit_nfvi_subnets, ["tenants"])
+        add_audit("networks", _audit_nfvi_networks, ["subnets"])
+
+
 def vim_nfvi_audits_initialize():
     """Initialize nfvi audits."""
 
+    _audit_scheduler_initialize()
+    _audit_rate_controllers_initialize()
+
     audits = []
 
     audits.append(_audit_nfvi)
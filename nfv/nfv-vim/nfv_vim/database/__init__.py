@@ -138,3 +138,9 @@ from nfv_vim.database._database_sw_update import (  # noqa: F401
 )
 from nfv_vim.database._database_sw_update import database_sw_update_add  # noqa: F401
 from nfv_vim.database._database_sw_update import database_sw_update_delete  # noqa: F401
+from nfv_vim.database._database_sw_update import (  # noqa: F401
+    database_sw_update_journal_add,
+)
+from nfv_vim.database._database_sw_update import (  # noqa: F401
+    database_sw_update_journal_enabled,
+)
@@ -3,18 +3,25 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
 import errno
+import hashlib
 import json
 import os
 
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.engine import Engine
 from sqlalchemy import event
 from sqlalchemy import MetaData
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
 
+from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
 from nfv_common.helpers import coroutine
+from nfv_common.helpers import Singleton
 from nfv_common import histogram
 from nfv_common import timers
 from nfv_vim.database._database_migrate import migrate_tables
@@ -22,9 +29,31 @@ from nfv_vim.database._database_upgrades import upgrade_table_row_data
 from nfv_vim.database.model import Base
 from nfv_vim.database.model import lookup_class_by_table
 
+DLOG = debug.debug_get_logger("nfv_vim.database")
+
 _db_version = 1
 _db_name = "vim_db_v%s" % _db_version
 _db_obj = None
+_db_pragmas = list()
+
+
+class DatabaseDurability(Constants, metaclass=Singleton):
+    """Database Durability Profile Constants."""
+
+    STRICT = Constant("strict")
+    WAL = Constant("wal")
+
+
+# Constant Instantiation
+DATABASE_DURABILITY = DatabaseDurability()
+
+# Journal mode and synchronous setting of each durability profile, strict
+# fsyncs the rollback journal and database on every commit, wal only fsyncs
+# the write-ahead log when it is checkpointed.
+_db_durability_pragmas = {
+    DATABASE_DURABILITY.STRICT: ("TRUNCATE", "EXTRA"),
+    DATABASE_DURABILITY.WAL: ("WAL", "NORMAL"),
+}
 
 
 class Database:
@@ -33,11 +62,26 @@ class Database:
     def __init__(self, database_url):
         self._engine = create_engine(database_url)
         Base.metadata.create_all(self._engine)
-        self._session = scoped_session(sessionmaker(bind=self._engine))
+        session_factory = sessionmaker(bind=self._engine)
+        event.listen(session_factory, "after_commit", self._after_commit)
+        event.listen(session_factory, "after_rollback", self._after_rollback)
+        self._session = scoped_session(session_factory)
         self._commit_timer_id = None
         self._commit_inline = False
+        self._pending_rows = collections.OrderedDict()
+        # Digests of the rows stored by committed transactions and of the
+        # rows flushed by the transaction in progress.
+        self._written_rows = {}
+        self._flushed_rows = {}
+        self._write_stats = {
+            "rows-written": 0,
+            "writes-coalesced": 0,
+            "writes-suppressed": 0,
+        }
 
     def dump_data(self, filename):
+        self.flush_rows()
+
         db_data = {}
         db_data["version"] = _db_version
         db_data["tables"] = {}
@@ -83,14 +127,120 @@ class Database:
     def session(self):
         return self._session
 
+    @property
+    def write_stats(self):
+        return dict(self._write_stats)
+
+    def write_row(self, model_class, key, obj, to_row):
+        """Queue the row of an object to be written by the next commit.
+
+        The row is built by to_row when the pending rows are flushed, so an
+        object updated many times before the commit is only serialized and
+        written once, and not at all if its row has not changed since it
+        was last written.
+        """
+        pending_key = (model_class, key)
+        if pending_key in self._pending_rows:
+            self._write_stats["writes-coalesced"] += 1
+        self._pending_rows[pending_key] = (obj, to_row)
+        self.commit()
+
+    def discard_row(self, model_class, key):
+        """Discard a queued row, the row is about to be deleted."""
+
+        pending_key = (model_class, key)
+        self._pending_rows.pop(pending_key, None)
+        self._written_rows.pop(pending_key, None)
+        self._flushed_rows.pop(pending_key, None)
+
+    def _after_commit(self, session):
+        """The rows flushed by the transaction have been stored."""
+
+        self._written_rows.update(self._flushed_rows)
+        self._flushed_rows.clear()
+
+    def _after_rollback(self, session):
+        """The rows flushed by the transaction have not been stored."""
+
+        self._flushed_rows.clear()
+
+    @staticmethod
+    def _row_digest(row):
+        """Returns a digest of the columns of a row."""
+
+        row_json = json.dumps(row, sort_keys=True, default=str)
+        return hashlib.blake2b(row_json.encode(), digest_size=16).digest()
+
+    def flush_rows(self):
+        """Write the queued rows, one bulk upsert per table."""
+
+        if not self._pending_rows:
+            return
+
+        pending_rows = self._pending_rows
+        self._pending_rows = collections.OrderedDict()
+
+        suppressed = 0
+        table_rows = collections.OrderedDict()
+        for pending_key, (obj, to_row) in pending_rows.items():
+            row = to_row(obj)
+            digest = self._row_digest(row)
+            written_digest = self._flushed_rows.get(
+                pending_key, self._written_rows.get(pending_key, None)
+            )
+            if written_digest == digest:
+                suppressed += 1
+                continue
+            table_rows.setdefault(pending_key[0], list()).append(
+                (pending_key, row, digest)
+            )
+
+        written = 0
+        for model_class, rows in table_rows.items():
+            table = model_class.__table__
+            primary_keys = [column.name for column in table.primary_key]
+            insert = sqlite.insert(table)
+            upsert = insert.on_conflict_do_update(
+                index_elements=primary_keys,
+                set_={
+                    column: insert.excluded[column]
+                    for column in rows[0][1]
+                    if column not in primary_keys
+                },
+            )
+            self._session.execute(upsert, [row for _, row, _ in rows])
+            # Only known to be stored once the transaction is committed.
+            for pending_key, _, digest in rows:
+                self._flushed_rows[pending_key] = digest
+            written += len(rows)
+
+        self._write_stats["rows-written"] += written
+        self._write_stats["writes-suppressed"] += suppressed
+        histogram.add_histogram_data("database-rows-written", written, "rows")
+        histogram.add_histogram_data("database-writes-suppressed", suppressed, "rows")
+
     def end_session(self):
+        if self._pending_rows:
+            self.flush_rows()
+            self._session.commit()
         self._session.remove()
 
+    def checkpoint(self):
+        """Copy the contents of the write-ahead log, if any, into the
+
+        database file and truncate the log.
+        """
+        with self._engine.connect() as connection:
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+            if "wal" == journal_mode.lower():
+                connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
     @coroutine
     def auto_commit(self):
         timer_id = yield
         if timer_id == self._commit_timer_id:
             start_ms = timers.get_monotonic_timestamp_in_ms()
+            self.flush_rows()
             self._session.commit()
             elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
             histogram.add_histogram_data(
@@ -101,6 +251,7 @@ class Database:
     def commit(self):
         if self._commit_inline:
             start_ms = timers.get_monotonic_timestamp_in_ms()
+            self.flush_rows()
             self._session.commit()
             elapsed_ms = timers.get_monotonic_timestamp_in_ms() - start_ms
             histogram.add_histogram_data(
@@ -116,21 +267,67 @@ class Database:
 @event.listens_for(Engine, "connect")
 def database_set_sqlite_pragma(db_connection, connection_record):
     cursor = db_connection.cursor()
-    cursor.execute("PRAGMA journal_mode=TRUNCATE")
-    cursor.execute("PRAGMA synchronous=EXTRA")
+    if _db_pragmas:
+        pragmas = _db_pragmas
+    else:
+        pragmas = database_get_sqlite_pragmas(dict())
+    for pragma in pragmas:
+        cursor.execute("PRAGMA %s" % pragma)
     cursor.execute("PRAGMA user_version=%s" % _db_version)
 
 
+def database_get_sqlite_pragmas(config):
+    """Returns the sqlite pragmas for the durability settings of the
+
+    database configuration.
+    """
+    durability = config.get("durability", DATABASE_DURABILITY.STRICT)
+    if durability not in _db_durability_pragmas:
+        DLOG.error(
+            "Unknown database durability profile %s, using %s."
+            % (durability, DATABASE_DURABILITY.STRICT)
+        )
+        durability = DATABASE_DURABILITY.STRICT
+
+    journal_mode, synchronous = _db_durability_pragmas[durability]
+    pragmas = [
+        "journal_mode=%s" % journal_mode,
+        "synchronous=%s" % config.get("synchronous", synchronous).upper(),
+    ]
+
+    # Pages written to the write-ahead log before it is checkpointed.
+    wal_autocheckpoint = config.get("wal_autocheckpoint", None)
+    if wal_autocheckpoint is not None:
+        pragmas.append("wal_autocheckpoint=%d" % int(wal_autocheckpoint))
+
+    # Bytes the journal or write-ahead log is truncated to after a commit or
+    # checkpoint.
+    journal_size_limit = config.get("journal_size_limit", None)
+    if journal_size_limit is not None:
+        pragmas.append("journal_size_limit=%d" % int(journal_size_limit))
+
+    mmap_size = config.get("mmap_size", None)
+    if mmap_size is not None:
+        pragmas.append("mmap_size=%d" % int(mmap_size))
+
+    return pragmas
+
+
 def database_get():
     """Get database object."""
 
     return _db_obj
 
 
-def database_create(database_dir):
+def database_create(database_dir, config=None):
     """Create the database."""
 
     global _db_obj
+    global _db_pragmas
+
+    if config is None:
+        config = dict()
+    _db_pragmas = database_get_sqlite_pragmas(config)
 
     if not os.path.exists(database_dir):
         try:
@@ -240,58 +240,42 @@ def database_instance_type_get_list():
     return instance_type_objs
 
 
+def _instance_row(instance_obj):
+    """Returns the database row of an instance object."""
+
+    return {
+        "uuid": instance_obj.uuid,
+        "name": instance_obj.name,
+        "admin_state": instance_obj.admin_state,
+        "oper_state": instance_obj.oper_state,
+        "avail_status": json.dumps(instance_obj.avail_status),
+        "action": instance_obj.action,
+        "host_name": instance_obj.host_name,
+        "image_uuid": instance_obj.image_uuid,
+        "live_migration_support": instance_obj.supports_live_migration(),
+        "elapsed_time_in_state": instance_obj.elapsed_time_in_state,
+        "elapsed_time_on_host": instance_obj.elapsed_time_on_host,
+        "action_data": json.dumps(instance_obj.action_data.as_dict()),
+        "last_action_data": json.dumps(instance_obj.last_action_data.as_dict()),
+        "guest_services": json.dumps(instance_obj.guest_services.as_dict()),
+        "recoverable": instance_obj.recoverable,
+        "unlock_to_recover": instance_obj.unlock_to_recover,
+        "nfvi_instance_data": json.dumps(instance_obj.nfvi_instance.as_dict()),
+    }
+
+
 def database_instance_add(instance_obj):
     """Add an instance object to the database."""
 
     db = database_get()
-    session = db.session()
-    query = session.query(model.Instance_v5)
-    query = query.filter(model.Instance_v5.uuid == instance_obj.uuid)
-    instance = query.first()
-    if not instance:
-        instance = model.Instance_v5()
-        instance.uuid = instance_obj.uuid
-        instance.name = instance_obj.name
-        instance.admin_state = instance_obj.admin_state
-        instance.oper_state = instance_obj.oper_state
-        instance.avail_status = json.dumps(instance_obj.avail_status)
-        instance.action = instance_obj.action
-        instance.host_name = instance_obj.host_name
-        instance.image_uuid = instance_obj.image_uuid
-        instance.live_migration_support = instance_obj.supports_live_migration()
-        instance.elapsed_time_in_state = instance_obj.elapsed_time_in_state
-        instance.elapsed_time_on_host = instance_obj.elapsed_time_on_host
-        instance.action_data = json.dumps(instance_obj.action_data.as_dict())
-        instance.last_action_data = json.dumps(instance_obj.last_action_data.as_dict())
-        instance.guest_services = json.dumps(instance_obj.guest_services.as_dict())
-        instance.recoverable = instance_obj.recoverable
-        instance.unlock_to_recover = instance_obj.unlock_to_recover
-        instance.nfvi_instance_data = json.dumps(instance_obj.nfvi_instance.as_dict())
-        session.add(instance)
-    else:
-        instance.name = instance_obj.name
-        instance.admin_state = instance_obj.admin_state
-        instance.oper_state = instance_obj.oper_state
-        instance.avail_status = json.dumps(instance_obj.avail_status)
-        instance.action = instance_obj.action
-        instance.host_name = instance_obj.host_name
-        instance.image_uuid = instance_obj.image_uuid
-        instance.live_migration_support = instance_obj.supports_live_migration()
-        instance.elapsed_time_in_state = instance_obj.elapsed_time_in_state
-        instance.elapsed_time_on_host = instance_obj.elapsed_time_on_host
-        instance.action_data = json.dumps(instance_obj.action_data.as_dict())
-        instance.last_action_data = json.dumps(instance_obj.last_action_data.as_dict())
-        instance.guest_services = json.dumps(instance_obj.guest_services.as_dict())
-        instance.recoverable = instance_obj.recoverable
-        instance.unlock_to_recover = instance_obj.unlock_to_recover
-        instance.nfvi_instance_data = json.dumps(instance_obj.nfvi_instance.as_dict())
-    db.commit()
+    db.write_row(model.Instance_v5, instance_obj.uuid, instance_obj, _instance_row)
 
 
 def database_instance_delete(instance_uuid):
     """Delete an instance object from the database."""
 
     db = database_get()
+    db.discard_row(model.Instance_v5, instance_uuid)
     session = db.session()
     query = session.query(model.Instance_v5)
     query.filter(model.Instance_v5.uuid == instance_uuid).delete()
@@ -420,38 +404,37 @@ def database_instance_get_list():
     return instance_objs
 
 
+def _instance_group_row(instance_group_obj):
+    """Returns the database row of an instance group object."""
+
+    return {
+        "uuid": instance_group_obj.uuid,
+        "name": instance_group_obj.name,
+        "member_uuids": json.dumps(instance_group_obj.member_uuids),
+        "policies": json.dumps(instance_group_obj.policies),
+        "nfvi_instance_group_data": json.dumps(
+            instance_group_obj.nfvi_instance_group.as_dict()
+        ),
+    }
+
+
 def database_instance_group_add(instance_group_obj):
     """Add an instance group object to the database."""
 
     db = database_get()
-    session = db.session()
-    query = session.query(model.InstanceGroup)
-    query = query.filter(model.InstanceGroup.uuid == instance_group_obj.uuid)
-    instance_group = query.first()
-    if not instance_group:
-        instance_group = model.InstanceGroup()
-        instance_group.uuid = instance_group_obj.uuid
-        instance_group.name = instance_group_obj.name
-        instance_group.member_uuids = json.dumps(instance_group_obj.member_uuids)
-        instance_group.policies = json.dumps(instance_group_obj.policies)
-        instance_group.nfvi_instance_group_data = json.dumps(
-            instance_group_obj.nfvi_instance_group.as_dict()
-        )
-        session.add(instance_group)
-    else:
-        instance_group.name = instance_group_obj.name
-        instance_group.member_uuids = json.dumps(instance_group_obj.member_uuids)
-        instance_group.policies = json.dumps(instance_group_obj.policies)
-        instance_group.nfvi_instance_group_data = json.dumps(
-            instance_group_obj.nfvi_instance_group.as_dict()
-        )
-    db.commit()
+    db.write_row(
+        model.InstanceGroup,
+        instance_group_obj.uuid,
+        instance_group_obj,
+        _instance_group_row,
+    )
 
 
 def database_instance_group_delete(instance_group_uuid):
     """Delete an instance group object from the database."""
 
     db = database_get()
+    db.discard_row(model.InstanceGroup, instance_group_uuid)
     session = db.session()
     query = session.query(model.InstanceGroup)
     query.filter(model.InstanceGroup.uuid == instance_group_uuid).delete()
@@ -479,37 +462,36 @@ def database_instance_group_get_list():
     return instance_group_objs
 
 
+def _host_aggregate_row(host_aggregate_obj):
+    """Returns the database row of a host aggregate object."""
+
+    return {
+        "name": host_aggregate_obj.name,
+        "host_names": json.dumps(host_aggregate_obj.host_names),
+        "availability_zone": host_aggregate_obj.availability_zone,
+        "nfvi_host_aggregate_data": json.dumps(
+            host_aggregate_obj.nfvi_host_aggregate.as_dict()
+        ),
+    }
+
+
 def database_host_aggregate_add(host_aggregate_obj):
     """Add a host aggregate object to the database."""
 
     db = database_get()
-    session = db.session()
-    query = session.query(model.HostAggregate).filter(
-        model.HostAggregate.name == host_aggregate_obj.name
+    db.write_row(
+        model.HostAggregate,
+        host_aggregate_obj.name,
+        host_aggregate_obj,
+        _host_aggregate_row,
     )
-    host_aggregate = query.first()
-    if not host_aggregate:
-        host_aggregate = model.HostAggregate()
-        host_aggregate.name = host_aggregate_obj.name
-        host_aggregate.host_names = json.dumps(host_aggregate_obj.host_names)
-        host_aggregate.availability_zone = host_aggregate_obj.availability_zone
-        host_aggregate.nfvi_host_aggregate_data = json.dumps(
-            host_aggregate_obj.nfvi_host_aggregate.as_dict()
-        )
-        session.add(host_aggregate)
-    else:
-        host_aggregate.host_names = json.dumps(host_aggregate_obj.host_names)
-        host_aggregate.availability_zone = host_aggregate_obj.availability_zone
-        host_aggregate.nfvi_host_aggregate_data = json.dumps(
-            host_aggregate_obj.nfvi_host_aggregate.as_dict()
-        )
-    db.commit()
 
 
 def database_host_aggregate_delete(host_aggregate_name):
     """Delete a host aggregate object from the database."""
 
     db = database_get()
+    db.discard_row(model.HostAggregate, host_aggregate_name)
     session = db.session()
     query = session.query(model.HostAggregate)
     query.filter(model.HostAggregate.name == host_aggregate_name).delete()
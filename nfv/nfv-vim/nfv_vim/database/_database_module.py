@@ -8,6 +8,7 @@ import subprocess
 
 from nfv_vim.database._database import database_create
 from nfv_vim.database._database import database_get
+from nfv_vim.database._database_sw_update import database_sw_update_initialize
 
 
 def database_dump_data(filename):
@@ -34,7 +35,8 @@ def database_migrate_data():
 def database_initialize(config):
     """Initialize the database package."""
 
-    database_create(config["database_dir"])
+    database_create(config["database_dir"], config)
+    database_sw_update_initialize(config)
 
 
 def database_finalize(config=None):
@@ -42,5 +44,6 @@ def database_finalize(config=None):
 
     database = database_get()
     database.end_session()
+    database.checkpoint()
     if config:
         subprocess.call(["sync", config["database_dir"]])
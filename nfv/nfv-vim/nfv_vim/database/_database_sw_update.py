@@ -3,12 +3,37 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
 import json
 
+from nfv_common import strategy
 from nfv_vim.database._database import database_get
 from nfv_vim.database import model
 from nfv_vim import objects
 
+_journal_enabled = False
+_journal_compact_records = 100
+_journals = dict()
+
+
+def _strategy_data(sw_update_obj):
+    """Returns the strategy data of a software update object, a snapshot
+
+    restarting the journal of the software update if journaling.
+    """
+    if sw_update_obj.strategy is None:
+        _journals.pop(sw_update_obj.uuid, None)
+        return json.dumps({})
+
+    if not _journal_enabled:
+        return json.dumps(sw_update_obj.strategy.as_dict())
+
+    journal = _journals.get(sw_update_obj.uuid, None)
+    if journal is None:
+        journal = strategy.StrategyJournal()
+        _journals[sw_update_obj.uuid] = journal
+    return journal.snapshot(sw_update_obj.strategy)
+
 
 def database_sw_update_add(sw_update_obj):
     """Add a software update object to the database."""
@@ -21,26 +46,63 @@ def database_sw_update_add(sw_update_obj):
         sw_update = model.SoftwareUpdate()
         sw_update.uuid = sw_update_obj.uuid
         sw_update.sw_update_type = sw_update_obj.sw_update_type
-        if sw_update_obj.strategy is None:
-            sw_update.strategy_data = json.dumps({})
-        else:
-            sw_update.strategy_data = json.dumps(sw_update_obj.strategy.as_dict())
+        sw_update.strategy_data = _strategy_data(sw_update_obj)
         session.add(sw_update)
     else:
-        if sw_update_obj.strategy is None:
-            sw_update.strategy_data = json.dumps({})
-        else:
-            sw_update.strategy_data = json.dumps(sw_update_obj.strategy.as_dict())
+        sw_update.strategy_data = _strategy_data(sw_update_obj)
+    # The strategy data now holds the changes journaled so far.
+    query = session.query(model.SoftwareUpdateJournal)
+    query.filter(model.SoftwareUpdateJournal.uuid == sw_update_obj.uuid).delete()
+    db.commit()
+
+
+def database_sw_update_journal_enabled():
+    """Returns true if the progress of software update strategies is
+
+    journaled.
+    """
+    return _journal_enabled
+
+
+def database_sw_update_journal_add(sw_update_obj, phase, stage=None):
+    """Journal the changes made to the strategy of a software update
+
+    object by a phase, or by one of its stages. The journal is compacted
+    into the strategy data once it grows too long.
+    """
+    journal = _journals.get(sw_update_obj.uuid, None)
+    if journal is None or sw_update_obj.strategy is None:
+        database_sw_update_add(sw_update_obj)
+        return
+
+    record_data = journal.record(sw_update_obj.strategy, phase, stage)
+    if record_data is None or journal.needs_compaction(_journal_compact_records):
+        database_sw_update_add(sw_update_obj)
+        return
+
+    if not record_data:
+        return
+
+    db = database_get()
+    session = db.session()
+    sw_update_journal = model.SoftwareUpdateJournal()
+    sw_update_journal.uuid = sw_update_obj.uuid
+    sw_update_journal.sequence = journal.num_records
+    sw_update_journal.record_data = record_data
+    session.add(sw_update_journal)
     db.commit()
 
 
 def database_sw_update_delete(sw_update_uuid):
     """Delete a software update object from the database."""
 
+    _journals.pop(sw_update_uuid, None)
     db = database_get()
     session = db.session()
     query = session.query(model.SoftwareUpdate)
     query.filter(model.SoftwareUpdate.uuid == sw_update_uuid).delete()
+    query = session.query(model.SoftwareUpdateJournal)
+    query.filter(model.SoftwareUpdateJournal.uuid == sw_update_uuid).delete()
     session.commit()
 
 
@@ -49,11 +111,20 @@ def database_sw_update_get_list():
 
     db = database_get()
     session = db.session()
+    query = session.query(model.SoftwareUpdateJournal)
+    query = query.order_by(model.SoftwareUpdateJournal.sequence)
+    journal_records = collections.defaultdict(list)
+    for sw_update_journal in query.all():
+        journal_records[sw_update_journal.uuid].append(sw_update_journal.record_data)
+
     query = session.query(model.SoftwareUpdate)
 
     sw_update_objs = []
     for sw_update in query.all():
         strategy_data = json.loads(sw_update.strategy_data)
+        if strategy_data:
+            for record_data in journal_records[sw_update.uuid]:
+                strategy.StrategyJournal.apply(strategy_data, json.loads(record_data))
         if objects.SW_UPDATE_TYPE.SW_UPGRADE == sw_update.sw_update_type:
             sw_upgrade_obj = objects.SwUpgrade(sw_update.uuid, strategy_data)
             sw_update_objs.append(sw_upgrade_obj)
@@ -83,3 +154,18 @@ def database_sw_update_exists():
 
     # Return True if any record exists, False otherwise
     return session.query(query.exists()).scalar()
+
+
+def database_sw_update_initialize(config):
+    """Initialize the journaling of software update strategies."""
+
+    global _journal_enabled, _journal_compact_records
+
+    _journal_enabled = config.get("strategy_journal", "false").lower() in [
+        "true",
+        "1",
+    ]
+    _journal_compact_records = int(
+        config.get("strategy_journal_compact_records", _journal_compact_records)
+    )
+    _journals.clear()
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2015-2016 Wind River Systems, Inc.
+# Copyright (c) 2015-2016, 2026 Wind River Systems, Inc.
 #
 # SPDX-License-Identifier: Apache-2.0
 #
@@ -21,6 +21,7 @@ from nfv_vim.database.model._network import Network  # noqa: F401
 from nfv_vim.database.model._service_host import ServiceHost  # noqa: F401
 from nfv_vim.database.model._subnet import Subnet  # noqa: F401
 from nfv_vim.database.model._sw_update import SoftwareUpdate  # noqa: F401
+from nfv_vim.database.model._sw_update import SoftwareUpdateJournal  # noqa: F401
 from nfv_vim.database.model._system import System  # noqa: F401
 from nfv_vim.database.model._tenant import Tenant  # noqa: F401
 from nfv_vim.database.model._volume import Volume  # noqa: F401
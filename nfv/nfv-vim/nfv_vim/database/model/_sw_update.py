@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 from sqlalchemy import Column
+from sqlalchemy import Integer
 from sqlalchemy import String
 
 from nfv_vim.database.model._base import AsDictMixin
@@ -27,3 +28,21 @@ class SoftwareUpdate(AsDictMixin, Base):
 
     def __repr__(self):
         return "<SwUpdate(%r)>" % self.uuid
+
+
+class SoftwareUpdateJournal(AsDictMixin, Base):
+    """Software Update Journal Database Table
+
+    NOTE: The records of this table are the changes made to the strategy of a
+          software update since its strategy_data was last written, they are
+          replayed in sequence order on top of the strategy_data.
+    """
+
+    __tablename__ = "sw_update_journal"
+
+    uuid = Column(String(64), nullable=False, primary_key=True)
+    sequence = Column(Integer, nullable=False, primary_key=True)
+    record_data = Column(String(2147483647), nullable=False, primary_key=False)
+
+    def __repr__(self):
+        return "<SwUpdateJournal(%r, %r)>" % (self.uuid, self.sequence)
@@ -6,6 +6,7 @@
 from nfv_common import config
 from nfv_common import debug
 from nfv_common import tcp
+from nfv_vim.events._vim_histogram_api_events import vim_histogram_api_get_histograms
 from nfv_vim.events._vim_image_api_events import vim_image_api_create_image
 from nfv_vim.events._vim_image_api_events import vim_image_api_delete_image
 from nfv_vim.events._vim_image_api_events import vim_image_api_finalize
@@ -74,6 +75,11 @@ def _vim_api_message_handler(connection, msg):
         % (msg, connection.ip, connection.port)
     )
 
+    # Requests multiplexed on a channel are responded to on the channel.
+    connection, msg = rpc.rpc_channel_demultiplex(connection, msg)
+    if msg is None:
+        return
+
     msg = rpc.RPCMessage.deserialize(msg)
 
     # Image API Requests
@@ -211,6 +217,10 @@ def _vim_api_message_handler(connection, msg):
     elif rpc.RPC_MSG_TYPE.GET_SW_UPDATE_STRATEGY_REQUEST == msg.type:
         vim_sw_update_api_get_strategy(connection, msg)
 
+    # Histogram API Requests
+    elif rpc.RPC_MSG_TYPE.GET_HISTOGRAMS_REQUEST == msg.type:
+        vim_histogram_api_get_histograms(connection, msg)
+
     else:
         DLOG.debug("Unknown message type received, msg_type=%s." % msg.type)
         connection.close()
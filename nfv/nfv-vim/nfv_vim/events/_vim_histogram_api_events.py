@@ -0,0 +1,23 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_common import debug
+from nfv_common import histogram
+from nfv_vim import rpc
+
+DLOG = debug.debug_get_logger("nfv_vim.vim_histogram_api_events")
+
+
+def vim_histogram_api_get_histograms(connection, msg):
+    """Handle Get-Histograms API request."""
+
+    DLOG.verbose("Get histograms, filter_by_name=%s." % msg.filter_by_name)
+    response = rpc.APIResponseGetHistograms()
+    response.histograms = histogram.get_histogram_data(msg.filter_by_name)
+    if msg.filter_by_name is not None and not response.histograms:
+        response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
+    connection.send(response.serialize())
+    DLOG.verbose("Sent response=%s" % response)
+    connection.close()
@@ -3,6 +3,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import bisect
+import itertools
+
 from nfv_common import debug
 from nfv_vim import directors
 from nfv_vim import objects
@@ -11,6 +14,8 @@ from nfv_vim import tables
 
 DLOG = debug.debug_get_logger("nfv_vim.vim_instance_api_events")
 
+GET_INSTANCES_MAX_BATCH_SIZE = 500
+
 _instance_create_operations = {}
 
 
@@ -282,79 +287,121 @@ def vim_instance_api_delete_instance(connection, msg):
     connection.close()
 
 
+def _get_instance_response(instance, host_table):
+    """Returns a Get-Instance response for an instance."""
+
+    response = rpc.APIResponseGetInstance()
+    response.uuid = instance.uuid
+    response.name = instance.name
+    response.admin_state = instance.admin_state
+    response.oper_state = instance.oper_state
+    response.avail_status = instance.avail_status
+    response.action = instance.action
+    response.host_name = instance.host_name
+    response.instance_type_original_name = instance.instance_type_original_name
+    response.image_uuid = instance.image_uuid
+    response.vcpus = instance.vcpus
+    response.memory_mb = instance.memory_mb
+    response.disk_gb = instance.disk_gb
+    response.ephemeral_gb = instance.ephemeral_gb
+    response.swap_gb = instance.swap_gb
+    response.auto_recovery = instance.auto_recovery
+    response.live_migration_timeout = instance.max_live_migrate_wait_in_secs
+    response.live_migration_max_downtime = instance.max_live_migration_downtime_in_ms
+    if instance.host_name is not None:
+        host = host_table.get(instance.host_name, None)
+        if host is not None:
+            response.host_uuid = host.uuid
+    return response
+
+
 def vim_instance_api_get_instance(connection, msg):
     """Handle Get-Instance API request."""
 
     DLOG.verbose("Get instance, filter_by_uuid=%s." % msg.filter_by_uuid)
     instance_table = tables.tables_get_instance_table()
-    response = rpc.APIResponseGetInstance()
     instance = instance_table.get(msg.filter_by_uuid, None)
     if instance is not None:
-        response.uuid = instance.uuid
-        response.name = instance.name
-        response.admin_state = instance.admin_state
-        response.oper_state = instance.oper_state
-        response.avail_status = instance.avail_status
-        response.action = instance.action
-        response.host_name = instance.host_name
-        response.instance_type_original_name = instance.instance_type_original_name
-        response.image_uuid = instance.image_uuid
-        response.vcpus = instance.vcpus
-        response.memory_mb = instance.memory_mb
-        response.disk_gb = instance.disk_gb
-        response.ephemeral_gb = instance.ephemeral_gb
-        response.swap_gb = instance.swap_gb
-        response.auto_recovery = instance.auto_recovery
-        response.live_migration_timeout = instance.max_live_migrate_wait_in_secs
-        response.live_migration_max_downtime = (
-            instance.max_live_migration_downtime_in_ms
-        )
-        if instance.host_name is not None:
-            host_table = tables.tables_get_host_table()
-            host = host_table.get(instance.host_name, None)
-            if host is not None:
-                response.host_uuid = host.uuid
-
+        response = _get_instance_response(instance, tables.tables_get_host_table())
     else:
+        response = rpc.APIResponseGetInstance()
         response.result = rpc.RPC_MSG_RESULT.NOT_FOUND
     connection.send(response.serialize())
     DLOG.verbose("Sent response=%s" % response)
     connection.close()
 
 
-def vim_instance_api_get_instances(connection, msg):
-    """Handle Get-Instances API request."""
+def _instance_selected(instance, msg):
+    """Returns true if the instance passes the filters of a request."""
+
+    if msg.filter_by_host is not None and msg.filter_by_host != instance.host_name:
+        return False
 
-    DLOG.verbose("Get instance, all=%s." % msg.get_all)
+    if msg.filter_by_state is not None and msg.filter_by_state != instance.oper_state:
+        return False
+
+    if (
+        msg.filter_by_tenant is not None
+        and msg.filter_by_tenant != instance.tenant_uuid
+    ):
+        return False
+
+    return True
+
+
+def vim_instance_api_get_instances(connection, msg):
+    """Handle Get-Instances API request.
+
+    Instances are returned in uuid order, starting after the marker and
+    stopping at the limit.  Requests giving a batch size get the instances
+    in batches of at most GET_INSTANCES_MAX_BATCH_SIZE, older requests get
+    a response per instance.
+    """
+    DLOG.verbose("Get instances, %s." % msg)
     instance_table = tables.tables_get_instance_table()
-    for instance in list(instance_table.values()):
-        response = rpc.APIResponseGetInstance()
-        response.uuid = instance.uuid
-        response.name = instance.name
-        response.admin_state = instance.admin_state
-        response.oper_state = instance.oper_state
-        response.avail_status = instance.avail_status
-        response.action = instance.action
-        response.host_name = instance.host_name
-        response.instance_type_original_name = instance.instance_type_original_name
-        response.image_uuid = instance.image_uuid
-        response.vcpus = instance.vcpus
-        response.memory_mb = instance.memory_mb
-        response.disk_gb = instance.disk_gb
-        response.ephemeral_gb = instance.ephemeral_gb
-        response.swap_gb = instance.swap_gb
-        response.auto_recovery = instance.auto_recovery
-        response.live_migration_timeout = instance.max_live_migrate_wait_in_secs
-        response.live_migration_max_downtime = (
-            instance.max_live_migration_downtime_in_ms
+    host_table = tables.tables_get_host_table()
+
+    if msg.filter_by_host is not None:
+        instance_uuids = sorted(
+            x.uuid for x in instance_table.on_host(msg.filter_by_host)
         )
-        if instance.host_name is not None:
-            host_table = tables.tables_get_host_table()
-            host = host_table.get(instance.host_name, None)
-            if host is not None:
-                response.host_uuid = host.uuid
-        connection.send(response.serialize())
-        DLOG.verbose("Sent response=%s" % response)
+    else:
+        instance_uuids = sorted(instance_table.keys())
+    start = 0
+    if msg.marker is not None:
+        start = bisect.bisect_right(instance_uuids, msg.marker)
+
+    batch_size = min(msg.batch_size or 0, GET_INSTANCES_MAX_BATCH_SIZE)
+    batch = rpc.APIResponseGetInstances()
+    next_marker = None
+    last_uuid = None
+    count = 0
+
+    for instance_uuid in itertools.islice(instance_uuids, start, None):
+        instance = instance_table[instance_uuid]
+        if not _instance_selected(instance, msg):
+            continue
+
+        if msg.limit is not None and count >= msg.limit:
+            next_marker = last_uuid
+            break
+
+        response = _get_instance_response(instance, host_table)
+        count += 1
+        last_uuid = instance_uuid
+        if batch_size:
+            batch.add_instance(response, msg.fields)
+            if batch_size <= len(batch.instances):
+                connection.send(batch.serialize())
+                batch = rpc.APIResponseGetInstances()
+        else:
+            connection.send(response.serialize())
+            DLOG.verbose("Sent response=%s" % response)
+
+    if batch_size and (batch.instances or next_marker is not None or 0 == count):
+        batch.next_marker = next_marker
+        connection.send(batch.serialize())
+    DLOG.verbose("Sent %s instances, next_marker=%s." % (count, next_marker))
     connection.close()
 
 
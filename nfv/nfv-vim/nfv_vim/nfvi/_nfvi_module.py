@@ -29,6 +29,25 @@ _task_worker_pools = {}
 DISABLED_LIST = ["Yes", "yes", "Y", "y", "True", "true", "T", "t", "1"]
 
 
+def _create_task_worker_pool(config, pool_id, pool_name, num_workers, worker_mode):
+    """Create a task worker pool, sized by <pool_id>_min_workers and
+
+    <pool_id>_max_workers when configured.
+    """
+    min_workers = int(config.get(pool_id + "_min_workers", num_workers))
+    max_workers = int(config.get(pool_id + "_max_workers", min_workers))
+
+    return tasks.TaskWorkerPool(
+        pool_name,
+        num_workers=min_workers,
+        worker_mode=worker_mode,
+        max_workers=max_workers,
+        grow_queue_depth=int(config.get("task_worker_grow_queue_depth", 2)),
+        grow_queue_wait_ms=int(config.get("task_worker_grow_queue_wait_ms", 1000)),
+        idle_secs=int(config.get("task_worker_idle_secs", 60)),
+    )
+
+
 def nfvi_initialize(config):
     """Initialize the NFVI package."""
 
@@ -55,39 +74,55 @@ def nfvi_initialize(config):
         config.get("fault_mgmt_plugin_disabled", "False") in DISABLED_LIST
     ) or (config.get("fault_management_pod_disabled", "True") in DISABLED_LIST)
 
-    _task_worker_pools["identity"] = tasks.TaskWorkerPool("Identity", num_workers=1)
+    # Task work runs in forked worker processes by default, thread mode runs
+    # it on a thread pool in the VIM process instead.
+    worker_mode = config.get("task_worker_mode", tasks.TASK_WORKER_MODE.PROCESS)
+
+    _task_worker_pools["identity"] = _create_task_worker_pool(
+        config, "identity", "Identity", 1, worker_mode
+    )
     nfvi_identity_initialize(config, _task_worker_pools["identity"])
 
     if not image_plugin_disabled:
-        _task_worker_pools["image"] = tasks.TaskWorkerPool("Image", num_workers=1)
+        _task_worker_pools["image"] = _create_task_worker_pool(
+            config, "image", "Image", 1, worker_mode
+        )
         nfvi_image_initialize(config, _task_worker_pools["image"])
 
     if not block_storage_plugin_disabled:
-        _task_worker_pools["block"] = tasks.TaskWorkerPool(
-            "BlockStorage", num_workers=1
+        _task_worker_pools["block"] = _create_task_worker_pool(
+            config, "block", "BlockStorage", 1, worker_mode
         )
         nfvi_block_storage_initialize(config, _task_worker_pools["block"])
 
     if not compute_plugin_disabled:
-        # Use two workers for the compute plugin. This allows the VIM to send
-        # two requests to the nova-api at a time.
-        _task_worker_pools["compute"] = tasks.TaskWorkerPool("Compute", num_workers=2)
+        # Use at least two workers for the compute plugin. This allows the VIM
+        # to send two requests to the nova-api at a time.
+        _task_worker_pools["compute"] = _create_task_worker_pool(
+            config, "compute", "Compute", 2, worker_mode
+        )
         init_complete = nfvi_compute_initialize(config, _task_worker_pools["compute"])
 
     if not network_plugin_disabled:
-        _task_worker_pools["network"] = tasks.TaskWorkerPool("Network", num_workers=1)
+        _task_worker_pools["network"] = _create_task_worker_pool(
+            config, "network", "Network", 1, worker_mode
+        )
         nfvi_network_initialize(config, _task_worker_pools["network"])
 
-    _task_worker_pools["infra"] = tasks.TaskWorkerPool("Infrastructure", num_workers=1)
+    _task_worker_pools["infra"] = _create_task_worker_pool(
+        config, "infra", "Infrastructure", 1, worker_mode
+    )
     nfvi_infrastructure_initialize(config, _task_worker_pools["infra"])
 
     if not guest_plugin_disabled:
-        _task_worker_pools["guest"] = tasks.TaskWorkerPool("Guest", num_workers=1)
+        _task_worker_pools["guest"] = _create_task_worker_pool(
+            config, "guest", "Guest", 1, worker_mode
+        )
         nfvi_guest_initialize(config, _task_worker_pools["guest"])
 
     if not fault_mgmt_plugin_disabled:
-        _task_worker_pools["fault_mgmt"] = tasks.TaskWorkerPool(
-            "Fault-Mgmt", num_workers=1
+        _task_worker_pools["fault_mgmt"] = _create_task_worker_pool(
+            config, "fault_mgmt", "Fault-Mgmt", 1, worker_mode
         )
         nfvi_fault_mgmt_initialize(config, _task_worker_pools["fault_mgmt"])
 
@@ -101,3 +101,5 @@ class NFVIPlugin:
 
         if self._plugin is not None:
             self._plugin.obj.finalize()
+
+        self._scheduler.shutdown()
@@ -14,6 +14,7 @@ class Paging:
         self._page_limit = page_limit
         self._next_page = None
         self._done = False
+        self._changes_since = None
 
     @property
     def page_request_id(self):
@@ -40,6 +41,20 @@ class Paging:
         self._next_page = value
         self._done = self._next_page is None
 
+    @property
+    def changes_since(self):
+        """Returns the time since which changed entries are listed, None if
+
+        all entries are listed.
+        """
+        return self._changes_since
+
+    @changes_since.setter
+    def changes_since(self, value):
+        """Set the time since which changed entries are listed."""
+
+        self._changes_since = value
+
     @property
     def done(self):
         """Returns true if there are no more pages."""
@@ -60,8 +75,9 @@ class Paging:
     def __str__(self):
         """Provide a string representation."""
 
-        return "Paging: page_limit=%s, done=%s, next_page=%s" % (
+        return "Paging: page_limit=%s, changes_since=%s, done=%s, next_page=%s" % (
             self.page_limit,
+            self.changes_since,
             self.done,
             self.next_page,
         )
@@ -792,8 +792,10 @@ class Host(ObjectData):
         """Persist changes to host object."""
 
         from nfv_vim import database
+        from nfv_vim import tables
 
         database.database_host_add(self)
+        tables.tables_get_host_table().update_indexes(self.name)
 
     def as_dict(self):
         """Represent host object as dictionary."""
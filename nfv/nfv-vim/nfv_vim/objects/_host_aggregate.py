@@ -50,8 +50,10 @@ class HostAggregate(ObjectData):
         """Persist changes to host aggregate object."""
 
         from nfv_vim import database
+        from nfv_vim import tables
 
         database.database_host_aggregate_add(self)
+        tables.tables_get_host_aggregate_table().update_indexes(self.name)
 
     def as_dict(self):
         """Represent host aggregate object as dictionary."""
@@ -2686,6 +2686,9 @@ class Instance(ObjectData):
 
         if from_host_name != to_host_name:
             self._nfvi_instance.host_name = to_host_name
+            # Lookups by host while the host change is handled have to find
+            # the instance on its new host.
+            tables.tables_get_instance_table().update_indexes(self.uuid)
             self._action_fsm.handle_event(instance_fsm.INSTANCE_EVENT.NFVI_HOST_CHANGED)
             self._elapsed_time_on_host = 0
             self._persist()
@@ -3109,8 +3112,10 @@ class Instance(ObjectData):
         """Persist changes to instance object."""
 
         from nfv_vim import database
+        from nfv_vim import tables
 
         database.database_instance_add(self)
+        tables.tables_get_instance_table().update_indexes(self.uuid)
 
     def as_dict(self):
         """Represent instance object as dictionary."""
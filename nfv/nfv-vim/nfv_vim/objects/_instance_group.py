@@ -140,8 +140,10 @@ class InstanceGroup(ObjectData):
         """Persist changes to instance group object."""
 
         from nfv_vim import database
+        from nfv_vim import tables
 
         database.database_instance_group_add(self)
+        tables.tables_get_instance_group_table().update_indexes(self.uuid)
 
     def as_dict(self):
         """Represent instance group object as dictionary."""
@@ -377,6 +377,16 @@ class SwUpdate(ObjectData):
 
         database.database_sw_update_add(self)
 
+    def _persist_progress(self, phase, stage):
+        """Persist the progress of the strategy of the sw-update object."""
+
+        from nfv_vim import database
+
+        if database.database_sw_update_journal_enabled():
+            database.database_sw_update_journal_add(self, phase, stage)
+        else:
+            self.save()
+
     def _unpersist(self):
         """Unpersist changes to sw-update object."""
 
@@ -387,5 +397,8 @@ class SwUpdate(ObjectData):
     def save(self):
         self._persist()
 
+    def save_progress(self, phase, stage=None):
+        self._persist_progress(phase, stage)
+
     def remove(self):
         self._unpersist()
@@ -3,10 +3,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+from nfv_vim.rpc._rpc_channel import rpc_channel_demultiplex  # noqa: F401
+from nfv_vim.rpc._rpc_channel import RPCChannel  # noqa: F401
+from nfv_vim.rpc._rpc_channel import RPCChannelConnection  # noqa: F401
+from nfv_vim.rpc._rpc_channel import RPCChannelPool  # noqa: F401
+from nfv_vim.rpc._rpc_channel import RPCChannelRequest  # noqa: F401
 from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT  # noqa: F401
 from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE  # noqa: F401
 from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION  # noqa: F401
 from nfv_vim.rpc._rpc_message import RPCMessage  # noqa: F401
+from nfv_vim.rpc._rpc_message_histogram import APIRequestGetHistograms  # noqa: F401
+from nfv_vim.rpc._rpc_message_histogram import APIResponseGetHistograms  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestCreateImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestDeleteImage  # noqa: F401
 from nfv_vim.rpc._rpc_message_image import APIRequestGetImage  # noqa: F401
@@ -42,6 +49,7 @@ from nfv_vim.rpc._rpc_message_instance import APIResponseCreateInstance  # noqa:
 from nfv_vim.rpc._rpc_message_instance import APIResponseDeleteInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseEvacuateInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstance  # noqa: F401
+from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstances  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponsePauseInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseRebootInstance  # noqa: F401
 from nfv_vim.rpc._rpc_message_instance import APIResponseResumeInstance  # noqa: F401
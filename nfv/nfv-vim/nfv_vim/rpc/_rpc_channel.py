@@ -0,0 +1,438 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+import itertools
+import queue
+import select
+import socket
+import threading
+
+from nfv_common import debug
+from nfv_common.helpers import Constant
+from nfv_common.helpers import Constants
+from nfv_common.helpers import Singleton
+from nfv_common import tcp
+from nfv_common import timers
+
+DLOG = debug.debug_get_logger("nfv_vim.rpc.channel")
+
+# Messages of a channel are framed as '@<request-id><frame-type><payload>',
+# messages that do not start with the prefix are one-shot requests on a
+# connection of their own.
+RPC_CHANNEL_PREFIX = b"@"
+
+
+class _RPCChannelFrameType(Constants, metaclass=Singleton):
+    """RPC Channel Frame Type Constants."""
+
+    MESSAGE = Constant(":")
+    END = Constant("!")
+    HEARTBEAT = Constant("?")
+
+
+# Constant Instantiation
+RPC_CHANNEL_FRAME_TYPE = _RPCChannelFrameType()
+
+
+def _rpc_channel_frame(request_id, frame_type, payload=""):
+    """Returns a frame of a channel."""
+
+    return "@%s%s%s" % (request_id, frame_type, payload)
+
+
+def _rpc_channel_parse(msg):
+    """Returns the request id, frame type and payload of a frame of a
+
+    channel, None if the message is not a frame of a channel.
+    """
+    if not msg.startswith(RPC_CHANNEL_PREFIX):
+        return None
+
+    for index in range(1, len(msg)):
+        frame_type = msg[index : index + 1].decode()
+        if frame_type in RPC_CHANNEL_FRAME_TYPE:
+            return int(msg[1:index]), frame_type, msg[index + 1 :]
+    return None
+
+
+class RPCChannelRequest:
+    """RPC Channel Request.
+
+    Takes the place of the connection of a one-shot request for a request
+    received on a channel, the messages sent are tagged with the request
+    id and closing ends the request rather than the channel.
+    """
+
+    def __init__(self, connection, request_id):
+        self._connection = connection
+        self._request_id = request_id
+        self._ended = False
+
+    @property
+    def ip(self):
+        """Returns the ip of the channel."""
+
+        return self._connection.ip
+
+    @property
+    def port(self):
+        """Returns the port of the channel."""
+
+        return self._connection.port
+
+    def is_shutdown(self):
+        """Returns true if the request has ended or the channel has closed."""
+
+        return self._ended or self._connection.is_shutdown()
+
+    def send(self, payload):
+        """Send a response to the request."""
+
+        if self._ended:
+            return 0
+
+        return self._connection.send(
+            _rpc_channel_frame(
+                self._request_id, RPC_CHANNEL_FRAME_TYPE.MESSAGE, payload
+            )
+        )
+
+    def close(self):
+        """End the request."""
+
+        if not self._ended:
+            self._ended = True
+            self._connection.send(
+                _rpc_channel_frame(self._request_id, RPC_CHANNEL_FRAME_TYPE.END)
+            )
+
+
+def rpc_channel_demultiplex(connection, msg):
+    """Returns the connection to respond on and the message of a request,
+
+    heartbeats are answered and return None for the message.
+    """
+    frame = _rpc_channel_parse(msg)
+    if frame is None:
+        return connection, msg
+
+    request_id, frame_type, payload = frame
+    if RPC_CHANNEL_FRAME_TYPE.HEARTBEAT == frame_type:
+        connection.send(_rpc_channel_frame(request_id, RPC_CHANNEL_FRAME_TYPE.END))
+        return connection, None
+
+    if RPC_CHANNEL_FRAME_TYPE.MESSAGE != frame_type:
+        DLOG.info(
+            "Unexpected frame type %s received, request_id=%s."
+            % (frame_type, request_id)
+        )
+        return connection, None
+
+    return RPCChannelRequest(connection, request_id), payload
+
+
+class RPCChannelConnection:
+    """RPC Channel Connection.
+
+    Takes the place of a connection for one request sent on a channel, it
+    receives the responses to the request until the request is ended, the
+    channel fails or the receive times out.
+    """
+
+    def __init__(self, channel, request_id):
+        self._channel = channel
+        self._request_id = request_id
+        self._responses = queue.Queue()
+        self._ended = False
+
+    @property
+    def request_id(self):
+        """Returns the request id."""
+
+        return self._request_id
+
+    def is_shutdown(self):
+        """Returns true if the request has ended."""
+
+        return self._ended
+
+    def send(self, payload):
+        """Send the request."""
+
+        return self._channel.send(self._request_id, payload)
+
+    def deliver(self, response):
+        """Deliver a response, None ends the request."""
+
+        self._responses.put(response)
+
+    def receive(self, blocking=True, timeout_in_secs=5):
+        """Receive a response, returns None if there are no more responses."""
+
+        if self._ended:
+            return None
+
+        try:
+            if blocking:
+                response = self._responses.get(timeout=timeout_in_secs)
+            else:
+                response = self._responses.get_nowait()
+
+        except queue.Empty:
+            if blocking:
+                DLOG.info(
+                    "Timed out waiting for a response, request_id=%s."
+                    % self._request_id
+                )
+            return None
+
+        if response is None:
+            self._ended = True
+        return response
+
+    def close(self):
+        """Finished with the request, late responses are dropped."""
+
+        self._ended = True
+        self._channel.request_done(self._request_id)
+
+
+class RPCChannel:
+    """RPC Channel.
+
+    A long-lived connection carrying many outstanding requests, each tagged
+    with a request id so that responses can be matched out of order.  A
+    reader thread receives the responses and sends a heartbeat when the
+    channel has been idle for heartbeat_interval_secs, the channel fails
+    if nothing has been received for heartbeat_timeout_secs.
+    """
+
+    def __init__(
+        self,
+        local_ip,
+        local_port,
+        ip,
+        port,
+        heartbeat_interval_secs=5,
+        heartbeat_timeout_secs=30,
+    ):
+        self._ip = ip
+        self._port = port
+        self._heartbeat_interval_secs = heartbeat_interval_secs
+        self._heartbeat_timeout_ms = heartbeat_timeout_secs * 1000
+        # The lock guards the outstanding requests and is never held while
+        # sending, so that the reader can deliver responses while a send is
+        # blocked waiting for the peer, the send lock keeps frames whole.
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._requests = {}
+        self._alive = True
+        self._last_received_ms = timers.get_monotonic_timestamp_in_ms()
+        self._connection = tcp.TCPConnection(local_ip, local_port)
+        self._connection.connect(ip, port)
+        self._thread = threading.Thread(
+            target=self._reader, name="rpc-channel-%s" % self._connection.port
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def is_alive(self):
+        """Returns true if the channel has not failed."""
+
+        return self._alive
+
+    @property
+    def outstanding(self):
+        """Returns the number of outstanding requests."""
+
+        return len(self._requests)
+
+    def open_connection(self):
+        """Returns a connection for a new request."""
+
+        with self._lock:
+            request_id = next(self._request_ids)
+            connection = RPCChannelConnection(self, request_id)
+            self._requests[request_id] = connection
+
+        if not self._alive:
+            connection.deliver(None)
+        return connection
+
+    def request_done(self, request_id):
+        """Finished with a request."""
+
+        with self._lock:
+            self._requests.pop(request_id, None)
+
+    def _send_frame(self, frame):
+        """Send a frame, returns the bytes sent."""
+
+        with self._send_lock:
+            if not self._alive:
+                return 0
+            return self._connection.send(frame)
+
+    def send(self, request_id, payload):
+        """Send a request."""
+
+        return self._send_frame(
+            _rpc_channel_frame(request_id, RPC_CHANNEL_FRAME_TYPE.MESSAGE, payload)
+        )
+
+    def _heartbeat(self):
+        """Send a heartbeat, checking that the channel is alive."""
+
+        # No heartbeat is needed while a send is in progress, and the reader
+        # must not wait behind a send blocked on the peer.
+        if not self._send_lock.acquire(blocking=False):
+            return
+        try:
+            if self._alive:
+                self._connection.send(
+                    _rpc_channel_frame(0, RPC_CHANNEL_FRAME_TYPE.HEARTBEAT)
+                )
+        finally:
+            self._send_lock.release()
+
+    def _deliver(self, msg):
+        """Deliver a frame received to its request."""
+
+        frame = _rpc_channel_parse(msg)
+        if frame is None:
+            DLOG.info("Unexpected message received on channel, msg=%s." % msg)
+            return
+
+        request_id, frame_type, payload = frame
+        with self._lock:
+            connection = self._requests.get(request_id, None)
+
+        if connection is not None:
+            if RPC_CHANNEL_FRAME_TYPE.MESSAGE == frame_type:
+                connection.deliver(payload)
+            else:
+                connection.deliver(None)
+
+    def _reader(self):
+        """Receive frames until the channel fails."""
+
+        try:
+            while not self._connection.is_shutdown():
+                readable, _, _ = select.select(
+                    [self._connection.selobj], [], [], self._heartbeat_interval_secs
+                )
+                now_ms = timers.get_monotonic_timestamp_in_ms()
+                if readable:
+                    self._last_received_ms = now_ms
+                    msg = self._connection.receive(blocking=False)
+                    while msg is not None:
+                        self._deliver(msg)
+                        msg = self._connection.receive_buffered()
+
+                elif self._heartbeat_timeout_ms <= now_ms - self._last_received_ms:
+                    DLOG.error(
+                        "RPC channel to %s, port=%s, missed heartbeats."
+                        % (self._ip, self._port)
+                    )
+                    break
+
+                else:
+                    self._heartbeat()
+
+        except Exception as e:
+            DLOG.exception("Caught exception in RPC channel reader, error=%s." % e)
+
+        finally:
+            self._fail()
+
+    def _fail(self):
+        """Fail the channel, ending the outstanding requests."""
+
+        with self._lock:
+            self._alive = False
+            requests = list(self._requests.values())
+            self._requests.clear()
+
+        DLOG.info(
+            "RPC channel to %s, port=%s, closed, outstanding=%s."
+            % (self._ip, self._port, len(requests))
+        )
+        for connection in requests:
+            connection.deliver(None)
+        self._connection.close()
+
+    def close(self):
+        """Close the channel."""
+
+        with self._lock:
+            self._alive = False
+
+        sock = self._connection.sock
+        if sock is not None:
+            try:
+                # Wake up the reader, which closes the connection.
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class RPCChannelPool:
+    """RPC Channel Pool.
+
+    Spreads requests over a small set of channels, replacing channels that
+    have failed.
+    """
+
+    def __init__(
+        self,
+        local_ip,
+        local_port,
+        ip,
+        port,
+        num_channels=2,
+        heartbeat_interval_secs=5,
+        heartbeat_timeout_secs=30,
+    ):
+        self._local_ip = local_ip
+        self._local_port = local_port
+        self._ip = ip
+        self._port = port
+        self._heartbeat_interval_secs = heartbeat_interval_secs
+        self._heartbeat_timeout_secs = heartbeat_timeout_secs
+        self._channels = [None] * max(1, num_channels)
+        self._lock = threading.Lock()
+
+    def _get_channel(self):
+        """Returns the channel with the fewest outstanding requests."""
+
+        with self._lock:
+            for index, channel in enumerate(self._channels):
+                if channel is None or not channel.is_alive:
+                    channel = RPCChannel(
+                        self._local_ip,
+                        self._local_port,
+                        self._ip,
+                        self._port,
+                        self._heartbeat_interval_secs,
+                        self._heartbeat_timeout_secs,
+                    )
+                    self._channels[index] = channel
+            return min(self._channels, key=lambda x: x.outstanding)
+
+    def open_connection(self):
+        """Returns a connection for a new request."""
+
+        return self._get_channel().open_connection()
+
+    def close(self):
+        """Close the channels."""
+
+        with self._lock:
+            for channel in self._channels:
+                if channel is not None:
+                    channel.close()
+            self._channels = [None] * len(self._channels)
@@ -68,6 +68,7 @@ class _RPCMessageType(Constants, metaclass=Singleton):
     DELETE_INSTANCE_RESPONSE = Constant("delete-instance-response")
     GET_INSTANCE_REQUEST = Constant("get-instance-request")
     GET_INSTANCE_RESPONSE = Constant("get-instance-response")
+    GET_INSTANCES_RESPONSE = Constant("get-instances-response")
 
     # Subnet Definitions
     CREATE_SUBNET_REQUEST = Constant("create-subnet-request")
@@ -111,6 +112,10 @@ class _RPCMessageType(Constants, metaclass=Singleton):
     GET_SW_UPDATE_STRATEGY_REQUEST = Constant("get-sw-update-strategy-request")
     GET_SW_UPDATE_STRATEGY_RESPONSE = Constant("get-sw-update-strategy-response")
 
+    # Histogram Definitions
+    GET_HISTOGRAMS_REQUEST = Constant("get-histograms-request")
+    GET_HISTOGRAMS_RESPONSE = Constant("get-histograms-response")
+
 
 class _RPCMessageResult(Constants, metaclass=Singleton):
     """RPC Message Result Constants."""
@@ -103,6 +103,7 @@ class RPCMessageFactory:
     from nfv_vim.rpc._rpc_message_instance import APIResponseDeleteInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseEvacuateInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstance
+    from nfv_vim.rpc._rpc_message_instance import APIResponseGetInstances
     from nfv_vim.rpc._rpc_message_instance import APIResponseLiveMigrateInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponsePauseInstance
     from nfv_vim.rpc._rpc_message_instance import APIResponseRebootInstance
@@ -149,6 +150,9 @@ class RPCMessageFactory:
     from nfv_vim.rpc._rpc_message_sw_update import APIResponseDeleteSwUpdateStrategy
     from nfv_vim.rpc._rpc_message_sw_update import APIResponseGetSwUpdateStrategy
 
+    from nfv_vim.rpc._rpc_message_histogram import APIRequestGetHistograms
+    from nfv_vim.rpc._rpc_message_histogram import APIResponseGetHistograms
+
     _rpc_msg_class_map = {
         # Image Mapping
         RPC_MSG_TYPE.CREATE_IMAGE_REQUEST: APIRequestCreateImage,
@@ -195,6 +199,7 @@ class RPCMessageFactory:
         RPC_MSG_TYPE.DELETE_INSTANCE_RESPONSE: APIResponseDeleteInstance,
         RPC_MSG_TYPE.GET_INSTANCE_REQUEST: APIRequestGetInstance,
         RPC_MSG_TYPE.GET_INSTANCE_RESPONSE: APIResponseGetInstance,
+        RPC_MSG_TYPE.GET_INSTANCES_RESPONSE: APIResponseGetInstances,
         # Subnet Mapping
         RPC_MSG_TYPE.CREATE_SUBNET_REQUEST: APIRequestCreateSubnet,
         RPC_MSG_TYPE.CREATE_SUBNET_RESPONSE: APIResponseCreateSubnet,
@@ -248,6 +253,9 @@ class RPCMessageFactory:
         ),
         RPC_MSG_TYPE.GET_SW_UPDATE_STRATEGY_REQUEST: APIRequestGetSwUpdateStrategy,
         RPC_MSG_TYPE.GET_SW_UPDATE_STRATEGY_RESPONSE: APIResponseGetSwUpdateStrategy,
+        # Histogram Mapping
+        RPC_MSG_TYPE.GET_HISTOGRAMS_REQUEST: APIRequestGetHistograms,
+        RPC_MSG_TYPE.GET_HISTOGRAMS_RESPONSE: APIResponseGetHistograms,
     }
 
     @classmethod
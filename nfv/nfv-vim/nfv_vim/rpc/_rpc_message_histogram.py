@@ -0,0 +1,59 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_common import debug
+from nfv_vim.rpc._rpc_defs import RPC_MSG_RESULT
+from nfv_vim.rpc._rpc_defs import RPC_MSG_TYPE
+from nfv_vim.rpc._rpc_defs import RPC_MSG_VERSION
+from nfv_vim.rpc._rpc_message import RPCMessage
+
+DLOG = debug.debug_get_logger("nfv_vim.rpc.histogram")
+
+
+class APIRequestGetHistograms(RPCMessage):
+    """RPC API Request Message - Get Histograms."""
+
+    filter_by_name = None
+
+    def __init__(
+        self,
+        msg_version=RPC_MSG_VERSION.VERSION_1_0,
+        msg_type=RPC_MSG_TYPE.GET_HISTOGRAMS_REQUEST,
+        msg_result=RPC_MSG_RESULT.SUCCESS,
+    ):
+        super().__init__(msg_version, msg_type, msg_result)
+
+    def serialize_payload(self, msg):
+        msg["filter_by_name"] = self.filter_by_name
+
+    def deserialize_payload(self, msg):
+        self.filter_by_name = msg.get("filter_by_name", None)
+
+    def __str__(self):
+        return "get-histograms request: %s" % self.filter_by_name
+
+
+class APIResponseGetHistograms(RPCMessage):
+    """RPC API Response Message - Get Histograms."""
+
+    histograms = None
+
+    def __init__(
+        self,
+        msg_version=RPC_MSG_VERSION.VERSION_1_0,
+        msg_type=RPC_MSG_TYPE.GET_HISTOGRAMS_RESPONSE,
+        msg_result=RPC_MSG_RESULT.SUCCESS,
+    ):
+        super().__init__(msg_version, msg_type, msg_result)
+        self.histograms = []
+
+    def serialize_payload(self, msg):
+        msg["histograms"] = self.histograms
+
+    def deserialize_payload(self, msg):
+        self.histograms = msg.get("histograms", [])
+
+    def __str__(self):
+        return "get-histograms response: %s histograms" % len(self.histograms)
@@ -660,6 +660,13 @@ class APIRequestGetInstance(RPCMessage):
 
     get_all = False
     filter_by_uuid = None
+    filter_by_host = None
+    filter_by_state = None
+    filter_by_tenant = None
+    limit = None
+    marker = None
+    fields = None
+    batch_size = None
 
     def __init__(
         self,
@@ -672,14 +679,38 @@ class APIRequestGetInstance(RPCMessage):
     def serialize_payload(self, msg):
         msg["get_all"] = self.get_all
         msg["filter_by_uuid"] = self.filter_by_uuid
+        msg["filter_by_host"] = self.filter_by_host
+        msg["filter_by_state"] = self.filter_by_state
+        msg["filter_by_tenant"] = self.filter_by_tenant
+        msg["limit"] = self.limit
+        msg["marker"] = self.marker
+        msg["fields"] = self.fields
+        msg["batch_size"] = self.batch_size
 
     def deserialize_payload(self, msg):
         self.get_all = msg.get("get_all", True)
         self.filter_by_uuid = msg.get("filter_by_uuid", None)
+        self.filter_by_host = msg.get("filter_by_host", None)
+        self.filter_by_state = msg.get("filter_by_state", None)
+        self.filter_by_tenant = msg.get("filter_by_tenant", None)
+        self.limit = msg.get("limit", None)
+        self.marker = msg.get("marker", None)
+        self.fields = msg.get("fields", None)
+        self.batch_size = msg.get("batch_size", None)
 
     def __str__(self):
         if self.get_all:
-            return "get-instance request: get-all"
+            return (
+                "get-instance request: get-all, host=%s, state=%s, tenant=%s, "
+                "limit=%s, marker=%s"
+                % (
+                    self.filter_by_host,
+                    self.filter_by_state,
+                    self.filter_by_tenant,
+                    self.limit,
+                    self.marker,
+                )
+            )
         return "get-instance request: %s" % self.filter_by_uuid
 
 
@@ -757,3 +788,61 @@ class APIResponseGetInstance(RPCMessage):
 
     def __str__(self):
         return "get-instance response: %s" % self.uuid
+
+
+class APIResponseGetInstances(RPCMessage):
+    """RPC API Response Message - Get Instances.
+
+    A batch of instances, each encoded as the payload of a Get-Instance
+    response holding the fields asked for.  The last batch gives the marker
+    for the next page if the limit was reached.
+    """
+
+    instances = None
+    next_marker = None
+
+    def __init__(
+        self,
+        msg_version=RPC_MSG_VERSION.VERSION_1_0,
+        msg_type=RPC_MSG_TYPE.GET_INSTANCES_RESPONSE,
+        msg_result=RPC_MSG_RESULT.SUCCESS,
+    ):
+        super().__init__(msg_version, msg_type, msg_result)
+        self.instances = []
+
+    def add_instance(self, response, fields=None):
+        """Add the payload of a Get-Instance response to the batch."""
+
+        instance = {}
+        response.serialize_payload(instance)
+        if fields:
+            instance = {
+                key: value
+                for key, value in instance.items()
+                if key in fields or "uuid" == key
+            }
+        self.instances.append(instance)
+
+    def get_instances(self):
+        """Returns the Get-Instance responses of the batch."""
+
+        responses = []
+        for instance in self.instances:
+            response = APIResponseGetInstance()
+            response.deserialize_payload(instance)
+            responses.append(response)
+        return responses
+
+    def serialize_payload(self, msg):
+        msg["instances"] = self.instances
+        msg["next_marker"] = self.next_marker
+
+    def deserialize_payload(self, msg):
+        self.instances = msg.get("instances", [])
+        self.next_marker = msg.get("next_marker", None)
+
+    def __str__(self):
+        return "get-instances response: %s instances, next_marker=%s" % (
+            len(self.instances),
+            self.next_marker,
+        )
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+from nfv_common import debug
+
+DLOG = debug.debug_get_logger("nfv_vim.strategy.host_grouping")
+
+
+class HostGrouping:
+    """Host Grouping.
+
+    Groups hosts into lists of hosts to be updated in parallel. A host is
+    added to the first list that is not full, that has no host it conflicts
+    with and in which no aggregate of the host has reached its limit, else to
+    a new list. This is a greedy colouring of the host conflict graph, with
+    each colour packed up to the maximum number of hosts.
+
+    Hosts conflict if they share a conflict key, such as an instance group
+    with an anti-affinity policy that has instances on both hosts. The keys
+    and the aggregate counts of every list are kept, so placing a host costs
+    a set intersection per list rather than comparing it with every host of
+    every list.
+    """
+
+    def __init__(self, max_hosts, aggregate_limits=None):
+        self._max_hosts = max_hosts
+        if aggregate_limits is None:
+            aggregate_limits = dict()
+        self._aggregate_limits = aggregate_limits
+        self._host_lists = []
+        self._list_conflict_keys = []
+        self._list_aggregate_counts = []
+        self._open_lists = []
+
+    @property
+    def host_lists(self):
+        """Returns the lists of hosts."""
+
+        return self._host_lists
+
+    def _aggregate_limit_reached(self, aggregate_counts, aggregate_names):
+        """Returns true if adding a host in the given aggregates to a list
+
+        would exceed the limit of one of its aggregates.
+        """
+        for aggregate_name in aggregate_names:
+            if aggregate_name in aggregate_counts:
+                if (
+                    aggregate_counts[aggregate_name]
+                    == self._aggregate_limits[aggregate_name]
+                ):
+                    return True
+        return False
+
+    def add_host(self, host, conflict_keys=frozenset(), aggregate_names=()):
+        """Add a host to the first list that can take it, else to a new list."""
+
+        for idx in self._open_lists:
+            if not self._list_conflict_keys[idx].isdisjoint(conflict_keys):
+                continue
+
+            aggregate_counts = self._list_aggregate_counts[idx]
+            if self._aggregate_limit_reached(aggregate_counts, aggregate_names):
+                continue
+
+            host_list = self._host_lists[idx]
+            host_list.append(host)
+            self._list_conflict_keys[idx].update(conflict_keys)
+            for aggregate_name in aggregate_names:
+                aggregate_counts[aggregate_name] = (
+                    aggregate_counts.get(aggregate_name, 0) + 1
+                )
+            if self._max_hosts <= len(host_list):
+                self._open_lists.remove(idx)
+            DLOG.debug("Host %s added to host list %s.", host.name, idx)
+            return idx
+
+        idx = len(self._host_lists)
+        self._host_lists.append([host])
+        self._list_conflict_keys.append(set(conflict_keys))
+        self._list_aggregate_counts.append(
+            {aggregate_name: 1 for aggregate_name in aggregate_names}
+        )
+        if self._max_hosts > 1:
+            self._open_lists.append(idx)
+        DLOG.debug("Host %s added to new host list %s.", host.name, idx)
+        return idx
@@ -25,6 +25,7 @@ from nfv_vim.objects import HOST_SERVICES
 from nfv_vim.objects import INSTANCE_GROUP_POLICY
 from nfv_vim.objects import SW_UPDATE_APPLY_TYPE
 from nfv_vim.objects import SW_UPDATE_INSTANCE_ACTION
+from nfv_vim.strategy._host_grouping import HostGrouping
 from nfv_vim.strategy._utils import normalize_release
 from nfv_vim.strategy._utils import parse_version
 from nfv_vim.strategy.stages._kube_upgrade_stages import KubeUpgradeStages
@@ -126,6 +127,14 @@ class SwUpdateStrategy(strategy.Strategy):
         if self.sw_update_obj is not None:
             self.sw_update_obj.save()
 
+    def save_progress(self, phase, stage=None):
+        """Save the progress of a phase, or of one of its stages, of the
+
+        software update strategy.
+        """
+        if self.sw_update_obj is not None:
+            self.sw_update_obj.save_progress(phase, stage)
+
     def _create_alarm_pre_check_step(self):
         """Create the appropriate alarm pre-check step for this strategy.
 
@@ -213,19 +222,22 @@ class SwUpdateStrategy(strategy.Strategy):
 
         from nfv_vim import tables
 
-        def has_policy_conflict(peer_host):
+        def host_conflict_keys():
+            """Returns the instance groups with an anti-affinity policy that
+
+            have instances on the host, hosts sharing one of these groups
+            can't be updated at the same time.
+            """
+            conflict_keys = set()
             for instance in instance_table.on_host(host.name):
-                for peer_instance in instance_table.on_host(peer_host.name):
+                for instance_group in instance_group_table.get_by_instance(
+                    instance.uuid
+                ):
                     for policy in policies:
-                        if instance_group_table.same_group(
-                            policy, instance.uuid, peer_instance.uuid
-                        ):
-                            return True
-            DLOG.debug(
-                "No instance group policy conflict between host %s and "
-                "host %s." % (host.name, peer_host.name)
-            )
-            return False
+                        if policy in instance_group.policies:
+                            conflict_keys.add(instance_group.uuid)
+                            break
+            return conflict_keys
 
         def calculate_host_aggregate_limits():
             """Calculate limit for each host aggregate."""
@@ -254,40 +266,6 @@ class SwUpdateStrategy(strategy.Strategy):
                         1, int(aggregate_count * aggregate_ratio)
                     )
 
-        def aggregate_limit_reached():
-            """Determine whether adding this host to a host_list would exceed
-
-            the number of hosts to be updated in the same aggregate
-            Note: This isn't efficient, because we will be calling the
-            host_aggregate_table.get_by_host many times, which will traverse
-            all the aggregates each time. It would be more efficient to
-            create a dictionary mapping host names to a list of aggregates
-            for that host. We could do this once and then use it to more
-            quickly calculate the host_aggregate_count here.
-            """
-
-            # count the number of hosts from the current host_list in each aggregate
-            host_aggregate_count = {}
-            for existing_host in host_list:
-                for aggregate in host_aggregate_table.get_by_host(existing_host.name):
-                    if aggregate.name in host_aggregate_count:
-                        host_aggregate_count[aggregate.name] += 1
-                    else:
-                        host_aggregate_count[aggregate.name] = 1
-
-            # now check whether adding the current host will exceed the limit
-            # for any aggregate
-            for aggregate in host_aggregate_table.get_by_host(host.name):
-                if aggregate.name in host_aggregate_count:
-                    if (
-                        host_aggregate_count[aggregate.name]
-                        == host_aggregate_limit[aggregate.name]
-                    ):
-                        return True
-
-            DLOG.debug("No host aggregate limit reached for host %s." % (host.name))
-            return False
-
         instance_table = tables.tables_get_instance_table()
         instance_group_table = tables.tables_get_instance_group_table()
 
@@ -351,6 +329,9 @@ class SwUpdateStrategy(strategy.Strategy):
             host_aggregate_table = tables.tables_get_host_aggregate_table()
             host_aggregate_limit = {}
             calculate_host_aggregate_limits()
+            host_grouping = HostGrouping(
+                self._max_parallel_worker_hosts, host_aggregate_limit
+            )
             controller_list = []
             host_lists.append([])  # start with empty list of workers
 
@@ -369,27 +350,13 @@ class SwUpdateStrategy(strategy.Strategy):
                     continue
 
                 # find the first list that can add this host else create a new list
-                for idx in range(1, len(host_lists), 1):
-                    host_list = host_lists[idx]
-                    if len(host_list) >= self._max_parallel_worker_hosts:
-                        # this list is full - don't add the host
-                        continue
-
-                    for peer_host in host_list:
-                        if has_policy_conflict(peer_host):
-                            # don't add host to the current list
-                            break
-                    else:
-                        if aggregate_limit_reached():
-                            # don't add host to the current list
-                            continue
+                host_aggregate_names = [
+                    aggregate.name
+                    for aggregate in host_aggregate_table.get_by_host(host.name)
+                ]
+                host_grouping.add_host(host, host_conflict_keys(), host_aggregate_names)
 
-                        # add host to the current list
-                        host_list.append(host)
-                        break
-                else:
-                    # create a new list with this host
-                    host_lists.append([host])
+            host_lists += host_grouping.host_lists
 
             if controller_list:
                 # handle controller hosts first
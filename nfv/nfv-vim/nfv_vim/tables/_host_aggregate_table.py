@@ -9,26 +9,30 @@ from nfv_vim.tables._table import Table
 _host_aggregate_table = None
 
 
+def _host_aggregate_host_names(host_aggregate):
+    """Returns the host index keys of a host aggregate."""
+
+    return host_aggregate.host_names
+
+
 class HostAggregateTable(Table):
     """Host Aggregate Table."""
 
+    _indexes = {"host_name": _host_aggregate_host_names}
+
     @staticmethod
     def get_by_host(host_name):
-        for host_aggregate_name in list(_host_aggregate_table.keys()):
-            host_aggregate = _host_aggregate_table[host_aggregate_name]
-            if host_name in host_aggregate.host_names:
-                yield host_aggregate
+        for host_aggregate in _host_aggregate_table.lookup("host_name", host_name):
+            yield host_aggregate
 
     @staticmethod
     def same_aggregate(host_name, peer_host_name):
-        for host_aggregate_name in list(_host_aggregate_table.keys()):
-            host_aggregate = _host_aggregate_table[host_aggregate_name]
-
-            if (
-                host_name in host_aggregate.host_names
-                and peer_host_name in host_aggregate.host_names
-            ):
-                return True
+        host_aggregate_names = _host_aggregate_table.lookup_keys("host_name", host_name)
+        peer_host_aggregate_names = _host_aggregate_table.lookup_keys(
+            "host_name", peer_host_name
+        )
+        if host_aggregate_names & peer_host_aggregate_names:
+            return True
         return False
 
     def _persist_value(self, value):
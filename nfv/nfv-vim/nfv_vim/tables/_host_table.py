@@ -9,29 +9,42 @@ from nfv_vim.tables._table import Table
 _host_table = None
 
 
+def _host_uuids(host):
+    """Returns the uuid index keys of a host."""
+
+    return (host.uuid,)
+
+
+def _host_personalities(host):
+    """Returns the personality index keys of a host, a host can have more
+
+    than one personality, such as controller,worker.
+    """
+    personality = host.personality
+    if isinstance(personality, str):
+        return [x.strip() for x in personality.split(",")]
+    return list(personality)
+
+
 class HostTable(Table):
     """Host Table."""
 
+    _indexes = {"uuid": _host_uuids, "personality": _host_personalities}
+
     @staticmethod
     def get_by_uuid(host_uuid):
-        for hostname in list(_host_table.keys()):
-            if _host_table[hostname].uuid == host_uuid:
-                return _host_table[hostname]
+        for host in _host_table.lookup("uuid", host_uuid):
+            return host
         return None
 
     @staticmethod
     def get_by_personality(host_personality):
-        for hostname in list(_host_table.keys()):
-            if host_personality in _host_table[hostname].personality:
-                yield _host_table[hostname]
+        for host in _host_table.lookup("personality", host_personality):
+            yield host
 
     @staticmethod
     def total_by_personality(host_personality):
-        count = 0
-        for hostname in list(_host_table.keys()):
-            if host_personality in _host_table[hostname].personality:
-                count += 1
-        return count
+        return len(_host_table.lookup_keys("personality", host_personality))
 
     def _persist_value(self, value):
         database.database_host_add(value)
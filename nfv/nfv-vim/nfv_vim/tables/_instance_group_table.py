@@ -9,16 +9,23 @@ from nfv_vim.tables._table import Table
 _instance_group_table = None
 
 
+def _instance_group_member_uuids(instance_group):
+    """Returns the instance index keys of an instance group."""
+
+    return instance_group.member_uuids
+
+
 class InstanceGroupTable(Table):
     """Instance Group Table."""
 
+    _indexes = {"member_uuid": _instance_group_member_uuids}
+
     @staticmethod
     def get_by_instance(instance_uuid):
-        for instance_group_uuid in list(_instance_group_table.keys()):
-            instance_group = _instance_group_table[instance_group_uuid]
-            for member_uuid in instance_group.member_uuids:
-                if instance_uuid == member_uuid:
-                    yield instance_group
+        for instance_group in _instance_group_table.lookup(
+            "member_uuid", instance_uuid
+        ):
+            yield instance_group
 
     @staticmethod
     def get_by_policy(instance_policy):
@@ -30,16 +37,15 @@ class InstanceGroupTable(Table):
 
     @staticmethod
     def same_group(instance_policy, instance_uuid, peer_instance_uuid):
-        for instance_group_uuid in list(_instance_group_table.keys()):
+        instance_group_uuids = _instance_group_table.lookup_keys(
+            "member_uuid", instance_uuid
+        )
+        peer_instance_group_uuids = _instance_group_table.lookup_keys(
+            "member_uuid", peer_instance_uuid
+        )
+        for instance_group_uuid in instance_group_uuids & peer_instance_group_uuids:
             instance_group = _instance_group_table[instance_group_uuid]
-
-            if instance_policy not in instance_group.policies:
-                continue
-
-            if (
-                instance_uuid in instance_group.member_uuids
-                and peer_instance_uuid in instance_group.member_uuids
-            ):
+            if instance_policy in instance_group.policies:
                 return True
         return False
 
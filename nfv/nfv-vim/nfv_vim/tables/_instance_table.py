@@ -9,18 +9,24 @@ from nfv_vim.tables._table import Table
 _instance_table = None
 
 
+def _instance_host_names(instance):
+    """Returns the host index keys of an instance."""
+
+    return (instance.host_name,)
+
+
 class InstanceTable(Table):
     """Instance Table."""
 
+    _indexes = {"host_name": _instance_host_names}
+
     def on_host(self, host_name):
-        for instance in list(self._entries.values()):
-            if instance.on_host(host_name):
-                yield instance
+        for instance in self.lookup("host_name", host_name):
+            yield instance
 
     def exist_on_host(self, host_name):
-        for instance in list(self._entries.values()):
-            if instance.on_host(host_name):
-                return True
+        if self.lookup_keys("host_name", host_name):
+            return True
         return False
 
     def _persist_value(self, value):
@@ -7,13 +7,25 @@ import collections
 
 
 class Table(collections.abc.MutableMapping):
-    """Generic Table Class."""
+    """Generic Table Class.
+
+    Sub-classes can declare secondary indexes in _indexes, a dictionary of
+    index name to a function returning the index keys of a value.  Indexes
+    are maintained as values are added and removed, and are refreshed for a
+    value by update_indexes when the attributes they are built from change.
+    """
+
+    _indexes = {}
 
     def __init__(self):
         """Initialize Table."""
 
         self._persist = True
         self._entries = {}
+        self._index_entries = {index_name: {} for index_name in self._indexes}
+        self._index_keys = {}
+        self._index_order = {}
+        self._index_sequence = 0
 
     @property
     def persist(self):
@@ -39,6 +51,100 @@ class Table(collections.abc.MutableMapping):
         a persisted value from a file or database, if needed.
         """
 
+    def _index_add(self, key, value):
+        """Add a value to the secondary indexes."""
+
+        if key not in self._index_order:
+            # Remember where the value sits in the table, so lookups return
+            # values in the same order as iterating over the table.
+            self._index_order[key] = self._index_sequence
+            self._index_sequence += 1
+
+        index_keys = {}
+        for index_name, get_index_keys in self._indexes.items():
+            index_keys[index_name] = frozenset(get_index_keys(value))
+            index_entries = self._index_entries[index_name]
+            for index_key in index_keys[index_name]:
+                index_entries.setdefault(index_key, set()).add(key)
+        self._index_keys[key] = index_keys
+
+    def _index_remove(self, key):
+        """Remove a value from the secondary indexes."""
+
+        index_keys = self._index_keys.pop(key, None)
+        if index_keys is None:
+            return
+
+        for index_name, keys in index_keys.items():
+            index_entries = self._index_entries[index_name]
+            for index_key in keys:
+                entry_keys = index_entries.get(index_key, None)
+                if entry_keys is not None:
+                    entry_keys.discard(key)
+                    if not entry_keys:
+                        del index_entries[index_key]
+
+    def update_indexes(self, key):
+        """Update the secondary indexes of a value, called when the
+
+        attributes the indexes are built from may have changed.
+        """
+        if not self._indexes or key not in self._entries:
+            return
+
+        value = self._entries[key]
+        index_keys = self._index_keys.get(key, None)
+        if index_keys is not None:
+            for index_name, get_index_keys in self._indexes.items():
+                if index_keys[index_name] != frozenset(get_index_keys(value)):
+                    break
+            else:
+                return
+
+        self._index_remove(key)
+        self._index_add(key, value)
+
+    def lookup_keys(self, index_name, index_key):
+        """Returns the keys of the values with the given key in a secondary
+
+        index.
+        """
+        return frozenset(self._index_entries[index_name].get(index_key, ()))
+
+    def lookup(self, index_name, index_key):
+        """Returns the values with the given key in a secondary index."""
+
+        keys = self._index_entries[index_name].get(index_key, ())
+        return [self._entries[key] for key in sorted(keys, key=self._index_order.get)]
+
+    def check_indexes(self):
+        """Returns a list of the differences between the secondary indexes
+
+        and indexes rebuilt from the current values, empty if consistent.
+        """
+        errors = list()
+        for index_name, get_index_keys in self._indexes.items():
+            expected = {}
+            for key, value in self._entries.items():
+                for index_key in get_index_keys(value):
+                    expected.setdefault(index_key, set()).add(key)
+
+            actual = self._index_entries[index_name]
+            for index_key in set(expected) | set(actual):
+                expected_keys = expected.get(index_key, set())
+                actual_keys = actual.get(index_key, set())
+                if expected_keys != actual_keys:
+                    errors.append(
+                        "index %s, key %s: expected %s, found %s"
+                        % (
+                            index_name,
+                            index_key,
+                            sorted(expected_keys),
+                            sorted(actual_keys),
+                        )
+                    )
+        return errors
+
     def __getitem__(self, key):
         """Get an item from the table based on a key."""
 
@@ -50,7 +156,11 @@ class Table(collections.abc.MutableMapping):
         if value is not None and self._persist:
             self._persist_value(value)
 
+        if self._indexes:
+            self._index_remove(key)
         self._entries[key] = value
+        if self._indexes and value is not None:
+            self._index_add(key, value)
 
     def __delitem__(self, key):
         """Delete an item from the table."""
@@ -58,6 +168,9 @@ class Table(collections.abc.MutableMapping):
         if key is not None and self._persist:
             self._unpersist_value(key)
         del self._entries[key]
+        if self._indexes:
+            self._index_remove(key)
+            self._index_order.pop(key, None)
 
     def __contains__(self, key):
         """Determine if entry exists in the table."""
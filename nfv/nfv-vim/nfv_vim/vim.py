@@ -38,12 +38,14 @@ stay_on = True
 do_reload = False
 dump_data_captured = False
 reset_data_captured = False
+toggle_profiling = False
 
 
 def process_signal_handler(signum, frame):
     """Virtual Infrastructure Manager - Process Signal Handler."""
 
     global stay_on, do_reload, dump_data_captured, reset_data_captured
+    global toggle_profiling
 
     if signal.SIGTERM == signum:
         stay_on = False
@@ -55,6 +57,8 @@ def process_signal_handler(signum, frame):
         dump_data_captured = True
     elif signal.SIGUSR2 == signum:
         reset_data_captured = True
+    elif signal.SIGPROF == signum:
+        toggle_profiling = True
     else:
         print("Ignoring signal")
 
@@ -65,13 +69,14 @@ def process_initialize():
     init_complete = True
 
     debug.debug_initialize(config.CONF["debug"], "VIM")
-    profiler.profiler_initialize()
-    selobj.selobj_initialize()
+    profiler.profiler_initialize(config.CONF.get("profiler", None), "VIM")
+    selobj.selobj_initialize(config.CONF.get("selobj", None))
     timers.timers_initialize(
         PROCESS_TICK_INTERVAL_IN_MS,
         PROCESS_TICK_MAX_DELAY_IN_MS,
         PROCESS_TICK_DELAY_DEBOUNCE_IN_MS,
     )
+    histogram.histogram_initialize(config.CONF.get("histogram", None), "VIM")
     schedule.schedule_initialize()
     event_log.event_log_initialize(config.CONF["event-log"])
     alarm.alarm_initialize(config.CONF["alarm"])
@@ -118,6 +123,7 @@ def process_finalize():
     alarm.alarm_finalize()
     event_log.event_log_finalize()
     schedule.schedule_finalize()
+    histogram.histogram_finalize()
     timers.timers_finalize()
     selobj.selobj_finalize()
     profiler.profiler_finalize()
@@ -127,12 +133,14 @@ def process_finalize():
 def process_main():
     """Virtual Infrastructure Manager - Main."""
 
-    def _force_exit():
+    def _force_exit(signum, frame):
         # Always finalize DB or it can become corrupted
         database.database_finalize(config.CONF["database"])
+        # Log what is still buffered, os._exit skips the exit handlers.
+        debug.debug_finalize()
         os._exit(-1)
 
-    global do_reload, dump_data_captured, reset_data_captured
+    global do_reload, dump_data_captured, reset_data_captured, toggle_profiling
 
     process_start_time = timers.get_monotonic_timestamp_in_ms()
 
@@ -142,6 +150,7 @@ def process_main():
         signal.signal(signal.SIGHUP, process_signal_handler)
         signal.signal(signal.SIGUSR1, process_signal_handler)
         signal.signal(signal.SIGUSR2, process_signal_handler)
+        signal.signal(signal.SIGPROF, process_signal_handler)
 
         parser = argparse.ArgumentParser()
         parser.add_argument("-c", "--config", help="configuration file")
@@ -163,7 +172,9 @@ def process_main():
         DLOG.info("Started")
 
         while stay_on:
-            selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
+            selobj.selobj_dispatch(
+                timers.timers_next_schedule_in_ms(PROCESS_TICK_INTERVAL_IN_MS)
+            )
             timers.timers_schedule()
 
             if not alarm.alarm_subsystem_sane():
@@ -183,7 +194,9 @@ def process_main():
             if dump_data_captured:
                 DLOG.info("Dump captured data signalled.")
                 histogram.display_histogram_data()
+                histogram.export_histogram_data()
                 profiler.profile_memory_dump()
+                profiler.profile_sampling_dump()
                 DLOG.info("Dump captured data complete.")
                 dump_data_captured = False
 
@@ -191,9 +204,15 @@ def process_main():
                 DLOG.info("Reset captured data signalled.")
                 histogram.reset_histogram_data()
                 profiler.profile_memory_set_reference()
+                profiler.profile_sampling_reset()
                 DLOG.info("Reset captured data complete.")
                 reset_data_captured = False
 
+            if toggle_profiling:
+                DLOG.info("Toggle profiling signalled.")
+                profiler.profile_sampling_toggle()
+                toggle_profiling = False
+
             if not init_complete:
                 # Retry initialization for up to 3 minutes.
                 now_ms = timers.get_monotonic_timestamp_in_ms()
@@ -14,8 +14,10 @@ from netaddr import IPAddress
 from nfv_common import config
 from nfv_common import debug
 from nfv_common.helpers import coroutine
+from nfv_common import histogram
 from nfv_common import selobj
 from nfv_common import timers
+from nfv_vim import api
 from nfv_vim.api import Application
 
 PROCESS_TICK_INTERVAL_IN_MS = 500
@@ -28,6 +30,9 @@ DLOG = debug.debug_get_logger("nfv_vim.api")
 
 stay_on = True
 do_reload = False
+dump_data_captured = False
+reset_data_captured = False
+_wsgi = None
 
 
 def get_address_family(ip_string):
@@ -42,7 +47,7 @@ def get_address_family(ip_string):
 def process_signal_handler(signum, frame):
     """Virtual Infrastructure Manager API - Process Signal Handler."""
 
-    global stay_on, do_reload
+    global stay_on, do_reload, dump_data_captured, reset_data_captured
 
     if signal.SIGTERM == signum:
         stay_on = False
@@ -50,6 +55,10 @@ def process_signal_handler(signum, frame):
         stay_on = False
     elif signal.SIGHUP == signum:
         do_reload = True
+    elif signal.SIGUSR1 == signum:
+        dump_data_captured = True
+    elif signal.SIGUSR2 == signum:
+        reset_data_captured = True
     else:
         print("Ignoring signal")
 
@@ -75,6 +84,16 @@ def process_event_handler(wsgi):
                 pass
 
 
+@coroutine
+def process_record_samples():
+    """Virtual Infrastructure Manager API - Record Samples."""
+
+    while True:
+        timer_id = yield
+        DLOG.verbose("Record samples, timer_id=%s." % timer_id)
+        api.server_record_samples()
+
+
 def get_handler_cls():
     cls = simple_server.WSGIRequestHandler
 
@@ -92,26 +111,51 @@ def process_initialize():
     """Virtual Infrastructure Manager API - Initialize."""
 
     debug.debug_initialize(config.CONF["debug"], "VIM-API")
-    selobj.selobj_initialize()
+    selobj.selobj_initialize(config.CONF.get("selobj", None))
     timers.timers_initialize(
         PROCESS_TICK_INTERVAL_IN_MS,
         PROCESS_TICK_MAX_DELAY_IN_MS,
         PROCESS_TICK_DELAY_DEBOUNCE_IN_MS,
     )
+    histogram.histogram_initialize(config.CONF.get("histogram", None), "VIM-API")
+
+    global _wsgi
 
-    ip = config.CONF["vim-api"]["host"]
-    port = int(config.CONF["vim-api"]["port"])
+    api_config = config.CONF["vim-api"]
+    ip = api_config["host"]
+    port = int(api_config["port"])
+    application = api.LatencyMiddleware(Application())
     # In order to support IPv6, set the address family before creating the server.
     simple_server.WSGIServer.address_family = get_address_family(ip)
-    wsgi = simple_server.make_server(
-        ip, port, Application(), handler_class=get_handler_cls()
-    )
-    selobj.selobj_add_read_obj(wsgi, process_event_handler, wsgi)
+
+    server_mode = api_config.get("server_mode", api.SERVER_MODE.INLINE)
+    if api.SERVER_MODE.THREAD == server_mode:
+        _wsgi = api.ThreadPoolWSGIServer(
+            (ip, port),
+            get_handler_cls(),
+            int(api_config.get("max_workers", 8)),
+            int(api_config.get("max_pending_requests", 32)),
+        )
+        _wsgi.set_app(application)
+    else:
+        _wsgi = simple_server.make_server(
+            ip, port, application, handler_class=get_handler_cls()
+        )
+    DLOG.info("Serving requests in %s mode." % server_mode)
+
+    selobj.selobj_add_read_obj(_wsgi, process_event_handler, _wsgi)
+    timers.timers_create_timer("record-samples", 1, 1, process_record_samples)
 
 
 def process_finalize():
     """Virtual Infrastructure Manager API - Finalize."""
 
+    if _wsgi is not None:
+        _wsgi.server_close()
+
+    api.close_rpc_channels()
+
+    histogram.histogram_finalize()
     timers.timers_finalize()
     selobj.selobj_finalize()
     debug.debug_finalize()
@@ -120,12 +164,14 @@ def process_finalize():
 def process_main():
     """Virtual Infrastructure Manager API - Main."""
 
-    global do_reload
+    global do_reload, dump_data_captured, reset_data_captured
 
     try:
         signal.signal(signal.SIGHUP, process_signal_handler)
         signal.signal(signal.SIGINT, process_signal_handler)
         signal.signal(signal.SIGTERM, process_signal_handler)
+        signal.signal(signal.SIGUSR1, process_signal_handler)
+        signal.signal(signal.SIGUSR2, process_signal_handler)
 
         parser = argparse.ArgumentParser()
         parser.add_argument("-c", "--config", help="configuration file")
@@ -145,13 +191,30 @@ def process_main():
 
         DLOG.info("Started")
         while stay_on:
-            selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
+            selobj.selobj_dispatch(
+                timers.timers_next_schedule_in_ms(PROCESS_TICK_INTERVAL_IN_MS)
+            )
             timers.timers_schedule()
 
             if do_reload:
                 debug.debug_reload_config()
                 do_reload = False
 
+            if dump_data_captured:
+                DLOG.info("Dump captured data signalled.")
+                api.server_record_samples()
+                histogram.display_histogram_data()
+                histogram.export_histogram_data()
+                DLOG.info("Dump captured data complete.")
+                dump_data_captured = False
+
+            if reset_data_captured:
+                DLOG.info("Reset captured data signalled.")
+                api.server_record_samples()
+                histogram.reset_histogram_data()
+                DLOG.info("Reset captured data complete.")
+                reset_data_captured = False
+
     except KeyboardInterrupt:
         print("Keyboard Interrupt received.")
 
@@ -46,7 +46,7 @@ def process_initialize():
     """Virtual Infrastructure Manager Web Server - Initialize."""
 
     debug.debug_initialize(config.CONF["debug"], "VIM-WEB")
-    selobj.selobj_initialize()
+    selobj.selobj_initialize(config.CONF.get("selobj", None))
     timers.timers_initialize(
         PROCESS_TICK_INTERVAL_IN_MS,
         PROCESS_TICK_MAX_DELAY_IN_MS,
@@ -99,7 +99,9 @@ def process_main():
 
         DLOG.info("Started")
         while stay_on:
-            selobj.selobj_dispatch(PROCESS_TICK_INTERVAL_IN_MS)
+            selobj.selobj_dispatch(
+                timers.timers_next_schedule_in_ms(PROCESS_TICK_INTERVAL_IN_MS)
+            )
             timers.timers_schedule()
 
             if do_reload: